@@ -1,18 +1,20 @@
 """Lifespan context manager for FastAPI application."""
 import asyncio
 import logging
+import os
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from backend.database import postgres
+from backend.database.storage import get_storage_backend, is_local_storage
 from backend.database.supabase.client import get_admin_client
+from backend.services.ai.llm_client import get_llm_client, reset_response_cache
+from backend.services.ai.taxonomy import get_skill_taxonomy
 
 logger = logging.getLogger(__name__)
 
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    """Lifespan context manager for startup and shutdown."""
-    # Startup
-    logger.info("Starting up CV Generator API...")
+async def _wait_for_supabase() -> None:
+    """Block startup until Supabase answers, retrying a few times."""
     max_retries = 5
     retry_count = 0
 
@@ -38,4 +40,28 @@ async def lifespan(app: FastAPI):
         logger.error("Failed to connect to Supabase database after multiple attempts")
         raise RuntimeError("Failed to connect to Supabase database")
 
-    yield
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Lifespan context manager for startup and shutdown."""
+    # Startup
+    logger.info("Starting up CV Generator API...")
+    if is_local_storage():
+        logger.info("Using local %s storage backend", get_storage_backend())
+    else:
+        await _wait_for_supabase()
+
+    taxonomy = get_skill_taxonomy()
+    logger.info("Loaded skill taxonomy v%s (%d terms)", taxonomy.version, len(taxonomy))
+
+    llm_client = get_llm_client()
+    if os.getenv("AI_HTTP_WARMUP", "true").lower() == "true" and await llm_client.warm_up():
+        logger.info("Warmed up LLM provider connection")
+
+    try:
+        yield
+    finally:
+        # Shutdown
+        await llm_client.aclose()
+        reset_response_cache()
+        await postgres.close_pool()
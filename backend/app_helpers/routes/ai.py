@@ -1,8 +1,9 @@
 """AI drafting routes (heuristics-first)."""
 
 import logging
-from typing import List, Dict, Any
+from typing import AsyncIterator, List, Dict, Any
 from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
 from pydantic import ValidationError
 from slowapi import Limiter
 import httpx
@@ -16,8 +17,9 @@ from backend.models_ai import (
     AIRewriteResponse,
 )
 from backend.services.ai.draft import generate_cv_draft
-from backend.services.ai.llm_client import get_llm_client
+from backend.services.ai.llm_client import CircuitOpenError, bypass_response_cache, get_llm_client, llm_step
 from backend.app_helpers.auth import get_current_user
+from backend.app_helpers.sse import SSE_HEARTBEAT_S, sse_response, stream_events
 
 logger = logging.getLogger(__name__)
 
@@ -61,6 +63,9 @@ def _format_exception_error(exc: Exception) -> str:
             "AI service request timed out. The service may be slow. Please try again."
         )
 
+    if isinstance(exc, CircuitOpenError):
+        return "AI service is temporarily unavailable. Please try again in a minute."
+
     if isinstance(exc, httpx.ConnectError):
         return "Could not connect to AI service. Please check your internet connection."
 
@@ -122,22 +127,59 @@ def _handle_generic_error(exc: Exception) -> HTTPException:
     return HTTPException(status_code=500, detail=friendly_msg)
 
 
+def _generation_error(exc: Exception) -> HTTPException:
+    """Map a CV generation failure to the HTTP error the endpoint reports."""
+    if isinstance(exc, HTTPException):
+        return exc
+    if isinstance(exc, ValidationError):
+        return _handle_validation_error(exc)
+    if isinstance(exc, ValueError):
+        return _handle_value_error(exc, "CV generation")
+    return _handle_generic_error(exc)
+
+
 async def _handle_generate_cv_request(
     payload: AIGenerateCVRequest,
 ) -> AIGenerateCVResponse:
     """Handle CV generation request."""
-    profile_dict = queries.get_profile()
+    profile_dict = await queries.aget_profile()
+    if not profile_dict:
+        raise HTTPException(status_code=404, detail="Profile not found")
+
+    profile = ProfileData.model_validate(profile_dict)
+    with bypass_response_cache(payload.regenerate):
+        return await generate_cv_draft(profile, payload)
+
+
+def _generate_cv_events(
+    profile: ProfileData,
+    payload: AIGenerateCVRequest,
+    heartbeat_s: float = SSE_HEARTBEAT_S,
+) -> AsyncIterator[str]:
+    """Run the draft pipeline and yield its progress as server-sent events."""
+
+    async def run(emit) -> AIGenerateCVResponse:
+        with bypass_response_cache(payload.regenerate):
+            return await generate_cv_draft(profile, payload, on_event=emit)
+
+    return stream_events(run, _generation_error, heartbeat_s)
+
+
+async def _handle_generate_cv_stream(payload: AIGenerateCVRequest) -> StreamingResponse:
+    """Handle streaming CV generation request."""
+    profile_dict = await queries.aget_profile()
     if not profile_dict:
         raise HTTPException(status_code=404, detail="Profile not found")
 
     profile = ProfileData.model_validate(profile_dict)
-    return await generate_cv_draft(profile, payload)
+    return sse_response(_generate_cv_events(profile, payload))
 
 
 async def _handle_rewrite_request(payload: AIRewriteRequest) -> AIRewriteResponse:
     """Handle text rewrite request."""
     llm_client = get_llm_client()
-    rewritten_text = await llm_client.rewrite_text(payload.text, payload.prompt)
+    with llm_step("rewrite"):
+        rewritten_text = await llm_client.rewrite_text(payload.text, payload.prompt)
     return AIRewriteResponse(rewritten_text=rewritten_text)
 
 
@@ -152,14 +194,17 @@ def create_ai_router(limiter: Limiter) -> APIRouter:  # noqa: C901
     ):
         try:
             return await _handle_generate_cv_request(payload)
-        except HTTPException:
-            raise
-        except ValidationError as e:
-            raise _handle_validation_error(e)
-        except ValueError as e:
-            raise _handle_value_error(e, "CV generation")
         except Exception as exc:
-            raise _handle_generic_error(exc)
+            raise _generation_error(exc)
+
+    @router.post("/api/ai/generate-cv/stream")
+    @limiter.limit("10/minute")
+    async def generate_cv_stream(request: Request, payload: AIGenerateCVRequest):
+        """Generate a CV draft, streaming pipeline progress as server-sent events."""
+        try:
+            return await _handle_generate_cv_stream(payload)
+        except Exception as exc:
+            raise _generation_error(exc)
 
     @router.post("/api/ai/rewrite", response_model=AIRewriteResponse)
     @limiter.limit("20/minute")
@@ -4,6 +4,7 @@
 from backend.app_helpers.routes.cover_letter.router import create_cover_letter_router
 from backend.app_helpers.routes.cover_letter.endpoints import (
     generate_cover_letter_endpoint,
+    generate_cover_letter_stream_endpoint,
     export_cover_letter_pdf,
     save_cover_letter_endpoint,
     list_cover_letters_endpoint,
@@ -12,27 +13,32 @@ from backend.app_helpers.routes.cover_letter.endpoints import (
 )
 from backend.app_helpers.routes.cover_letter.error_handlers import (
     _format_validation_error,
+    _cover_letter_error,
     _handle_validation_error,
     _handle_value_error,
     _handle_generic_error,
 )
 from backend.app_helpers.routes.cover_letter.request_handlers import (
     _handle_generate_cover_letter_request,
+    _handle_generate_cover_letter_stream,
 )
 from backend.database import queries
 
 __all__ = [
     "create_cover_letter_router",
     "generate_cover_letter_endpoint",
+    "generate_cover_letter_stream_endpoint",
     "export_cover_letter_pdf",
     "save_cover_letter_endpoint",
     "list_cover_letters_endpoint",
     "get_cover_letter_endpoint",
     "delete_cover_letter_endpoint",
     "_format_validation_error",
+    "_cover_letter_error",
     "_handle_validation_error",
     "_handle_value_error",
     "_handle_generic_error",
     "_handle_generate_cover_letter_request",
+    "_handle_generate_cover_letter_stream",
     "queries",
 ]
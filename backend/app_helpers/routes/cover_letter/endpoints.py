@@ -5,12 +5,14 @@ from fastapi import HTTPException, Request, Response
 from pydantic import ValidationError
 
 from backend.app_helpers.routes.cover_letter.error_handlers import (
+    _cover_letter_error,
     _handle_validation_error,
     _handle_value_error,
     _handle_generic_error,
 )
 from backend.app_helpers.routes.cover_letter.request_handlers import (
     _handle_generate_cover_letter_request,
+    _handle_generate_cover_letter_stream,
 )
 from backend.database import queries
 from backend.models_cover_letter import CoverLetterRequest, CoverLetterSaveRequest, CoverLetterData
@@ -44,6 +46,16 @@ async def generate_cover_letter_endpoint(
         raise _handle_generic_error(exc)
 
 
+async def generate_cover_letter_stream_endpoint(
+    request: Request, payload: CoverLetterRequest
+):
+    """Generate a cover letter, streaming the body as it is written."""
+    try:
+        return await _handle_generate_cover_letter_stream(payload)
+    except Exception as exc:
+        raise _cover_letter_error(exc)
+
+
 async def export_cover_letter_pdf(
     request: Request,
     pdf_request: CoverLetterPDFRequest,
@@ -111,10 +123,16 @@ async def list_cover_letters_endpoint(
     limit: int = 50,
     offset: int = 0,
     search: str | None = None,
+    cursor: str | None = None,
+    count: str = "exact",
 ):
-    """List saved cover letters."""
+    """List saved cover letters with offset or cursor pagination."""
     try:
-        return queries.list_cover_letters(limit=limit, offset=offset, search=search)
+        return queries.list_cover_letters(
+            limit=limit, offset=offset, search=search, cursor=cursor, count=count
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
     except Exception as exc:
         logger.error("Failed to list cover letters", exc_info=exc)
         raise HTTPException(
@@ -51,3 +51,14 @@ def _handle_generic_error(exc: Exception) -> HTTPException:
     error_msg = f"Failed to generate cover letter: {str(exc)}"
     logger.error(f"Failed to generate cover letter: {exc}", exc_info=exc)
     return HTTPException(status_code=500, detail=error_msg)
+
+
+def _cover_letter_error(exc: Exception) -> HTTPException:
+    """Map a cover letter generation failure to the HTTP error the endpoint reports."""
+    if isinstance(exc, HTTPException):
+        return exc
+    if isinstance(exc, ValidationError):
+        return _handle_validation_error(exc)
+    if isinstance(exc, ValueError):
+        return _handle_value_error(exc)
+    return _handle_generic_error(exc)
@@ -1,10 +1,15 @@
 """Request handling utilities for cover letter endpoints."""
 
+from typing import AsyncIterator
+
 from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
 
+from backend.app_helpers.routes.cover_letter.error_handlers import _cover_letter_error
+from backend.app_helpers.sse import SSE_HEARTBEAT_S, sse_response, stream_events
 from backend.database import queries
 from backend.models import ProfileData
-from backend.models_cover_letter import CoverLetterResponse
+from backend.models_cover_letter import CoverLetterRequest, CoverLetterResponse
 from backend.services.ai.cover_letter import generate_cover_letter
 
 
@@ -12,9 +17,34 @@ async def _handle_generate_cover_letter_request(
     payload,
 ) -> CoverLetterResponse:
     """Handle cover letter generation request."""
-    profile_dict = queries.get_profile()
+    profile_dict = await queries.aget_profile()
     if not profile_dict:
         raise HTTPException(status_code=404, detail="Profile not found")
 
     profile = ProfileData.model_validate(profile_dict)
     return await generate_cover_letter(profile, payload)
+
+
+def _generate_cover_letter_events(
+    profile: ProfileData,
+    payload: CoverLetterRequest,
+    heartbeat_s: float = SSE_HEARTBEAT_S,
+) -> AsyncIterator[str]:
+    """Stream body tokens as server-sent events, then the formatted letter."""
+
+    async def run(emit) -> CoverLetterResponse:
+        return await generate_cover_letter(
+            profile, payload, on_token=lambda text: emit("token", {"text": text})
+        )
+
+    return stream_events(run, _cover_letter_error, heartbeat_s)
+
+
+async def _handle_generate_cover_letter_stream(payload) -> StreamingResponse:
+    """Handle streaming cover letter generation request."""
+    profile_dict = await queries.aget_profile()
+    if not profile_dict:
+        raise HTTPException(status_code=404, detail="Profile not found")
+
+    profile = ProfileData.model_validate(profile_dict)
+    return sse_response(_generate_cover_letter_events(profile, payload))
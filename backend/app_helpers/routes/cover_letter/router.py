@@ -1,10 +1,11 @@
 """Cover letter router creation."""
 
-from fastapi import APIRouter, Depends, Request
+from fastapi import APIRouter, Depends, Query, Request
 from slowapi import Limiter
 
 from backend.app_helpers.routes.cover_letter.endpoints import (
     generate_cover_letter_endpoint,
+    generate_cover_letter_stream_endpoint,
     export_cover_letter_pdf,
     save_cover_letter_endpoint,
     list_cover_letters_endpoint,
@@ -40,6 +41,13 @@ def create_cover_letter_router(
     ):
         return await generate_cover_letter_endpoint(request, payload)
 
+    @router.post("/api/ai/generate-cover-letter/stream")
+    @limiter.limit("10/minute")
+    async def generate_cover_letter_stream_endpoint_decorated(
+        request: Request, payload: CoverLetterRequest
+    ):
+        return await generate_cover_letter_stream_endpoint(request, payload)
+
     @router.post("/api/ai/cover-letter/pdf")
     @limiter.limit("30/minute")
     async def export_cover_letter_pdf_decorated(
@@ -61,8 +69,16 @@ def create_cover_letter_router(
         limit: int = 50,
         offset: int = 0,
         search: str | None = None,
+        cursor: str | None = None,
+        count: str = Query(
+            "exact",
+            pattern="^(exact|planned|estimated|none)$",
+            description="How to compute total: exact, planned, estimated or none",
+        ),
     ):
-        return await list_cover_letters_endpoint(request, limit, offset, search)
+        return await list_cover_letters_endpoint(
+            request, limit, offset, search, cursor, count
+        )
 
     @router.get("/api/cover-letters/{cover_letter_id}", response_model=CoverLetterData)
     @limiter.limit("30/minute")
@@ -2,8 +2,11 @@
 import logging
 import csv
 import io
+import itertools
+import json
+from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from fastapi.responses import StreamingResponse
 from slowapi import Limiter
@@ -11,6 +14,7 @@ from backend.models import CVData, CVResponse, CVListResponse
 from backend.database import queries
 from backend.services.cv_file_service import CVFileService
 from backend.app_helpers.auth import get_current_user
+from backend.database.supabase.utils import require_user_id
 
 logger = logging.getLogger(__name__)
 
@@ -42,7 +46,7 @@ def create_cv_router(  # noqa: C901
     @router.get("/api/cv/{cv_id}")
     async def get_cv(cv_id: str):
         """Retrieve CV data."""
-        cv = queries.get_cv_by_id(cv_id)
+        cv = await queries.aget_cv_by_id(cv_id)
         if not cv:
             raise HTTPException(status_code=404, detail="CV not found")
         return cv
@@ -52,13 +56,25 @@ def create_cv_router(  # noqa: C901
         limit: int = Query(50, ge=1, le=100),
         offset: int = Query(0, ge=0),
         search: Optional[str] = None,
+        cursor: Optional[str] = Query(
+            None, description="Opaque cursor from a previous page (overrides offset)"
+        ),
+        count: str = Query(
+            "exact",
+            pattern="^(exact|planned|estimated|none)$",
+            description="How to compute total: exact, planned, estimated or none",
+        ),
     ):
-        """List all saved CVs with pagination."""
+        """List all saved CVs with offset or cursor pagination."""
         try:
-            result = queries.list_cvs(limit=limit, offset=offset, search=search)
+            result = await queries.alist_cvs(
+                limit=limit, offset=offset, search=search, cursor=cursor, count=count
+            )
             return CVListResponse(**result)
         except HTTPException:
             raise
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         except Exception as e:
             logger.error(
                 "Failed to list CVs: %s (limit=%d, offset=%d, search=%s)",
@@ -72,20 +88,28 @@ def create_cv_router(  # noqa: C901
 
     @router.get("/api/cvs/export")
     async def export_cvs(
-        format: str = Query("csv", regex="^(csv)$", description="Export format (currently only csv supported)"),
+        format: str = Query(
+            "csv",
+            pattern="^(csv|ndjson)$",
+            description="Export format: csv (list columns) or ndjson (full CV payloads)",
+        ),
         search: Optional[str] = None,
     ):
-        """Export CV list as downloadable file."""
+        """Stream every CV as a downloadable file."""
         try:
-            # Get all CVs (no pagination for export)
-            result = queries.list_cvs(limit=1000, offset=0, search=search)
-            cvs = result["cvs"]
-
-            if format == "csv":
-                return await _export_cvs_csv(cvs)
+            # Resolve the owner now: the stream outlives the request-scoped user context
+            user_id = require_user_id()
+            cvs = queries.iter_cvs(
+                search=search, user_id=user_id, full=format == "ndjson"
+            )
+            # Pull the first page eagerly so query errors still surface as a 500
+            first = next(cvs, None)
+            if first is not None:
+                cvs = itertools.chain([first], cvs)
 
-            # Future: Add other formats here
-            raise HTTPException(status_code=400, detail=f"Unsupported format: {format}")
+            if format == "ndjson":
+                return _export_cvs_ndjson(cvs)
+            return _export_cvs_csv(cvs)
 
         except HTTPException:
             raise
@@ -162,7 +186,7 @@ def create_cv_router(  # noqa: C901
         """Download the featured CV as DOCX."""
         try:
             # Get the latest profile
-            profile = queries.get_profile()
+            profile = await queries.aget_profile()
             if not profile:
                 raise HTTPException(status_code=404, detail="No profile found")
 
@@ -200,17 +224,41 @@ def create_cv_router(  # noqa: C901
     return router
 
 
-async def _export_cvs_csv(cvs: list) -> StreamingResponse:
-    """Export CVs as CSV file."""
-    from datetime import datetime
+def _format_export_date(value) -> str:
+    """Format an ISO timestamp as a readable date, passing through anything else."""
+    if not value:
+        return ""
+    try:
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        return dt.strftime("%Y-%m-%d %H:%M:%S")
+    except (ValueError, AttributeError):
+        return value
+
+
+def _export_headers(extension: str) -> dict:
+    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+    filename = f"cvs_export_{timestamp}.{extension}"
+    return {
+        "Content-Disposition": f'attachment; filename="{filename}"',
+        "Cache-Control": "no-cache, no-store, must-revalidate",
+        "Pragma": "no-cache",
+        "Expires": "0"
+    }
 
-    def generate_csv():
-        """Generate CSV data row by row."""
-        # Create CSV writer
+
+def _export_cvs_csv(cvs: Iterable[dict]) -> StreamingResponse:
+    """Export CVs as CSV, emitting one chunk per row."""
+
+    def iter_csv():
         output = io.StringIO()
         writer = csv.writer(output)
 
-        # Write header
+        def flush() -> str:
+            chunk = output.getvalue()
+            output.seek(0)
+            output.truncate(0)
+            return chunk
+
         writer.writerow([
             "CV ID",
             "Person Name",
@@ -220,58 +268,34 @@ async def _export_cvs_csv(cvs: list) -> StreamingResponse:
             "Updated Date",
             "Has File"
         ])
+        yield flush()
 
-        # Write data rows
         for cv in cvs:
-            created_date = ""
-            updated_date = ""
-
-            try:
-                if cv.get("created_at"):
-                    # Parse ISO format and format as readable date
-                    dt = datetime.fromisoformat(cv["created_at"].replace('Z', '+00:00'))
-                    created_date = dt.strftime("%Y-%m-%d %H:%M:%S")
-            except (ValueError, AttributeError):
-                created_date = cv.get("created_at", "")
-
-            try:
-                if cv.get("updated_at"):
-                    # Parse ISO format and format as readable date
-                    dt = datetime.fromisoformat(cv["updated_at"].replace('Z', '+00:00'))
-                    updated_date = dt.strftime("%Y-%m-%d %H:%M:%S")
-            except (ValueError, AttributeError):
-                updated_date = cv.get("updated_at", "")
-
             writer.writerow([
                 cv.get("cv_id", ""),
                 cv.get("person_name", ""),
                 cv.get("target_company", ""),
                 cv.get("target_role", ""),
-                created_date,
-                updated_date,
+                _format_export_date(cv.get("created_at")),
+                _format_export_date(cv.get("updated_at")),
                 "Yes" if cv.get("filename") else "No"
             ])
+            yield flush()
+
+    return StreamingResponse(
+        iter_csv(), media_type="text/csv", headers=_export_headers("csv")
+    )
 
-        # Get the CSV content
-        csv_content = output.getvalue()
-        output.close()
-        return csv_content
 
-    # Generate filename with timestamp
-    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-    filename = f"cvs_export_{timestamp}.csv"
+def _export_cvs_ndjson(cvs: Iterable[dict]) -> StreamingResponse:
+    """Export full CV payloads as newline-delimited JSON for backups."""
 
-    # Return streaming response
-    def iter_csv():
-        yield generate_csv()
+    def iter_ndjson():
+        for cv in cvs:
+            yield json.dumps(cv, default=str) + "\n"
 
     return StreamingResponse(
-        iter_csv(),
-        media_type="text/csv",
-        headers={
-            "Content-Disposition": f'attachment; filename="{filename}"',
-            "Cache-Control": "no-cache, no-store, must-revalidate",
-            "Pragma": "no-cache",
-            "Expires": "0"
-        }
+        iter_ndjson(),
+        media_type="application/x-ndjson",
+        headers=_export_headers("ndjson"),
     )
@@ -94,7 +94,7 @@ async def _handle_generate_cv_docx_file(
 ) -> CVResponse:
     """Handle generate DOCX file for existing CV."""
     try:
-        cv = queries.get_cv_by_id(cv_id)
+        cv = await queries.aget_cv_by_id(cv_id)
         if not cv:
             raise HTTPException(status_code=404, detail="CV not found")
         cv_dict = cv_file_service.prepare_cv_dict(cv)
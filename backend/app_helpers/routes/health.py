@@ -1,10 +1,34 @@
 """Health check routes."""
 from fastapi import APIRouter, Depends
+from backend.database.storage import get_storage_backend, is_local_storage
 from backend.database.supabase.client import get_admin_client
+from backend.services.ai.llm_client import (
+    get_circuit_breaker,
+    get_llm_governor,
+    get_llm_telemetry,
+    get_response_cache,
+)
 from backend.services.cv_file_service import CVFileService
 from backend.app_helpers.auth import get_current_admin
 
 
+def _response_cache_stats() -> dict:
+    cache = get_response_cache()
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **cache.snapshot()}
+
+
+def _llm_metrics_snapshot() -> dict:
+    """LLM call aggregates plus governor, circuit breaker and cache state."""
+    return {
+        "calls": get_llm_telemetry().snapshot(),
+        "governor": get_llm_governor().snapshot(),
+        "circuit": get_circuit_breaker().snapshot(),
+        "cache": _response_cache_stats(),
+    }
+
+
 def create_health_router(cv_file_service: CVFileService) -> APIRouter:
     """Create health router with dependencies."""
     router = APIRouter()
@@ -12,11 +36,16 @@ def create_health_router(cv_file_service: CVFileService) -> APIRouter:
     @router.get("/api/health")
     async def health_check():
         """Health check endpoint."""
-        provider = "supabase"
+        provider = get_storage_backend()
         try:
-            client = get_admin_client()
-            client.table("user_profiles").select("id").limit(1).execute()
-            db_connected = True
+            if is_local_storage():
+                from backend.database.local import get_local_store
+
+                db_connected = get_local_store().ping()
+            else:
+                client = get_admin_client()
+                client.table("user_profiles").select("id").limit(1).execute()
+                db_connected = True
         except Exception:
             db_connected = False
         return {
@@ -44,4 +73,14 @@ def create_health_router(cv_file_service: CVFileService) -> APIRouter:
                 "error": str(e),
             }
 
+    @router.get("/api/admin/llm-cache")
+    async def llm_cache_stats(_current_user=Depends(get_current_admin)):
+        """LLM response cache hit-rate metrics (admin endpoint)."""
+        return _response_cache_stats()
+
+    @router.get("/api/admin/llm-metrics")
+    async def llm_metrics(_current_user=Depends(get_current_admin)):
+        """LLM call latency, token and cost aggregates by pipeline step (admin endpoint)."""
+        return _llm_metrics_snapshot()
+
     return router
@@ -70,7 +70,7 @@ def create_pdf_router(  # noqa: C901
     ):
         """Generate long single-page PDF for existing CV."""
         try:
-            cv = queries.get_cv_by_id(cv_id)
+            cv = await queries.aget_cv_by_id(cv_id)
             if not cv:
                 raise HTTPException(status_code=404, detail="CV not found")
 
@@ -35,7 +35,7 @@ def create_print_html_router(
     @limiter.limit("30/minute")
     async def render_print_html_for_cv(request: Request, cv_id: str):
         try:
-            cv = queries.get_cv_by_id(cv_id)
+            cv = await queries.aget_cv_by_id(cv_id)
             if not cv:
                 raise HTTPException(status_code=404, detail="CV not found")
             # Log raw CV data from database
@@ -71,7 +71,7 @@ def create_profile_router(limiter: Limiter, cv_file_service=None) -> APIRouter:
     async def get_profile_endpoint():
         """Get master profile."""
         try:
-            profile = queries.get_profile()
+            profile = await queries.aget_profile()
             if not profile:
                 raise HTTPException(status_code=404, detail="Profile not found")
             return profile
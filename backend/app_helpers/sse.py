@@ -0,0 +1,74 @@
+"""Server-sent events helpers for streaming AI endpoints."""
+
+import asyncio
+import json
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict
+
+from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+SSE_HEARTBEAT_S = 15.0
+
+EventCallback = Callable[[str, Dict[str, Any]], None]
+
+_DONE = object()
+
+
+def sse_event(name: str, data: Dict[str, Any]) -> str:
+    """Format one server-sent event."""
+    return f"event: {name}\ndata: {json.dumps(data)}\n\n"
+
+
+async def stream_events(
+    run: Callable[[EventCallback], Awaitable[BaseModel]],
+    to_http_error: Callable[[Exception], HTTPException],
+    heartbeat_s: float = SSE_HEARTBEAT_S,
+) -> AsyncIterator[str]:
+    """
+    Run ``run(emit)`` and yield what it emits as server-sent events.
+
+    The returned model is sent as a final ``result`` event. A failure is
+    mapped with ``to_http_error`` and sent as an ``error`` event instead.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def produce() -> BaseModel:
+        try:
+            return await run(lambda name, data: queue.put_nowait((name, data)))
+        finally:
+            queue.put_nowait(_DONE)
+
+    task = asyncio.create_task(produce())
+    try:
+        while True:
+            try:
+                item = await asyncio.wait_for(queue.get(), timeout=heartbeat_s)
+            except asyncio.TimeoutError:
+                # Comment lines keep proxies from closing an idle connection
+                yield ": keep-alive\n\n"
+                continue
+            if item is _DONE:
+                break
+            yield sse_event(*item)
+
+        try:
+            response = await task
+        except Exception as exc:
+            error = to_http_error(exc)
+            yield sse_event("error", {"status_code": error.status_code, "detail": error.detail})
+        else:
+            yield sse_event("result", response.model_dump(mode="json"))
+    finally:
+        # Client disconnected mid-stream: stop the producer
+        if not task.done():
+            task.cancel()
+
+
+def sse_response(events: AsyncIterator[str]) -> StreamingResponse:
+    """Wrap an event iterator in an unbuffered event-stream response."""
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
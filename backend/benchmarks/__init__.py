@@ -0,0 +1 @@
+"""Performance benchmarks (run as modules, not collected by pytest)."""
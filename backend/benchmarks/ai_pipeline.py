@@ -0,0 +1,261 @@
+"""Benchmark CV draft and cover letter generation against the mock LLM server.
+
+Drives ``generate_cv_draft`` and ``generate_cover_letter`` end to end with
+synthetic profiles of several sizes. Reports p50/p95 latency, throughput, LLM
+calls and tokens per run. Without ``--base-url`` a mock server
+(``backend.benchmarks.mock_llm``) is started in-process on a free port.
+
+Usage::
+
+    python -m backend.benchmarks.ai_pipeline --sizes small,large --iterations 20 \\
+        --concurrency 4 --latency-ms 400 --latency-dist lognormal --error-rate 0.02
+    python -m backend.benchmarks.ai_pipeline --base-url http://127.0.0.1:8765/v1
+
+The response cache and JD analysis cache are disabled so every run calls the LLM.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import socket
+import statistics
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, List
+
+from backend.benchmarks.mock_llm import add_config_arguments, config_from_args, create_mock_llm_app
+from backend.models import ProfileData
+from backend.models_ai import AIGenerateCVRequest
+from backend.models_cover_letter import CoverLetterRequest
+from backend.services.ai.cover_letter import generate_cover_letter
+from backend.services.ai.draft import generate_cv_draft
+from backend.services.ai.llm_client import (
+    collect_llm_calls,
+    get_llm_client,
+    reset_circuit_breaker,
+    reset_llm_client,
+    reset_llm_governor,
+    reset_llm_telemetry,
+    reset_response_cache,
+)
+from backend.services.ai.pipeline.jd_analyzer import reset_jd_analysis_cache
+
+# (experiences, projects per experience, highlights per project, skills)
+PROFILE_SIZES = {
+    "small": (2, 1, 3, 10),
+    "medium": (4, 2, 4, 25),
+    "large": (8, 3, 5, 60),
+}
+
+_TECH = [
+    "Python", "Django", "FastAPI", "PostgreSQL", "Redis", "Kafka", "Docker", "Kubernetes",
+    "Terraform", "AWS", "GCP", "React", "TypeScript", "Node.js", "GraphQL", "Go", "Rust",
+    "Java", "Spring", "Elasticsearch", "Airflow", "Spark", "pandas", "gRPC", "RabbitMQ",
+    "Celery", "Prometheus", "Grafana", "Linux", "CI/CD", "Jenkins", "GitHub Actions",
+    "MongoDB", "MySQL", "Snowflake", "dbt", "Vue", "Next.js", "Tailwind", "OAuth",
+]
+_VERBS = ["Built", "Designed", "Led", "Migrated", "Optimized", "Automated", "Introduced", "Scaled"]
+_OBJECTS = [
+    "the billing service", "an internal API gateway", "the data ingestion pipeline",
+    "the customer dashboard", "a feature flag platform", "the search backend",
+    "on-call tooling", "the deployment workflow",
+]
+
+
+def synthetic_profile(size: str, seed: int = 0) -> ProfileData:
+    """Build a deterministic profile with the dimensions of ``PROFILE_SIZES[size]``."""
+    experiences, projects, highlights, skills = PROFILE_SIZES[size]
+    rng = random.Random(f"{size}:{seed}")
+
+    def highlight() -> str:
+        tech = rng.sample(_TECH, 2)
+        return (
+            f"{rng.choice(_VERBS)} {rng.choice(_OBJECTS)} with {tech[0]} and {tech[1]}, "
+            f"cutting latency by {rng.randint(10, 60)}% for {rng.randint(2, 40)} teams"
+        )
+
+    skill_names = (_TECH + [f"{name} Tooling" for name in _TECH])[:skills]
+    return ProfileData.model_validate({
+        "personal_info": {"name": "Bench Candidate", "title": "Software Engineer", "email": "bench@example.com"},
+        "experience": [
+            {
+                "title": rng.choice(["Software Engineer", "Senior Engineer", "Staff Engineer"]),
+                "company": f"Company {idx}",
+                "start_date": f"{2023 - 2 * idx}-01",
+                "end_date": None if idx == 0 else f"{2025 - 2 * idx}-01",
+                "description": f"{rng.choice(_VERBS)} {rng.choice(_OBJECTS)} for a team of {rng.randint(3, 12)} engineers.",
+                "projects": [
+                    {
+                        "name": f"Project {idx}.{proj}",
+                        "description": f"Work on {rng.choice(_OBJECTS)}.",
+                        "highlights": [highlight() for _ in range(highlights)],
+                        "technologies": rng.sample(_TECH, 3),
+                    }
+                    for proj in range(projects)
+                ],
+            }
+            for idx in range(experiences)
+        ],
+        "education": [{"degree": "BSc Computer Science", "institution": "Bench University", "year": "2012"}],
+        "skills": [{"name": name} for name in skill_names],
+    })
+
+
+def synthetic_job_description(seed: int = 0) -> str:
+    rng = random.Random(f"jd:{seed}")
+    required = rng.sample(_TECH, 6)
+    preferred = rng.sample([tech for tech in _TECH if tech not in required], 4)
+    return (
+        "Senior Backend Engineer\n\n"
+        f"Requirements: {', '.join(required)}. You must have 5+ years of experience building services.\n"
+        f"Nice to have: {', '.join(preferred)}.\n\n"
+        "Responsibilities:\n"
+        "- Design and build scalable APIs\n"
+        "- Lead technical design reviews and mentor engineers\n"
+        "- Improve reliability and observability of production systems\n"
+        "- Collaborate with product to ship customer-facing features\n"
+    )
+
+
+def _scenarios(profile: ProfileData, job_description: str) -> Dict[str, Callable[[], Awaitable[Any]]]:
+    draft_request = AIGenerateCVRequest(job_description=job_description, max_experiences=4)
+    context_request = AIGenerateCVRequest(
+        job_description=job_description,
+        max_experiences=4,
+        additional_context="Emphasize platform reliability work",
+    )
+    letter_request = CoverLetterRequest(job_description=job_description, company_name="Bench Corp", tone="professional")
+    return {
+        "cv_draft": lambda: generate_cv_draft(profile, draft_request),
+        "cv_draft_context": lambda: generate_cv_draft(profile, context_request),
+        "cover_letter": lambda: generate_cover_letter(profile, letter_request),
+    }
+
+
+async def _measure(call: Callable[[], Awaitable[Any]], iterations: int, concurrency: int) -> Dict[str, float]:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    calls = prompt_tokens = completion_tokens = failures = warnings = 0
+
+    async def one() -> None:
+        nonlocal calls, prompt_tokens, completion_tokens, failures, warnings
+        async with semaphore:
+            started = time.perf_counter()
+            with collect_llm_calls() as llm_calls:
+                try:
+                    response = await call()
+                    warnings += len(getattr(response, "warnings", []) or [])
+                except Exception:
+                    failures += 1
+            latencies.append((time.perf_counter() - started) * 1000)
+            calls += len(llm_calls)
+            prompt_tokens += sum(c.prompt_tokens for c in llm_calls)
+            completion_tokens += sum(c.completion_tokens for c in llm_calls)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(iterations)))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "p50_ms": statistics.median(latencies),
+        "p95_ms": latencies[max(0, int(len(latencies) * 0.95) - 1)],
+        "mean_ms": statistics.fmean(latencies),
+        "runs_per_s": iterations / elapsed,
+        "calls_per_run": calls / iterations,
+        "prompt_tokens_per_run": prompt_tokens / iterations,
+        "completion_tokens_per_run": completion_tokens / iterations,
+        "failures": failures,
+        "warnings": warnings,
+    }
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _start_mock_server(args: argparse.Namespace) -> str:
+    """Serve the mock LLM on a background thread and return its base URL."""
+    import uvicorn
+
+    port = _free_port()
+    server = uvicorn.Server(uvicorn.Config(
+        create_mock_llm_app(config_from_args(args)), host="127.0.0.1", port=port, log_level="warning",
+    ))
+    threading.Thread(target=server.run, daemon=True).start()
+    deadline = time.monotonic() + 10
+    while not server.started:
+        if time.monotonic() > deadline:
+            raise SystemExit("Mock LLM server did not start")
+        time.sleep(0.05)
+    return f"http://127.0.0.1:{port}/v1"
+
+
+def _configure_client(base_url: str) -> None:
+    """Point the LLM client at ``base_url`` with both caches off, so every run calls the LLM."""
+    os.environ.update({
+        "AI_ENABLED": "true",
+        "AI_BASE_URL": base_url,
+        "AI_API_KEY": os.getenv("AI_API_KEY", "mock"),
+        "AI_RESPONSE_CACHE": "false",
+        "JD_CACHE_TTL_S": "0",
+    })
+    for reset in (
+        reset_llm_client,
+        reset_llm_governor,
+        reset_circuit_breaker,
+        reset_llm_telemetry,
+        reset_response_cache,
+        reset_jd_analysis_cache,
+    ):
+        reset()
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="small,medium,large", help=f"comma-separated from {', '.join(PROFILE_SIZES)}")
+    parser.add_argument("--scenarios", default="cv_draft,cv_draft_context,cover_letter")
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--base-url", help="use a running OpenAI-compatible server instead of the in-process mock")
+    parser.add_argument("--json", dest="json_path", help="also write the results to this file")
+    parser.add_argument("--log-level", default="ERROR")
+    add_config_arguments(parser)
+    args = parser.parse_args()
+    logging.basicConfig(level=args.log_level)
+
+    _configure_client(args.base_url or _start_mock_server(args))
+    job_description = synthetic_job_description(args.seed)
+    results = []
+
+    print(
+        f"{'scenario':<17} {'size':<7} {'p50 ms':>8} {'p95 ms':>8} {'mean ms':>8} {'runs/s':>7} "
+        f"{'calls':>6} {'prompt tk':>9} {'compl tk':>8} {'fail':>5} {'warn':>5}"
+    )
+    try:
+        for size in args.sizes.split(","):
+            profile = synthetic_profile(size, args.seed)
+            scenarios = _scenarios(profile, job_description)
+            for name in args.scenarios.split(","):
+                call = scenarios[name]
+                await call()  # warm up connections
+                stats = await _measure(call, args.iterations, args.concurrency)
+                results.append({"scenario": name, "size": size, **stats})
+                print(
+                    f"{name:<17} {size:<7} {stats['p50_ms']:>8.1f} {stats['p95_ms']:>8.1f} {stats['mean_ms']:>8.1f} "
+                    f"{stats['runs_per_s']:>7.2f} {stats['calls_per_run']:>6.1f} {stats['prompt_tokens_per_run']:>9.0f} "
+                    f"{stats['completion_tokens_per_run']:>8.0f} {stats['failures']:>5} {stats['warnings']:>5}"
+                )
+    finally:
+        await get_llm_client().aclose()
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,361 @@
+"""Deterministic OpenAI-compatible stand-in server for the AI pipeline.
+
+Answers ``/v1/chat/completions`` (plain and streamed) with canned responses
+shaped for each prompt the pipeline sends: JD analysis, context analysis,
+skill relevance, content adaptation, rewrites, cover letter selection and the
+letter body. Latency, error rate and 429 rate are configurable. Each answer is
+seeded from the prompt, so a run is reproducible regardless of request order.
+
+Usage::
+
+    python -m backend.benchmarks.mock_llm --port 8765 --latency-ms 600 \\
+        --latency-dist lognormal --error-rate 0.02
+    export AI_ENABLED=true AI_BASE_URL=http://127.0.0.1:8765/v1 AI_API_KEY=mock
+
+``GET /mock/stats`` returns request and injected-error counts by prompt kind.
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import math
+import random
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from backend.services.ai.pipeline.jd_analyzer.heuristic_analysis import _analyze_with_heuristics
+
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "lognormal")
+
+
+@dataclass
+class MockLLMConfig:
+    """Response timing and failure injection for the mock server."""
+
+    latency_ms: float = 0.0  # median time to first token
+    latency_dist: str = "fixed"
+    latency_spread: float = 0.5  # uniform: +/- fraction of latency_ms; lognormal: sigma
+    token_ms: float = 0.0  # extra time per completion token
+    error_rate: float = 0.0  # fraction of requests answered with 503
+    rate_limit_rate: float = 0.0  # fraction answered with 429 + retry-after-ms
+    retry_after_ms: int = 200
+    seed: int = 0
+    kind_latency_ms: Dict[str, float] = field(default_factory=dict)  # per prompt kind overrides
+
+    def sample_latency_s(self, kind: str, rng: random.Random) -> float:
+        median = self.kind_latency_ms.get(kind, self.latency_ms)
+        if median <= 0:
+            return 0.0
+        if self.latency_dist == "uniform":
+            value = median * (1 + rng.uniform(-self.latency_spread, self.latency_spread))
+        elif self.latency_dist == "lognormal":
+            value = median * math.exp(rng.gauss(0.0, self.latency_spread))
+        else:
+            value = median
+        return max(0.0, value) / 1000
+
+
+def _user_message(messages: List[Dict[str, Any]]) -> str:
+    return next((m.get("content") or "" for m in reversed(messages) if m.get("role") == "user"), "")
+
+
+def _system_message(messages: List[Dict[str, Any]]) -> str:
+    return next((m.get("content") or "" for m in messages if m.get("role") == "system"), "")
+
+
+def classify_prompt(messages: List[Dict[str, Any]]) -> str:
+    """Name the pipeline prompt a request carries ("generic" if unknown)."""
+    system = _system_message(messages)
+    user = _user_message(messages)
+    if "job description analyzer" in system:
+        return "jd_analysis"
+    if "analyzing additional context" in system:
+        return "context_analysis"
+    if "career skills analyst" in system:
+        return "skill_batch" if "For EACH of these skills" in user else "skill_eval"
+    if "CV editor" in system and "Original items (JSON):" in user:
+        return "adaptation_batch"
+    if "Text to rewrite:" in user:
+        return "rewrite"
+    if "career advisor analyzing job applications" in system:
+        return "cover_letter_selection"
+    if "cover letter writer" in system:
+        return "cover_letter"
+    return "generic"
+
+
+def _between(text: str, start: str, end: str) -> str:
+    begin = text.find(start)
+    if begin < 0:
+        return ""
+    begin += len(start)
+    finish = text.find(end, begin)
+    return text[begin:] if finish < 0 else text[begin:finish]
+
+
+def _jd_analysis(user: str, rng: random.Random) -> str:
+    analysis = _analyze_with_heuristics(_between(user, "Job Description:\n", "\n\nExtract and categorize"))
+    return json.dumps({
+        "required_skills": sorted(analysis.required_skills),
+        "preferred_skills": sorted(analysis.preferred_skills),
+        "responsibilities": analysis.responsibilities,
+        "domain_keywords": sorted(analysis.domain_keywords),
+        "seniority_signals": analysis.seniority_signals,
+    })
+
+
+def _context_analysis(user: str, rng: random.Random) -> str:
+    context = _between(user, "Additional Context: ", "\n").strip()
+    directive = any(word in context.lower() for word in ("make", "emphasize", "focus", "tailor"))
+    return json.dumps({
+        "type": "directive" if directive else "content_statement",
+        "placement": "adaptation_guidance" if directive else "summary",
+        "suggested_text": context,
+        "reasoning": "Mock analysis",
+    })
+
+
+def _requirements(user: str) -> List[str]:
+    line = _between(user, "Given these job requirements: ", "\n")
+    return [req.strip() for req in line.split(",") if req.strip()]
+
+
+def _verdict(skill: str, requirements: List[str], rng: random.Random) -> Dict[str, Any]:
+    lowered = skill.lower()
+    match = next((req for req in requirements if lowered in req.lower() or req.lower() in lowered), None)
+    relevant = match is not None or rng.random() < 0.3
+    return {
+        "relevant": relevant,
+        "type": "direct" if match else "related",
+        "why": "Mock relevance verdict",
+        "match": match or (requirements[0] if requirements and relevant else ""),
+    }
+
+
+def _skill_batch(user: str, rng: random.Random) -> str:
+    requirements = _requirements(user)
+    skills = re.findall(r'^- "(.+)"$', user, re.MULTILINE)
+    return json.dumps([{"skill": skill, **_verdict(skill, requirements, rng)} for skill in skills])
+
+
+def _skill_eval(user: str, rng: random.Random) -> str:
+    skill = _between(user, 'Is the skill "', '" relevant')
+    return json.dumps(_verdict(skill, _requirements(user), rng))
+
+
+def _adaptation_batch(user: str, rng: random.Random) -> str:
+    items = json.loads(_between(user, "Original items (JSON):\n", "\n\nCRITICAL RULES"))
+    return json.dumps([{"id": item["id"], "text": item["text"]} for item in items])
+
+
+def _rewrite(user: str, rng: random.Random) -> str:
+    return user.split("Text to rewrite:\n", 1)[1]
+
+
+def _cover_letter_selection(user: str, rng: random.Random) -> str:
+    indices = [int(idx) for idx in re.findall(r"^\[(\d+)\] ", user, re.MULTILINE)]
+    skills_line = _between(user, "SKILLS: ", "\n")
+    skills = [skill.strip() for skill in skills_line.split(",") if skill.strip()]
+    highlights = re.findall(r"^\s+• (.+)$", user, re.MULTILINE)
+    return json.dumps({
+        "experience_indices": indices[:3],
+        "skill_names": skills[:8],
+        "key_highlights": highlights[:3],
+        "relevance_reasoning": "Mock selection of the most recent experience",
+    })
+
+
+_LETTER_PARAGRAPHS = [
+    "I am writing to apply for the role described in your posting. My recent work has focused on "
+    "building reliable services and shipping features that customers rely on every day.",
+    "In my current position I design and maintain backend systems, review code with my team and "
+    "improve our delivery practices. I enjoy turning ambiguous requirements into clear plans.",
+    "I would welcome the chance to bring this experience to your team and to learn from it. "
+    "Thank you for your time and consideration.",
+]
+
+
+def _cover_letter(user: str, rng: random.Random) -> str:
+    return "\n\n".join(_LETTER_PARAGRAPHS)
+
+
+def _generic(user: str, rng: random.Random) -> str:
+    return "OK"
+
+
+_RESPONDERS = {
+    "jd_analysis": _jd_analysis,
+    "context_analysis": _context_analysis,
+    "skill_batch": _skill_batch,
+    "skill_eval": _skill_eval,
+    "adaptation_batch": _adaptation_batch,
+    "rewrite": _rewrite,
+    "cover_letter_selection": _cover_letter_selection,
+    "cover_letter": _cover_letter,
+    "generic": _generic,
+}
+
+
+def canned_response(kind: str, messages: List[Dict[str, Any]], rng: random.Random) -> str:
+    """Build the deterministic answer for a classified prompt."""
+    return _RESPONDERS[kind](_user_message(messages), rng)
+
+
+def _tokens(text: str) -> int:
+    """Rough token count (4 characters per token)."""
+    return max(1, len(text) // 4)
+
+
+def _prompt_rng(config: MockLLMConfig, seen: Counter, payload: Dict[str, Any]) -> random.Random:
+    """Seed from the prompt and how often it was seen, not from arrival order."""
+    body = json.dumps(payload.get("messages", []), sort_keys=True)
+    seen[body] += 1
+    digest = hashlib.sha256(f"{config.seed}:{seen[body]}:{body}".encode()).digest()
+    return random.Random(int.from_bytes(digest[:8], "big"))
+
+
+def _injected_error(
+    config: MockLLMConfig, kind: str, rng: random.Random, stats: Dict[str, Counter]
+) -> Optional[JSONResponse]:
+    """Return a 503 or 429 response for the configured share of requests, else None."""
+    roll = rng.random()
+    if roll < config.error_rate:
+        stats["errors"][kind] += 1
+        return JSONResponse({"error": {"message": "mock overload"}}, status_code=503)
+    if roll < config.error_rate + config.rate_limit_rate:
+        stats["rate_limited"][kind] += 1
+        return JSONResponse(
+            {"error": {"message": "mock rate limit"}},
+            status_code=429,
+            headers={"retry-after-ms": str(config.retry_after_ms)},
+        )
+    return None
+
+
+def _usage(messages: List[Dict[str, Any]], content: str) -> Dict[str, int]:
+    usage = {
+        "prompt_tokens": sum(_tokens(m.get("content") or "") for m in messages),
+        "completion_tokens": _tokens(content),
+    }
+    usage["total_tokens"] = usage["prompt_tokens"] + usage["completion_tokens"]
+    return usage
+
+
+async def _stream_events(
+    config: MockLLMConfig, model: str, content: str, usage: Optional[Dict[str, int]]
+) -> AsyncIterator[str]:
+    """Server-sent events for ``content``, one word per chunk; ``usage`` goes last when given."""
+    pieces = re.findall(r"\S+\s*", content) or [content]
+    for piece in pieces:
+        chunk = {"object": "chat.completion.chunk", "model": model, "choices": [{"index": 0, "delta": {"content": piece}}]}
+        yield f"data: {json.dumps(chunk)}\n\n"
+        if config.token_ms:
+            await asyncio.sleep(config.token_ms * _tokens(piece) / 1000)
+    if usage is not None:
+        yield f"data: {json.dumps({'object': 'chat.completion.chunk', 'choices': [], 'usage': usage})}\n\n"
+    yield "data: [DONE]\n\n"
+
+
+def create_mock_llm_app(config: MockLLMConfig) -> FastAPI:
+    """Build the ASGI app; ``app.state.stats`` counts requests and injected errors."""
+    app = FastAPI(title="Mock LLM")
+    app.state.stats = {"requests": Counter(), "errors": Counter(), "rate_limited": Counter()}
+    seen: Counter = Counter()
+
+    @app.get("/v1/models")
+    async def models():
+        return {"object": "list", "data": [{"id": "mock", "object": "model"}]}
+
+    @app.get("/mock/stats")
+    async def stats():
+        return {name: dict(counter) for name, counter in app.state.stats.items()}
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        payload = await request.json()
+        messages = payload.get("messages", [])
+        kind = classify_prompt(messages)
+        rng = _prompt_rng(config, seen, payload)
+        app.state.stats["requests"][kind] += 1
+
+        error = _injected_error(config, kind, rng, app.state.stats)
+        if error is not None:
+            return error
+
+        content = canned_response(kind, messages, rng)
+        usage = _usage(messages, content)
+        model = payload.get("model", "mock")
+        await asyncio.sleep(config.sample_latency_s(kind, rng))
+
+        if payload.get("stream"):
+            include_usage = bool((payload.get("stream_options") or {}).get("include_usage"))
+            events = _stream_events(config, model, content, usage if include_usage else None)
+            return StreamingResponse(events, media_type="text/event-stream")
+
+        await asyncio.sleep(config.token_ms * usage["completion_tokens"] / 1000)
+        return {
+            "object": "chat.completion",
+            "model": model,
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+            "usage": usage,
+        }
+
+    return app
+
+
+def _kind_latency(values: List[str]) -> Dict[str, float]:
+    overrides = {}
+    for value in values:
+        kind, _, ms = value.partition("=")
+        if kind not in _RESPONDERS or not ms:
+            raise argparse.ArgumentTypeError(f"expected KIND=MS with KIND in {sorted(_RESPONDERS)}, got {value!r}")
+        overrides[kind] = float(ms)
+    return overrides
+
+
+def add_config_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the mock server's timing and failure options to a parser."""
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="median time to first token")
+    parser.add_argument("--latency-dist", choices=LATENCY_DISTRIBUTIONS, default="fixed")
+    parser.add_argument("--latency-spread", type=float, default=0.5)
+    parser.add_argument("--token-ms", type=float, default=0.0, help="extra time per completion token")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of 503 responses")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="fraction of 429 responses")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--kind-latency", action="append", default=[], metavar="KIND=MS",
+        help="latency override for one prompt kind, e.g. jd_analysis=1500",
+    )
+
+
+def config_from_args(args: argparse.Namespace) -> MockLLMConfig:
+    return MockLLMConfig(
+        latency_ms=args.latency_ms,
+        latency_dist=args.latency_dist,
+        latency_spread=args.latency_spread,
+        token_ms=args.token_ms,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        seed=args.seed,
+        kind_latency_ms=_kind_latency(args.kind_latency),
+    )
+
+
+def main() -> None:
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    add_config_arguments(parser)
+    args = parser.parse_args()
+    uvicorn.run(create_mock_llm_app(config_from_args(args)), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Compare pairwise tech_terms_match loops with TechTermIndex lookups.
+
+Usage::
+
+    python -m backend.benchmarks.tech_terms --skills 300 --requirements 200 --repeat 5
+
+Both approaches must find the same first matching requirement for every skill;
+the run aborts if they disagree.
+"""
+import argparse
+import random
+import statistics
+import time
+from typing import Callable, List, Optional
+
+from backend.services.ai.text import TechTermIndex, tech_terms_match
+
+_NAMES = [
+    "Python", "Django", "FastAPI", "PostgreSQL", "Postgres", "Redis", "Kafka", "Docker",
+    "Kubernetes", "Terraform", "AWS", "AWS Lambda", "GCP", "React", "ReactJS", "React Native",
+    "TypeScript", "JavaScript", "Java", "Node", "Node.js", "NodeJS", "Next.js", "Vue", "VueJS",
+    "GraphQL", "REST API", "REST APIs", "Go", "Golang", "Rust", "Spring", "Spring Boot",
+    "Elasticsearch", "Airflow", "Spark", "pandas", "gRPC", "Tailwind", "Tailwind CSS", "TailwindCSS",
+    "Machine Learning", "Data Engineering", "Cloud Security", "Technical Leadership", "CI/CD",
+    "MongoDB", "MySQL", "Snowflake", "dbt", "Azure DevOps", "DevOps", "Prometheus", "Grafana",
+]
+_QUALIFIERS = ["Advanced", "Distributed", "Cloud", "Streaming", "Realtime", "Platform", "Applied"]
+_NOUNS = ["Systems", "Pipelines", "Services", "Analytics", "Tooling", "Infrastructure", "Design"]
+
+
+def _terms(count: int, rng: random.Random) -> List[str]:
+    """Known tech names mixed with multi-word phrases, like real profiles and JDs."""
+    terms = []
+    for _ in range(count):
+        roll = rng.random()
+        if roll < 0.5:
+            terms.append(rng.choice(_NAMES))
+        elif roll < 0.8:
+            terms.append(f"{rng.choice(_QUALIFIERS)} {rng.choice(_NAMES)}")
+        else:
+            terms.append(f"{rng.choice(_NAMES)} {rng.choice(_NOUNS)}")
+    return terms
+
+
+def _pairwise(skills: List[str], requirements: List[str]) -> List[Optional[str]]:
+    return [next((req for req in requirements if tech_terms_match(skill, req)), None) for skill in skills]
+
+
+def _indexed(skills: List[str], requirements: List[str]) -> List[Optional[str]]:
+    index = TechTermIndex(requirements)
+    return [index.first_match(skill) for skill in skills]
+
+
+def _time(call: Callable[[], object], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        call()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--skills", type=int, default=300)
+    parser.add_argument("--requirements", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    skills = _terms(args.skills, rng)
+    requirements = _terms(args.requirements, rng)
+
+    expected = _pairwise(skills, requirements)
+    if _indexed(skills, requirements) != expected:
+        raise SystemExit("TechTermIndex disagrees with tech_terms_match")
+
+    pairwise_ms = _time(lambda: _pairwise(skills, requirements), args.repeat)
+    indexed_ms = _time(lambda: _indexed(skills, requirements), args.repeat)
+    matched = sum(req is not None for req in expected)
+    print(f"{len(skills)} skills x {len(requirements)} requirements, {matched} skills matched")
+    print(f"pairwise tech_terms_match: {pairwise_ms:8.2f} ms")
+    print(f"TechTermIndex (incl. build): {indexed_ms:8.2f} ms  ({pairwise_ms / indexed_ms:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
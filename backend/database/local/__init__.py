@@ -0,0 +1,45 @@
+"""Local storage backends (SQLite and in-memory) for the queries interface."""
+import os
+import threading
+
+from backend.database.local.memory import MemoryStore
+from backend.database.local.sqlite import SQLiteStore
+from backend.database.local.store import LocalStore
+from backend.database.storage import get_storage_backend
+
+DEFAULT_SQLITE_PATH = "backend/output/cv_pro.sqlite3"
+
+_store: LocalStore | None = None
+_store_lock = threading.Lock()
+
+
+def create_local_store(backend: str | None = None) -> LocalStore:
+    """Build the local store named by ``backend`` (defaults to STORAGE_BACKEND)."""
+    name = backend or get_storage_backend()
+    if name == "memory":
+        return MemoryStore()
+    if name == "sqlite":
+        path = os.getenv("SQLITE_DATABASE_PATH") or DEFAULT_SQLITE_PATH
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        return SQLiteStore(path)
+    raise RuntimeError(f"{name} is not a local storage backend")
+
+
+def get_local_store() -> LocalStore:
+    """Return the process-wide local store."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = create_local_store()
+    return _store
+
+
+__all__ = [
+    "LocalStore",
+    "MemoryStore",
+    "SQLiteStore",
+    "create_local_store",
+    "get_local_store",
+]
@@ -0,0 +1,33 @@
+"""In-memory storage backend."""
+import copy
+from typing import Any, Dict, List
+
+from backend.database.local.store import TABLES, LocalStore
+
+
+class MemoryStore(LocalStore):
+    """Keep rows in process-local dictionaries; nothing survives a restart."""
+
+    def __init__(self):
+        super().__init__()
+        self._tables: Dict[str, Dict[str, Dict[str, Any]]] = {name: {} for name in TABLES}
+
+    def _insert(self, table: str, row: Dict[str, Any]) -> None:
+        self._tables[table][row["id"]] = copy.deepcopy(row)
+
+    def _select(self, table: str, user_id: str, **filters: Any) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = [
+                copy.deepcopy(row)
+                for row in self._tables[table].values()
+                if row["user_id"] == user_id
+                and all(row.get(key) == value for key, value in filters.items())
+            ]
+        rows.sort(key=lambda row: (row["created_at"], row["id"]), reverse=True)
+        return rows
+
+    def _update(self, table: str, row_id: str, fields: Dict[str, Any]) -> None:
+        self._tables[table][row_id].update(copy.deepcopy(fields))
+
+    def _delete(self, table: str, row_id: str) -> None:
+        self._tables[table].pop(row_id, None)
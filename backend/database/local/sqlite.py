@@ -0,0 +1,99 @@
+"""SQLite storage backend."""
+import json
+import sqlite3
+from typing import Any, Dict, List
+
+from backend.database.local.store import TABLES, LocalStore
+
+_COLUMNS = ("id", "user_id", "created_at", "updated_at")
+
+
+class SQLiteStore(LocalStore):
+    """Keep rows in a SQLite database file (or ``:memory:``).
+
+    Key columns are stored as real columns with a (user_id, created_at, id)
+    index; everything else lives in a JSON ``payload`` column.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        super().__init__()
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        for table in TABLES:
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} ("
+                "id TEXT PRIMARY KEY, user_id TEXT NOT NULL, created_at TEXT NOT NULL, "
+                "updated_at TEXT NOT NULL, payload TEXT NOT NULL)"
+            )
+            self._conn.execute(
+                f"CREATE INDEX IF NOT EXISTS {table}_user_created_idx "
+                f"ON {table} (user_id, created_at DESC, id DESC)"
+            )
+
+    @staticmethod
+    def _split(row: Dict[str, Any]):
+        payload = {key: value for key, value in row.items() if key not in _COLUMNS}
+        return [row.get(key) for key in _COLUMNS], json.dumps(payload, default=str)
+
+    @staticmethod
+    def _join(record: sqlite3.Row) -> Dict[str, Any]:
+        row = json.loads(record["payload"])
+        row.update({key: record[key] for key in _COLUMNS})
+        return row
+
+    def _insert(self, table: str, row: Dict[str, Any]) -> None:
+        values, payload = self._split(row)
+        with self._lock:
+            self._conn.execute(
+                f"INSERT INTO {table} (id, user_id, created_at, updated_at, payload) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (*values, payload),
+            )
+
+    def _select(self, table: str, user_id: str, **filters: Any) -> List[Dict[str, Any]]:
+        clauses = ["user_id = ?"]
+        params: List[Any] = [user_id]
+        for key, value in filters.items():
+            if key in _COLUMNS:
+                clauses.append(f"{key} = ?")
+            else:
+                clauses.append("json_extract(payload, ?) = ?")
+                params.append(f"$.{key}")
+            params.append(value)
+        sql = (
+            f"SELECT id, user_id, created_at, updated_at, payload FROM {table} "
+            f"WHERE {' AND '.join(clauses)} ORDER BY created_at DESC, id DESC"
+        )
+        with self._lock:
+            records = self._conn.execute(sql, params).fetchall()
+        return [self._join(record) for record in records]
+
+    def _update(self, table: str, row_id: str, fields: Dict[str, Any]) -> None:
+        with self._lock:
+            record = self._conn.execute(
+                f"SELECT id, user_id, created_at, updated_at, payload FROM {table} WHERE id = ?",
+                (row_id,),
+            ).fetchone()
+            if record is None:
+                return
+            values, payload = self._split({**self._join(record), **fields})
+            self._conn.execute(
+                f"UPDATE {table} SET updated_at = ?, payload = ? WHERE id = ?",
+                (values[3], payload, row_id),
+            )
+
+    def _delete(self, table: str, row_id: str) -> None:
+        with self._lock:
+            self._conn.execute(f"DELETE FROM {table} WHERE id = ?", (row_id,))
+
+    def ping(self) -> bool:
+        with self._lock:
+            self._conn.execute("SELECT 1").fetchone()
+        return True
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
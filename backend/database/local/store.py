@@ -0,0 +1,364 @@
+"""Query implementation shared by the local storage backends.
+
+Subclasses provide four row primitives (insert, select, update, delete); this
+class layers the ``backend.database.queries`` functions on top of them with the
+same signatures, return shapes and per-user scoping as the Supabase backend.
+"""
+import threading
+import uuid
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional
+
+from backend.database.supabase.cv_search import cv_matches
+from backend.database.supabase.pagination import (
+    decode_cursor,
+    resolve_count_mode,
+    split_page,
+)
+from backend.database.supabase.rows import (
+    build_cv_list_item,
+    build_cv_response,
+    build_profile_response,
+)
+from backend.database.supabase.utils import require_user_id
+
+TABLES = ("cvs", "cover_letters", "cv_profiles")
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _contains(value: Any, needle: str) -> bool:
+    return needle in str(value or "").lower()
+
+
+def _build_cover_letter_list_item(row: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "cover_letter_id": row.get("id"),
+        "created_at": row.get("created_at"),
+        "updated_at": row.get("updated_at"),
+        "company_name": row.get("company_name"),
+        "hiring_manager_name": row.get("hiring_manager_name"),
+        "tone": row.get("tone"),
+    }
+
+
+def _build_cover_letter_response(row: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        **_build_cover_letter_list_item(row),
+        "job_description": row.get("job_description"),
+        "company_address": row.get("company_address"),
+        "cover_letter_html": row.get("cover_letter_html"),
+        "cover_letter_text": row.get("cover_letter_text"),
+        "highlights_used": row.get("highlights_used", []),
+        "selected_experiences": row.get("selected_experiences", []),
+        "selected_skills": row.get("selected_skills", []),
+    }
+
+
+def _cv_payload(cv_data: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "theme": cv_data.get("theme", "classic"),
+        "layout": cv_data.get("layout", "classic-two-column"),
+        "target_company": cv_data.get("target_company"),
+        "target_role": cv_data.get("target_role"),
+        "cv_data": cv_data,
+    }
+
+
+class LocalStore(ABC):
+    """Base class for stores that keep rows on this machine."""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+
+    # Row primitives -----------------------------------------------------
+
+    @abstractmethod
+    def _insert(self, table: str, row: Dict[str, Any]) -> None:
+        """Store a new row."""
+
+    @abstractmethod
+    def _select(self, table: str, user_id: str, **filters: Any) -> List[Dict[str, Any]]:
+        """Return a user's rows matching ``filters``, newest first by (created_at, id)."""
+
+    @abstractmethod
+    def _update(self, table: str, row_id: str, fields: Dict[str, Any]) -> None:
+        """Update fields of an existing row."""
+
+    @abstractmethod
+    def _delete(self, table: str, row_id: str) -> None:
+        """Delete a row."""
+
+    def ping(self) -> bool:
+        """Return True when the store is reachable."""
+        return True
+
+    def close(self) -> None:
+        """Release any resources held by the store."""
+
+    # Helpers ------------------------------------------------------------
+
+    def _create_row(self, table: str, user_id: str, fields: Dict[str, Any]) -> Dict[str, Any]:
+        timestamp = _now()
+        row = {
+            "id": fields.pop("id", None) or str(uuid.uuid4()),
+            "user_id": user_id,
+            "created_at": fields.pop("created_at", None) or timestamp,
+            "updated_at": timestamp,
+            **fields,
+        }
+        with self._lock:
+            self._insert(table, row)
+        return row
+
+    def _first(self, table: str, user_id: str, **filters: Any) -> Optional[Dict[str, Any]]:
+        rows = self._select(table, user_id, **filters)
+        return rows[0] if rows else None
+
+    def _update_owned(self, table: str, row_id: str, fields: Dict[str, Any]) -> bool:
+        user_id = require_user_id()
+        with self._lock:
+            if not self._select(table, user_id, id=row_id):
+                return False
+            self._update(table, row_id, {**fields, "updated_at": _now()})
+        return True
+
+    def _delete_owned(self, table: str, user_id: str, **filters: Any) -> bool:
+        with self._lock:
+            rows = self._select(table, user_id, **filters)
+            for row in rows:
+                self._delete(table, row["id"])
+        return bool(rows)
+
+    @staticmethod
+    def _page(
+        rows: List[Dict[str, Any]],
+        limit: int,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+    ):
+        if cursor:
+            position = decode_cursor(cursor)
+            rows = [row for row in rows if (row["created_at"], row["id"]) < position]
+            offset = 0
+        return split_page(rows[offset : offset + limit + 1], limit)
+
+    # CVs ----------------------------------------------------------------
+
+    def create_cv(self, cv_data: Dict[str, Any]) -> str:
+        user_id = require_user_id(cv_data.get("user_id"))
+        return self._create_row("cvs", user_id, _cv_payload(cv_data))["id"]
+
+    def get_cv_by_id(self, cv_id: str) -> Optional[Dict[str, Any]]:
+        row = self._first("cvs", require_user_id(), id=cv_id)
+        return build_cv_response(row) if row else None
+
+    def get_cv_by_filename(self, filename: str) -> Optional[Dict[str, Any]]:
+        row = self._first("cvs", require_user_id(), filename=filename)
+        return build_cv_response(row) if row else None
+
+    def _filter_cvs(self, user_id: str, search: Optional[str]) -> List[Dict[str, Any]]:
+        rows = self._select("cvs", user_id)
+        if not search:
+            return rows
+        needle = search.lower()
+        matches = []
+        for row in rows:
+            personal_info = (row.get("cv_data") or {}).get("personal_info") or {}
+            if _contains(personal_info.get("name"), needle) or _contains(
+                personal_info.get("email"), needle
+            ):
+                matches.append(row)
+        return matches
+
+    def list_cvs(
+        self,
+        limit: int = 50,
+        offset: int = 0,
+        search: Optional[str] = None,
+        cursor: Optional[str] = None,
+        count: Optional[str] = "exact",
+    ) -> Dict[str, Any]:
+        count_mode = resolve_count_mode(count)
+        rows = self._filter_cvs(require_user_id(), search)
+        page, next_cursor = self._page(rows, limit, offset=offset, cursor=cursor)
+        return {
+            "cvs": [build_cv_list_item(row) for row in page],
+            "total": len(rows) if count_mode is not None else None,
+            "next_cursor": next_cursor,
+        }
+
+    def iter_cvs(
+        self,
+        search: Optional[str] = None,
+        user_id: Optional[str] = None,
+        page_size: int = 200,
+        full: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        build = build_cv_response if full else build_cv_list_item
+        for row in self._filter_cvs(require_user_id(user_id), search):
+            yield build(row)
+
+    def update_cv(self, cv_id: str, cv_data: Dict[str, Any]) -> bool:
+        return self._update_owned("cvs", cv_id, _cv_payload(cv_data))
+
+    def set_cv_filename(self, cv_id: str, filename: str) -> bool:
+        return self._update_owned("cvs", cv_id, {"filename": filename})
+
+    def delete_cv(self, cv_id: str) -> bool:
+        return self._delete_owned("cvs", require_user_id(), id=cv_id)
+
+    def search_cvs(
+        self,
+        skills: Optional[List[str]] = None,
+        experience_keywords: Optional[List[str]] = None,
+        education_keywords: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        if not any([skills, experience_keywords, education_keywords]):
+            return []
+        terms = [term.lower() for term in (skills or [])]
+        exp_terms = [term.lower() for term in (experience_keywords or [])]
+        edu_terms = [term.lower() for term in (education_keywords or [])]
+        results = []
+        for row in self._select("cvs", require_user_id())[:500]:
+            cv_data = row.get("cv_data") or {}
+            if cv_matches(cv_data, terms, exp_terms, edu_terms):
+                results.append(
+                    {
+                        "cv_id": row.get("id"),
+                        "created_at": row.get("created_at"),
+                        "person_name": (cv_data.get("personal_info") or {}).get("name"),
+                    }
+                )
+        return results
+
+    # Cover letters ------------------------------------------------------
+
+    def create_cover_letter(
+        self,
+        cover_letter_id: str,
+        created_at: str,
+        job_description: str,
+        company_name: str,
+        hiring_manager_name: Optional[str],
+        company_address: Optional[str],
+        tone: str,
+        cover_letter_html: str,
+        cover_letter_text: str,
+        highlights_used: list[str],
+        selected_experiences: list[str],
+        selected_skills: list[str],
+        user_id: Optional[str] = None,
+        profile_id: Optional[str] = None,
+        cv_id: Optional[str] = None,
+    ) -> str:
+        row = self._create_row(
+            "cover_letters",
+            require_user_id(user_id),
+            {
+                "id": cover_letter_id,
+                "created_at": created_at,
+                "profile_id": profile_id,
+                "cv_id": cv_id,
+                "job_description": job_description,
+                "company_name": company_name,
+                "hiring_manager_name": hiring_manager_name,
+                "company_address": company_address,
+                "tone": tone,
+                "cover_letter_html": cover_letter_html,
+                "cover_letter_text": cover_letter_text,
+                "highlights_used": highlights_used,
+                "selected_experiences": selected_experiences,
+                "selected_skills": selected_skills,
+            },
+        )
+        return row["id"]
+
+    def list_cover_letters(
+        self,
+        limit: int = 50,
+        offset: int = 0,
+        search: Optional[str] = None,
+        cursor: Optional[str] = None,
+        count: Optional[str] = "exact",
+    ) -> Dict[str, Any]:
+        count_mode = resolve_count_mode(count)
+        rows = self._select("cover_letters", require_user_id())
+        if search:
+            needle = search.lower()
+            rows = [
+                row
+                for row in rows
+                if _contains(row.get("company_name"), needle)
+                or _contains(row.get("job_description"), needle)
+            ]
+        page, next_cursor = self._page(rows, limit, offset=offset, cursor=cursor)
+        return {
+            "cover_letters": [_build_cover_letter_list_item(row) for row in page],
+            "total": len(rows) if count_mode is not None else None,
+            "next_cursor": next_cursor,
+        }
+
+    def get_cover_letter_by_id(self, cover_letter_id: str) -> Optional[Dict[str, Any]]:
+        row = self._first("cover_letters", require_user_id(), id=cover_letter_id)
+        return _build_cover_letter_response(row) if row else None
+
+    def delete_cover_letter(self, cover_letter_id: str) -> bool:
+        return self._delete_owned("cover_letters", require_user_id(), id=cover_letter_id)
+
+    # Profiles -----------------------------------------------------------
+
+    def _profiles(self, user_id: str, **filters: Any) -> List[Dict[str, Any]]:
+        rows = self._select("cv_profiles", user_id, **filters)
+        return sorted(rows, key=lambda row: row["updated_at"], reverse=True)
+
+    def save_profile(self, profile_data: Dict[str, Any]) -> bool:
+        user_id = require_user_id(profile_data.get("user_id"))
+        with self._lock:
+            existing = self._profiles(user_id)
+            if existing:
+                self._update(
+                    "cv_profiles",
+                    existing[0]["id"],
+                    {"profile_data": profile_data, "updated_at": _now()},
+                )
+            else:
+                self._create_row("cv_profiles", user_id, {"profile_data": profile_data})
+        return True
+
+    def get_profile(self) -> Optional[Dict[str, Any]]:
+        rows = self._profiles(require_user_id())
+        return build_profile_response(rows[0]) if rows else None
+
+    def list_profiles(self) -> List[Dict[str, Any]]:
+        return [
+            {
+                "name": ((row.get("profile_data") or {}).get("personal_info") or {}).get(
+                    "name", "Unknown"
+                ),
+                "updated_at": row.get("updated_at"),
+            }
+            for row in self._profiles(require_user_id())
+        ]
+
+    def get_profile_by_updated_at(self, updated_at: str) -> Optional[Dict[str, Any]]:
+        rows = self._profiles(require_user_id(), updated_at=updated_at)
+        return build_profile_response(rows[0]) if rows else None
+
+    def delete_profile_by_updated_at(self, updated_at: str) -> bool:
+        return self._delete_owned("cv_profiles", require_user_id(), updated_at=updated_at)
+
+    def delete_profile(self) -> bool:
+        user_id = require_user_id()
+        with self._lock:
+            rows = self._profiles(user_id)
+            if not rows:
+                return False
+            self._delete("cv_profiles", rows[0]["id"])
+        return True
+
+    create_profile = save_profile
+    update_profile = save_profile
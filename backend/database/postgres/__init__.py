@@ -0,0 +1,12 @@
+"""Optional direct Postgres (asyncpg) path for hot read queries."""
+from backend.database.postgres.pool import close_pool, get_pool, is_enabled
+from backend.database.postgres.queries import get_cv_by_id, get_profile, list_cvs
+
+__all__ = [
+    "close_pool",
+    "get_pool",
+    "is_enabled",
+    "get_cv_by_id",
+    "get_profile",
+    "list_cvs",
+]
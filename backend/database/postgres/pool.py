@@ -0,0 +1,73 @@
+"""Optional asyncpg connection pool for direct Postgres reads.
+
+Enabled when ``DATABASE_URL`` is set and ``asyncpg`` is installed. Without
+either, callers fall back to the PostgREST (Supabase) queries.
+"""
+import asyncio
+import json
+import logging
+import os
+from typing import Any, Optional
+
+from backend.env import env_int
+
+try:
+    import asyncpg
+except ImportError:  # pragma: no cover - exercised only without the optional dependency
+    asyncpg = None
+
+logger = logging.getLogger(__name__)
+
+_pool: Optional[Any] = None
+_pool_lock: Optional[asyncio.Lock] = None
+_warned_missing_driver = False
+
+
+def is_enabled() -> bool:
+    """Return True when the direct Postgres path is configured and available."""
+    global _warned_missing_driver
+    if not os.getenv("DATABASE_URL"):
+        return False
+    if asyncpg is None:
+        if not _warned_missing_driver:
+            logger.warning("DATABASE_URL is set but asyncpg is not installed; using PostgREST")
+            _warned_missing_driver = True
+        return False
+    return True
+
+
+async def _init_connection(conn) -> None:
+    for type_name in ("json", "jsonb"):
+        await conn.set_type_codec(
+            type_name, encoder=json.dumps, decoder=json.loads, schema="pg_catalog"
+        )
+
+
+async def get_pool():
+    """Return the shared pool, creating it on first use."""
+    global _pool, _pool_lock
+    if _pool is not None:
+        return _pool
+    if _pool_lock is None:
+        _pool_lock = asyncio.Lock()
+    async with _pool_lock:
+        if _pool is None:
+            _pool = await asyncpg.create_pool(
+                os.environ["DATABASE_URL"],
+                min_size=env_int("DATABASE_POOL_MIN_SIZE", 1),
+                max_size=env_int("DATABASE_POOL_MAX_SIZE", 10),
+                # Transaction-mode poolers (pgbouncer, Supavisor) cannot keep
+                # prepared statements, so the cache size is configurable.
+                statement_cache_size=env_int("DATABASE_STATEMENT_CACHE_SIZE", 100),
+                init=_init_connection,
+            )
+            logger.info("Opened direct Postgres connection pool")
+    return _pool
+
+
+async def close_pool() -> None:
+    """Close the shared pool if it was opened."""
+    global _pool, _pool_lock
+    pool, _pool, _pool_lock = _pool, None, None
+    if pool is not None:
+        await pool.close()
@@ -0,0 +1,144 @@
+"""Hot read queries served directly from Postgres.
+
+Each query mirrors its Supabase counterpart: same arguments, same return
+shape and the same ``user_id`` scoping that ``apply_user_scope`` adds.
+"""
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from backend.database.postgres.pool import get_pool
+from backend.database.supabase.pagination import (
+    decode_cursor,
+    resolve_count_mode,
+    split_page,
+)
+from backend.database.supabase.profile_cache import (
+    cache_generation,
+    cached_profile,
+    store_profile,
+)
+from backend.database.supabase.rows import (
+    build_cv_list_item,
+    build_cv_response,
+    build_profile_response,
+)
+from backend.database.supabase.utils import require_user_id
+
+_LIST_COLUMNS = "id, created_at, updated_at, filename, target_company, target_role, cv_data"
+
+
+def _normalize(record) -> Dict[str, Any]:
+    """Convert a record to the JSON-compatible shape PostgREST returns."""
+    row = {}
+    for key, value in dict(record).items():
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        elif isinstance(value, UUID):
+            value = str(value)
+        row[key] = value
+    return row
+
+
+def _as_uuid(value: str) -> Optional[UUID]:
+    try:
+        return UUID(str(value))
+    except ValueError:
+        return None
+
+
+def _cv_filters(
+    user_id: str, search: Optional[str], cursor: Optional[str]
+) -> Tuple[List[str], List[Any]]:
+    clauses = ["user_id = $1::uuid"]
+    params: List[Any] = [user_id]
+    if search:
+        params.append(f"%{search}%")
+        clauses.append(
+            f"(cv_data->'personal_info'->>'name' ilike ${len(params)}"
+            f" or cv_data->'personal_info'->>'email' ilike ${len(params)})"
+        )
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        params.append(datetime.fromisoformat(created_at.replace("Z", "+00:00")))
+        params.append(UUID(row_id))
+        clauses.append(f"(created_at, id) < (${len(params) - 1}, ${len(params)})")
+    return clauses, params
+
+
+async def _count(conn, where: str, params: List[Any], count_mode: str) -> int:
+    if count_mode == "exact":
+        return await conn.fetchval(f"select count(*) from cvs where {where}", *params)
+    plan = await conn.fetchval(
+        f"explain (format json) select 1 from cvs where {where}", *params
+    )
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def get_cv_by_id(cv_id: str) -> Optional[Dict[str, Any]]:
+    user_id = require_user_id()
+    row_id = _as_uuid(cv_id)
+    if row_id is None:
+        return None
+    pool = await get_pool()
+    record = await pool.fetchrow(
+        "select * from cvs where id = $1 and user_id = $2::uuid limit 1",
+        row_id,
+        user_id,
+    )
+    if record is None:
+        return None
+    return build_cv_response(_normalize(record))
+
+
+async def get_profile() -> Optional[Dict[str, Any]]:
+    user_id = require_user_id()
+    cached = cached_profile(user_id)
+    if cached is not None:
+        return cached
+    generation = cache_generation(user_id)
+    pool = await get_pool()
+    record = await pool.fetchrow(
+        "select profile_data, updated_at from cv_profiles where user_id = $1::uuid "
+        "order by updated_at desc limit 1",
+        user_id,
+    )
+    if record is None:
+        return None
+    profile = build_profile_response(_normalize(record))
+    store_profile(user_id, profile, generation)
+    return profile
+
+
+async def list_cvs(
+    limit: int = 50,
+    offset: int = 0,
+    search: Optional[str] = None,
+    cursor: Optional[str] = None,
+    count: Optional[str] = "exact",
+) -> Dict[str, Any]:
+    user_id = require_user_id()
+    count_mode = resolve_count_mode(count)
+    clauses, params = _cv_filters(user_id, search, cursor)
+    where = " and ".join(clauses)
+    page_params = [*params, limit + 1, 0 if cursor else offset]
+    sql = (
+        f"select {_LIST_COLUMNS} from cvs where {where} "
+        f"order by created_at desc, id desc limit ${len(params) + 1} offset ${len(params) + 2}"
+    )
+    pool = await get_pool()
+    async with pool.acquire() as conn:
+        records = await conn.fetch(sql, *page_params)
+        total = None
+        if count_mode is not None:
+            count_clauses, count_params = _cv_filters(user_id, search, None)
+            total = await _count(conn, " and ".join(count_clauses), count_params, count_mode)
+    rows, next_cursor = split_page([_normalize(record) for record in records], limit)
+    return {
+        "cvs": [build_cv_list_item(row) for row in rows],
+        "total": total,
+        "next_cursor": next_cursor,
+    }
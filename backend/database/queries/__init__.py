@@ -1,31 +1,88 @@
-"""Supabase database query modules."""
-from backend.database.supabase import (
-    create_cover_letter,
-    create_cv,
-    create_profile,
-    delete_cover_letter,
-    delete_cv,
-    delete_profile,
-    delete_profile_by_updated_at,
-    get_cover_letter_by_id,
-    get_cv_by_filename,
-    get_cv_by_id,
-    get_profile,
-    get_profile_by_updated_at,
-    list_cover_letters,
-    list_cvs,
-    list_profiles,
-    save_profile,
-    search_cvs,
-    set_cv_filename,
-    update_cv,
-    update_profile,
-)
+"""Database query functions for the configured storage backend.
+
+Supabase is the default. ``STORAGE_BACKEND=sqlite`` or ``memory`` serves the
+same functions from a local store so rendering, AI and PDF throughput can be
+measured without a Supabase stack.
+
+The ``a``-prefixed coroutines serve the hottest reads. They use the direct
+Postgres pool when ``DATABASE_URL`` is configured and otherwise run the
+regular query in a worker thread so the event loop is not blocked.
+"""
+import asyncio
+from typing import Any, Dict, Optional
+
+from backend.database import postgres
+from backend.database.storage import is_local_storage
+from backend.database import supabase as _supabase
+
+# Pick the backend once; every query function below is bound from it
+if is_local_storage():
+    from backend.database.local import get_local_store
+
+    _backend = get_local_store()
+else:
+    _backend = _supabase
+
+create_cover_letter = _backend.create_cover_letter
+create_cv = _backend.create_cv
+create_profile = _backend.create_profile
+delete_cover_letter = _backend.delete_cover_letter
+delete_cv = _backend.delete_cv
+delete_profile = _backend.delete_profile
+delete_profile_by_updated_at = _backend.delete_profile_by_updated_at
+get_cover_letter_by_id = _backend.get_cover_letter_by_id
+get_cv_by_filename = _backend.get_cv_by_filename
+get_cv_by_id = _backend.get_cv_by_id
+iter_cvs = _backend.iter_cvs
+get_profile = _backend.get_profile
+get_profile_by_updated_at = _backend.get_profile_by_updated_at
+list_cover_letters = _backend.list_cover_letters
+list_cvs = _backend.list_cvs
+list_profiles = _backend.list_profiles
+save_profile = _backend.save_profile
+search_cvs = _backend.search_cvs
+set_cv_filename = _backend.set_cv_filename
+update_cv = _backend.update_cv
+update_profile = _backend.update_profile
+
+
+def _use_postgres() -> bool:
+    return not is_local_storage() and postgres.is_enabled()
+
+
+async def aget_cv_by_id(cv_id: str) -> Optional[Dict[str, Any]]:
+    if _use_postgres():
+        return await postgres.get_cv_by_id(cv_id)
+    return await asyncio.to_thread(get_cv_by_id, cv_id)
+
+
+async def aget_profile() -> Optional[Dict[str, Any]]:
+    if _use_postgres():
+        return await postgres.get_profile()
+    return await asyncio.to_thread(get_profile)
+
+
+async def alist_cvs(
+    limit: int = 50,
+    offset: int = 0,
+    search: Optional[str] = None,
+    cursor: Optional[str] = None,
+    count: Optional[str] = "exact",
+) -> Dict[str, Any]:
+    kwargs = {"limit": limit, "offset": offset, "search": search, "cursor": cursor, "count": count}
+    if _use_postgres():
+        return await postgres.list_cvs(**kwargs)
+    return await asyncio.to_thread(list_cvs, **kwargs)
+
 
 __all__ = [
+    "aget_cv_by_id",
+    "aget_profile",
+    "alist_cvs",
     "create_cv",
     "create_cover_letter",
     "get_cv_by_id",
+    "iter_cvs",
     "get_cv_by_filename",
     "get_cover_letter_by_id",
     "list_cvs",
@@ -0,0 +1,19 @@
+"""Storage backend selection."""
+import os
+
+STORAGE_BACKENDS = ("supabase", "sqlite", "memory")
+
+
+def get_storage_backend() -> str:
+    """Return the configured storage backend name (``STORAGE_BACKEND``)."""
+    name = (os.getenv("STORAGE_BACKEND") or "supabase").strip().lower()
+    if name not in STORAGE_BACKENDS:
+        raise RuntimeError(
+            f"Unknown STORAGE_BACKEND {name!r}; expected one of {', '.join(STORAGE_BACKENDS)}"
+        )
+    return name
+
+
+def is_local_storage() -> bool:
+    """Return True when queries are served by a local (non-Supabase) store."""
+    return get_storage_backend() != "supabase"
@@ -4,6 +4,7 @@ from backend.database.supabase.cv import (
     delete_cv,
     get_cv_by_filename,
     get_cv_by_id,
+    iter_cvs,
     list_cvs,
     set_cv_filename,
     update_cv,
@@ -32,6 +33,7 @@ __all__ = [
     "delete_cv",
     "get_cv_by_filename",
     "get_cv_by_id",
+    "iter_cvs",
     "list_cvs",
     "search_cvs",
     "set_cv_filename",
@@ -1,6 +1,11 @@
 """Supabase-backed cover letter queries."""
 from typing import Any, Dict, Optional
 from backend.database.supabase.client import get_admin_client
+from backend.database.supabase.pagination import (
+    apply_page,
+    resolve_count_mode,
+    split_page,
+)
 from backend.database.supabase.utils import apply_user_scope, require_user_id
 
 
@@ -47,15 +52,15 @@ def create_cover_letter(
     return row["id"]
 
 
-def list_cover_letters(
-    limit: int = 50, offset: int = 0, search: Optional[str] = None
-) -> Dict[str, Any]:
+def _cover_letter_query(
+    columns: str,
+    user_id: str,
+    search: Optional[str] = None,
+    count_mode: Optional[str] = None,
+    head: Optional[bool] = None,
+):
     client = get_admin_client()
-    user_id = require_user_id()
-    query = client.table("cover_letters").select(
-        "id, created_at, updated_at, company_name, hiring_manager_name, tone",
-        count="exact",
-    )
+    query = client.table("cover_letters").select(columns, count=count_mode, head=head)
     query = apply_user_scope(query, user_id)
     if search:
         pattern = f"%{search}%"
@@ -64,10 +69,37 @@ def list_cover_letters(
                 pattern, pattern
             )
         )
-    query = query.order("created_at", desc=True).range(offset, offset + limit - 1)
+    return query
+
+
+def list_cover_letters(
+    limit: int = 50,
+    offset: int = 0,
+    search: Optional[str] = None,
+    cursor: Optional[str] = None,
+    count: Optional[str] = "exact",
+) -> Dict[str, Any]:
+    user_id = require_user_id()
+    count_mode = resolve_count_mode(count)
+    # The total covers the whole filter; counting the page query under a
+    # cursor would only count the rows after it
+    query = _cover_letter_query(
+        "id, created_at, updated_at, company_name, hiring_manager_name, tone",
+        user_id,
+        search,
+        count_mode=None if cursor else count_mode,
+    )
+    query = apply_page(query, limit, offset=offset, cursor=cursor)
     response = query.execute()
-    rows = response.data or []
-    total = response.count if response.count is not None else len(rows)
+    rows, next_cursor = split_page(response.data or [], limit)
+    row_count = response.count
+    if cursor and count_mode is not None:
+        row_count = _cover_letter_query(
+            "id", user_id, search, count_mode=count_mode, head=True
+        ).execute().count
+    total = None
+    if count_mode is not None:
+        total = row_count if row_count is not None else len(rows)
     cover_letters = []
     for row in rows:
         cover_letters.append(
@@ -80,7 +112,11 @@ def list_cover_letters(
                 "tone": row.get("tone"),
             }
         )
-    return {"cover_letters": cover_letters, "total": total}
+    return {
+        "cover_letters": cover_letters,
+        "total": total,
+        "next_cursor": next_cursor,
+    }
 
 
 def get_cover_letter_by_id(cover_letter_id: str) -> Optional[Dict[str, Any]]:
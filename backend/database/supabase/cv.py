@@ -1,28 +1,15 @@
 """Supabase-backed CV queries."""
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, Optional
 from backend.database.supabase.client import get_admin_client
+from backend.database.supabase.pagination import (
+    apply_page,
+    resolve_count_mode,
+    split_page,
+)
+from backend.database.supabase.rows import build_cv_list_item, build_cv_response
 from backend.database.supabase.utils import apply_user_scope, require_user_id
 
 
-def _build_cv_response(row: Dict[str, Any]) -> Dict[str, Any]:
-    cv_data = row.get("cv_data") or {}
-    personal_info = cv_data.get("personal_info") or {}
-    return {
-        "cv_id": row.get("id"),
-        "created_at": row.get("created_at"),
-        "updated_at": row.get("updated_at"),
-        "filename": row.get("filename"),
-        "theme": row.get("theme") or cv_data.get("theme", "classic"),
-        "layout": row.get("layout") or cv_data.get("layout", "classic-two-column"),
-        "target_company": row.get("target_company"),
-        "target_role": row.get("target_role"),
-        "personal_info": personal_info,
-        "experience": cv_data.get("experience", []),
-        "education": cv_data.get("education", []),
-        "skills": cv_data.get("skills", []),
-    }
-
-
 def create_cv(cv_data: Dict[str, Any]) -> str:
     client = get_admin_client()
     user_id = require_user_id(cv_data.get("user_id"))
@@ -49,7 +36,7 @@ def get_cv_by_id(cv_id: str) -> Optional[Dict[str, Any]]:
     response = query.execute()
     if not response.data:
         return None
-    return _build_cv_response(response.data[0])
+    return build_cv_response(response.data[0])
 
 
 def get_cv_by_filename(filename: str) -> Optional[Dict[str, Any]]:
@@ -60,18 +47,18 @@ def get_cv_by_filename(filename: str) -> Optional[Dict[str, Any]]:
     response = query.execute()
     if not response.data:
         return None
-    return _build_cv_response(response.data[0])
+    return build_cv_response(response.data[0])
 
 
-def list_cvs(
-    limit: int = 50, offset: int = 0, search: Optional[str] = None
-) -> Dict[str, Any]:
+def _cv_query(
+    columns: str,
+    user_id: str,
+    search: Optional[str] = None,
+    count_mode: Optional[str] = None,
+    head: Optional[bool] = None,
+):
     client = get_admin_client()
-    user_id = require_user_id()
-    query = client.table("cvs").select(
-        "id, created_at, updated_at, filename, target_company, target_role, cv_data",
-        count="exact",
-    )
+    query = client.table("cvs").select(columns, count=count_mode, head=head)
     query = apply_user_scope(query, user_id)
     if search:
         pattern = f"%{search}%"
@@ -79,26 +66,82 @@ def list_cvs(
             "cv_data->personal_info->>name.ilike.{},"
             "cv_data->personal_info->>email.ilike.{}".format(pattern, pattern)
         )
-    query = query.order("created_at", desc=True).range(offset, offset + limit - 1)
+    return query
+
+
+def _fetch_cv_page(
+    columns: str,
+    user_id: str,
+    limit: int,
+    offset: int = 0,
+    search: Optional[str] = None,
+    cursor: Optional[str] = None,
+    count_mode: Optional[str] = None,
+):
+    # The total covers the whole filter; counting the page query under a
+    # cursor would only count the rows after it
+    page_count_mode = None if cursor else count_mode
+    query = _cv_query(columns, user_id, search, count_mode=page_count_mode)
+    query = apply_page(query, limit, offset=offset, cursor=cursor)
     response = query.execute()
-    rows = response.data or []
-    total = response.count if response.count is not None else len(rows)
-    cvs = []
-    for row in rows:
-        cv_data = row.get("cv_data") or {}
-        personal_info = cv_data.get("personal_info") or {}
-        cvs.append(
-            {
-                "cv_id": row.get("id"),
-                "created_at": row.get("created_at"),
-                "updated_at": row.get("updated_at"),
-                "person_name": personal_info.get("name"),
-                "filename": row.get("filename"),
-                "target_company": row.get("target_company"),
-                "target_role": row.get("target_role"),
-            }
+    rows, next_cursor = split_page(response.data or [], limit)
+    row_count = response.count
+    if cursor and count_mode is not None:
+        row_count = _cv_query("id", user_id, search, count_mode=count_mode, head=True).execute().count
+    return rows, next_cursor, row_count
+
+
+def list_cvs(
+    limit: int = 50,
+    offset: int = 0,
+    search: Optional[str] = None,
+    cursor: Optional[str] = None,
+    count: Optional[str] = "exact",
+) -> Dict[str, Any]:
+    user_id = require_user_id()
+    count_mode = resolve_count_mode(count)
+    rows, next_cursor, row_count = _fetch_cv_page(
+        "id, created_at, updated_at, filename, target_company, target_role, cv_data",
+        user_id,
+        limit,
+        offset=offset,
+        search=search,
+        cursor=cursor,
+        count_mode=count_mode,
+    )
+    total = None
+    if count_mode is not None:
+        total = row_count if row_count is not None else len(rows)
+    cvs = [build_cv_list_item(row) for row in rows]
+    return {"cvs": cvs, "total": total, "next_cursor": next_cursor}
+
+
+def iter_cvs(
+    search: Optional[str] = None,
+    user_id: Optional[str] = None,
+    page_size: int = 200,
+    full: bool = False,
+) -> Iterator[Dict[str, Any]]:
+    """Yield every CV of a user, fetching one keyset page at a time.
+
+    Yields list items by default, or complete CV payloads when ``full`` is set.
+    """
+    owner_id = require_user_id(user_id)
+    columns = (
+        "*"
+        if full
+        else "id, created_at, updated_at, filename, target_company, target_role, cv_data"
+    )
+    build = build_cv_response if full else build_cv_list_item
+    cursor = None
+    while True:
+        rows, cursor, _ = _fetch_cv_page(
+            columns, owner_id, page_size, search=search, cursor=cursor
         )
-    return {"cvs": cvs, "total": total}
+        for row in rows:
+            yield build(row)
+        if not cursor:
+            return
 
 
 def update_cv(cv_id: str, cv_data: Dict[str, Any]) -> bool:
@@ -8,7 +8,7 @@ def _match_any(value: str, terms: List[str]) -> bool:
     return any(term in value for term in terms)
 
 
-def _cv_matches(
+def cv_matches(
     cv_data: Dict[str, Any],
     skills: List[str],
     experience_keywords: List[str],
@@ -59,7 +59,7 @@ def search_cvs(
     results = []
     for row in rows:
         cv_data = row.get("cv_data") or {}
-        if _cv_matches(cv_data, terms, exp_terms, edu_terms):
+        if cv_matches(cv_data, terms, exp_terms, edu_terms):
             personal_info = cv_data.get("personal_info") or {}
             results.append(
                 {
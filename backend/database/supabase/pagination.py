@@ -0,0 +1,65 @@
+"""Keyset pagination helpers for Supabase list queries."""
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+COUNT_MODES = ("exact", "planned", "estimated")
+
+
+def resolve_count_mode(count: Optional[str]) -> Optional[str]:
+    """Map the public count option to a PostgREST count method (None disables counting)."""
+    if count is None or count == "none":
+        return None
+    if count not in COUNT_MODES:
+        raise ValueError(f"Invalid count mode: {count}")
+    return count
+
+
+def encode_cursor(row: Dict[str, Any]) -> str:
+    """Build an opaque cursor pointing after the given row."""
+    raw = json.dumps([row.get("created_at"), row.get("id")], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, str]:
+    """Decode and validate a cursor into its (created_at, id) position."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        datetime.fromisoformat(str(created_at).replace("Z", "+00:00"))
+        row_id = str(UUID(str(row_id)))
+    except (binascii.Error, UnicodeError, TypeError, ValueError) as exc:
+        raise ValueError("Invalid cursor") from exc
+    return str(created_at), row_id
+
+
+def apply_page(
+    query, limit: int, offset: int = 0, cursor: Optional[str] = None
+):
+    """Order by (created_at, id) descending and select one extra row for look-ahead.
+
+    With a cursor the query seeks past the cursor position instead of skipping
+    ``offset`` rows, so the cost of a page does not grow with its depth.
+    """
+    query = query.order("created_at", desc=True).order("id", desc=True)
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        query = query.or_(
+            f'created_at.lt."{created_at}",'
+            f'and(created_at.eq."{created_at}",id.lt.{row_id})'
+        )
+        return query.limit(limit + 1)
+    return query.range(offset, offset + limit)
+
+
+def split_page(
+    rows: List[Dict[str, Any]], limit: int
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """Trim the look-ahead row and return the page with its next cursor."""
+    if len(rows) <= limit:
+        return rows, None
+    page = rows[:limit]
+    return page, encode_cursor(page[-1])
@@ -1,15 +1,16 @@
 """Supabase-backed profile queries."""
 from typing import Any, Dict, Optional
 from backend.database.supabase.client import get_admin_client
+from backend.database.supabase.profile_cache import (
+    cache_generation,
+    cached_profile,
+    invalidate_profile,
+    store_profile,
+)
+from backend.database.supabase.rows import build_profile_response
 from backend.database.supabase.utils import apply_user_scope, require_user_id
 
 
-def _build_profile_response(row: Dict[str, Any]) -> Dict[str, Any]:
-    profile_data = dict(row.get("profile_data") or {})
-    profile_data["updated_at"] = row.get("updated_at")
-    return profile_data
-
-
 def save_profile(profile_data: Dict[str, Any]) -> bool:
     client = get_admin_client()
     user_id = require_user_id(profile_data.get("user_id"))
@@ -18,18 +19,25 @@ def save_profile(profile_data: Dict[str, Any]) -> bool:
         .upsert({"user_id": user_id, "profile_data": profile_data}, on_conflict="user_id")
         .execute()
     )
+    invalidate_profile(user_id)
     return bool(response.data)
 
 
 def get_profile() -> Optional[Dict[str, Any]]:
-    client = get_admin_client()
     user_id = require_user_id()
+    cached = cached_profile(user_id)
+    if cached is not None:
+        return cached
+    generation = cache_generation(user_id)
+    client = get_admin_client()
     query = client.table("cv_profiles").select("profile_data, updated_at")
     query = apply_user_scope(query, user_id)
     response = query.order("updated_at", desc=True).limit(1).execute()
     if not response.data:
         return None
-    return _build_profile_response(response.data[0])
+    profile = build_profile_response(response.data[0])
+    store_profile(user_id, profile, generation)
+    return profile
 
 
 def list_profiles() -> list[Dict[str, Any]]:
@@ -51,8 +59,11 @@ def list_profiles() -> list[Dict[str, Any]]:
 
 
 def get_profile_by_updated_at(updated_at: str) -> Optional[Dict[str, Any]]:
-    client = get_admin_client()
     user_id = require_user_id()
+    cached = cached_profile(user_id)
+    if cached is not None and cached.get("updated_at") == updated_at:
+        return cached
+    client = get_admin_client()
     query = (
         client.table("cv_profiles")
         .select("profile_data, updated_at")
@@ -63,7 +74,7 @@ def get_profile_by_updated_at(updated_at: str) -> Optional[Dict[str, Any]]:
     response = query.execute()
     if not response.data:
         return None
-    return _build_profile_response(response.data[0])
+    return build_profile_response(response.data[0])
 
 
 def delete_profile_by_updated_at(updated_at: str) -> bool:
@@ -72,6 +83,7 @@ def delete_profile_by_updated_at(updated_at: str) -> bool:
     query = client.table("cv_profiles").delete().eq("updated_at", updated_at)
     query = apply_user_scope(query, user_id)
     response = query.execute()
+    invalidate_profile(user_id)
     return bool(response.data)
 
 
@@ -87,4 +99,5 @@ def delete_profile() -> bool:
         .limit(1)
         .execute()
     )
+    invalidate_profile(user_id)
     return bool(response.data)
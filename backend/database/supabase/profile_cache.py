@@ -0,0 +1,180 @@
+"""Per-user read-through cache for profile queries.
+
+Entries are keyed by user id and remember the ``updated_at`` of the cached
+profile. Writes and deletes invalidate the entry for their user. By default
+the cache lives in-process; set ``PROFILE_CACHE_REDIS_URL`` to share it across
+workers (requires the ``redis`` package).
+"""
+import copy
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from backend.env import env_float
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_S = 300.0
+_KEY_PREFIX = "cv-pro:profile:"
+
+
+def _ttl_from_env() -> float:
+    return max(0.0, env_float("PROFILE_CACHE_TTL_S", DEFAULT_TTL_S))
+
+
+class LocalProfileCache:
+    """Thread-safe in-process profile cache."""
+
+    def __init__(self, ttl_s: float = DEFAULT_TTL_S):
+        self.ttl_s = ttl_s
+        self._entries: Dict[str, tuple[float, Dict[str, Any]]] = {}
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def generation(self, user_id: str) -> int:
+        with self._lock:
+            return self._generations.get(user_id, 0)
+
+    def get(self, user_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            expires_at, profile = entry
+            if expires_at <= time.monotonic():
+                del self._entries[user_id]
+                return None
+        return copy.deepcopy(profile)
+
+    def set(self, user_id: str, profile: Dict[str, Any], generation: int) -> None:
+        """Store a profile unless the user was invalidated since ``generation``."""
+        if self.ttl_s <= 0:
+            return
+        stored = copy.deepcopy(profile)
+        with self._lock:
+            if self._generations.get(user_id, 0) != generation:
+                return
+            self._entries[user_id] = (time.monotonic() + self.ttl_s, stored)
+
+    def invalidate(self, user_id: str) -> None:
+        with self._lock:
+            self._entries.pop(user_id, None)
+            self._generations[user_id] = self._generations.get(user_id, 0) + 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._generations.clear()
+
+
+class RedisProfileCache:
+    """Profile cache shared between workers through Redis."""
+
+    def __init__(self, client, ttl_s: float = DEFAULT_TTL_S):
+        self.ttl_s = ttl_s
+        self._client = client
+
+    def generation(self, user_id: str) -> int:
+        value = self._client.get(f"{_KEY_PREFIX}{user_id}:gen")
+        return int(value or 0)
+
+    def get(self, user_id: str) -> Optional[Dict[str, Any]]:
+        value = self._client.get(f"{_KEY_PREFIX}{user_id}")
+        if value is None:
+            return None
+        return json.loads(value)
+
+    def set(self, user_id: str, profile: Dict[str, Any], generation: int) -> None:
+        if self.ttl_s <= 0 or self.generation(user_id) != generation:
+            return
+        self._client.set(
+            f"{_KEY_PREFIX}{user_id}",
+            json.dumps(profile, default=str),
+            px=int(self.ttl_s * 1000),
+        )
+
+    def invalidate(self, user_id: str) -> None:
+        pipe = self._client.pipeline()
+        pipe.delete(f"{_KEY_PREFIX}{user_id}")
+        pipe.incr(f"{_KEY_PREFIX}{user_id}:gen")
+        pipe.execute()
+
+    def clear(self) -> None:
+        for key in self._client.scan_iter(f"{_KEY_PREFIX}*"):
+            self._client.delete(key)
+
+
+_cache: LocalProfileCache | RedisProfileCache | None = None
+_cache_lock = threading.Lock()
+
+
+def _create_cache() -> LocalProfileCache | RedisProfileCache:
+    ttl_s = _ttl_from_env()
+    redis_url = os.getenv("PROFILE_CACHE_REDIS_URL")
+    if redis_url:
+        try:
+            import redis
+        except ImportError:
+            logger.warning(
+                "PROFILE_CACHE_REDIS_URL is set but redis is not installed; "
+                "using in-process profile cache"
+            )
+        else:
+            return RedisProfileCache(redis.Redis.from_url(redis_url), ttl_s=ttl_s)
+    return LocalProfileCache(ttl_s=ttl_s)
+
+
+def get_profile_cache() -> LocalProfileCache | RedisProfileCache:
+    """Return the process-wide profile cache."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = _create_cache()
+    return _cache
+
+
+def reset_profile_cache() -> None:
+    """Drop the configured cache so the next access re-reads the environment."""
+    global _cache
+    with _cache_lock:
+        _cache = None
+
+
+def cached_profile(user_id: str) -> Optional[Dict[str, Any]]:
+    """Return the cached profile for the user, or None on a miss or cache error."""
+    try:
+        return get_profile_cache().get(user_id)
+    except Exception as exc:
+        logger.warning("Profile cache read failed: %s", exc)
+        return None
+
+
+def cache_generation(user_id: str) -> Optional[int]:
+    """Return the user's cache generation, or None when the cache is unavailable."""
+    try:
+        return get_profile_cache().generation(user_id)
+    except Exception as exc:
+        logger.warning("Profile cache read failed: %s", exc)
+        return None
+
+
+def store_profile(user_id: str, profile: Dict[str, Any], generation: Optional[int]) -> None:
+    """Cache a freshly read profile unless the generation could not be read."""
+    if generation is None:
+        return
+    try:
+        get_profile_cache().set(user_id, profile, generation)
+    except Exception as exc:
+        logger.warning("Profile cache write failed: %s", exc)
+
+
+def invalidate_profile(user_id: str) -> None:
+    """Drop the user's cached profile after a write or delete."""
+    try:
+        get_profile_cache().invalidate(user_id)
+    except Exception as exc:
+        logger.error("Profile cache invalidation failed: %s", exc)
@@ -0,0 +1,44 @@
+"""Row-to-response builders shared by every storage backend."""
+from typing import Any, Dict
+
+
+def build_cv_response(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape a ``cvs`` row into the full CV response."""
+    cv_data = row.get("cv_data") or {}
+    personal_info = cv_data.get("personal_info") or {}
+    return {
+        "cv_id": row.get("id"),
+        "created_at": row.get("created_at"),
+        "updated_at": row.get("updated_at"),
+        "filename": row.get("filename"),
+        "theme": row.get("theme") or cv_data.get("theme", "classic"),
+        "layout": row.get("layout") or cv_data.get("layout", "classic-two-column"),
+        "target_company": row.get("target_company"),
+        "target_role": row.get("target_role"),
+        "personal_info": personal_info,
+        "experience": cv_data.get("experience", []),
+        "education": cv_data.get("education", []),
+        "skills": cv_data.get("skills", []),
+    }
+
+
+def build_cv_list_item(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape a ``cvs`` row into a CV list entry."""
+    cv_data = row.get("cv_data") or {}
+    personal_info = cv_data.get("personal_info") or {}
+    return {
+        "cv_id": row.get("id"),
+        "created_at": row.get("created_at"),
+        "updated_at": row.get("updated_at"),
+        "person_name": personal_info.get("name"),
+        "filename": row.get("filename"),
+        "target_company": row.get("target_company"),
+        "target_role": row.get("target_role"),
+    }
+
+
+def build_profile_response(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape a ``cv_profiles`` row into the profile response."""
+    profile_data = dict(row.get("profile_data") or {})
+    profile_data["updated_at"] = row.get("updated_at")
+    return profile_data
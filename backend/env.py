@@ -0,0 +1,23 @@
+"""Typed environment variable readers.
+
+Malformed values fall back to the default instead of failing at import or
+startup, matching how the rest of the configuration is read.
+"""
+
+import os
+
+
+def env_float(name: str, default: float) -> float:
+    """Read a float from the environment, or the default when unset or malformed."""
+    try:
+        return float(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+def env_int(name: str, default: int) -> int:
+    """Read an int from the environment, or the default when unset or malformed."""
+    try:
+        return int(os.getenv(name, str(default)))
+    except ValueError:
+        return default
@@ -57,4 +57,5 @@ class CVListResponse(BaseModel):
     """CV list response."""
 
     cvs: List[CVListItem]
-    total: int
+    total: Optional[int] = None
+    next_cursor: Optional[str] = None
@@ -40,6 +40,10 @@ class AIGenerateCVRequest(BaseModel):
         max_length=2000,
         description="Directive for CV tailoring (e.g., 'make more enterprise-focused', 'emphasize Python skills'). Only used as directive with llm_tailor style; used as context for other styles.",
     )
+    regenerate: bool = Field(
+        default=False,
+        description="Skip cached LLM responses and fetch fresh ones (only relevant when AI_RESPONSE_CACHE is enabled).",
+    )
 
 
 class AIGenerateCVResponse(BaseModel):
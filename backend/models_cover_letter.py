@@ -32,6 +32,10 @@ class CoverLetterResponse(BaseModel):
     selected_skills: List[str] = Field(
         default_factory=list, description="Skills selected as most relevant to the job"
     )
+    warnings: List[str] = Field(
+        default_factory=list,
+        description="Steps that fell back to heuristics to stay within the time budget",
+    )
 
 
 class CoverLetterData(BaseModel):
@@ -67,7 +71,8 @@ class CoverLetterListResponse(BaseModel):
     """Cover letter list response."""
 
     cover_letters: List[CoverLetterListItem]
-    total: int
+    total: Optional[int] = None
+    next_cursor: Optional[str] = None
 
 
 class CoverLetterSaveRequest(BaseModel):
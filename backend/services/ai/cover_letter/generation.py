@@ -3,19 +3,53 @@
 from __future__ import annotations
 
 import logging
+from typing import Callable, List, Optional
 
 from backend.models import ProfileData
 from backend.models_cover_letter import CoverLetterRequest, CoverLetterResponse
-from backend.services.ai.llm_client import get_llm_client
-from backend.services.ai.cover_letter_selection import select_relevant_content
+from backend.services.ai.deadline import BudgetExhausted, deadline_scope, within_budget
+from backend.services.ai.llm_client import collect_llm_calls, get_llm_client, llm_step, summarize_calls
+from backend.services.ai.cover_letter_selection import SelectedContent, select_relevant_content
+from backend.services.ai.pipeline.jd_analyzer import get_cached_jd_analysis
+from backend.services.ai.pipeline.skill_relevance_evaluator import match_skills_in_raw_jd
+from backend.services.ai.cover_letter.highlights import _extract_highlights_used
 from backend.services.ai.cover_letter.formatting import _format_profile_summary, _format_as_html, _format_as_text
 from backend.services.ai.cover_letter.prompt_builder import _build_cover_letter_prompt
 
 logger = logging.getLogger(__name__)
 
+SYSTEM_PROMPT = "You are a professional cover letter writer. Generate compelling, tailored cover letters."
+SELECTION_DEGRADED = "Cover letter content selected with heuristics to stay within the time budget"
+
+
+def _heuristic_selection(profile: ProfileData, job_description: str, max_experiences: int = 3) -> SelectedContent:
+    """Select the most recent experiences and the skills the JD names, without the LLM."""
+    skill_names: List[str] = []
+    for match in match_skills_in_raw_jd(profile.skills, job_description):
+        if match.profile_skill.name not in skill_names:
+            skill_names.append(match.profile_skill.name)
+
+    return SelectedContent(
+        experience_indices=list(range(min(max_experiences, len(profile.experience)))),
+        skill_names=skill_names,
+        key_highlights=_extract_highlights_used(profile, job_description),
+        relevance_reasoning="Most recent experience and the skills named in the job description",
+    )
+
+
+async def _stream_body(llm_client, prompt: str, on_token: Callable[[str], None]) -> str:
+    """Stream the letter body, forwarding each token, and return the full text."""
+    parts = []
+    async for delta in llm_client.stream_text(prompt, system_prompt=SYSTEM_PROMPT):
+        parts.append(delta)
+        on_token(delta)
+    return "".join(parts)
+
 
 async def generate_cover_letter(
-    profile: ProfileData, request: CoverLetterRequest
+    profile: ProfileData,
+    request: CoverLetterRequest,
+    on_token: Optional[Callable[[str], None]] = None,
 ) -> CoverLetterResponse:
     """
     Generate a tailored cover letter using LLM.
@@ -23,13 +57,31 @@ async def generate_cover_letter(
     Args:
         profile: User's saved profile data
         request: Cover letter generation request
+        on_token: Optional callback; when given, the body is streamed and each
+            token is passed to it as it arrives
 
     Returns:
         CoverLetterResponse with HTML and plain text versions
 
     Raises:
-        ValueError: If LLM is not configured
+        ValueError: If LLM is not configured, or the body could not be
+            generated within the time budget (AI_DEADLINE_S)
     """
+    with deadline_scope() as deadline, collect_llm_calls() as llm_calls:
+        try:
+            response = await _generate_cover_letter(profile, request, on_token)
+        finally:
+            logger.info(f"Cover letter LLM usage: {summarize_calls(llm_calls)}")
+    if deadline is not None:
+        response.warnings.extend(deadline.degradations)
+    return response
+
+
+async def _generate_cover_letter(
+    profile: ProfileData,
+    request: CoverLetterRequest,
+    on_token: Optional[Callable[[str], None]],
+) -> CoverLetterResponse:
     llm_client = get_llm_client()
 
     if not llm_client.is_configured():
@@ -39,11 +91,19 @@ async def generate_cover_letter(
 
     # Phase 1: Use LLM to select most relevant content
     try:
-        selected_content = await select_relevant_content(
-            profile=profile,
-            job_description=request.job_description,
-            llm_client=llm_client,
-        )
+        with llm_step("cover_letter_selection"):
+            selected_content = await within_budget(
+                select_relevant_content(
+                    profile=profile,
+                    job_description=request.job_description,
+                    llm_client=llm_client,
+                    # Reuse requirements already extracted for a CV draft of this JD
+                    jd_analysis=get_cached_jd_analysis(request.job_description),
+                ),
+                SELECTION_DEGRADED,
+            )
+    except BudgetExhausted:
+        selected_content = _heuristic_selection(profile, request.job_description)
     except Exception as e:
         logger.error(f"Failed to select relevant content: {e}", exc_info=True)
         raise ValueError(f"Failed to select relevant content: {str(e)}") from e
@@ -85,10 +145,13 @@ async def generate_cover_letter(
 
     # Phase 2: Generate cover letter body using LLM
     try:
-        cover_letter_body = await llm_client.generate_text(
-            prompt,
-            system_prompt="You are a professional cover letter writer. Generate compelling, tailored cover letters."
-        )
+        with llm_step("cover_letter"):
+            if on_token is None:
+                body_call = llm_client.generate_text(prompt, system_prompt=SYSTEM_PROMPT)
+            else:
+                body_call = _stream_body(llm_client, prompt, on_token)
+            # The body has no heuristic fallback, so running out of time fails the request
+            cover_letter_body = await within_budget(body_call, "Cover letter body was not generated within the time budget")
         cover_letter_body = cover_letter_body.strip()
     except Exception as e:
         logger.error(f"Failed to generate cover letter: {e}", exc_info=True)
@@ -5,11 +5,14 @@ from __future__ import annotations
 import json
 import logging
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
 import httpx
 
 from backend.models import ProfileData
 from backend.services.ai.llm_client import LLMClient
+from backend.services.ai.llm_client.request_builder import _is_reasoning_model
+from backend.services.ai.llm_client.request_executor import _cached_request
+from backend.services.ai.pipeline.models import JDAnalysis
 
 logger = logging.getLogger(__name__)
 
@@ -59,12 +62,28 @@ def _format_profile_for_selection(profile: ProfileData) -> str:
     return "\n".join(lines)
 
 
-def _build_selection_prompt(profile_text: str, job_description: str) -> str:
+def _format_jd_analysis(jd_analysis: Optional[JDAnalysis]) -> str:
+    """Format a cached JD analysis as an extra prompt section."""
+    if jd_analysis is None:
+        return ""
+    lines = ["", "", "EXTRACTED REQUIREMENTS:"]
+    if jd_analysis.required_skills:
+        lines.append(f"Required: {', '.join(sorted(jd_analysis.required_skills))}")
+    if jd_analysis.preferred_skills:
+        lines.append(f"Preferred: {', '.join(sorted(jd_analysis.preferred_skills))}")
+    if jd_analysis.responsibilities:
+        lines.append(f"Responsibilities: {'; '.join(jd_analysis.responsibilities[:5])}")
+    return "\n".join(lines) if len(lines) > 3 else ""
+
+
+def _build_selection_prompt(
+    profile_text: str, job_description: str, jd_analysis: Optional[JDAnalysis] = None
+) -> str:
     """Build prompt for LLM to select relevant content."""
     prompt = f"""You are analyzing a job application. Your task is to identify which parts of the candidate's profile are MOST relevant to this specific job.
 
 JOB DESCRIPTION:
-{job_description}
+{job_description}{_format_jd_analysis(jd_analysis)}
 
 CANDIDATE PROFILE:
 {profile_text}
@@ -99,6 +118,7 @@ async def select_relevant_content(  # noqa: C901
     profile: ProfileData,
     job_description: str,
     llm_client: LLMClient,
+    jd_analysis: Optional[JDAnalysis] = None,
 ) -> SelectedContent:
     """
     Use LLM to identify most relevant profile content for the job.
@@ -107,6 +127,7 @@ async def select_relevant_content(  # noqa: C901
         profile: Full profile data
         job_description: Job description text
         llm_client: Configured LLM client
+        jd_analysis: Optional analysis of the same JD (e.g. cached from CV drafting)
 
     Returns:
         SelectedContent with indices and names of relevant items
@@ -118,7 +139,7 @@ async def select_relevant_content(  # noqa: C901
     profile_text = _format_profile_for_selection(profile)
 
     # Build selection prompt
-    prompt = _build_selection_prompt(profile_text, job_description)
+    prompt = _build_selection_prompt(profile_text, job_description, jd_analysis)
 
     # Call LLM for structured selection
     try:
@@ -139,7 +160,7 @@ async def select_relevant_content(  # noqa: C901
         }
 
         # Only include temperature for models that support it
-        if not llm_client._is_reasoning_model():
+        if not _is_reasoning_model(llm_client):
             payload["temperature"] = 0.3  # Lower temperature for consistent selection
 
         headers = {
@@ -149,76 +170,69 @@ async def select_relevant_content(  # noqa: C901
 
         url = f"{llm_client.base_url}/chat/completions"
 
-        async with httpx.AsyncClient(timeout=llm_client.timeout) as client:
-            response = await client.post(url, json=payload, headers=headers)
-            response.raise_for_status()
-            result = response.json()
-
-            if "choices" not in result or not result["choices"]:
-                raise ValueError("Invalid response from LLM API")
-
-            content = result["choices"][0]["message"]["content"].strip()
-
-            # Parse JSON response
-            # Remove markdown code blocks if present
-            if content.startswith("```"):
-                # Extract JSON from code block
-                lines = content.split("\n")
-                json_start = None
-                json_end = None
-                for i, line in enumerate(lines):
-                    if line.strip().startswith("```"):
-                        if json_start is None:
-                            json_start = i + 1
-                        else:
-                            json_end = i
-                            break
-                if json_start is not None and json_end is not None:
-                    content = "\n".join(lines[json_start:json_end])
-                elif json_start is not None:
-                    content = "\n".join(lines[json_start:])
-
-            # Parse JSON
-            try:
-                data = json.loads(content)
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse LLM JSON response: {content[:200]}")
-                raise ValueError(f"LLM returned invalid JSON: {str(e)}") from e
-
-            # Validate and extract data
-            experience_indices = data.get("experience_indices", [])
-            skill_names = data.get("skill_names", [])
-            key_highlights = data.get("key_highlights", [])
-            relevance_reasoning = data.get(
-                "relevance_reasoning", "Selected based on job requirements"
-            )
+        # Shares the client's connection pool, governor slot, retries and response cache
+        content = await _cached_request(llm_client, url, payload, headers)
+
+        # Parse JSON response
+        # Remove markdown code blocks if present
+        if content.startswith("```"):
+            # Extract JSON from code block
+            lines = content.split("\n")
+            json_start = None
+            json_end = None
+            for i, line in enumerate(lines):
+                if line.strip().startswith("```"):
+                    if json_start is None:
+                        json_start = i + 1
+                    else:
+                        json_end = i
+                        break
+            if json_start is not None and json_end is not None:
+                content = "\n".join(lines[json_start:json_end])
+            elif json_start is not None:
+                content = "\n".join(lines[json_start:])
+
+        # Parse JSON
+        try:
+            data = json.loads(content)
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to parse LLM JSON response: {content[:200]}")
+            raise ValueError(f"LLM returned invalid JSON: {str(e)}") from e
+
+        # Validate and extract data
+        experience_indices = data.get("experience_indices", [])
+        skill_names = data.get("skill_names", [])
+        key_highlights = data.get("key_highlights", [])
+        relevance_reasoning = data.get(
+            "relevance_reasoning", "Selected based on job requirements"
+        )
 
-            # Validate indices are within bounds
-            max_idx = len(profile.experience) - 1
-            experience_indices = [
-                idx
-                for idx in experience_indices
-                if isinstance(idx, int) and 0 <= idx <= max_idx
-            ]
-
-            # Validate skills exist in profile
-            profile_skill_names = {s.name.lower() for s in profile.skills}
-            skill_names = [
-                skill
-                for skill in skill_names
-                if isinstance(skill, str) and skill.lower() in profile_skill_names
-            ]
-
-            return SelectedContent(
-                experience_indices=experience_indices,
-                skill_names=skill_names,
-                key_highlights=key_highlights
-                if isinstance(key_highlights, list)
-                else [],
-                relevance_reasoning=relevance_reasoning
-                if isinstance(relevance_reasoning, str)
-                else "",
-            )
+        # Validate indices are within bounds
+        max_idx = len(profile.experience) - 1
+        experience_indices = [
+            idx
+            for idx in experience_indices
+            if isinstance(idx, int) and 0 <= idx <= max_idx
+        ]
+
+        # Validate skills exist in profile
+        profile_skill_names = {s.name.lower() for s in profile.skills}
+        skill_names = [
+            skill
+            for skill in skill_names
+            if isinstance(skill, str) and skill.lower() in profile_skill_names
+        ]
+
+        return SelectedContent(
+            experience_indices=experience_indices,
+            skill_names=skill_names,
+            key_highlights=key_highlights
+            if isinstance(key_highlights, list)
+            else [],
+            relevance_reasoning=relevance_reasoning
+            if isinstance(relevance_reasoning, str)
+            else "",
+        )
 
     except httpx.HTTPError as e:
         logger.error(f"LLM API request failed during selection: {e}", exc_info=True)
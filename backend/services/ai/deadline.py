@@ -0,0 +1,126 @@
+"""Request-level time budget for AI generation.
+
+``deadline_scope`` installs a ``Deadline`` for one CV draft or cover letter.
+LLM steps await their calls through ``within_budget``. A call that cannot
+start with enough time left, or that runs past the deadline, raises
+``BudgetExhausted`` and records a note; the step then takes its heuristic
+path and the note is reported in the response warnings. The deadline lives in
+a context variable, so it reaches every task the pipeline spawns.
+"""
+
+import asyncio
+import contextvars
+import logging
+import time
+from contextlib import contextmanager
+from typing import Awaitable, Callable, Iterator, List, Optional, TypeVar
+
+from backend.env import env_float
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_BUDGET_S = 90.0
+# Time kept back from LLM calls for heuristic fallbacks and assembly
+HEURISTIC_RESERVE_S = 1.0
+
+_current: contextvars.ContextVar[Optional["Deadline"]] = contextvars.ContextVar(
+    "ai_deadline", default=None
+)
+
+
+class BudgetExhausted(TimeoutError):
+    """Raised when an LLM step has no time left in the request budget."""
+
+
+class Deadline:
+    """Time budget for one generation request, plus what was degraded to meet it."""
+
+    def __init__(
+        self,
+        budget_s: float,
+        min_step_s: float = 3.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.budget_s = budget_s
+        self.min_step_s = min_step_s
+        self._clock = clock
+        self.expires_at = clock() + budget_s
+        self.degradations: List[str] = []
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - self._clock())
+
+    def llm_time_left(self) -> float:
+        """Seconds an LLM call started now may take."""
+        return max(0.0, self.remaining() - HEURISTIC_RESERVE_S)
+
+    def degrade(self, note: str) -> None:
+        """Record a degradation once, in the order it first happened."""
+        if note not in self.degradations:
+            logger.warning(f"Time budget: {note}")
+            self.degradations.append(note)
+
+
+@contextmanager
+def deadline_scope(budget_s: Optional[float] = None) -> Iterator[Optional[Deadline]]:
+    """
+    Run the block under a time budget (default AI_DEADLINE_S; 0 disables).
+
+    An enclosing scope is reused, so a cover letter generated inside another
+    request does not get a fresh budget.
+    """
+    existing = _current.get()
+    if existing is not None:
+        yield existing
+        return
+
+    if budget_s is None:
+        budget_s = env_float("AI_DEADLINE_S", DEFAULT_BUDGET_S)
+    if budget_s <= 0:
+        yield None
+        return
+
+    deadline = Deadline(budget_s, min_step_s=env_float("AI_DEADLINE_MIN_STEP_S", 3.0))
+    token = _current.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current.reset(token)
+
+
+def current_deadline() -> Optional[Deadline]:
+    return _current.get()
+
+
+async def within_budget(call: Awaitable[T], degraded: str) -> T:
+    """
+    Await an LLM call within the remaining request budget.
+
+    Args:
+        call: Coroutine performing the LLM call
+        degraded: Warning recorded if the call is skipped or cut short
+
+    Raises:
+        BudgetExhausted: If too little time is left to start the call or it
+            did not finish before the deadline
+    """
+    deadline = _current.get()
+    if deadline is None:
+        return await call
+
+    time_left = deadline.llm_time_left()
+    if time_left < deadline.min_step_s:
+        if asyncio.iscoroutine(call):
+            call.close()
+        deadline.degrade(degraded)
+        raise BudgetExhausted(f"{time_left:.1f}s left in the time budget; skipped LLM call")
+
+    try:
+        return await asyncio.wait_for(call, timeout=time_left)
+    except asyncio.TimeoutError as e:
+        if isinstance(e, BudgetExhausted):
+            raise
+        deadline.degrade(degraded)
+        raise BudgetExhausted("LLM call did not finish within the time budget") from None
@@ -3,139 +3,279 @@
 from __future__ import annotations
 
 import logging
-from typing import Optional
+from typing import List, Optional, Tuple
 
 from backend.models import ProfileData
 from backend.models_ai import AIGenerateCVRequest, AIGenerateCVResponse
+from backend.services.ai.deadline import deadline_scope
+from backend.services.ai.llm_client import collect_llm_calls, summarize_calls
 from backend.services.ai.review import (
     build_evidence_map,
     build_questions,
     build_summary,
 )
 from backend.services.ai.pipeline.jd_analyzer import analyze_jd
-from backend.services.ai.pipeline.skill_relevance_evaluator import evaluate_all_skills
+from backend.services.ai.pipeline.skill_relevance_evaluator import evaluate_all_skills, match_skills_in_raw_jd
 from backend.services.ai.pipeline.content_selector import select_content
 from backend.services.ai.pipeline.content_adapter import adapt_content
 from backend.services.ai.pipeline.cv_assembler import assemble_cv
 from backend.services.ai.pipeline.context_analyzer import analyze_additional_context
-from backend.services.ai.pipeline.models import ContextAnalysis, ContextIncorporation
+from backend.services.ai.progress import (
+    ProgressCallback,
+    adapted_item_event,
+    jd_analysis_event,
+    selection_event,
+    skill_mapping_event,
+    step_event,
+)
+from backend.services.ai.pipeline.dag import PipelineStep, StepResults, format_timings, run_pipeline_graph
+from backend.services.ai.pipeline.models import (
+    AdaptedContent,
+    ContextAnalysis,
+    ContextIncorporation,
+    JDAnalysis,
+    SelectionResult,
+    SkillMapping,
+    SkillMatch,
+)
 
 logger = logging.getLogger(__name__)
 
 
-async def generate_cv_draft(
-    profile: ProfileData, request: AIGenerateCVRequest
-) -> AIGenerateCVResponse:
-    """
-    Generate CV draft using multi-step AI pipeline.
+def _use_directive(
+    request: AIGenerateCVRequest, context_analysis: Optional[ContextAnalysis]
+) -> bool:
+    """Use additional_context as directive for llm_tailor style or when step 0 says so."""
+    return bool(
+        (request.style == "llm_tailor" and request.additional_context)
+        or (context_analysis and context_analysis.type == "directive")
+    )
 
-    Steps:
-    0. Analyze additional_context (if provided) to determine how to incorporate it
-    1. Analyze JD to extract requirements
-    2. Evaluate skills for relevance
-    3. Select relevant content from profile
-    4. Adapt content for JD
-    5. Assemble final CV
-    6. Incorporate additional_context content (if applicable)
-    """
-    logger.info(f"Starting CV generation pipeline for {len(profile.experience)} experiences, {len(profile.skills)} skills")
 
-    # Step 0: Analyze additional_context intelligently
-    context_analysis: Optional[ContextAnalysis] = None
-    context_incorporation: Optional[ContextIncorporation] = None
+class _DraftSteps:
+    """Step implementations of the CV draft pipeline for one request."""
 
-    if request.additional_context:
+    def __init__(
+        self,
+        profile: ProfileData,
+        request: AIGenerateCVRequest,
+        on_event: Optional[ProgressCallback] = None,
+    ):
+        self.profile = profile
+        self.request = request
+        self.on_event = on_event
+
+    def emit(self, name: str, data: dict) -> None:
+        if self.on_event is not None:
+            self.on_event(name, data)
+
+    def directive(self, results: StepResults) -> Optional[str]:
+        if _use_directive(self.request, results.get("context")):
+            return self.request.additional_context
+        return None
+
+    async def analyze_context(self, results: StepResults) -> Optional[ContextAnalysis]:
         logger.info("Step 0: Analyzing additional_context")
         context_analysis = await analyze_additional_context(
-            request.additional_context,
-            request.job_description,
+            self.request.additional_context,
+            self.request.job_description,
         )
+        if context_analysis:
+            logger.info(
+                f"Context analysis: type={context_analysis.type}, "
+                f"placement={context_analysis.placement}"
+            )
+        return context_analysis
+
+    async def match_raw_jd(self, results: StepResults) -> List[SkillMatch]:
+        # Layer 1 of step 2 only needs the raw JD, so it runs while step 0/1 wait on the LLM
+        return match_skills_in_raw_jd(self.profile.skills, self.request.job_description)
+
+    async def analyze_job(self, additional_context: Optional[str]) -> JDAnalysis:
+        logger.info("Step 1: Analyzing job description")
+        jd_analysis = await analyze_jd(self.request.job_description, additional_context=additional_context)
         logger.info(
-            f"Context analysis: type={context_analysis.type}, "
-            f"placement={context_analysis.placement}"
+            f"JD Analysis: {len(jd_analysis.required_skills)} required skills, "
+            f"{len(jd_analysis.preferred_skills)} preferred skills, "
+            f"{len(jd_analysis.responsibilities)} responsibilities"
         )
+        return jd_analysis
 
-    # Determine if we should use additional_context as directive
-    # Use as directive if: (1) llm_tailor style, OR (2) analysis says it's a directive
-    use_directive = (
-        (request.style == "llm_tailor" and request.additional_context)
-        or (context_analysis and context_analysis.type == "directive")
-    )
+    async def analyze_job_plain(self, results: StepResults) -> JDAnalysis:
+        return await self.analyze_job(None)
 
-    # Step 1: Analyze JD
-    logger.info("Step 1: Analyzing job description")
-    jd_analysis = await analyze_jd(
-        request.job_description,
-        additional_context=request.additional_context if use_directive else None,
-    )
-    logger.info(
-        f"JD Analysis: {len(jd_analysis.required_skills)} required skills, "
-        f"{len(jd_analysis.preferred_skills)} preferred skills, "
-        f"{len(jd_analysis.responsibilities)} responsibilities"
-    )
+    async def analyze_job_final(self, results: StepResults) -> JDAnalysis:
+        if self.directive(results) is None:
+            jd_analysis = results["jd_plain"]
+        else:
+            jd_analysis = await self.analyze_job(self.request.additional_context)
+        self.emit("jd_analysis", jd_analysis_event(jd_analysis))
+        return jd_analysis
 
-    # Step 2: Evaluate each skill individually for relevance
-    logger.info("Step 2: Evaluating skill relevance")
-    skill_mapping = await evaluate_all_skills(
-        profile.skills,
-        jd_analysis,
-        raw_jd=request.job_description,
-        additional_context=request.additional_context if use_directive else None,
-    )
-    logger.info(
-        f"Skill mapping: {len(skill_mapping.matched_skills)} matched skills, "
-        f"{len(skill_mapping.coverage_gaps)} gaps"
-    )
+    async def analyze_job_direct(self, results: StepResults) -> JDAnalysis:
+        jd_analysis = await self.analyze_job(self.request.additional_context or None)
+        self.emit("jd_analysis", jd_analysis_event(jd_analysis))
+        return jd_analysis
 
-    # Step 3: Select content
-    logger.info("Step 3: Selecting relevant content")
-    max_experiences = request.max_experiences or 4
-    selection_result = select_content(
-        profile.experience,
-        jd_analysis,
-        skill_mapping,
-        max_experiences=max_experiences,
-        additional_context=request.additional_context if use_directive else None,
-    )
-    logger.info(f"Selected {len(selection_result.experiences)} experiences")
-
-    # Step 4: Adapt content
-    logger.info("Step 4: Adapting content wording")
-    # For llm_tailor style, pass context as directive; for other styles, use existing behavior
-    adapted_content = await adapt_content(
-        selection_result,
-        jd_analysis,
-        request.additional_context if use_directive else (request.additional_context if request.style == "select_and_reorder" else None),
-    )
-    logger.info(
-        f"Content adaptation complete: {len(adapted_content.adaptation_notes)} items adapted, "
-        f"{len(adapted_content.warnings)} warnings"
-    )
-    warnings = adapted_content.warnings or []
+    async def evaluate_skills(self, results: StepResults) -> SkillMapping:
+        logger.info("Step 2: Evaluating skill relevance")
+        skill_mapping = await evaluate_all_skills(
+            self.profile.skills,
+            results["jd"],
+            raw_jd=self.request.job_description,
+            additional_context=self.directive(results),
+            raw_jd_matches=results["raw_jd_skills"],
+        )
+        logger.info(
+            f"Skill mapping: {len(skill_mapping.matched_skills)} matched skills, "
+            f"{len(skill_mapping.coverage_gaps)} gaps"
+        )
+        self.emit("skills", skill_mapping_event(skill_mapping))
+        return skill_mapping
 
-    # Step 5: Assemble CV
-    # Build context incorporation if needed (for content_statement or achievement types)
-    if context_analysis and context_analysis.type in ("content_statement", "achievement", "mixed"):
+    async def select(self, results: StepResults) -> SelectionResult:
+        logger.info("Step 3: Selecting relevant content")
+        max_experiences = self.request.max_experiences or 4
+        selection_result = select_content(
+            self.profile.experience,
+            results["jd"],
+            results["skills"],
+            max_experiences=max_experiences,
+            additional_context=self.directive(results),
+        )
+        logger.info(f"Selected {len(selection_result.experiences)} experiences")
+        self.emit("selection", selection_event(selection_result))
+        return selection_result
+
+    def _adapt_directive(self, results: StepResults) -> Optional[str]:
+        # For llm_tailor style, pass context as directive; for other styles, use existing behavior
+        if self.request.style == "select_and_reorder":
+            return self.directive(results) or self.request.additional_context
+        return self.directive(results)
+
+    def _emit_adapted_item(self, item) -> None:
+        self.emit("adapted_item", adapted_item_event(item))
+
+    async def adapt(self, results: StepResults) -> AdaptedContent:
+        logger.info("Step 4: Adapting content wording")
+        adapted_content = await adapt_content(
+            results["selection"],
+            results["jd"],
+            self._adapt_directive(results),
+            on_item=self._emit_adapted_item if self.on_event else None,
+        )
+        logger.info(
+            f"Content adaptation complete: {len(adapted_content.adaptation_notes)} items adapted, "
+            f"{len(adapted_content.warnings)} warnings"
+        )
+        return adapted_content
+
+    async def incorporate(self, results: StepResults) -> Optional[ContextIncorporation]:
+        # Build context incorporation if needed (for content_statement or achievement types)
+        context_analysis = results["context"]
+        if not context_analysis or context_analysis.type not in ("content_statement", "achievement", "mixed"):
+            return None
         from backend.services.ai.pipeline.content_incorporator import _build_incorporation
         context_incorporation = _build_incorporation(
             context_analysis,
-            selection_result.experiences,
+            results["selection"].experiences,
         )
         logger.info(
             f"Built context incorporation: summary={bool(context_incorporation.summary_update)}, "
             f"highlights={len(context_incorporation.project_highlights)}, "
             f"experiences={len(context_incorporation.experience_updates)}"
         )
+        return context_incorporation
 
-    draft_cv, coverage_summary = assemble_cv(
-        adapted_content,
-        profile.personal_info,
-        profile.education,
-        profile.skills,
-        skill_mapping,
-        jd_analysis,
-        context_incorporation,
-    )
+    async def assemble(self, results: StepResults):
+        return assemble_cv(
+            results["adaptation"],
+            self.profile.personal_info,
+            self.profile.education,
+            self.profile.skills,
+            results["skills"],
+            results["jd"],
+            results.get("incorporation"),
+        )
+
+
+def _build_pipeline(
+    profile: ProfileData,
+    request: AIGenerateCVRequest,
+    on_event: Optional[ProgressCallback] = None,
+) -> List[PipelineStep]:
+    """Build the step graph for steps 0-5."""
+    draft = _DraftSteps(profile, request, on_event)
+    has_context = bool(request.additional_context)
+    context_deps: Tuple[str, ...] = ("context",) if has_context else ()
+
+    steps: List[PipelineStep] = [PipelineStep("raw_jd_skills", draft.match_raw_jd)]
+    if has_context:
+        steps.append(PipelineStep("context", draft.analyze_context))
+
+    if has_context and request.style != "llm_tailor":
+        # Whether step 1 gets the directive depends on step 0's verdict. Analyze the
+        # JD without it in parallel and only re-run step 1 if step 0 says "directive".
+        steps.append(PipelineStep("jd_plain", draft.analyze_job_plain))
+        steps.append(PipelineStep("jd", draft.analyze_job_final, ("context", "jd_plain")))
+    else:
+        # Directive use is known up front: llm_tailor with context, or no context at all
+        steps.append(PipelineStep("jd", draft.analyze_job_direct))
+
+    steps.append(PipelineStep("skills", draft.evaluate_skills, ("jd", "raw_jd_skills", *context_deps)))
+    steps.append(PipelineStep("selection", draft.select, ("jd", "skills", *context_deps)))
+    steps.append(PipelineStep("adaptation", draft.adapt, ("jd", "selection", *context_deps)))
+    assembly_deps: Tuple[str, ...] = ("adaptation", "skills", "jd")
+    if has_context:
+        steps.append(PipelineStep("incorporation", draft.incorporate, ("context", "selection")))
+        assembly_deps += ("incorporation",)
+    steps.append(PipelineStep("assembly", draft.assemble, assembly_deps))
+    return steps
+
+
+async def generate_cv_draft(
+    profile: ProfileData,
+    request: AIGenerateCVRequest,
+    on_event: Optional[ProgressCallback] = None,
+) -> AIGenerateCVResponse:
+    """
+    Generate CV draft using multi-step AI pipeline.
+
+    Steps:
+    0. Analyze additional_context (if provided) to determine how to incorporate it
+    1. Analyze JD to extract requirements
+    2. Evaluate skills for relevance
+    3. Select relevant content from profile
+    4. Adapt content for JD
+    5. Assemble final CV
+    6. Incorporate additional_context content (if applicable)
+
+    Steps run as a dependency graph: step 0, step 1 and the raw-JD layer of
+    step 2 overlap; the remaining steps follow their inputs.
+
+    The run shares one time budget (AI_DEADLINE_S). LLM steps that would
+    exceed it fall back to heuristics, and the response warnings say which.
+
+    ``on_event(name, data)`` receives progress events ("step", "jd_analysis",
+    "skills", "selection", "adapted_item") while the pipeline runs.
+    """
+    logger.info(f"Starting CV generation pipeline for {len(profile.experience)} experiences, {len(profile.skills)} skills")
+
+    with deadline_scope() as deadline, collect_llm_calls() as llm_calls:
+        try:
+            results, timings = await run_pipeline_graph(
+                _build_pipeline(profile, request, on_event),
+                on_event=(lambda name, status: on_event("step", step_event(name, status))) if on_event else None,
+            )
+        finally:
+            logger.info(f"Pipeline LLM usage: {summarize_calls(llm_calls)}")
+    logger.info(f"Pipeline step timings: {format_timings(timings)}")
+
+    jd_analysis: JDAnalysis = results["jd"]
+    warnings = list(results["adaptation"].warnings or [])
+    if deadline is not None:
+        warnings.extend(deadline.degradations)
+    draft_cv, coverage_summary = results["assembly"]
 
     # Step 6: Incorporate context (if not already incorporated in assembler)
     # Note: Currently incorporation happens in assembler, but keeping this step
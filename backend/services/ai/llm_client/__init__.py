@@ -2,9 +2,51 @@
 
 # Re-export main functionality for backward compatibility
 from backend.services.ai.llm_client.client import LLMClient, get_llm_client, reset_llm_client
+from backend.services.ai.llm_client.circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+    get_circuit_breaker,
+    reset_circuit_breaker,
+)
+from backend.services.ai.llm_client.governor import (
+    LLMGovernor,
+    get_llm_governor,
+    reset_llm_governor,
+)
+from backend.services.ai.llm_client.response_cache import (
+    LLMResponseCache,
+    bypass_response_cache,
+    get_response_cache,
+    reset_response_cache,
+)
+from backend.services.ai.llm_client.telemetry import (
+    LLMTelemetry,
+    collect_llm_calls,
+    get_llm_telemetry,
+    llm_step,
+    reset_llm_telemetry,
+    summarize_calls,
+)
 
 __all__ = [
     "LLMClient",
     "get_llm_client",
     "reset_llm_client",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "get_circuit_breaker",
+    "reset_circuit_breaker",
+    "LLMGovernor",
+    "get_llm_governor",
+    "reset_llm_governor",
+    "LLMResponseCache",
+    "bypass_response_cache",
+    "get_response_cache",
+    "reset_response_cache",
+    "LLMTelemetry",
+    "collect_llm_calls",
+    "get_llm_telemetry",
+    "llm_step",
+    "reset_llm_telemetry",
+    "summarize_calls",
 ]
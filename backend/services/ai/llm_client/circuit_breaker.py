@@ -0,0 +1,137 @@
+"""Process-wide circuit breaker for the LLM provider.
+
+After a run of consecutive transient failures (5xx responses, timeouts,
+connection errors) the circuit opens and LLM requests fail immediately with
+``CircuitOpenError``. Callers already fall back to heuristics when an LLM
+call fails, so an outage costs milliseconds instead of a full retry cycle per
+call. After a cool-down, one probe request is let through: success closes
+the circuit, failure opens it again.
+"""
+
+import logging
+import time
+from typing import Callable, Dict, Optional
+
+import httpx
+
+from backend.env import env_float, env_int
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of sending a request while the circuit is open."""
+
+
+def is_transient_failure(exc: BaseException) -> bool:
+    """Return True for failures that indicate the provider is unhealthy."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code >= 500
+    return isinstance(exc, (httpx.TimeoutException, httpx.TransportError))
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with a single half-open probe."""
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout_s: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout_s = max(0.0, reset_timeout_s)
+        self._clock = clock
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._times_opened = 0
+        self._rejected = 0
+
+    @property
+    def state(self) -> str:
+        if self._state == OPEN and self._clock() - self._opened_at >= self.reset_timeout_s:
+            return HALF_OPEN
+        return self._state
+
+    def allow(self) -> bool:
+        """Return True if a request may be sent now."""
+        state = self.state
+        if state == CLOSED:
+            return True
+        if state == HALF_OPEN and not self._probe_in_flight:
+            self._state = HALF_OPEN
+            self._probe_in_flight = True
+            return True
+        self._rejected += 1
+        return False
+
+    def check(self) -> bool:
+        """
+        Raise ``CircuitOpenError`` if a request may not be sent now.
+
+        Returns True if the admitted request is the half-open probe, in which
+        case the caller must report its outcome or call ``release_probe``.
+        """
+        was_half_open = self.state == HALF_OPEN
+        if not self.allow():
+            raise CircuitOpenError("LLM provider is unavailable (circuit open); skipping request")
+        return was_half_open
+
+    def record_success(self) -> None:
+        if self._state != CLOSED:
+            logger.info("LLM circuit closed after successful probe")
+        self._state = CLOSED
+        self._failures = 0
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+            if self._state != OPEN:
+                self._times_opened += 1
+                logger.warning(
+                    "LLM circuit opened after %d consecutive failures; failing fast for %.0fs",
+                    self._failures,
+                    self.reset_timeout_s,
+                )
+            self._state = OPEN
+            self._opened_at = self._clock()
+        self._probe_in_flight = False
+
+    def release_probe(self) -> None:
+        """Free the half-open probe slot when the probe ended without a verdict."""
+        self._probe_in_flight = False
+
+    def snapshot(self) -> Dict[str, float]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self._failures,
+            "times_opened": self._times_opened,
+            "rejected": self._rejected,
+        }
+
+
+_breaker: Optional[CircuitBreaker] = None
+
+
+def get_circuit_breaker() -> CircuitBreaker:
+    """Get or create the process-wide circuit breaker from the environment."""
+    global _breaker
+    if _breaker is None:
+        _breaker = CircuitBreaker(
+            failure_threshold=env_int("AI_CIRCUIT_FAILURE_THRESHOLD", 5),
+            reset_timeout_s=env_float("AI_CIRCUIT_RESET_S", 30.0),
+        )
+    return _breaker
+
+
+def reset_circuit_breaker() -> None:
+    """Reset the breaker singleton (useful for testing or config changes)."""
+    global _breaker
+    _breaker = None
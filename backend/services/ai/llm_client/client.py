@@ -2,11 +2,14 @@
 
 import os
 import logging
-from typing import Optional
+from typing import AsyncIterator, Optional
 from dotenv import load_dotenv
 
-from backend.services.ai.llm_client.request_builder import _build_payload
-from backend.services.ai.llm_client.request_executor import _make_request_with_retry
+from backend.env import env_float
+from backend.services.ai.llm_client.http_pool import _close_http_client, _warm_up
+from backend.services.ai.llm_client.request_builder import _build_generation_payload, _build_payload
+from backend.services.ai.llm_client.request_executor import _cached_request
+from backend.services.ai.llm_client.streaming import _stream_request
 from backend.services.ai.llm_client.validation import _validate_configuration
 
 load_dotenv()
@@ -24,11 +27,23 @@ class LLMClient:
         self.temperature = float(os.getenv("AI_TEMPERATURE", "0.7"))
         self.timeout = int(os.getenv("AI_REQUEST_TIMEOUT_S", "30"))
         self.enabled = os.getenv("AI_ENABLED", "false").lower() == "true"
+        # Seconds before a hedged call sends its backup request; 0 disables hedging
+        self.hedge_after_s = env_float("AI_HEDGE_AFTER_S", 0.0)
+        self._http_client = None
+        self._http_client_loop = None
 
     def is_configured(self) -> bool:
         """Check if LLM is properly configured."""
         return self.enabled and bool(self.base_url) and bool(self.api_key)
 
+    async def warm_up(self) -> bool:
+        """Open a pooled connection to the provider. Returns False if it failed."""
+        return await _warm_up(self)
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        await _close_http_client(self)
+
     async def rewrite_text(self, text: str, prompt: str) -> str:
         """
         Rewrite text using LLM with a custom prompt.
@@ -55,15 +70,19 @@ class LLMClient:
 
         url = f"{self.base_url}/chat/completions"
 
-        return await _make_request_with_retry(self, url, payload, headers)
+        return await _cached_request(self, url, payload, headers)
 
-    async def generate_text(self, prompt: str, system_prompt: str | None = None) -> str:
+    async def generate_text(
+        self, prompt: str, system_prompt: str | None = None, hedge: bool = False
+    ) -> str:
         """
         Generate text using LLM with a custom prompt.
 
         Args:
             prompt: The generation prompt/instructions
             system_prompt: Optional custom system prompt (defaults to generic assistant)
+            hedge: Send a backup request if the first is slower than AI_HEDGE_AFTER_S
+                (for latency-critical single calls)
 
         Returns:
             Generated text
@@ -74,24 +93,37 @@ class LLMClient:
         """
         _validate_configuration(self)
 
-        if system_prompt is None:
-            system_prompt = "You are a helpful assistant. Follow the user's instructions carefully."
-
-        from backend.services.ai.llm_client.request_builder import _is_reasoning_model
+        payload = _build_generation_payload(self, prompt, system_prompt)
 
-        payload = {
-            "model": self.model,
-            "messages": [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": prompt},
-            ],
-            "max_completion_tokens": 2000,
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
         }
 
-        # Only include temperature for models that support it
-        # Reasoning models (o1, o3, gpt-5.x) don't support temperature
-        if not _is_reasoning_model(self):
-            payload["temperature"] = self.temperature
+        url = f"{self.base_url}/chat/completions"
+
+        return await _cached_request(
+            self, url, payload, headers, hedge_after_s=self.hedge_after_s if hedge else 0.0
+        )
+
+    async def stream_text(self, prompt: str, system_prompt: str | None = None) -> AsyncIterator[str]:
+        """
+        Generate text using LLM, yielding content as the provider streams it.
+
+        Args:
+            prompt: The generation prompt/instructions
+            system_prompt: Optional custom system prompt (defaults to generic assistant)
+
+        Yields:
+            Content deltas in the order the provider sends them
+
+        Raises:
+            ValueError: If LLM is not configured
+            httpx.HTTPError: If API request fails
+        """
+        _validate_configuration(self)
+
+        payload = _build_generation_payload(self, prompt, system_prompt)
 
         headers = {
             "Authorization": f"Bearer {self.api_key}",
@@ -100,7 +132,8 @@ class LLMClient:
 
         url = f"{self.base_url}/chat/completions"
 
-        return await _make_request_with_retry(self, url, payload, headers)
+        async for delta in _stream_request(self, url, payload, headers):
+            yield delta
 
 
 # Singleton instance
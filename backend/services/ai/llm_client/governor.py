@@ -0,0 +1,192 @@
+"""Process-wide LLM concurrency governor.
+
+Every LLM request waits for a slot from the governor before it is sent. The
+governor enforces a maximum number of in-flight requests and an optional
+token-bucket rate limit. Waiting requests are served round-robin per user,
+so one large generation cannot starve other users.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from typing import Callable, Deque, Dict, Optional, Tuple
+
+from backend.database.supabase.utils import get_user_id
+from backend.env import env_float, env_int
+
+logger = logging.getLogger(__name__)
+
+_Waiter = Tuple[asyncio.Future, float]
+
+
+class LLMGovernor:
+    """Admission control for outgoing LLM requests."""
+
+    def __init__(
+        self,
+        max_in_flight: int = 16,
+        rate_per_s: float = 0.0,
+        burst: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_in_flight = max(1, max_in_flight)
+        self.rate_per_s = max(0.0, rate_per_s)
+        self.burst = max(1.0, burst if burst else self.rate_per_s)
+        self._clock = clock
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._reset_state()
+
+    def _reset_state(self) -> None:
+        self._queues: "OrderedDict[str, Deque[_Waiter]]" = OrderedDict()
+        self._in_flight = 0
+        self._tokens = self.burst
+        self._refilled_at = self._clock()
+        self._paused_until = 0.0
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._granted = 0
+        self._total_wait_s = 0.0
+        self._max_wait_s = 0.0
+        self._recent_waits: Deque[float] = deque(maxlen=1000)
+
+    def _bind(self, loop: asyncio.AbstractEventLoop) -> None:
+        # Futures belong to one event loop; start fresh if the loop changed.
+        if self._loop is not None and self._loop is not loop:
+            self._reset_state()
+        self._loop = loop
+
+    # Admission ----------------------------------------------------------
+
+    @asynccontextmanager
+    async def slot(self, user_id: Optional[str] = None):
+        """Hold one in-flight slot for the duration of the block."""
+        await self.acquire(user_id)
+        try:
+            yield
+        finally:
+            self.release()
+
+    async def acquire(self, user_id: Optional[str] = None) -> None:
+        """Wait until the governor admits a request for ``user_id``."""
+        loop = asyncio.get_running_loop()
+        self._bind(loop)
+        key = user_id or get_user_id() or "anonymous"
+        waiter: _Waiter = (loop.create_future(), self._clock())
+        self._queues.setdefault(key, deque()).append(waiter)
+        self._dispatch()
+        try:
+            await waiter[0]
+        except asyncio.CancelledError:
+            if waiter[0].done() and not waiter[0].cancelled():
+                self.release()
+            else:
+                self._discard(key, waiter)
+            raise
+
+    def release(self) -> None:
+        """Return a slot and admit the next waiter."""
+        self._in_flight = max(0, self._in_flight - 1)
+        self._dispatch()
+
+    def backoff(self, seconds: float) -> None:
+        """Pause all admissions, e.g. after the provider answered 429."""
+        logger.warning("Pausing LLM request admission for %.1fs", seconds)
+        self._paused_until = max(self._paused_until, self._clock() + max(0.0, seconds))
+
+    def _discard(self, key: str, waiter: _Waiter) -> None:
+        queue = self._queues.get(key)
+        if queue and waiter in queue:
+            queue.remove(waiter)
+            if not queue:
+                del self._queues[key]
+
+    def _refill(self, now: float) -> None:
+        if self.rate_per_s:
+            elapsed = now - self._refilled_at
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate_per_s)
+        self._refilled_at = now
+
+    def _admission_delay(self, now: float) -> float:
+        if self._paused_until > now:
+            return self._paused_until - now
+        if not self.rate_per_s:
+            return 0.0
+        self._refill(now)
+        if self._tokens >= 1:
+            return 0.0
+        return (1 - self._tokens) / self.rate_per_s
+
+    def _schedule(self, delay: float) -> None:
+        if self._timer is None and self._loop is not None:
+            self._timer = self._loop.call_later(delay, self._on_timer)
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        while self._queues and self._in_flight < self.max_in_flight:
+            now = self._clock()
+            delay = self._admission_delay(now)
+            if delay > 0:
+                self._schedule(delay)
+                return
+            user, queue = next(iter(self._queues.items()))
+            future, enqueued_at = queue.popleft()
+            if queue:
+                self._queues.move_to_end(user)
+            else:
+                del self._queues[user]
+            if future.done():
+                continue
+            if self.rate_per_s:
+                self._tokens -= 1
+            self._in_flight += 1
+            self._record_wait(now - enqueued_at)
+            future.set_result(None)
+
+    # Metrics ------------------------------------------------------------
+
+    def _record_wait(self, wait_s: float) -> None:
+        self._granted += 1
+        self._total_wait_s += wait_s
+        self._max_wait_s = max(self._max_wait_s, wait_s)
+        self._recent_waits.append(wait_s)
+
+    def snapshot(self) -> Dict[str, float]:
+        """Return current load and queue-time metrics."""
+        recent = sorted(self._recent_waits)
+        p95 = recent[max(0, int(len(recent) * 0.95) - 1)] if recent else 0.0
+        return {
+            "max_in_flight": self.max_in_flight,
+            "rate_per_s": self.rate_per_s,
+            "in_flight": self._in_flight,
+            "queued": sum(len(queue) for queue in self._queues.values()),
+            "queued_users": len(self._queues),
+            "granted": self._granted,
+            "avg_wait_ms": (self._total_wait_s / self._granted * 1000) if self._granted else 0.0,
+            "p95_wait_ms": p95 * 1000,
+            "max_wait_ms": self._max_wait_s * 1000,
+        }
+
+
+_governor: Optional[LLMGovernor] = None
+
+
+def get_llm_governor() -> LLMGovernor:
+    """Get or create the process-wide governor from the environment."""
+    global _governor
+    if _governor is None:
+        _governor = LLMGovernor(
+            max_in_flight=env_int("AI_MAX_IN_FLIGHT", 16),
+            rate_per_s=env_float("AI_RATE_LIMIT_RPS", 0.0),
+            burst=env_float("AI_RATE_LIMIT_BURST", 0.0) or None,
+        )
+    return _governor
+
+
+def reset_llm_governor() -> None:
+    """Reset the governor singleton (useful for testing or config changes)."""
+    global _governor
+    _governor = None
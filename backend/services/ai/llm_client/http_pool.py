@@ -0,0 +1,70 @@
+"""Shared pooled HTTP client utilities."""
+
+import asyncio
+import logging
+import os
+import httpx
+
+from backend.env import env_float, env_int
+
+logger = logging.getLogger(__name__)
+
+
+def _build_limits() -> httpx.Limits:
+    """Build connection pool limits from the environment."""
+    return httpx.Limits(
+        max_connections=env_int("AI_HTTP_MAX_CONNECTIONS", 50),
+        max_keepalive_connections=env_int("AI_HTTP_MAX_KEEPALIVE", 20),
+        keepalive_expiry=env_float("AI_HTTP_KEEPALIVE_EXPIRY_S", 30.0),
+    )
+
+
+def _http2_enabled() -> bool:
+    """Return True when HTTP/2 is requested and the h2 package is available."""
+    if os.getenv("AI_HTTP2", "false").lower() != "true":
+        return False
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        logger.warning("AI_HTTP2=true but the h2 package is not installed; using HTTP/1.1")
+        return False
+    return True
+
+
+def _get_http_client(self) -> httpx.AsyncClient:
+    """Return the client's pooled AsyncClient, creating it for the running loop."""
+    loop = asyncio.get_running_loop()
+    if self._http_client is None or self._http_client_loop is not loop:
+        # Connections are bound to the event loop that opened them, so a new
+        # loop (e.g. a fresh test loop) gets its own pool.
+        self._http_client = httpx.AsyncClient(
+            timeout=self.timeout,
+            limits=_build_limits(),
+            http2=_http2_enabled(),
+        )
+        self._http_client_loop = loop
+    return self._http_client
+
+
+async def _warm_up(self, timeout: float = 5.0) -> bool:
+    """Open a pooled connection to the provider ahead of the first LLM call."""
+    if not self.is_configured():
+        return False
+    client = _get_http_client(self)
+    try:
+        await client.get(
+            f"{self.base_url}/models",
+            headers={"Authorization": f"Bearer {self.api_key}"},
+            timeout=timeout,
+        )
+    except httpx.HTTPError as e:
+        logger.warning(f"LLM connection warm-up failed: {e}")
+        return False
+    return True
+
+
+async def _close_http_client(self) -> None:
+    """Close the pooled client if one was opened."""
+    client, self._http_client, self._http_client_loop = self._http_client, None, None
+    if client is not None:
+        await client.aclose()
@@ -27,6 +27,28 @@ def _build_payload(self, text: str, prompt: str) -> dict:
     return payload
 
 
+def _build_generation_payload(self, prompt: str, system_prompt: str | None = None) -> dict:
+    """Build API request payload for free-form generation."""
+    if system_prompt is None:
+        system_prompt = "You are a helpful assistant. Follow the user's instructions carefully."
+
+    payload = {
+        "model": self.model,
+        "messages": [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": prompt},
+        ],
+        "max_completion_tokens": 2000,
+    }
+
+    # Only include temperature for models that support it
+    # Reasoning models (o1, o3, gpt-5.x) don't support temperature
+    if not _is_reasoning_model(self):
+        payload["temperature"] = self.temperature
+
+    return payload
+
+
 def _is_reasoning_model(self) -> bool:
     """Check if the model is a reasoning model that doesn't support temperature."""
     model_lower = self.model.lower()
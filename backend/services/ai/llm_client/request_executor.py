@@ -2,31 +2,109 @@
 
 import asyncio
 import logging
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+
 import httpx
 
-from backend.services.ai.llm_client.retry_logic import _should_retry_status_error, _should_retry_timeout
+from backend.services.ai.llm_client.circuit_breaker import get_circuit_breaker, is_transient_failure
+from backend.services.ai.llm_client.governor import get_llm_governor
+from backend.services.ai.llm_client.http_pool import _get_http_client
+from backend.services.ai.llm_client.response_cache import get_response_cache
+from backend.services.ai.llm_client.telemetry import note_attempt, note_usage, track_llm_call
+from backend.services.ai.llm_client.retry_logic import (
+    _backoff_delay,
+    _retry_after_seconds,
+    _should_retry_status_error,
+    _should_retry_timeout,
+)
 
 logger = logging.getLogger(__name__)
 
 
+async def _cached_request(
+    self, url: str, payload: dict, headers: dict, hedge_after_s: float = 0.0
+) -> str:
+    """Serve the request from the response cache when enabled, else send it.
+
+    With ``hedge_after_s`` > 0 a second identical request is sent if the first
+    has not answered within that many seconds (see ``_hedged_request``).
+    The call is recorded in the LLM telemetry under the current ``llm_step``.
+    """
+    with track_llm_call(payload.get("model")) as call:
+        cache = get_response_cache()
+        if cache is not None:
+            cached = cache.get(payload)
+            if cached is not None:
+                logger.debug("LLM response cache hit")
+                call.cached = True
+                return cached
+
+        if hedge_after_s > 0:
+            content = await _hedged_request(self, url, payload, headers, hedge_after_s)
+        else:
+            content = await _make_request_with_retry(self, url, payload, headers)
+
+        if cache is not None:
+            cache.set(payload, content)
+        return content
+
+
+async def _hedged_request(
+    self, url: str, payload: dict, headers: dict, hedge_after_s: float
+) -> str:
+    """Send a backup request if the first is slow and return whichever answers first.
+
+    Cuts tail latency for single calls on the critical path at the cost of an
+    occasional duplicate request. The slower request is cancelled.
+    """
+    tasks = [asyncio.create_task(_make_request_with_retry(self, url, payload, headers))]
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=hedge_after_s)
+        if done:
+            return tasks[0].result()
+
+        logger.info(f"LLM request slower than {hedge_after_s}s; sending hedged request")
+        tasks.append(asyncio.create_task(_make_request_with_retry(self, url, payload, headers)))
+        pending = set(tasks)
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                error = error or task.exception()
+        raise error
+    finally:
+        # Also reached when the caller is cancelled, e.g. by a time budget
+        unfinished = [task for task in tasks if not task.done()]
+        for task in unfinished:
+            task.cancel()
+        await asyncio.gather(*unfinished, return_exceptions=True)
+
+
 async def _make_request_with_retry(self, url: str, payload: dict, headers: dict) -> str:
-    """Make API request with retry logic for transient errors."""
+    """Make API request with retry logic for transient errors.
+
+    Backoff honours the provider's Retry-After header and is otherwise
+    jittered. The shared circuit breaker fails the request immediately while
+    the provider is considered down.
+    """
     max_retries = 3
     retry_delays = [1, 2, 4]  # Exponential backoff: 1s, 2s, 4s
 
+    governor = get_llm_governor()
+    breaker = get_circuit_breaker()
     for attempt in range(max_retries):
+        is_probe = breaker.check()
+        note_attempt()
         try:
-            return await _execute_request(self, url, payload, headers)
-        except httpx.HTTPStatusError as e:
-            should_retry, delay = _should_retry_status_error(e, attempt, max_retries, retry_delays)
-            if not should_retry:
-                raise
-            await asyncio.sleep(delay)
-        except httpx.TimeoutException as e:
-            should_retry, delay = _should_retry_timeout(e, attempt, max_retries, retry_delays)
-            if not should_retry:
-                raise
-            await asyncio.sleep(delay)
+            with _breaker_attempt(breaker, is_probe):
+                # Hold a governor slot per attempt so backoff sleeps free it up
+                async with governor.slot():
+                    return await _execute_request(self, url, payload, headers)
+        except (httpx.HTTPStatusError, httpx.TimeoutException) as e:
+            await _retry_or_raise(e, attempt, max_retries, retry_delays)
         except httpx.HTTPError as e:
             logger.error(f"LLM API request failed: {e}", exc_info=True)
             raise
@@ -35,15 +113,61 @@ async def _make_request_with_retry(self, url: str, payload: dict, headers: dict)
             raise ValueError(f"Failed to rewrite text: {str(e)}")
 
 
+@contextmanager
+def _breaker_attempt(breaker, is_probe: bool) -> Iterator[None]:
+    """Report one attempt's outcome to the circuit breaker.
+
+    HTTP failures are judged by ``_record_outcome``. Anything else, such as a
+    cancellation or a malformed response, gives no verdict and only frees
+    the half-open probe.
+    """
+    try:
+        yield
+    except httpx.HTTPError as e:
+        _record_outcome(breaker, e)
+        raise
+    except BaseException:
+        if is_probe:
+            breaker.release_probe()
+        raise
+    breaker.record_success()
+
+
+def _record_outcome(breaker, e: Exception) -> None:
+    """Count provider-side failures; a client error still proves the provider is up."""
+    if is_transient_failure(e):
+        breaker.record_failure()
+    else:
+        breaker.record_success()
+
+
+async def _retry_or_raise(
+    e: httpx.HTTPError, attempt: int, max_retries: int, retry_delays: List[int]
+) -> None:
+    """Sleep before the next attempt, or re-raise ``e`` if it should not be retried."""
+    if isinstance(e, httpx.HTTPStatusError):
+        should_retry, delay = _should_retry_status_error(e, attempt, max_retries, retry_delays)
+        if e.response.status_code == 429:
+            # Hold back every queued request, not just this one
+            retry_after = _retry_after_seconds(e.response)
+            get_llm_governor().backoff(retry_after if retry_after is not None else (delay or retry_delays[-1]))
+    else:
+        should_retry, delay = _should_retry_timeout(e, attempt, max_retries, retry_delays)
+    if not should_retry:
+        raise e
+    await asyncio.sleep(_backoff_delay(e, delay))
+
+
 async def _execute_request(self, url: str, payload: dict, headers: dict) -> str:
-    """Execute a single API request."""
-    async with httpx.AsyncClient(timeout=self.timeout) as client:
-        response = await client.post(url, json=payload, headers=headers)
-        response.raise_for_status()
-        result = response.json()
+    """Execute a single API request on the shared connection pool."""
+    client = _get_http_client(self)
+    response = await client.post(url, json=payload, headers=headers)
+    response.raise_for_status()
+    result = response.json()
+    note_usage(result.get("usage"))
 
-        if "choices" not in result or not result["choices"]:
-            raise ValueError("Invalid response from LLM API")
+    if "choices" not in result or not result["choices"]:
+        raise ValueError("Invalid response from LLM API")
 
-        content = result["choices"][0]["message"]["content"]
-        return content.strip()
+    content = result["choices"][0]["message"]["content"]
+    return content.strip()
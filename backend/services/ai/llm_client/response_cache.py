@@ -0,0 +1,189 @@
+"""Opt-in persistent cache for LLM responses.
+
+Identical requests (same model, temperature, token limit and messages) are
+served from a size-bounded SQLite file instead of being sent again. This pays
+off when users regenerate drafts for the same job description while tweaking
+options. Set ``AI_RESPONSE_CACHE=true`` to enable it. Inside
+``bypass_response_cache()`` lookups are skipped but fresh responses are still
+stored, so an explicit regenerate refreshes the cache.
+"""
+
+import contextvars
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Optional
+
+from backend.env import env_float, env_int
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = "backend/output/llm_cache.sqlite3"
+DEFAULT_TTL_S = 7 * 24 * 3600
+DEFAULT_MAX_ENTRIES = 5000
+
+# Only the fields that change the model's output are part of the key
+_KEY_FIELDS = ("model", "temperature", "max_completion_tokens", "messages")
+
+_bypass: contextvars.ContextVar[bool] = contextvars.ContextVar("llm_cache_bypass", default=False)
+
+
+@contextmanager
+def bypass_response_cache(enabled: bool = True):
+    """Skip cache lookups for LLM calls made inside the block."""
+    token = _bypass.set(enabled)
+    try:
+        yield
+    finally:
+        _bypass.reset(token)
+
+
+def is_cache_bypassed() -> bool:
+    """Return True inside ``bypass_response_cache()``."""
+    return _bypass.get()
+
+
+def cache_key(payload: Dict[str, Any]) -> str:
+    """Return a stable hash of the output-relevant parts of a request payload."""
+    material = {field: payload.get(field) for field in _KEY_FIELDS}
+    encoded = json.dumps(material, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """SQLite-backed response cache with TTL and least-recently-used eviction."""
+
+    def __init__(
+        self,
+        path: str = ":memory:",
+        ttl_s: float = DEFAULT_TTL_S,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = path
+        self.ttl_s = ttl_s
+        self.max_entries = max(1, max_entries)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_responses ("
+            "key TEXT PRIMARY KEY, response TEXT NOT NULL, "
+            "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS llm_responses_accessed_idx ON llm_responses (accessed_at)"
+        )
+        self._hits = 0
+        self._misses = 0
+        self._bypassed = 0
+        self._stores = 0
+        self._evictions = 0
+
+    def get(self, payload: Dict[str, Any]) -> Optional[str]:
+        """Return the cached response for ``payload``, or None."""
+        if is_cache_bypassed():
+            self._bypassed += 1
+            return None
+        key = cache_key(payload)
+        now = self._clock()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, created_at FROM llm_responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and now - row[1] > self.ttl_s:
+                self._conn.execute("DELETE FROM llm_responses WHERE key = ?", (key,))
+                row = None
+            if row is None:
+                self._misses += 1
+                return None
+            self._conn.execute("UPDATE llm_responses SET accessed_at = ? WHERE key = ?", (now, key))
+            self._hits += 1
+        return row[0]
+
+    def set(self, payload: Dict[str, Any], response: str) -> None:
+        """Store ``response`` for ``payload`` and evict the oldest entries past the cap."""
+        now = self._clock()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_responses (key, response, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?)",
+                (cache_key(payload), response, now, now),
+            )
+            self._stores += 1
+            overflow = self._count() - self.max_entries
+            if overflow > 0:
+                self._conn.execute(
+                    "DELETE FROM llm_responses WHERE key IN ("
+                    "SELECT key FROM llm_responses ORDER BY accessed_at ASC LIMIT ?)",
+                    (overflow,),
+                )
+                self._evictions += overflow
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_responses")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _count(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()[0]
+
+    def snapshot(self) -> Dict[str, float]:
+        """Return hit-rate metrics."""
+        lookups = self._hits + self._misses
+        with self._lock:
+            entries = self._count()
+        return {
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "hits": self._hits,
+            "misses": self._misses,
+            "bypassed": self._bypassed,
+            "stores": self._stores,
+            "evictions": self._evictions,
+            "hit_rate": self._hits / lookups if lookups else 0.0,
+        }
+
+
+_cache: Optional[LLMResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> Optional[LLMResponseCache]:
+    """Return the process-wide response cache, or None when it is disabled."""
+    global _cache
+    if os.getenv("AI_RESPONSE_CACHE", "false").lower() != "true":
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                path = os.getenv("AI_RESPONSE_CACHE_PATH") or DEFAULT_CACHE_PATH
+                if path != ":memory:":
+                    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+                _cache = LLMResponseCache(
+                    path,
+                    ttl_s=env_float("AI_RESPONSE_CACHE_TTL_S", DEFAULT_TTL_S),
+                    max_entries=env_int("AI_RESPONSE_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES),
+                )
+    return _cache
+
+
+def reset_response_cache() -> None:
+    """Close and forget the cache singleton (useful for testing or config changes)."""
+    global _cache
+    with _cache_lock:
+        if _cache is not None:
+            _cache.close()
+        _cache = None
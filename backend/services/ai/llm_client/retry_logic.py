@@ -1,10 +1,54 @@
 """Retry logic utilities."""
 
 import logging
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
 import httpx
 
 logger = logging.getLogger(__name__)
 
+# Never wait longer than this for a single retry, whatever the provider asks for
+MAX_RETRY_AFTER_S = 60.0
+
+
+def _retry_after_seconds(response: httpx.Response) -> Optional[float]:
+    """Read the provider's requested wait from Retry-After / retry-after-ms headers."""
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    try:
+        if "retry-after-ms" in headers:
+            return min(MAX_RETRY_AFTER_S, max(0.0, float(headers["retry-after-ms"]) / 1000))
+        value = headers.get("retry-after")
+        if value is None:
+            return None
+        try:
+            seconds = float(value)
+        except ValueError:
+            # HTTP-date form
+            seconds = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+        return min(MAX_RETRY_AFTER_S, max(0.0, seconds))
+    except (TypeError, ValueError):
+        return None
+
+
+def _jittered(delay: float) -> float:
+    """Spread a backoff delay over [delay/2, delay] so parallel calls don't retry in lockstep."""
+    return delay * (0.5 + random.random() / 2)
+
+
+def _backoff_delay(e: Exception, delay: float) -> float:
+    """Delay before the next attempt: the provider's Retry-After if given, else jittered backoff."""
+    if isinstance(e, httpx.HTTPStatusError):
+        retry_after = _retry_after_seconds(e.response)
+        if retry_after is not None:
+            # Small jitter on top so callers told the same value don't all return at once
+            return retry_after + random.random() * min(1.0, retry_after * 0.1)
+    return _jittered(delay)
+
 
 def _should_retry_status_error(
     e: httpx.HTTPStatusError, attempt: int, max_retries: int, retry_delays: list
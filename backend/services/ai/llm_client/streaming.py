@@ -0,0 +1,133 @@
+"""Streaming chat completion utilities."""
+
+import json
+import logging
+from contextlib import aclosing
+from typing import AsyncIterator
+
+import httpx
+
+from backend.services.ai.llm_client.circuit_breaker import get_circuit_breaker
+from backend.services.ai.llm_client.governor import get_llm_governor
+from backend.services.ai.llm_client.http_pool import _get_http_client
+from backend.services.ai.llm_client.request_executor import _breaker_attempt, _retry_or_raise
+from backend.services.ai.llm_client.response_cache import get_response_cache
+from backend.services.ai.llm_client.telemetry import LLMCall, track_stream_call
+
+logger = logging.getLogger(__name__)
+
+
+def _parse_stream_chunk(data: str) -> dict:
+    """Decode one ``data:`` payload."""
+    try:
+        return json.loads(data)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid stream chunk from LLM API: {data[:100]}") from e
+
+
+def _chunk_delta(chunk: dict) -> str:
+    """Return the content delta of a decoded chunk ("" if it carries none)."""
+    choices = chunk.get("choices") or []
+    if not choices:
+        return ""
+    return (choices[0].get("delta") or {}).get("content") or ""
+
+
+async def _execute_stream(
+    self, url: str, payload: dict, headers: dict, call: LLMCall
+) -> AsyncIterator[str]:
+    """Send one streaming request and yield content deltas as they arrive.
+
+    Token usage from the final chunk, if the provider sends one, goes to ``call``.
+    """
+    client = _get_http_client(self)
+    async with client.stream("POST", url, json=payload, headers=headers) as response:
+        if response.is_error:
+            # Load the error body so it is available on the raised exception
+            await response.aread()
+        response.raise_for_status()
+        async for line in response.aiter_lines():
+            if not line.startswith("data:"):
+                continue
+            data = line[len("data:"):].strip()
+            if data == "[DONE]":
+                break
+            chunk = _parse_stream_chunk(data)
+            call.add_usage(chunk.get("usage"))
+            delta = _chunk_delta(chunk)
+            if delta:
+                yield delta
+
+
+async def _stream_attempt(
+    self, url: str, payload: dict, headers: dict, call: LLMCall, is_probe: bool
+) -> AsyncIterator[str]:
+    """Run one streaming attempt; the first delta already proves the provider is up."""
+    breaker = get_circuit_breaker()
+    with _breaker_attempt(breaker, is_probe):
+        # The slot is held until the stream is fully read
+        async with get_llm_governor().slot():
+            first = True
+            async for delta in _execute_stream(self, url, payload, headers, call):
+                if first:
+                    breaker.record_success()
+                    first = False
+                yield delta
+
+
+async def _stream_with_retry(
+    self, url: str, payload: dict, headers: dict, call: LLMCall
+) -> AsyncIterator[str]:
+    """Stream with the same retry policy as ``_make_request_with_retry``.
+
+    Only failures before the first delta are retried; once text has been
+    forwarded to the caller a retry would repeat it.
+    """
+    max_retries = 3
+    retry_delays = [1, 2, 4]
+
+    breaker = get_circuit_breaker()
+    for attempt in range(max_retries):
+        is_probe = breaker.check()
+        call.attempts += 1
+        started = False
+        try:
+            async with aclosing(_stream_attempt(self, url, payload, headers, call, is_probe)) as deltas:
+                async for delta in deltas:
+                    started = True
+                    yield delta
+            return
+        except (httpx.HTTPStatusError, httpx.TimeoutException) as e:
+            if started:
+                raise
+            await _retry_or_raise(e, attempt, max_retries, retry_delays)
+        except httpx.HTTPError as e:
+            logger.error(f"LLM API streaming request failed: {e}", exc_info=True)
+            raise
+
+
+async def _stream_request(self, url: str, payload: dict, headers: dict) -> AsyncIterator[str]:
+    """Stream a chat completion, serving it from the response cache when enabled.
+
+    A cached response is yielded as a single chunk. A completed stream is
+    stored under the same key as the equivalent non-streaming request.
+    The call is recorded in the LLM telemetry under the current ``llm_step``.
+    """
+    with track_stream_call(payload.get("model")) as call:
+        cache = get_response_cache()
+        if cache is not None:
+            cached = cache.get(payload)
+            if cached is not None:
+                logger.debug("LLM response cache hit")
+                call.cached = True
+                yield cached
+                return
+
+        stream_payload = {**payload, "stream": True, "stream_options": {"include_usage": True}}
+        parts = []
+        async for delta in _stream_with_retry(self, url, stream_payload, headers, call):
+            parts.append(delta)
+            yield delta
+
+        if cache is not None:
+            cache.set(payload, "".join(parts).strip())
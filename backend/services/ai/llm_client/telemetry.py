@@ -0,0 +1,270 @@
+"""Per-call LLM telemetry: latency, retries, tokens and cost by pipeline step.
+
+Callers tag their LLM calls with ``llm_step("jd_analysis")``. The tag is a
+context variable, like ``bypass_response_cache``, so it follows the call into
+tasks spawned inside the block. Every call is recorded in the process-wide
+``LLMTelemetry`` aggregates, and in every enclosing ``collect_llm_calls()``
+list so requests can log a summary.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+
+from backend.env import env_float
+
+logger = logging.getLogger(__name__)
+
+UNTAGGED_STEP = "other"
+# Latencies kept per step for the p95 estimate
+RECENT_LATENCIES = 200
+
+_step: ContextVar[Optional[str]] = ContextVar("llm_step", default=None)
+_call: ContextVar[Optional["LLMCall"]] = ContextVar("llm_call", default=None)
+_collectors: ContextVar[Tuple[List["LLMCall"], ...]] = ContextVar("llm_collectors", default=())
+
+
+@contextmanager
+def llm_step(name: str):
+    """Attribute LLM calls made inside the block to a pipeline step."""
+    token = _step.set(name)
+    try:
+        yield
+    finally:
+        _step.reset(token)
+
+
+def current_step() -> str:
+    return _step.get() or UNTAGGED_STEP
+
+
+@dataclass
+class LLMCall:
+    """One logical LLM call, including its retries."""
+
+    step: str
+    model: str
+    streamed: bool = False
+    attempts: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cached: bool = False
+    error: Optional[str] = None
+    latency_ms: float = 0.0
+    started: float = field(default_factory=time.perf_counter, repr=False)
+
+    @property
+    def retries(self) -> int:
+        return max(0, self.attempts - 1)
+
+    def add_usage(self, usage: Optional[Dict[str, Any]]) -> None:
+        """Take token counts from an OpenAI-style ``usage`` object."""
+        if not isinstance(usage, dict):
+            return
+        try:
+            self.prompt_tokens = int(usage.get("prompt_tokens") or 0)
+            self.completion_tokens = int(usage.get("completion_tokens") or 0)
+        except (TypeError, ValueError):
+            logger.debug(f"Ignoring malformed usage: {usage!r}")
+
+
+def start_call(model: Optional[str], streamed: bool = False) -> LLMCall:
+    return LLMCall(step=current_step(), model=model or "unknown", streamed=streamed)
+
+
+def finish_call(call: LLMCall, error: Optional[BaseException] = None) -> None:
+    """Record a finished call in the process aggregates and every enclosing collector."""
+    call.latency_ms = (time.perf_counter() - call.started) * 1000
+    if error is not None:
+        call.error = type(error).__name__
+    get_llm_telemetry().record(call)
+    for calls in _collectors.get():
+        calls.append(call)
+
+
+@contextmanager
+def track_llm_call(model: Optional[str]) -> Iterator[LLMCall]:
+    """Time a non-streaming call; ``note_attempt``/``note_usage`` inside update it."""
+    call = start_call(model)
+    token = _call.set(call)
+    try:
+        yield call
+    except BaseException as e:
+        _call.reset(token)
+        finish_call(call, e)
+        raise
+    _call.reset(token)
+    finish_call(call)
+
+
+@contextmanager
+def track_stream_call(model: Optional[str]) -> Iterator[LLMCall]:
+    """Time a streamed call.
+
+    A stream hands control back to its consumer between chunks, so the call
+    is passed to the stream code directly rather than through ``note_*``.
+    """
+    call = start_call(model, streamed=True)
+    try:
+        yield call
+    except BaseException as e:
+        finish_call(call, e)
+        raise
+    finish_call(call)
+
+
+def note_attempt() -> None:
+    call = _call.get()
+    if call is not None:
+        call.attempts += 1
+
+
+def note_usage(usage: Optional[Dict[str, Any]]) -> None:
+    call = _call.get()
+    if call is not None:
+        call.add_usage(usage)
+
+
+@contextmanager
+def collect_llm_calls() -> Iterator[List[LLMCall]]:
+    """Collect the calls made inside the block, for a per-request summary.
+
+    Blocks nest: a call is added to every enclosing collector.
+    """
+    calls: List[LLMCall] = []
+    token = _collectors.set((*_collectors.get(), calls))
+    try:
+        yield calls
+    finally:
+        _collectors.reset(token)
+
+
+def summarize_calls(calls: List[LLMCall]) -> str:
+    """Render calls as 'N calls, tokens, cost; step=calls/latency/tokens, ...'."""
+    if not calls:
+        return "no LLM calls"
+    by_step: Dict[str, List[LLMCall]] = {}
+    for call in calls:
+        by_step.setdefault(call.step, []).append(call)
+
+    prices = _prices()
+    parts = []
+    for step, step_calls in by_step.items():
+        part = (
+            f"{step}={len(step_calls)} calls/"
+            f"{max(c.latency_ms for c in step_calls):.0f}ms max/"
+            f"{sum(c.prompt_tokens for c in step_calls)}+{sum(c.completion_tokens for c in step_calls)} tokens"
+        )
+        retries = sum(c.retries for c in step_calls)
+        if retries:
+            part += f"/{retries} retries"
+        parts.append(part)
+
+    total = (
+        f"{len(calls)} calls, {sum(c.prompt_tokens for c in calls)} prompt + "
+        f"{sum(c.completion_tokens for c in calls)} completion tokens"
+    )
+    if any(prices):
+        total += f", ~${sum(_cost(c, prices) for c in calls):.4f}"
+    return f"{total}; " + ", ".join(parts)
+
+
+def _prices() -> tuple[float, float]:
+    """USD per million prompt and completion tokens (0 when not configured)."""
+    return env_float("AI_PRICE_INPUT_PER_1M", 0.0), env_float("AI_PRICE_OUTPUT_PER_1M", 0.0)
+
+
+def _cost(call: LLMCall, prices: tuple[float, float]) -> float:
+    return (call.prompt_tokens * prices[0] + call.completion_tokens * prices[1]) / 1_000_000
+
+
+class _Stats:
+    """Running totals for one step or model."""
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.cache_hits = 0
+        self.retries = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.cost_usd = 0.0
+        self.total_latency_ms = 0.0
+        self.max_latency_ms = 0.0
+        self.recent: Deque[float] = deque(maxlen=RECENT_LATENCIES)
+
+    def add(self, call: LLMCall, cost: float) -> None:
+        self.calls += 1
+        self.errors += call.error is not None
+        self.cache_hits += call.cached
+        self.retries += call.retries
+        self.prompt_tokens += call.prompt_tokens
+        self.completion_tokens += call.completion_tokens
+        self.cost_usd += cost
+        self.total_latency_ms += call.latency_ms
+        self.max_latency_ms = max(self.max_latency_ms, call.latency_ms)
+        self.recent.append(call.latency_ms)
+
+    def snapshot(self) -> Dict[str, float]:
+        recent = sorted(self.recent)
+        p95 = recent[max(0, int(len(recent) * 0.95) - 1)] if recent else 0.0
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "cache_hits": self.cache_hits,
+            "retries": self.retries,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "cost_usd": round(self.cost_usd, 6),
+            "avg_latency_ms": (self.total_latency_ms / self.calls) if self.calls else 0.0,
+            "p95_latency_ms": p95,
+            "max_latency_ms": self.max_latency_ms,
+        }
+
+
+class LLMTelemetry:
+    """Process-wide LLM call aggregates by pipeline step and by model."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._total = _Stats()
+        self._by_step: Dict[str, _Stats] = {}
+        self._by_model: Dict[str, _Stats] = {}
+
+    def record(self, call: LLMCall) -> None:
+        cost = _cost(call, _prices())
+        with self._lock:
+            self._total.add(call, cost)
+            self._by_step.setdefault(call.step, _Stats()).add(call, cost)
+            self._by_model.setdefault(call.model, _Stats()).add(call, cost)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return totals plus per-step and per-model breakdowns."""
+        with self._lock:
+            return {
+                "total": self._total.snapshot(),
+                "steps": {name: stats.snapshot() for name, stats in sorted(self._by_step.items())},
+                "models": {name: stats.snapshot() for name, stats in sorted(self._by_model.items())},
+            }
+
+
+_telemetry: Optional[LLMTelemetry] = None
+
+
+def get_llm_telemetry() -> LLMTelemetry:
+    """Get or create the process-wide telemetry aggregates."""
+    global _telemetry
+    if _telemetry is None:
+        _telemetry = LLMTelemetry()
+    return _telemetry
+
+
+def reset_llm_telemetry() -> None:
+    """Forget all recorded calls (useful for testing)."""
+    global _telemetry
+    _telemetry = None
@@ -2,22 +2,71 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
+from backend.env import env_int
 from backend.models import CVData, Experience, Project
-from backend.services.ai.llm_client import get_llm_client
+from backend.services.ai.llm_client import get_llm_client, llm_step
 from backend.services.ai.llm_tailor.text_tailoring import _tailor_text
 from backend.services.ai.llm_tailor.skill_reordering import _reorder_skills_for_jd
 
 logger = logging.getLogger(__name__)
 
+# Items tailored at once per CV; the LLM governor still caps requests process-wide
+DEFAULT_CONCURRENCY = 8
+
+
+def _get_concurrency() -> int:
+    return max(1, env_int("AI_TAILOR_CONCURRENCY", DEFAULT_CONCURRENCY))
+
+
+async def _tailor_items(
+    llm_client,
+    items: List[Tuple[str, str]],
+    job_description: str,
+    additional_context: Optional[str],
+    concurrency: int,
+) -> List[str]:
+    """
+    Tailor (text, context) items concurrently and return results in item order.
+
+    Each item is tailored independently. When an item fails, the items still
+    running are cancelled and the error is raised. If several items had
+    already failed, the error of the earliest one in item order is raised.
+    """
+    if not items:
+        return []
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def tailor(text: str, context: str) -> str:
+        async with semaphore:
+            return await _tailor_text(llm_client, text, job_description, context, additional_context)
+
+    tasks = [asyncio.create_task(tailor(text, context)) for text, context in items]
+    try:
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+    finally:
+        # Also reached when the caller is cancelled
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    for task in tasks:
+        if not task.cancelled() and task.exception() is not None:
+            raise task.exception()
+    return [task.result() for task in tasks]
+
 
 async def llm_tailor_cv(
     draft: CVData,
     job_description: str,
     original_profile: CVData,
     additional_context: Optional[str] = None,
+    concurrency: Optional[int] = None,
 ) -> CVData:
     """
     Tailor CV content using LLM to better match job description.
@@ -30,6 +79,7 @@ async def llm_tailor_cv(
         job_description: The job description to match against
         original_profile: Original profile for reference (to prevent hallucination)
         additional_context: Optional additional achievements or context to incorporate
+        concurrency: Max items tailored at once (default from AI_TAILOR_CONCURRENCY)
 
     Returns:
         Tailored CV with reworded content
@@ -41,45 +91,36 @@ async def llm_tailor_cv(
             "LLM is not configured. Set AI_ENABLED=true and configure API credentials."
         )
 
-    tailored_experiences: List[Experience] = []
-
+    # Flatten every text to tailor in document order, tailor them concurrently,
+    # then rebuild the experiences from the results in the same order.
+    items: List[Tuple[str, str]] = []
     for experience in draft.experience:
-        # Tailor experience description if present
-        tailored_description = experience.description
         if experience.description:
-            tailored_description = await _tailor_text(
+            items.append((experience.description, "experience description"))
+        for project in experience.projects:
+            if project.description:
+                items.append((project.description, "project description"))
+            items.extend((highlight, "bullet point") for highlight in project.highlights)
+
+    with llm_step("tailor"):
+        tailored = iter(
+            await _tailor_items(
                 llm_client,
-                experience.description,
+                items,
                 job_description,
-                "experience description",
                 additional_context,
+                concurrency or _get_concurrency(),
             )
+        )
+
+    tailored_experiences: List[Experience] = []
+    for experience in draft.experience:
+        tailored_description = next(tailored) if experience.description else experience.description
 
-        # Tailor projects
         tailored_projects: List[Project] = []
         for project in experience.projects:
-            # Tailor project description if present
-            tailored_proj_description = project.description
-            if project.description:
-                tailored_proj_description = await _tailor_text(
-                    llm_client,
-                    project.description,
-                    job_description,
-                    "project description",
-                    additional_context,
-                )
-
-            # Tailor highlights
-            tailored_highlights: List[str] = []
-            for highlight in project.highlights:
-                tailored_highlight = await _tailor_text(
-                    llm_client,
-                    highlight,
-                    job_description,
-                    "bullet point",
-                    additional_context,
-                )
-                tailored_highlights.append(tailored_highlight)
+            tailored_proj_description = next(tailored) if project.description else project.description
+            tailored_highlights = [next(tailored) for _ in project.highlights]
 
             tailored_projects.append(
                 Project(
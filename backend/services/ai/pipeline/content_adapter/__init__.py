@@ -6,6 +6,7 @@ from backend.services.ai.pipeline.content_adapter.task_collection import _collec
 from backend.services.ai.pipeline.content_adapter.reconstruction import _reconstruct_experience, _reconstruct_project
 from backend.services.ai.pipeline.content_adapter.text_adaptation import _adapt_text, _build_jd_summary
 from backend.services.ai.pipeline.content_adapter.mapping import _build_adapted_text_map
+from backend.services.ai.pipeline.content_adapter.batch_adaptation import _adapt_text_batch, parse_batch_adaptation_response
 
 __all__ = [
     "adapt_content",
@@ -17,4 +18,6 @@ __all__ = [
     "_adapt_text",
     "_build_jd_summary",
     "_build_adapted_text_map",
+    "_adapt_text_batch",
+    "parse_batch_adaptation_response",
 ]
@@ -2,21 +2,27 @@
 
 import asyncio
 import logging
-from typing import Optional
+from typing import Callable, Optional, Tuple
 
 from backend.services.ai.pipeline.models import JDAnalysis, SelectionResult, AdaptedContent
-from backend.services.ai.llm_client import get_llm_client
+from backend.services.ai.llm_client import get_llm_client, llm_step
+from backend.services.ai.pipeline.content_adapter.batch_adaptation import _adapt_text_batch, _get_batch_size, _group_adaptation_tasks
 from backend.services.ai.pipeline.content_adapter.task_collection import _collect_adaptation_tasks, _adapt_single_text_item
 from backend.services.ai.pipeline.content_adapter.reconstruction import _reconstruct_experience
 from backend.services.ai.pipeline.content_adapter.mapping import _build_adapted_text_map
 
 logger = logging.getLogger(__name__)
 
+AdaptationResult = Tuple[str, str, str, str, str, str, Optional[str]]
+AdaptedItemCallback = Callable[[AdaptationResult], None]
+
 
 async def adapt_content(
     selection_result: SelectionResult,
     jd_analysis: JDAnalysis,
     additional_context: Optional[str] = None,
+    batch_size: Optional[int] = None,
+    on_item: Optional[AdaptedItemCallback] = None,
 ) -> AdaptedContent:
     """
     Adapt wording of selected content to match JD terminology.
@@ -27,6 +33,10 @@ async def adapt_content(
         selection_result: Selected content from profile
         jd_analysis: JD requirements for context
         additional_context: Optional user-provided context to incorporate
+        batch_size: Text items per LLM call, grouped by experience (defaults to
+            AI_ADAPT_BATCH_SIZE; 1 or less adapts each item with its own call)
+        on_item: Optional callback invoked with each adaptation result tuple
+            as soon as its LLM call finishes
 
     Returns:
         AdaptedContent with reworded content
@@ -34,9 +44,10 @@ async def adapt_content(
     llm_client = get_llm_client()
 
     if llm_client.is_configured():
-        return await _adapt_with_llm(
-            llm_client, selection_result, jd_analysis, additional_context
-        )
+        with llm_step("adaptation"):
+            return await _adapt_with_llm(
+                llm_client, selection_result, jd_analysis, additional_context, batch_size, on_item
+            )
 
     # Without LLM, return content as-is
     return AdaptedContent(
@@ -46,11 +57,22 @@ async def adapt_content(
     )
 
 
+async def _notify(coro, on_item: Optional[AdaptedItemCallback]):
+    """Await an item or batch adaptation and report its results to ``on_item``."""
+    result = await coro
+    if on_item is not None:
+        for item in (result if isinstance(result, list) else [result]):
+            on_item(item)
+    return result
+
+
 async def _adapt_with_llm(
     llm_client,
     selection_result: SelectionResult,
     jd_analysis: JDAnalysis,
     additional_context: Optional[str],
+    batch_size: Optional[int] = None,
+    on_item: Optional[AdaptedItemCallback] = None,
 ) -> AdaptedContent:
     """Use LLM to adapt content wording."""
     from backend.services.ai.pipeline.content_adapter.text_adaptation import _build_jd_summary
@@ -74,13 +96,24 @@ Follow this directive when adapting content. The directive should guide how you
 
     # Collect all text items that need adaptation
     adaptation_tasks = _collect_adaptation_tasks(selection_result)
-    logger.info(f"Collected {len(adaptation_tasks)} text items to adapt - running in parallel")
+    if batch_size is None:
+        batch_size = _get_batch_size()
+
+    if batch_size > 1:
+        groups = _group_adaptation_tasks(adaptation_tasks, batch_size)
+        logger.info(f"Collected {len(adaptation_tasks)} text items to adapt - running {len(groups)} batch(es) in parallel")
+        group_results = await asyncio.gather(
+            *[_notify(_adapt_text_batch(llm_client, group, jd_summary, context_section), on_item) for group in groups]
+        )
+        adaptation_results = [result for group in group_results for result in group]
+    else:
+        logger.info(f"Collected {len(adaptation_tasks)} text items to adapt - running in parallel")
 
-    # Adapt all text items in parallel
-    adaptation_results = await asyncio.gather(
-        *[_adapt_single_text_item(llm_client, task, jd_summary, context_section) for task in adaptation_tasks],
-        return_exceptions=False
-    )
+        # Adapt all text items in parallel
+        adaptation_results = await asyncio.gather(
+            *[_notify(_adapt_single_text_item(llm_client, task, jd_summary, context_section), on_item) for task in adaptation_tasks],
+            return_exceptions=False
+        )
 
     # Build a lookup map for adapted text
     adapted_text_map = _build_adapted_text_map(adaptation_results, warnings)
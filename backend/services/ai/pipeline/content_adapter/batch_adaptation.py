@@ -0,0 +1,195 @@
+"""Batched adaptation: rewrite a group of text items with one LLM call."""
+
+import asyncio
+import json
+import logging
+import re
+from typing import Dict, List, Optional, Tuple
+
+from backend.env import env_int
+from backend.services.ai.deadline import BudgetExhausted, within_budget
+from backend.services.ai.llm_client import CircuitOpenError
+from backend.services.ai.pipeline.content_adapter.task_collection import (
+    ADAPTATION_DEGRADED,
+    _CONTEXT_TYPES,
+    _adapt_single_text_item,
+)
+from backend.services.ai.pipeline.content_adapter.text_adaptation import _length_limits, _validate_adapted_text
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 12
+
+_Task = Tuple[str, str, str, str, str]
+_Result = Tuple[str, str, str, str, str, str, str | None]
+
+
+def _get_batch_size() -> int:
+    """Items per LLM call from AI_ADAPT_BATCH_SIZE (1 or less disables batching)."""
+    return env_int("AI_ADAPT_BATCH_SIZE", DEFAULT_BATCH_SIZE)
+
+
+def _group_adaptation_tasks(tasks: List[_Task], batch_size: int) -> List[List[_Task]]:
+    """Group tasks per experience, splitting experiences larger than batch_size."""
+    by_experience: Dict[str, List[_Task]] = {}
+    for task in tasks:
+        by_experience.setdefault(task[1], []).append(task)
+
+    groups: List[List[_Task]] = []
+    for exp_tasks in by_experience.values():
+        for i in range(0, len(exp_tasks), batch_size):
+            groups.append(exp_tasks[i:i + batch_size])
+    return groups
+
+
+def _build_batch_prompt(tasks: List[_Task], jd_summary: str, context_section: str) -> str:
+    """Build one prompt that adapts every item in the group."""
+    items = []
+    for item_id, (task_type, _exp, _proj, _hl, text) in enumerate(tasks):
+        context_type = _CONTEXT_TYPES.get(task_type, "text")
+        target_chars, _max = _length_limits(context_type)
+        items.append({"id": item_id, "type": context_type, "max_chars": target_chars, "text": text})
+
+    return f"""Job Description Context:
+{jd_summary}{context_section}
+
+Original items (JSON):
+{json.dumps(items, ensure_ascii=False, indent=2)}
+
+CRITICAL RULES (apply to every item independently):
+- You are ADAPTING existing content, not creating new content
+- Every fact in an item's output must exist in that item's original text
+- Do NOT move facts between items
+- You may rephrase, reorder, and emphasize differently
+- You may use terminology from the job description
+- You may NOT add new achievements, metrics, or claims
+- If the original says "improved performance", do NOT say "improved performance by 30%"
+- If unsure, keep original wording
+- Aim to keep each rewritten text under its max_chars
+
+Return ONLY a JSON array with one object per item, no explanations:
+[{{"id": 0, "text": "reworded text"}}]"""
+
+
+def parse_batch_adaptation_response(response: str) -> Dict[int, str]:
+    """Parse a batched response into rewritten text keyed by item id.
+
+    Accepts a JSON array of {"id", "text"} objects or an object keyed by id.
+    Malformed entries are skipped so callers can retry just those items.
+    """
+    json_match = re.search(r'[\[{][\s\S]*[\]}]', response)
+    if not json_match:
+        return {}
+    try:
+        data = json.loads(json_match.group())
+    except json.JSONDecodeError as e:
+        logger.error(f"Failed to parse batch adaptation response: {e}, response: {response[:200]}")
+        return {}
+
+    if isinstance(data, dict):
+        entries = [{"id": key, "text": value} for key, value in data.items()]
+    elif isinstance(data, list):
+        entries = data
+    else:
+        return {}
+
+    results: Dict[int, str] = {}
+    for entry in entries:
+        if not isinstance(entry, dict) or not isinstance(entry.get("text"), str):
+            continue
+        try:
+            results[int(entry.get("id"))] = entry["text"].strip()
+        except (TypeError, ValueError):
+            logger.debug(f"Skipping malformed batch entry {entry!r}")
+    return results
+
+
+async def _generate_within_budget(llm_client, prompt: str) -> Optional[str]:
+    """Run the batch LLM call under the time budget.
+
+    Returns None once the budget is spent or while the LLM circuit is open.
+    """
+    try:
+        return await within_budget(
+            llm_client.generate_text(
+                prompt,
+                system_prompt="You are a CV editor. Reword content without adding facts.",
+            ),
+            ADAPTATION_DEGRADED,
+        )
+    except (BudgetExhausted, CircuitOpenError):
+        return None
+
+
+async def _request_batch(
+    llm_client,
+    tasks: List[_Task],
+    pending: List[int],
+    jd_summary: str,
+    context_section: str,
+) -> Optional[Dict[int, str]]:
+    """Ask the LLM to adapt the pending items; returns rewritten text keyed by item id.
+
+    Returns None when the time budget runs out or the circuit is open. Any
+    other failure returns no results, so every pending item is adapted on
+    its own.
+    """
+    prompt = _build_batch_prompt([tasks[i] for i in pending], jd_summary, context_section)
+    logger.debug(f"LLM adapting {len(pending)} items in one batch")
+    try:
+        response = await _generate_within_budget(llm_client, prompt)
+    except Exception as e:
+        logger.warning(f"Batch adaptation failed for {len(pending)} items, adapting individually: {e}")
+        return {}
+    if response is None:
+        return None
+    parsed = parse_batch_adaptation_response(response)
+    return {pending[k]: text for k, text in parsed.items() if 0 <= k < len(pending)}
+
+
+def _validate_batch_item(task: _Task, adapted: str) -> _Result:
+    """Result for one batched item, keeping the original text if validation fails."""
+    context_type = _CONTEXT_TYPES.get(task[0], "text")
+    try:
+        _validate_adapted_text(task[4], adapted, context_type)
+        return (*task, adapted, None)
+    except ValueError as e:
+        logger.warning(f"Failed to adapt {context_type}: {e}")
+        return (*task, task[4], str(e))
+
+
+async def _adapt_text_batch(
+    llm_client,
+    tasks: List[_Task],
+    jd_summary: str,
+    context_section: str,
+) -> List[_Result]:
+    """Adapt a group of text items with one LLM call.
+
+    Returns the same result tuples as ``_adapt_single_text_item``. Each item
+    is validated on its own; items missing from the response are adapted
+    individually. If the time budget runs out or the LLM circuit is open,
+    pending items keep their original text.
+    """
+    results: Dict[int, _Result] = {item_id: (*task, task[4], None) for item_id, task in enumerate(tasks)}
+    pending = [item_id for item_id, task in enumerate(tasks) if task[4] and task[4].strip()]
+    if not pending:
+        return list(results.values())
+
+    parsed = await _request_batch(llm_client, tasks, pending, jd_summary, context_section)
+    if parsed is None:
+        return list(results.values())
+
+    for item_id, adapted in parsed.items():
+        results[item_id] = _validate_batch_item(tasks[item_id], adapted)
+
+    missing = [item_id for item_id in pending if item_id not in parsed]
+    if missing:
+        if parsed:
+            logger.warning(f"Batch response missing {len(missing)} item(s), adapting them individually")
+        retried = await asyncio.gather(
+            *[_adapt_single_text_item(llm_client, tasks[i], jd_summary, context_section) for i in missing]
+        )
+        results.update(zip(missing, retried))
+
+    return [results[i] for i in range(len(tasks))]
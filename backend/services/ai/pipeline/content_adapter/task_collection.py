@@ -3,11 +3,21 @@
 import logging
 from typing import List, Tuple
 
+from backend.services.ai.deadline import BudgetExhausted, within_budget
+from backend.services.ai.llm_client import CircuitOpenError
 from backend.services.ai.pipeline.models import SelectionResult
 from backend.services.ai.pipeline.content_adapter.text_adaptation import _adapt_text
 
 logger = logging.getLogger(__name__)
 
+_CONTEXT_TYPES = {
+    "exp_desc": "experience description",
+    "proj_desc": "project description",
+    "highlight": "bullet point",
+}
+
+ADAPTATION_DEGRADED = "Some items kept their original wording to stay within the time budget"
+
 
 def _collect_adaptation_tasks(selection_result: SelectionResult) -> List[Tuple[str, str, str, str, str]]:
     """Collect all text items that need adaptation."""
@@ -37,24 +47,28 @@ async def _adapt_single_text_item(
     jd_summary: str,
     context_section: str,
 ) -> Tuple[str, str, str, str, str, str, str | None]:
-    """Adapt a single text item with error handling."""
+    """Adapt a single text item with error handling.
+
+    The original text is kept, without an error, if the time budget runs out
+    or the LLM circuit is open.
+    """
     task_type, exp_idx, proj_idx, hl_idx, original_text = task_info
-    context_type_map = {
-        "exp_desc": "experience description",
-        "proj_desc": "project description",
-        "highlight": "bullet point",
-    }
-    context_type = context_type_map.get(task_type, "text")
+    context_type = _CONTEXT_TYPES.get(task_type, "text")
 
     try:
-        adapted = await _adapt_text(
-            llm_client,
-            original_text,
-            jd_summary,
-            context_type,
-            context_section,
+        adapted = await within_budget(
+            _adapt_text(
+                llm_client,
+                original_text,
+                jd_summary,
+                context_type,
+                context_section,
+            ),
+            ADAPTATION_DEGRADED,
         )
         return (task_type, exp_idx, proj_idx, hl_idx, original_text, adapted, None)
+    except (BudgetExhausted, CircuitOpenError):
+        return (task_type, exp_idx, proj_idx, hl_idx, original_text, original_text, None)
     except ValueError as e:
         logger.warning(f"Failed to adapt {context_type}: {e}")
         return (task_type, exp_idx, proj_idx, hl_idx, original_text, original_text, str(e))
@@ -1,6 +1,7 @@
 """Text adaptation and JD summary building."""
 
 import logging
+from typing import Tuple
 
 from backend.services.ai.pipeline.models import JDAnalysis
 
@@ -42,9 +43,7 @@ async def _adapt_text(
     if not original_text or not original_text.strip():
         return original_text
 
-    # Use conservative target for LLM, but allow up to model validation limit
-    target_chars = _LLM_TARGET_DESCRIPTION_CHARS if "description" in context_type else _LLM_TARGET_HIGHLIGHT_CHARS
-    max_chars = _MAX_DESCRIPTION_CHARS if "description" in context_type else _MAX_HIGHLIGHT_CHARS
+    target_chars, max_chars = _length_limits(context_type)
     length_instruction = f"\n- Aim to keep the rewritten text under {target_chars} characters"
 
     prompt = f"""Job Description Context:
@@ -69,6 +68,22 @@ Return ONLY the reworded text, no explanations."""
     adapted = adapted.strip()
     logger.debug(f"LLM response for {context_type}: {len(adapted)} chars - '{adapted[:100]}...'")
 
+    _validate_adapted_text(original_text, adapted, context_type)
+    return adapted
+
+
+def _length_limits(context_type: str) -> Tuple[int, int]:
+    """Return (target, max) character limits for a context type."""
+    # Use conservative target for LLM, but allow up to model validation limit
+    if "description" in context_type:
+        return _LLM_TARGET_DESCRIPTION_CHARS, _MAX_DESCRIPTION_CHARS
+    return _LLM_TARGET_HIGHLIGHT_CHARS, _MAX_HIGHLIGHT_CHARS
+
+
+def _validate_adapted_text(original_text: str, adapted: str, context_type: str) -> None:
+    """Raise ValueError if adapted text breaks the length or content-loss rules."""
+    target_chars, max_chars = _length_limits(context_type)
+
     # Validate length - allow up to model validation limit even if over target
     if len(adapted) > max_chars:
         logger.error(
@@ -89,5 +104,3 @@ Return ONLY the reworded text, no explanations."""
         raise ValueError(
             f"LLM output for {context_type} is too short - possible content loss"
         )
-
-    return adapted
@@ -4,7 +4,8 @@ import logging
 from typing import List, Dict, Optional
 from backend.models import Experience, Project
 from backend.services.ai.pipeline.models import JDAnalysis, SkillMapping, SelectionResult
-from backend.services.ai.scoring import score_item, top_n_scored
+from backend.services.ai.scoring import CompiledSpec, compile_spec, score_items, top_n_scored
+from backend.services.ai.target_spec import TargetSpec
 
 logger = logging.getLogger(__name__)
 
@@ -36,32 +37,28 @@ def select_content(
     if not profile_experiences:
         return SelectionResult(experiences=[], selected_indices={})
 
-    # Build a simple spec-like object for scoring compatibility
-    class SimpleSpec:
-        def __init__(self, jd: JDAnalysis):
-            self.required_keywords = jd.required_skills
-            self.preferred_keywords = jd.preferred_skills
-            self.responsibilities = jd.responsibilities
-
-    spec = SimpleSpec(jd_analysis)
+    # Tokenize the JD side once for every item scored below
+    spec = compile_spec(TargetSpec(
+        required_keywords=jd_analysis.required_skills,
+        preferred_keywords=jd_analysis.preferred_skills,
+        responsibilities=jd_analysis.responsibilities,
+    ))
 
     # Score and select experiences
-    scored_experiences: List[tuple[float, Experience]] = []
-    for exp in profile_experiences:
-        # Score based on how well it matches JD requirements
-        score = score_item(
-            text_parts=[
-                exp.title,
-                exp.company,
-                exp.description or "",
-            ],
-            technologies=[
-                tech for project in exp.projects for tech in project.technologies
-            ],
-            start_date=exp.start_date,
-            spec=spec,
-        ).value
-        scored_experiences.append((score, exp))
+    scores = score_items(
+        [
+            (
+                [exp.title, exp.company, exp.description or ""],
+                [tech for project in exp.projects for tech in project.technologies],
+                exp.start_date,
+            )
+            for exp in profile_experiences
+        ],
+        spec,
+    )
+    scored_experiences: List[tuple[float, Experience]] = [
+        (score.value, exp) for score, exp in zip(scores, profile_experiences)
+    ]
 
     # Select top experiences
     top_experiences = [
@@ -83,12 +80,19 @@ def select_content(
 
         # Create a set of selected project names for comparison
         selected_project_names = {p.name for p in selected_projects}
+        # Highlights are selected once per project, for both the indices and the trimmed copy
+        highlights_by_project: Dict[int, List[str]] = {}
+
+        def project_highlights(project: Project) -> List[str]:
+            if id(project) not in highlights_by_project:
+                highlights_by_project[id(project)] = _select_highlights(project, spec, max_highlights=3)
+            return highlights_by_project[id(project)]
 
         for idx, project in enumerate(exp.projects):
             if project.name in selected_project_names:
                 project_indices.append(idx)
                 # Select highlights for this project
-                selected_highlights = _select_highlights(project, spec, max_highlights=3)
+                selected_highlights = project_highlights(project)
                 highlight_indices = [
                     hl_idx for hl_idx, hl in enumerate(project.highlights)
                     if hl in selected_highlights
@@ -103,7 +107,7 @@ def select_content(
         # Create trimmed experience with selected projects
         trimmed_projects: List[Project] = []
         for project in selected_projects:
-            selected_highlights = _select_highlights(project, spec, max_highlights=3)
+            selected_highlights = project_highlights(project)
             trimmed_project = Project(
                 name=project.name,
                 description=project.description,
@@ -130,37 +134,30 @@ def select_content(
     )
 
 
-def _select_projects(experience: Experience, spec, max_projects: int) -> List[Project]:
+def _select_projects(experience: Experience, spec: CompiledSpec, max_projects: int) -> List[Project]:
     """Select relevant projects from an experience."""
     if not experience.projects:
         return []
 
-    scored: List[tuple[float, Project]] = []
-    for project in experience.projects:
-        score = score_item(
-            text_parts=[project.name, project.description or "", *project.highlights],
-            technologies=project.technologies,
-            start_date=experience.start_date,
-            spec=spec,
-        ).value
-        scored.append((score, project))
-
+    scores = score_items(
+        [
+            ([project.name, project.description or "", *project.highlights], project.technologies, experience.start_date)
+            for project in experience.projects
+        ],
+        spec,
+    )
+    scored = [(score.value, project) for score, project in zip(scores, experience.projects)]
     return [project for _, project in top_n_scored(scored, max_projects)]
 
 
-def _select_highlights(project: Project, spec, max_highlights: int) -> List[str]:
+def _select_highlights(project: Project, spec: CompiledSpec, max_highlights: int) -> List[str]:
     """Select relevant highlights from a project."""
     if not project.highlights:
         return []
 
-    scored: List[tuple[float, str]] = []
-    for highlight in project.highlights:
-        score = score_item(
-            text_parts=[highlight],
-            technologies=project.technologies,
-            start_date="2023-01",
-            spec=spec,
-        ).value
-        scored.append((score, highlight))
-
+    scores = score_items(
+        [([highlight], project.technologies, "2023-01") for highlight in project.highlights],
+        spec,
+    )
+    scored = [(score.value, highlight) for score, highlight in zip(scores, project.highlights)]
     return [highlight for _, highlight in top_n_scored(scored, max_highlights)]
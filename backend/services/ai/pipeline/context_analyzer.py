@@ -4,8 +4,9 @@ import json
 import logging
 import re
 from typing import Optional
+from backend.services.ai.deadline import within_budget
 from backend.services.ai.pipeline.models import ContextAnalysis
-from backend.services.ai.llm_client import get_llm_client
+from backend.services.ai.llm_client import get_llm_client, llm_step
 
 logger = logging.getLogger(__name__)
 
@@ -53,7 +54,11 @@ async def analyze_additional_context(
         )
 
     try:
-        return await _analyze_with_llm(llm_client, additional_context, job_description)
+        with llm_step("context_analysis"):
+            return await within_budget(
+                _analyze_with_llm(llm_client, additional_context, job_description),
+                "Additional context placed in the summary without analysis to stay within the time budget",
+            )
     except Exception as e:
         logger.warning(f"Failed to analyze additional_context with LLM: {e}, using fallback")
         # Fallback to content_statement in summary
@@ -102,7 +107,8 @@ Return JSON:
     logger.debug(f"Analyzing additional_context: {additional_context[:100]}...")
     response = await llm_client.generate_text(
         prompt,
-        system_prompt="You are an assistant analyzing additional context for CV tailoring."
+        system_prompt="You are an assistant analyzing additional context for CV tailoring.",
+        hedge=True,  # On the critical path of every draft that has additional_context
     )
     logger.debug(f"LLM response for context analysis: {response[:200]}...")
 
@@ -0,0 +1,160 @@
+"""Small dependency-graph executor for pipeline steps.
+
+Each step starts as soon as the steps it depends on have finished, so
+independent steps (e.g. LLM calls and CPU-only heuristics) overlap. The
+executor records when every step started and finished relative to the start
+of the run.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+StepResults = Dict[str, Any]
+StepEventCallback = Callable[[str, str], None]  # (step name, "started" | "finished")
+
+
+@dataclass(frozen=True)
+class PipelineStep:
+    """A named pipeline step and the steps whose results it needs."""
+
+    name: str
+    run: Callable[[StepResults], Awaitable[Any]]
+    depends_on: Tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class StepTiming:
+    """Start and finish offsets of a step, in milliseconds from the run start."""
+
+    started_ms: float
+    finished_ms: float
+
+    @property
+    def duration_ms(self) -> float:
+        return self.finished_ms - self.started_ms
+
+
+def _topological_order(steps: List[PipelineStep]) -> List[PipelineStep]:
+    by_name = {step.name: step for step in steps}
+    if len(by_name) != len(steps):
+        raise ValueError("Pipeline step names must be unique")
+
+    ordered: List[PipelineStep] = []
+    state: Dict[str, str] = {}
+
+    def visit(step: PipelineStep) -> None:
+        if state.get(step.name) == "done":
+            return
+        if state.get(step.name) == "visiting":
+            raise ValueError(f"Pipeline has a dependency cycle at '{step.name}'")
+        state[step.name] = "visiting"
+        for dependency in step.depends_on:
+            if dependency not in by_name:
+                raise ValueError(f"Step '{step.name}' depends on unknown step '{dependency}'")
+            visit(by_name[dependency])
+        state[step.name] = "done"
+        ordered.append(step)
+
+    for step in steps:
+        visit(step)
+    return ordered
+
+
+class _GraphRun:
+    """Tasks, results and timings of one ``run_pipeline_graph`` call."""
+
+    def __init__(self, on_event: Optional[StepEventCallback]):
+        self.on_event = on_event
+        self.results: StepResults = {}
+        self.timings: Dict[str, StepTiming] = {}
+        self.tasks: Dict[str, asyncio.Task] = {}
+        self._started = time.perf_counter()
+
+    def _offset_ms(self) -> float:
+        return (time.perf_counter() - self._started) * 1000
+
+    def _emit(self, name: str, event: str) -> None:
+        if self.on_event:
+            self.on_event(name, event)
+
+    async def _run_step(self, step: PipelineStep) -> None:
+        if step.depends_on:
+            await asyncio.gather(*(self.tasks[name] for name in step.depends_on))
+        started_ms = self._offset_ms()
+        self._emit(step.name, "started")
+        self.results[step.name] = await step.run(self.results)
+        self.timings[step.name] = StepTiming(started_ms, self._offset_ms())
+        self._emit(step.name, "finished")
+
+    def schedule(self, ordered: List[PipelineStep]) -> None:
+        """Start a task per step; each waits for its dependencies itself."""
+        for step in ordered:
+            self.tasks[step.name] = asyncio.create_task(self._run_step(step), name=f"pipeline:{step.name}")
+
+    async def wait(self, ordered: List[PipelineStep]) -> None:
+        """Wait for every step, or cancel the rest and raise on the first failure.
+
+        If the caller is cancelled while waiting, the unfinished steps are
+        cancelled too, so their LLM calls do not outlive the run.
+        """
+        try:
+            done, pending = await asyncio.wait(self.tasks.values(), return_when=asyncio.FIRST_EXCEPTION)
+        except BaseException:
+            await _cancel_tasks([task for task in self.tasks.values() if not task.done()])
+            raise
+        failed = {task for task in done if not task.cancelled() and task.exception() is not None}
+        if failed:
+            await _cancel_tasks(pending)
+            raise _root_cause(ordered, self.tasks, failed)
+
+
+async def _cancel_tasks(tasks) -> None:
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _root_cause(
+    ordered: List[PipelineStep],
+    tasks: Dict[str, asyncio.Task],
+    failed: Set[asyncio.Task],
+) -> BaseException:
+    """The failure of the earliest step in dependency order, not a dependent step's."""
+    return next(tasks[step.name].exception() for step in ordered if tasks[step.name] in failed)
+
+
+async def run_pipeline_graph(
+    steps: List[PipelineStep],
+    on_event: Optional[StepEventCallback] = None,
+) -> Tuple[StepResults, Dict[str, StepTiming]]:
+    """
+    Run steps concurrently in dependency order.
+
+    Args:
+        steps: Steps to run; each receives the results of all finished steps
+        on_event: Optional callback invoked when a step starts and finishes
+
+    Returns:
+        Tuple of (results by step name, timings by step name)
+
+    Raises:
+        The first exception raised by a step; the remaining steps are cancelled.
+    """
+    ordered = _topological_order(steps)
+    run = _GraphRun(on_event)
+    run.schedule(ordered)
+    await run.wait(ordered)
+    return run.results, run.timings
+
+
+def format_timings(timings: Dict[str, StepTiming]) -> str:
+    """Render timings as 'name=duration (start-finish)' in start order."""
+    return ", ".join(
+        f"{name}={timing.duration_ms:.0f}ms ({timing.started_ms:.0f}-{timing.finished_ms:.0f})"
+        for name, timing in sorted(timings.items(), key=lambda item: item[1].started_ms)
+    )
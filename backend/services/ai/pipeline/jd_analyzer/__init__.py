@@ -1,14 +1,21 @@
 """JD analyzer package."""
 
 # Re-export main functionality for backward compatibility
-from backend.services.ai.pipeline.jd_analyzer.analysis import analyze_jd
+from backend.services.ai.pipeline.jd_analyzer.analysis import analyze_jd, get_cached_jd_analysis
+from backend.services.ai.pipeline.jd_analyzer.cache import get_jd_analysis_cache, reset_jd_analysis_cache
 from backend.services.ai.pipeline.jd_analyzer.llm_analysis import _analyze_with_llm
 from backend.services.ai.pipeline.jd_analyzer.heuristic_analysis import _analyze_with_heuristics
-from backend.services.ai.pipeline.jd_analyzer.tech_extraction import _extract_tech_terms
+from backend.services.ai.pipeline.jd_analyzer.tech_extraction import TechHit, TechScan, _extract_tech_terms, scan_tech_terms
 
 __all__ = [
     "analyze_jd",
+    "get_cached_jd_analysis",
+    "get_jd_analysis_cache",
+    "reset_jd_analysis_cache",
     "_analyze_with_llm",
     "_analyze_with_heuristics",
     "_extract_tech_terms",
+    "scan_tech_terms",
+    "TechHit",
+    "TechScan",
 ]
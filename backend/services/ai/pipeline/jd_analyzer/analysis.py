@@ -3,21 +3,51 @@
 import logging
 from typing import Optional
 
+from backend.services.ai.deadline import within_budget
 from backend.services.ai.pipeline.models import JDAnalysis
-from backend.services.ai.llm_client import get_llm_client
+from backend.services.ai.llm_client import get_llm_client, llm_step
+from backend.services.ai.llm_client.response_cache import is_cache_bypassed
+from backend.services.ai.pipeline.jd_analyzer.cache import get_jd_analysis_cache, jd_cache_key
 from backend.services.ai.pipeline.jd_analyzer.llm_analysis import _analyze_with_llm
 from backend.services.ai.pipeline.jd_analyzer.heuristic_analysis import _analyze_with_heuristics
 
 logger = logging.getLogger(__name__)
 
 
+def _cached_analysis(key: str) -> Optional[JDAnalysis]:
+    try:
+        return get_jd_analysis_cache().get(key)
+    except Exception as e:
+        logger.warning(f"JD analysis cache read failed: {e}")
+        return None
+
+
+def _store_analysis(key: str, analysis: JDAnalysis) -> None:
+    try:
+        get_jd_analysis_cache().set(key, analysis)
+    except Exception as e:
+        logger.warning(f"JD analysis cache write failed: {e}")
+
+
+def get_cached_jd_analysis(
+    job_description: str, additional_context: Optional[str] = None
+) -> Optional[JDAnalysis]:
+    """Return a previously computed LLM analysis for this JD without calling the LLM."""
+    llm_client = get_llm_client()
+    if not llm_client.is_configured():
+        return None
+    return _cached_analysis(jd_cache_key(job_description, additional_context, llm_client.model))
+
+
 async def analyze_jd(
     job_description: str, additional_context: Optional[str] = None
 ) -> JDAnalysis:
     """
     Analyze job description to extract structured requirements.
 
-    Uses LLM if available for better understanding, falls back to heuristics.
+    Uses LLM if available for better understanding, falls back to heuristics
+    (also when the request's time budget runs low).
+    LLM results are cached per normalized JD, directive and model.
 
     Args:
         job_description: The job description text
@@ -30,12 +60,23 @@ async def analyze_jd(
     llm_client = get_llm_client()
 
     if llm_client.is_configured():
+        cache_key = jd_cache_key(job_description, additional_context, llm_client.model)
+        if not is_cache_bypassed():
+            cached = _cached_analysis(cache_key)
+            if cached is not None:
+                logger.info("JD Analysis served from cache")
+                return cached
         try:
-            result = await _analyze_with_llm(llm_client, job_description, additional_context)
+            with llm_step("jd_analysis"):
+                result = await within_budget(
+                    _analyze_with_llm(llm_client, job_description, additional_context),
+                    "Job description analyzed with heuristics to stay within the time budget",
+                )
             logger.info(
                 f"JD Analysis result: {len(result.required_skills)} required, "
                 f"{len(result.preferred_skills)} preferred, {len(result.responsibilities)} responsibilities"
             )
+            _store_analysis(cache_key, result)
             return result
         except Exception as e:
             logger.warning(f"LLM analysis failed, falling back to heuristics: {e}")
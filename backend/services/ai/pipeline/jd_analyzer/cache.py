@@ -0,0 +1,164 @@
+"""Cache for LLM job description analyses.
+
+Results are keyed on a hash of the normalized JD text, the directive and the
+model, so CV drafts and cover letters for the same posting reuse a single
+extraction. Entries are stored as compact JSON. By default the cache lives
+in-process; set ``JD_CACHE_REDIS_URL`` to share it across workers (requires
+the ``redis`` package).
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from backend.env import env_float, env_int
+from backend.services.ai.pipeline.models import JDAnalysis
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_S = 24 * 3600.0
+DEFAULT_MAX_ENTRIES = 512
+_KEY_PREFIX = "cv-pro:jd:"
+
+
+def _normalize(text: Optional[str]) -> str:
+    return " ".join((text or "").split()).casefold()
+
+
+def jd_cache_key(job_description: str, additional_context: Optional[str], model: str) -> str:
+    """Hash the whitespace- and case-normalized JD, directive and model."""
+    material = "\x1f".join((model, _normalize(job_description), _normalize(additional_context)))
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def serialize_jd_analysis(analysis: JDAnalysis) -> str:
+    """Encode an analysis as compact JSON (sets become sorted lists)."""
+    return json.dumps(
+        [
+            sorted(analysis.required_skills),
+            sorted(analysis.preferred_skills),
+            analysis.responsibilities,
+            sorted(analysis.domain_keywords),
+            analysis.seniority_signals,
+        ],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+
+
+def deserialize_jd_analysis(value: str | bytes) -> JDAnalysis:
+    required, preferred, responsibilities, domain, seniority = json.loads(value)
+    return JDAnalysis(
+        required_skills=set(required),
+        preferred_skills=set(preferred),
+        responsibilities=list(responsibilities),
+        domain_keywords=set(domain),
+        seniority_signals=list(seniority),
+    )
+
+
+class LocalJDAnalysisCache:
+    """Thread-safe in-process cache with TTL and least-recently-used eviction."""
+
+    def __init__(self, ttl_s: float = DEFAULT_TTL_S, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.ttl_s = ttl_s
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[JDAnalysis]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return deserialize_jd_analysis(value)
+
+    def set(self, key: str, analysis: JDAnalysis) -> None:
+        if self.ttl_s <= 0:
+            return
+        value = serialize_jd_analysis(analysis)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_s, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class RedisJDAnalysisCache:
+    """JD analysis cache shared between workers through Redis."""
+
+    def __init__(self, client, ttl_s: float = DEFAULT_TTL_S):
+        self.ttl_s = ttl_s
+        self._client = client
+
+    def get(self, key: str) -> Optional[JDAnalysis]:
+        value = self._client.get(f"{_KEY_PREFIX}{key}")
+        if value is None:
+            return None
+        return deserialize_jd_analysis(value)
+
+    def set(self, key: str, analysis: JDAnalysis) -> None:
+        if self.ttl_s <= 0:
+            return
+        self._client.set(
+            f"{_KEY_PREFIX}{key}",
+            serialize_jd_analysis(analysis),
+            px=int(self.ttl_s * 1000),
+        )
+
+    def clear(self) -> None:
+        for key in self._client.scan_iter(f"{_KEY_PREFIX}*"):
+            self._client.delete(key)
+
+
+_cache: LocalJDAnalysisCache | RedisJDAnalysisCache | None = None
+_cache_lock = threading.Lock()
+
+
+def _create_cache() -> LocalJDAnalysisCache | RedisJDAnalysisCache:
+    ttl_s = max(0.0, env_float("JD_CACHE_TTL_S", DEFAULT_TTL_S))
+    redis_url = os.getenv("JD_CACHE_REDIS_URL")
+    if redis_url:
+        try:
+            import redis
+        except ImportError:
+            logger.warning(
+                "JD_CACHE_REDIS_URL is set but redis is not installed; "
+                "using in-process JD analysis cache"
+            )
+        else:
+            return RedisJDAnalysisCache(redis.Redis.from_url(redis_url), ttl_s=ttl_s)
+    return LocalJDAnalysisCache(
+        ttl_s=ttl_s,
+        max_entries=max(0, env_int("JD_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)),
+    )
+
+
+def get_jd_analysis_cache() -> LocalJDAnalysisCache | RedisJDAnalysisCache:
+    """Return the process-wide JD analysis cache."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = _create_cache()
+    return _cache
+
+
+def reset_jd_analysis_cache() -> None:
+    """Drop the configured cache so the next access re-reads the environment."""
+    global _cache
+    with _cache_lock:
+        _cache = None
@@ -1,16 +1,16 @@
 """Heuristic-based job description analysis."""
 
 from backend.services.ai.pipeline.models import JDAnalysis
-from backend.services.ai.pipeline.jd_analyzer.tech_extraction import _extract_tech_terms, _REQUIRED_HINTS, _PREFERRED_HINTS, _SENIORITY_SIGNALS
-from backend.services.ai.text import normalize_text
+from backend.services.ai.pipeline.jd_analyzer.tech_extraction import scan_tech_terms, _REQUIRED_HINTS, _PREFERRED_HINTS, _SENIORITY_SIGNALS
+from backend.services.ai.taxonomy import canonicalize_terms
 
 
 def _analyze_with_heuristics(job_description: str) -> JDAnalysis:
     """Fallback heuristic analysis when LLM is not available."""
-    lines = [normalize_text(line) for line in job_description.splitlines() if line.strip()]
-
-    # First, extract tech terms using smart extraction from full JD
-    all_tech_terms = _extract_tech_terms(job_description)
+    # Extract tech terms once; each line's section reuses its hits
+    scan = scan_tech_terms(job_description)
+    # Aliases of one skill ("k8s", "Kubernetes") become a single canonical requirement
+    all_tech_terms = canonicalize_terms(scan.all_terms)
 
     required: set[str] = set()
     preferred: set[str] = set()
@@ -20,8 +20,8 @@ def _analyze_with_heuristics(job_description: str) -> JDAnalysis:
     # Track which section we're in based on hints
     in_preferred_section = False
 
-    for line in lines:
-        line_tech = _extract_tech_terms(line)
+    for line, line_terms in zip(scan.lines, scan.terms_by_line()):
+        line_tech = canonicalize_terms(line_terms)
 
         # Check for section markers
         if any(hint in line for hint in _PREFERRED_HINTS):
@@ -48,7 +48,8 @@ Include frameworks, languages, tools, and methodologies mentioned."""
     try:
         response = await llm_client.generate_text(
             prompt,
-            system_prompt="You are a job description analyzer. Return only valid JSON."
+            system_prompt="You are a job description analyzer. Return only valid JSON.",
+            hedge=True,  # Every later step waits on this call
         )
         # Parse JSON from response
         import json
@@ -1,9 +1,11 @@
 """Technology term extraction utilities."""
 
 import re
-from typing import Set
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Set, Tuple
 
-from backend.services.ai.text import extract_words
+from backend.services.ai.text import trie_pattern
 
 # Pattern to extract tech from parentheses like (e.g., Terraform) or (e.g. Docker, Kubernetes)
 _TECH_IN_PARENS_PATTERN = re.compile(r'\((?:e\.?g\.?[,:]?\s*)([^)]+)\)', re.IGNORECASE)
@@ -83,40 +85,125 @@ _KNOWN_TECH_TERMS = frozenset({
 })
 
 
-def _extract_tech_terms(text: str) -> Set[str]:
+# One pass finds every known multi-word term at every position; terms that are a
+# prefix of the longest match there ("google cloud" in "google cloud platform")
+# are implied by it
+_MULTI_WORD_PATTERN = re.compile("(?=(" + trie_pattern(_KNOWN_MULTI_WORD_TECH) + "))")
+_IMPLIED_MULTI_WORD = {
+    tech: [other for other in _KNOWN_MULTI_WORD_TECH if other != tech and tech.startswith(other)]
+    for tech in _KNOWN_MULTI_WORD_TECH
+}
+
+# Whole words (as text.extract_words splits them) that are a known term plus
+# optional trailing dots. A word starts at its first letter, so a leading run
+# of digits and symbols ("9python") is consumed before the term.
+_WORD_CHARS = "a-z0-9.+#/-"
+_SINGLE_WORD_PATTERN = re.compile(
+    rf"(?<![{_WORD_CHARS}])[0-9.+#/-]*("
+    + trie_pattern(term for term in _KNOWN_TECH_TERMS if re.fullmatch(rf"[a-z][{_WORD_CHARS}]*(?<!\.)", term))
+    + rf")\.*(?![{_WORD_CHARS}])"
+)
+
+
+@dataclass(frozen=True)
+class TechHit:
+    """A technology term found on a line of the job description."""
+
+    term: str
+    line: int  # index into TechScan.lines
+    start: int  # offset in that line
+
+
+@dataclass
+class TechScan:
+    """Tech terms of a job description, found in one pass over its lines."""
+
+    lines: List[str]  # normalized, non-blank lines
+    hits: List[TechHit] = field(default_factory=list)
+    all_terms: Set[str] = field(default_factory=set)
+
+    def terms_by_line(self) -> List[Set[str]]:
+        """The terms found on each line, as _extract_tech_terms(line) would return them."""
+        by_line: List[Set[str]] = [set() for _ in self.lines]
+        for hit in self.hits:
+            by_line[hit.line].add(hit.term)
+        return by_line
+
+
+def _parens_terms(text: str) -> Dict[str, int]:
+    """Items of (e.g., X, Y) lists with their offsets, case preserved."""
+    found: Dict[str, int] = {}
+    for match in _TECH_IN_PARENS_PATTERN.finditer(text):
+        # Split by comma and clean up
+        offset = match.start(1)
+        for item in match.group(1).split(","):
+            cleaned = item.strip().strip(".")
+            if cleaned and len(cleaned) >= 2:
+                found.setdefault(cleaned, offset)
+            offset += len(item) + 1
+    return found
+
+
+def _normalized_lines(lowered: str) -> Tuple[List[str], List[int]]:
+    """Non-blank stripped lines and the offset in ``lowered`` where each starts."""
+    lines: List[str] = []
+    line_starts: List[int] = []
+    offset = 0
+    for raw_line in lowered.splitlines(keepends=True):
+        line = raw_line.strip()
+        if line:
+            lines.append(line)
+            line_starts.append(offset + len(raw_line) - len(raw_line.lstrip()))
+        offset += len(raw_line)
+    return lines, line_starts
+
+
+def _known_term_positions(lowered: str) -> Iterator[Tuple[str, int]]:
+    """Every known multi-word and single-word term with its offset in ``lowered``."""
+    for match in _MULTI_WORD_PATTERN.finditer(lowered):
+        tech = match.group(1)
+        for term in (tech, *_IMPLIED_MULTI_WORD[tech]):
+            yield term, match.start()
+    for match in _SINGLE_WORD_PATTERN.finditer(lowered):
+        yield match.group(1), match.start(1)
+
+
+def _add_parens_terms(scan: TechScan, text: str) -> None:
+    for line_no, line in enumerate(scan.lines):
+        if "(" in line:
+            for item, start in _parens_terms(line).items():
+                scan.hits.append(TechHit(item, line_no, start))
+    scan.all_terms.update(_parens_terms(text))
+
+
+def scan_tech_terms(text: str) -> TechScan:
     """
-    Extract technology terms from text using smart patterns.
+    Extract technology terms from every line of ``text`` in a single pass.
 
     Handles:
     - Tech in parentheses: (e.g., Terraform, Docker)
     - Known multi-word tech: GitHub Actions, Azure DevOps
     - Known single-word tech: Python, AWS, Docker
     - Comma-separated lists in parentheses
+
+    Known terms are found by one scan of the whole text and mapped back to
+    the normalized line they fall on. Parenthesized lists may span lines, so
+    ``all_terms`` takes their items from the full text with original case,
+    while each line only sees the lists it contains.
     """
-    extracted: Set[str] = set()
-    text_lower = text.lower()
+    lowered = text.lower()
+    lines, line_starts = _normalized_lines(lowered)
+    scan = TechScan(lines=lines)
+    for term, position in _known_term_positions(lowered):
+        line_no = bisect_right(line_starts, position) - 1
+        scan.hits.append(TechHit(term, line_no, position - line_starts[line_no]))
+        scan.all_terms.add(term)
 
-    # 1. Extract from parentheses patterns like (e.g., Terraform) or (e.g. Docker, Kubernetes)
-    for match in _TECH_IN_PARENS_PATTERN.finditer(text):
-        content = match.group(1)
-        # Split by comma and clean up
-        for item in content.split(","):
-            item = item.strip().strip(".")
-            if item and len(item) >= 2:
-                # Preserve original case for tech terms
-                extracted.add(item)
-
-    # 2. Find known multi-word tech terms
-    for tech in _KNOWN_MULTI_WORD_TECH:
-        if tech in text_lower:
-            extracted.add(tech)
-
-    # 3. Find known single-word tech terms (case-insensitive)
-    words = set(extract_words(text))
-    for word in words:
-        # Strip trailing punctuation for matching
-        word_clean = word.rstrip(".,;:!?")
-        if word_clean in _KNOWN_TECH_TERMS:
-            extracted.add(word_clean)
-
-    return extracted
+    if "(" in text:
+        _add_parens_terms(scan, text)
+    return scan
+
+
+def _extract_tech_terms(text: str) -> Set[str]:
+    """Extract technology terms from text (see scan_tech_terms)."""
+    return scan_tech_terms(text).all_terms
@@ -4,8 +4,13 @@ from typing import List, Set, Tuple
 
 from backend.models import Skill
 from backend.services.ai.pipeline.models import JDAnalysis, SkillMapping, SkillMatch
-from backend.services.ai.text import tech_terms_match
-from backend.services.ai.pipeline.skill_mapper.match_utils import _normalize_keyword, _determine_match_type_and_confidence
+from backend.services.ai.taxonomy import SYNONYM, get_skill_taxonomy
+from backend.services.ai.text import get_tech_term_index
+from backend.services.ai.pipeline.skill_mapper.match_utils import (
+    _normalize_keyword,
+    _determine_match_type_and_confidence,
+    _taxonomy_match_type_and_confidence,
+)
 
 
 def _map_with_heuristics(
@@ -24,6 +29,8 @@ def _map_with_heuristics(
         match, covered = _match_skill_to_keywords(
             skill, required_keywords, True, _normalize_keyword
         )
+        if not match:
+            match, covered = _match_skill_to_taxonomy(skill, required_keywords, True)
         if match:
             matched_skills_list.append(match)
             selected_skill_names.add(skill.name)
@@ -34,6 +41,8 @@ def _map_with_heuristics(
         match, covered = _match_skill_to_keywords(
             skill, preferred_keywords, False, _normalize_keyword
         )
+        if not match:
+            match, covered = _match_skill_to_taxonomy(skill, preferred_keywords, False)
         if match:
             matched_skills_list.append(match)
             selected_skill_names.add(skill.name)
@@ -53,6 +62,33 @@ def _map_with_heuristics(
     )
 
 
+def _map_with_taxonomy(
+    profile_skills: List[Skill], jd_analysis: JDAnalysis
+) -> SkillMapping:
+    """Map the skills the bundled taxonomy can resolve, without an LLM call."""
+    required_keywords = sorted(jd_analysis.required_skills)
+    preferred_keywords = sorted(jd_analysis.preferred_skills)
+
+    matched_skills_list: List[SkillMatch] = []
+    covered_jd_requirements: Set[str] = set()
+
+    for skill in profile_skills:
+        match, covered = _match_skill_to_taxonomy(skill, required_keywords, True)
+        if not match:
+            match, covered = _match_skill_to_taxonomy(skill, preferred_keywords, False)
+        if match:
+            matched_skills_list.append(match)
+            covered_jd_requirements.update(covered)
+
+    selected_skill_names = {m.profile_skill.name for m in matched_skills_list}
+    all_jd_requirements = jd_analysis.required_skills | jd_analysis.preferred_skills
+    return SkillMapping(
+        matched_skills=matched_skills_list,
+        selected_skills=[s for s in profile_skills if s.name in selected_skill_names],
+        coverage_gaps=list(all_jd_requirements - covered_jd_requirements),
+    )
+
+
 def _match_skill_to_keywords(
     skill: Skill,
     keywords: List[str],
@@ -61,22 +97,51 @@ def _match_skill_to_keywords(
 ) -> Tuple[SkillMatch | None, Set[str]]:
     """Match a skill to a list of keywords. Returns (match, covered_requirements)."""
     covered_requirements: Set[str] = set()
-    for jd_kw in keywords:
-        if tech_terms_match(skill.name, jd_kw):
-            normalized_skill = normalize_keyword_func(skill.name)
-            normalized_jd = normalize_keyword_func(jd_kw)
+    jd_kw = get_tech_term_index(keywords).first_match(skill.name)
+    if jd_kw is not None:
+        normalized_skill = normalize_keyword_func(skill.name)
+        normalized_jd = normalize_keyword_func(jd_kw)
+        if get_skill_taxonomy().relation(normalized_skill, normalized_jd) == SYNONYM:
+            # Known aliases of one technology ("Postgres", "PostgreSQL")
+            match_type, confidence = _taxonomy_match_type_and_confidence(SYNONYM, is_required)
+        else:
             match_type, confidence = _determine_match_type_and_confidence(
                 normalized_skill, normalized_jd, is_required
             )
 
-            prefix = "" if is_required else "Preferred "
-            match = SkillMatch(
-                profile_skill=skill,
-                jd_requirement=normalized_jd,
-                match_type=match_type,
-                confidence=confidence,
-                explanation=f"{prefix}match: '{skill.name}' ↔ '{jd_kw}' ({match_type})",
-            )
-            covered_requirements.add(normalized_jd)
-            return match, covered_requirements
+        prefix = "" if is_required else "Preferred "
+        match = SkillMatch(
+            profile_skill=skill,
+            jd_requirement=normalized_jd,
+            match_type=match_type,
+            confidence=confidence,
+            explanation=f"{prefix}match: '{skill.name}' ↔ '{jd_kw}' ({match_type})",
+        )
+        covered_requirements.add(normalized_jd)
+        return match, covered_requirements
+    return None, covered_requirements
+
+
+def _match_skill_to_taxonomy(
+    skill: Skill,
+    keywords: List[str],
+    is_required: bool,
+) -> Tuple[SkillMatch | None, Set[str]]:
+    """Match a skill to keywords via taxonomy aliases, ecosystems and foundations."""
+    covered_requirements: Set[str] = set()
+    found = get_skill_taxonomy().best_relation(skill.name, [_normalize_keyword(kw) for kw in keywords])
+    if found is not None:
+        relation, normalized_jd = found
+        match_type, confidence = _taxonomy_match_type_and_confidence(relation, is_required)
+
+        prefix = "" if is_required else "Preferred "
+        match = SkillMatch(
+            profile_skill=skill,
+            jd_requirement=normalized_jd,
+            match_type=match_type,
+            confidence=confidence,
+            explanation=f"{prefix}taxonomy {relation}: '{skill.name}' ↔ '{normalized_jd}'",
+        )
+        covered_requirements.add(normalized_jd)
+        return match, covered_requirements
     return None, covered_requirements
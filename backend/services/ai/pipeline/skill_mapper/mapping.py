@@ -6,7 +6,7 @@ from typing import List, Set
 from backend.models import Skill
 from backend.services.ai.pipeline.models import JDAnalysis, SkillMapping, SkillMatch
 from backend.services.ai.llm_client import get_llm_client
-from backend.services.ai.pipeline.skill_mapper.heuristic_mapping import _map_with_heuristics
+from backend.services.ai.pipeline.skill_mapper.heuristic_mapping import _map_with_heuristics, _map_with_taxonomy
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +19,8 @@ async def map_skills(
     Map profile skills to JD requirements with intelligent matching.
 
     Handles synonyms (e.g., "Node.js" matches "JavaScript") and related skills.
+    Aliases, ecosystems and foundations known to the bundled taxonomy are
+    resolved locally; only the remaining skills are sent to the LLM.
 
     Args:
         profile_skills: Skills from user's profile
@@ -27,6 +29,13 @@ async def map_skills(
     Returns:
         SkillMapping with matched skills and gaps
     """
+    taxonomy_mapping = _map_with_taxonomy(profile_skills, jd_analysis)
+    resolved = {skill.name for skill in taxonomy_mapping.selected_skills}
+    remaining_skills = [skill for skill in profile_skills if skill.name not in resolved]
+    if not remaining_skills:
+        logger.info(f"Taxonomy mapped all {len(profile_skills)} skill(s); skipping the LLM")
+        return taxonomy_mapping
+
     llm_client = get_llm_client()
 
     if not llm_client.is_configured():
@@ -34,7 +43,20 @@ async def map_skills(
             "LLM is not configured. Set AI_ENABLED=true and configure API credentials."
         )
 
-    return await _map_with_llm(llm_client, profile_skills, jd_analysis)
+    logger.info(
+        f"Taxonomy mapped {len(resolved)} skill(s); mapping {len(remaining_skills)} via LLM"
+    )
+    llm_mapping = await _map_with_llm(llm_client, remaining_skills, jd_analysis)
+
+    matched_skills_list = taxonomy_mapping.matched_skills + llm_mapping.matched_skills
+    selected_skill_names = {m.profile_skill.name for m in matched_skills_list}
+    covered_requirements = {m.jd_requirement for m in matched_skills_list}
+    all_jd_requirements = jd_analysis.required_skills | jd_analysis.preferred_skills
+    return SkillMapping(
+        matched_skills=matched_skills_list,
+        selected_skills=[s for s in profile_skills if s.name in selected_skill_names],
+        coverage_gaps=list(all_jd_requirements - covered_requirements),
+    )
 
 
 async def _map_with_llm(
@@ -1,5 +1,14 @@
 """Skill matching utility functions."""
 
+from backend.services.ai.taxonomy import ECOSYSTEM, FOUNDATION, SYNONYM
+
+# (match_type, required confidence, preferred confidence) per taxonomy relation
+_TAXONOMY_MATCHES = {
+    SYNONYM: ("exact", 0.9, 0.7),
+    FOUNDATION: ("ecosystem", 0.8, 0.6),
+    ECOSYSTEM: ("ecosystem", 0.75, 0.6),
+}
+
 
 def _normalize_keyword(word: str) -> str:
     """Normalize keyword for matching."""
@@ -20,3 +29,9 @@ def _determine_match_type_and_confidence(
         match_type = "ecosystem"
         confidence = 0.75 if is_required else 0.6
     return match_type, confidence
+
+
+def _taxonomy_match_type_and_confidence(relation: str, is_required: bool) -> tuple[str, float]:
+    """Determine match type and confidence for a taxonomy relation."""
+    match_type, required_confidence, preferred_confidence = _TAXONOMY_MATCHES[relation]
+    return match_type, required_confidence if is_required else preferred_confidence
@@ -1,20 +1,28 @@
 """Skill relevance evaluation package."""
 
 # Re-export main functionality for backward compatibility
-from backend.services.ai.pipeline.skill_relevance_evaluator.evaluation import evaluate_all_skills
-from backend.services.ai.pipeline.skill_relevance_evaluator.matching import _match_skills_in_raw_jd, _match_skills_to_requirements, _skill_in_raw_jd
+from backend.services.ai.pipeline.skill_relevance_evaluator.evaluation import evaluate_all_skills, match_skills_in_raw_jd
+from backend.services.ai.pipeline.skill_relevance_evaluator.batch_evaluation import _evaluate_skill_batch, parse_batch_relevance_response
+from backend.services.ai.pipeline.skill_relevance_evaluator.matching import _match_skills_by_taxonomy, _match_skills_in_raw_jd, _match_skills_to_requirements, _skill_in_raw_jd
+from backend.services.ai.pipeline.skill_relevance_evaluator.raw_jd_matcher import SkillMatcher, get_skill_matcher
 from backend.services.ai.pipeline.skill_relevance_evaluator.llm_evaluation import _evaluate_skill_with_error_handling
 from backend.services.ai.pipeline.skill_relevance_evaluator.parsing import evaluate_skill_relevance, parse_relevance_response, _heuristic_skill_check
 from backend.services.ai.pipeline.skill_relevance_evaluator.processing import _process_llm_evaluation_results
 
 __all__ = [
     "evaluate_all_skills",
+    "match_skills_in_raw_jd",
     "_match_skills_in_raw_jd",
     "_match_skills_to_requirements",
+    "_match_skills_by_taxonomy",
     "_skill_in_raw_jd",
+    "SkillMatcher",
+    "get_skill_matcher",
     "_evaluate_skill_with_error_handling",
     "evaluate_skill_relevance",
     "parse_relevance_response",
     "_heuristic_skill_check",
     "_process_llm_evaluation_results",
+    "_evaluate_skill_batch",
+    "parse_batch_relevance_response",
 ]
@@ -0,0 +1,145 @@
+"""Batched LLM skill relevance evaluation (many skills per prompt)."""
+
+import json
+import logging
+import re
+from typing import Dict, List, Optional
+
+from backend.env import env_int
+from backend.models import Skill
+from backend.services.ai.deadline import BudgetExhausted, within_budget
+from backend.services.ai.llm_client import CircuitOpenError
+from backend.services.ai.pipeline.models import SkillRelevanceResult
+from backend.services.ai.pipeline.skill_relevance_evaluator.parsing import _heuristic_skill_check
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 20
+SKILLS_DEGRADED = "Some skills matched with heuristics to stay within the time budget"
+
+
+def _get_batch_size() -> int:
+    """Skills per LLM call from AI_SKILL_BATCH_SIZE (1 or less disables batching)."""
+    return env_int("AI_SKILL_BATCH_SIZE", DEFAULT_BATCH_SIZE)
+
+
+def _build_batch_prompt(
+    skills: List[Skill], jd_requirements: List[str], additional_context: Optional[str] = None
+) -> str:
+    """Build one prompt that evaluates every skill in the batch."""
+    jd_str = ", ".join(jd_requirements[:20])  # Limit to prevent prompt bloat
+    directive_section = ""
+    if additional_context and additional_context.strip():
+        directive_section = f"""
+
+DIRECTIVE: {additional_context}
+
+Follow this directive when evaluating skill relevance. The directive should guide your assessment. For example, if the directive is "emphasize Python", give higher relevance scores to Python-related skills."""
+
+    skill_lines = "\n".join(f'- "{skill.name}"' for skill in skills)
+
+    return f"""Given these job requirements: {jd_str}{directive_section}
+
+For EACH of these skills, decide whether it is relevant for this job:
+{skill_lines}
+
+Match types:
+- direct: Exact or near-exact match (e.g., "Python" matches "Python")
+- foundation: Underlying language/platform (e.g., "Python" for "Django")
+- alternative: Similar technology (e.g., "PostgreSQL" for "MySQL")
+- related: Generally related skill
+
+Return a JSON array only, one object per skill, using the skill name exactly as given:
+[{{"skill": "name", "relevant": true/false, "type": "direct|foundation|alternative|related", "why": "brief reason", "match": "which requirement"}}]"""
+
+
+def _entry_to_result(entry: dict) -> SkillRelevanceResult:
+    return SkillRelevanceResult(
+        relevant=bool(entry.get("relevant", False)),
+        relevance_type=entry.get("type", "related"),
+        why=entry.get("why", ""),
+        match=entry.get("match", ""),
+    )
+
+
+def parse_batch_relevance_response(response: str) -> Dict[str, SkillRelevanceResult]:
+    """
+    Parse a batched response into results keyed by lower-cased skill name.
+
+    Accepts a JSON array of objects with a "skill" key, or an object keyed by
+    skill name. Malformed entries are skipped so callers can fall back for
+    just those skills.
+    """
+    json_match = re.search(r'[\[{][\s\S]*[\]}]', response)
+    if not json_match:
+        return {}
+    try:
+        data = json.loads(json_match.group())
+    except json.JSONDecodeError as e:
+        logger.error(f"Failed to parse batch relevance response: {e}, response: {response[:200]}")
+        return {}
+
+    if isinstance(data, dict):
+        entries = [
+            {**value, "skill": name} for name, value in data.items() if isinstance(value, dict)
+        ]
+    elif isinstance(data, list):
+        entries = data
+    else:
+        return {}
+
+    results: Dict[str, SkillRelevanceResult] = {}
+    for entry in entries:
+        if not isinstance(entry, dict) or not isinstance(entry.get("skill"), str):
+            continue
+        try:
+            results[entry["skill"].strip().lower()] = _entry_to_result(entry)
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Skipping malformed batch entry {entry!r}: {e}")
+    return results
+
+
+async def _evaluate_skill_batch(
+    skills: List[Skill],
+    jd_requirements: List[str],
+    llm_client,
+    additional_context: Optional[str] = None,
+) -> List[tuple[Skill, Optional[SkillRelevanceResult], Optional[Exception]]]:
+    """Evaluate a batch of skills with one LLM call.
+
+    Returns the same (skill, result, error) tuples as the per-skill path.
+    Skills missing from the parsed response, or the whole batch when the time
+    budget runs out or the circuit is open, fall back to the heuristic check.
+    """
+    prompt = _build_batch_prompt(skills, jd_requirements, additional_context)
+    try:
+        logger.debug(f"LLM evaluating {len(skills)} skills in one batch")
+        response = await within_budget(
+            llm_client.generate_text(
+                prompt,
+                system_prompt="You are a career skills analyst. Evaluate skill relevance accurately.",
+            ),
+            SKILLS_DEGRADED,
+        )
+    except (BudgetExhausted, CircuitOpenError):
+        return [(skill, _heuristic_skill_check(skill, jd_requirements), None) for skill in skills]
+    except Exception as e:
+        logger.error(f"Failed to evaluate skill batch ({len(skills)} skills): {e}", exc_info=True)
+        return [(skill, None, e) for skill in skills]
+
+    parsed = parse_batch_relevance_response(response)
+    results = []
+    fallback = []
+    for skill in skills:
+        result = parsed.get(skill.name.strip().lower())
+        if result is None:
+            fallback.append(skill.name)
+            result = _heuristic_skill_check(skill, jd_requirements)
+        results.append((skill, result, None))
+
+    if fallback:
+        logger.warning(
+            f"Batch response missing {len(fallback)} skill(s), used heuristic check: "
+            f"{', '.join(fallback)}"
+        )
+    return results
@@ -6,18 +6,27 @@ from typing import List, Optional
 
 from backend.models import Skill
 from backend.services.ai.pipeline.models import JDAnalysis, SkillMapping, SkillMatch
-from backend.services.ai.llm_client import get_llm_client
-from backend.services.ai.pipeline.skill_relevance_evaluator.matching import _match_skills_in_raw_jd, _match_skills_to_requirements
+from backend.services.ai.llm_client import get_llm_client, llm_step
+from backend.services.ai.pipeline.skill_relevance_evaluator.batch_evaluation import _evaluate_skill_batch, _get_batch_size
+from backend.services.ai.pipeline.skill_relevance_evaluator.matching import _match_skills_by_taxonomy, _match_skills_in_raw_jd, _match_skills_to_requirements
 from backend.services.ai.pipeline.skill_relevance_evaluator.processing import _process_llm_evaluation_results
+from backend.services.ai.pipeline.skill_relevance_evaluator.similarity import triage_by_similarity
 
 logger = logging.getLogger(__name__)
 
 
+def match_skills_in_raw_jd(profile_skills: List[Skill], raw_jd: str) -> List[SkillMatch]:
+    """Run layer 1 on its own; it only needs the raw JD, not the JD analysis."""
+    return _match_skills_in_raw_jd(profile_skills, raw_jd, set())
+
+
 async def evaluate_all_skills(
     profile_skills: List[Skill],
     jd_analysis: JDAnalysis,
     raw_jd: Optional[str] = None,
     additional_context: Optional[str] = None,
+    batch_size: Optional[int] = None,
+    raw_jd_matches: Optional[List[SkillMatch]] = None,
 ) -> SkillMapping:
     """
     Evaluate each profile skill individually for relevance to JD requirements.
@@ -27,6 +36,10 @@ async def evaluate_all_skills(
         jd_analysis: Analyzed JD requirements
         raw_jd: Raw job description text for direct matching
         additional_context: Optional directive to guide skill evaluation (e.g., "emphasize Python")
+        batch_size: Skills per LLM call in layer 3 (defaults to AI_SKILL_BATCH_SIZE;
+            1 or less evaluates each skill with its own call)
+        raw_jd_matches: Layer-1 matches computed ahead of time by
+            match_skills_in_raw_jd (raw_jd is not re-scanned when given)
 
     Returns:
         SkillMapping with relevant skills and their matches
@@ -38,15 +51,23 @@ async def evaluate_all_skills(
     all_jd_requirements = list(jd_analysis.required_skills | jd_analysis.preferred_skills)
 
     # LAYER 1: First, check raw JD text for literal skill matches
-    if raw_jd:
+    if raw_jd_matches is not None:
+        matched_skills_list.extend(raw_jd_matches)
+        selected_skill_names.update(match.profile_skill.name for match in raw_jd_matches)
+    elif raw_jd:
         matched_skills_list.extend(_match_skills_in_raw_jd(profile_skills, raw_jd, selected_skill_names))
 
     # LAYER 2: Check against extracted JD requirements using tech_terms_match
     matched_skills_list.extend(_match_skills_to_requirements(profile_skills, all_jd_requirements, selected_skill_names))
+    # ...then aliases, ecosystems and foundations from the bundled taxonomy
+    matched_skills_list.extend(_match_skills_by_taxonomy(profile_skills, all_jd_requirements, selected_skill_names))
 
-    # LAYER 3: LLM evaluation for remaining skills (semantic matching)
+    # LAYER 3: Offline similarity decides clear cases before any LLM call
     remaining_skills = [s for s in profile_skills if s.name not in selected_skill_names]
+    local_results, remaining_skills = triage_by_similarity(remaining_skills, all_jd_requirements, additional_context)
+    _process_llm_evaluation_results(local_results, matched_skills_list, selected_skill_names)
 
+    # LAYER 4: LLM evaluation for ambiguous skills (semantic matching)
     if remaining_skills and all_jd_requirements:
         llm_client = get_llm_client()
 
@@ -56,19 +77,38 @@ async def evaluate_all_skills(
                 f"Need LLM to evaluate {len(remaining_skills)} remaining skills."
             )
 
-        logger.info(
-            f"Evaluating {len(remaining_skills)} remaining skills via LLM in parallel "
-            f"(already matched {len(selected_skill_names)} via layers 1-2)"
-        )
+        if batch_size is None:
+            batch_size = _get_batch_size()
+
+        if batch_size > 1:
+            batches = [
+                remaining_skills[i:i + batch_size]
+                for i in range(0, len(remaining_skills), batch_size)
+            ]
+            logger.info(
+                f"Evaluating {len(remaining_skills)} remaining skills via LLM in "
+                f"{len(batches)} batch(es) (already matched {len(selected_skill_names)} via layers 1-3)"
+            )
+            with llm_step("skill_eval"):
+                batch_results = await asyncio.gather(
+                    *[_evaluate_skill_batch(batch, all_jd_requirements, llm_client, additional_context) for batch in batches]
+                )
+            evaluation_results = [item for batch in batch_results for item in batch]
+        else:
+            logger.info(
+                f"Evaluating {len(remaining_skills)} remaining skills via LLM in parallel "
+                f"(already matched {len(selected_skill_names)} via layers 1-3)"
+            )
 
-        # Import here to avoid circular imports
-        from backend.services.ai.pipeline.skill_relevance_evaluator.llm_evaluation import _evaluate_skill_with_error_handling
+            # Import here to avoid circular imports
+            from backend.services.ai.pipeline.skill_relevance_evaluator.llm_evaluation import _evaluate_skill_with_error_handling
 
-        # Run all skill evaluations in parallel
-        evaluation_results = await asyncio.gather(
-            *[_evaluate_skill_with_error_handling(skill, all_jd_requirements, llm_client, additional_context) for skill in remaining_skills],
-            return_exceptions=False
-        )
+            # Run all skill evaluations in parallel
+            with llm_step("skill_eval"):
+                evaluation_results = await asyncio.gather(
+                    *[_evaluate_skill_with_error_handling(skill, all_jd_requirements, llm_client, additional_context) for skill in remaining_skills],
+                    return_exceptions=False
+                )
 
         # Process results
         failed_skills = _process_llm_evaluation_results(evaluation_results, matched_skills_list, selected_skill_names)
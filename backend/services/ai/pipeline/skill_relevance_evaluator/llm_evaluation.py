@@ -4,8 +4,11 @@ import logging
 from typing import List, Optional
 
 from backend.models import Skill
+from backend.services.ai.deadline import BudgetExhausted, within_budget
+from backend.services.ai.llm_client import CircuitOpenError
 from backend.services.ai.pipeline.models import SkillRelevanceResult
-from backend.services.ai.pipeline.skill_relevance_evaluator.parsing import evaluate_skill_relevance
+from backend.services.ai.pipeline.skill_relevance_evaluator.batch_evaluation import SKILLS_DEGRADED
+from backend.services.ai.pipeline.skill_relevance_evaluator.parsing import _heuristic_skill_check, evaluate_skill_relevance
 
 logger = logging.getLogger(__name__)
 
@@ -16,8 +19,13 @@ async def _evaluate_skill_with_error_handling(
     """Wrapper to handle errors per skill without stopping others."""
     try:
         logger.debug(f"LLM evaluating skill: '{skill.name}' against {len(all_jd_requirements)} requirements")
-        result = await evaluate_skill_relevance(skill, all_jd_requirements, llm_client, additional_context)
+        result = await within_budget(
+            evaluate_skill_relevance(skill, all_jd_requirements, llm_client, additional_context),
+            SKILLS_DEGRADED,
+        )
         return skill, result, None
+    except (BudgetExhausted, CircuitOpenError):
+        return skill, _heuristic_skill_check(skill, all_jd_requirements), None
     except Exception as e:
         logger.error(f"Failed to evaluate skill '{skill.name}': {e}", exc_info=True)
         return skill, None, e
@@ -1,15 +1,23 @@
 """Skill matching logic for JD requirements."""
 
 import logging
-import re
 from typing import List
 
 from backend.models import Skill
 from backend.services.ai.pipeline.models import SkillMatch
-from backend.services.ai.text import tech_terms_match
+from backend.services.ai.pipeline.skill_relevance_evaluator.raw_jd_matcher import get_skill_matcher
+from backend.services.ai.taxonomy import ECOSYSTEM, FOUNDATION, SYNONYM, get_skill_taxonomy
+from backend.services.ai.text import get_tech_term_index
 
 logger = logging.getLogger(__name__)
 
+# (match_type, confidence) per taxonomy relation, in line with the LLM layer
+_TAXONOMY_MATCHES = {
+    SYNONYM: ("exact", 0.9),
+    FOUNDATION: ("ecosystem", 0.85),
+    ECOSYSTEM: ("ecosystem", 0.75),
+}
+
 
 def _skill_in_raw_jd(skill_name: str, raw_jd: str) -> bool:
     """
@@ -17,12 +25,7 @@ def _skill_in_raw_jd(skill_name: str, raw_jd: str) -> bool:
 
     Uses word boundary matching to avoid false positives like "Java" in "JavaScript".
     """
-    jd_lower = raw_jd.lower()
-    skill_lower = skill_name.lower()
-
-    # Word boundary match
-    pattern = r'\b' + re.escape(skill_lower) + r'\b'
-    return bool(re.search(pattern, jd_lower))
+    return bool(get_skill_matcher([skill_name]).scan(raw_jd))
 
 
 def _match_skills_in_raw_jd(
@@ -30,13 +33,14 @@ def _match_skills_in_raw_jd(
     raw_jd: str,
     selected_skill_names: set[str],
 ) -> List[SkillMatch]:
-    """LAYER 1: Check raw JD text for literal skill matches."""
+    """LAYER 1: Check raw JD text for literal skill matches, in one scan for all skills."""
     matched_skills_list: List[SkillMatch] = []
+    found = get_skill_matcher(skill.name for skill in profile_skills).scan(raw_jd)
     for skill in profile_skills:
         if skill.name in selected_skill_names:
             continue
 
-        if _skill_in_raw_jd(skill.name, raw_jd):
+        if skill.name.lower() in found:
             logger.info(f"Raw JD match: '{skill.name}' found in job description")
             match = SkillMatch(
                 profile_skill=skill,
@@ -57,21 +61,50 @@ def _match_skills_to_requirements(
 ) -> List[SkillMatch]:
     """LAYER 2: Check against extracted JD requirements using tech_terms_match."""
     matched_skills_list: List[SkillMatch] = []
+    requirement_index = get_tech_term_index(all_jd_requirements)
     for skill in profile_skills:
         if skill.name in selected_skill_names:
             continue
 
-        for req in all_jd_requirements:
-            if tech_terms_match(skill.name, req):
-                logger.info(f"Tech match: '{skill.name}' matches requirement '{req}'")
-                match = SkillMatch(
-                    profile_skill=skill,
-                    jd_requirement=req,
-                    match_type="exact",
-                    confidence=0.9,
-                    explanation=f"Technology match: {skill.name} ↔ {req}",
-                )
-                matched_skills_list.append(match)
-                selected_skill_names.add(skill.name)
-                break
+        req = requirement_index.first_match(skill.name)
+        if req is not None:
+            logger.info(f"Tech match: '{skill.name}' matches requirement '{req}'")
+            match = SkillMatch(
+                profile_skill=skill,
+                jd_requirement=req,
+                match_type="exact",
+                confidence=0.9,
+                explanation=f"Technology match: {skill.name} ↔ {req}",
+            )
+            matched_skills_list.append(match)
+            selected_skill_names.add(skill.name)
+    return matched_skills_list
+
+
+def _match_skills_by_taxonomy(
+    profile_skills: List[Skill],
+    all_jd_requirements: List[str],
+    selected_skill_names: set[str],
+) -> List[SkillMatch]:
+    """LAYER 2b: Resolve aliases, ecosystems and foundations with the bundled taxonomy."""
+    matched_skills_list: List[SkillMatch] = []
+    taxonomy = get_skill_taxonomy()
+    for skill in profile_skills:
+        if skill.name in selected_skill_names:
+            continue
+
+        found = taxonomy.best_relation(skill.name, all_jd_requirements)
+        if found is not None:
+            relation, req = found
+            match_type, confidence = _TAXONOMY_MATCHES[relation]
+            logger.info(f"Taxonomy match: '{skill.name}' is a {relation} of requirement '{req}'")
+            match = SkillMatch(
+                profile_skill=skill,
+                jd_requirement=req,
+                match_type=match_type,
+                confidence=confidence,
+                explanation=f"Taxonomy {relation}: {skill.name} ↔ {req}",
+            )
+            matched_skills_list.append(match)
+            selected_skill_names.add(skill.name)
     return matched_skills_list
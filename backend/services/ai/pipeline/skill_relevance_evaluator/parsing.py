@@ -7,10 +7,14 @@ from typing import List, Optional
 
 from backend.models import Skill
 from backend.services.ai.pipeline.models import SkillRelevanceResult
-from backend.services.ai.text import tech_terms_match
+from backend.services.ai.taxonomy import ECOSYSTEM, FOUNDATION, SYNONYM, get_skill_taxonomy
+from backend.services.ai.text import get_tech_term_index
 
 logger = logging.getLogger(__name__)
 
+# Relevance type per taxonomy relation; an ecosystem member is scored like an alternative
+_TAXONOMY_RELEVANCE = {SYNONYM: "direct", FOUNDATION: "foundation", ECOSYSTEM: "alternative"}
+
 
 async def evaluate_skill_relevance(
     skill: Skill, jd_requirements: List[str], llm_client, additional_context: Optional[str] = None
@@ -62,26 +66,34 @@ Return JSON only: {{"relevant": true/false, "type": "direct|foundation|alternati
 
 def _heuristic_skill_check(skill: Skill, jd_requirements: List[str]) -> SkillRelevanceResult:
     """Fallback heuristic check when LLM fails."""
-    skill_name_lower = skill.name.lower()
-
-    for req in jd_requirements:
-        req_lower = req.lower()
+    # An exact match is also a tech_terms_match, so the first match decides both cases
+    req = get_tech_term_index(jd_requirements).first_match(skill.name)
+    if req is not None:
         # Check exact match (case-insensitive)
-        if skill_name_lower == req_lower:
+        if skill.name.lower() == req.lower():
             return SkillRelevanceResult(
                 relevant=True,
                 relevance_type="direct",
                 why="Direct match (heuristic)",
                 match=req,
             )
-        # Check using tech_terms_match for variations
-        if tech_terms_match(skill.name, req):
-            return SkillRelevanceResult(
-                relevant=True,
-                relevance_type="direct",
-                why="Technology match (heuristic)",
-                match=req,
-            )
+        # Otherwise a variation matched via tech_terms_match
+        return SkillRelevanceResult(
+            relevant=True,
+            relevance_type="direct",
+            why="Technology match (heuristic)",
+            match=req,
+        )
+
+    found = get_skill_taxonomy().best_relation(skill.name, jd_requirements)
+    if found is not None:
+        relation, req = found
+        return SkillRelevanceResult(
+            relevant=True,
+            relevance_type=_TAXONOMY_RELEVANCE[relation],
+            why=f"Taxonomy {relation} (heuristic)",
+            match=req,
+        )
 
     return SkillRelevanceResult(
         relevant=False,
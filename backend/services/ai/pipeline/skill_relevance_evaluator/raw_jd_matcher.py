@@ -0,0 +1,59 @@
+"""Compiled matcher that finds every profile skill in a JD with one scan."""
+
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple
+
+from backend.services.ai.text import trie_pattern
+
+# Distinct skill sets kept compiled; one per active profile is enough
+MATCHER_CACHE_SIZE = 256
+
+
+class SkillMatcher:
+    """Word-boundary, case-insensitive matcher over a fixed set of skill names.
+
+    Gives the same answers as searching ``\\b<skill>\\b`` in the lower-cased JD
+    for each skill separately, including overlapping skills such as
+    "Java" and "Java EE", but scans the JD once.
+    """
+
+    def __init__(self, skill_names: Iterable[str]):
+        self.keys = sorted({name.lower() for name in skill_names})
+        self._pattern = (
+            re.compile(r"(?=\b(" + trie_pattern(self.keys) + r")\b)") if self.keys else None
+        )
+        # Shorter keys that also match wherever a longer key does: they are its
+        # prefix and the word boundary after them lies inside the longer key
+        self._implied: Dict[str, List[str]] = {
+            key: [
+                other for other in self.keys
+                if len(other) < len(key) and re.match(re.escape(other) + r"\b", key)
+            ]
+            for key in self.keys
+        }
+
+    def scan(self, raw_jd: str) -> Dict[str, List[int]]:
+        """Return each matching lower-cased skill name with its start offsets.
+
+        Offsets index the lower-cased JD, in ascending order.
+        """
+        found: Dict[str, List[int]] = {}
+        if self._pattern is None:
+            return found
+        for match in self._pattern.finditer(raw_jd.lower()):
+            key = match.group(1)
+            start = match.start()
+            for hit in (key, *self._implied[key]):
+                found.setdefault(hit, []).append(start)
+        return found
+
+
+@lru_cache(maxsize=MATCHER_CACHE_SIZE)
+def _cached_matcher(keys: Tuple[str, ...]) -> SkillMatcher:
+    return SkillMatcher(keys)
+
+
+def get_skill_matcher(skill_names: Iterable[str]) -> SkillMatcher:
+    """Get the compiled matcher for a skill set, reusing it while the profile's skills are unchanged."""
+    return _cached_matcher(tuple(sorted({name.lower() for name in skill_names})))
@@ -0,0 +1,170 @@
+"""Offline skill similarity: character n-gram and context TF-IDF.
+
+Runs before the LLM layer. Skills that are clearly similar to a requirement
+are matched locally, and known skills that are clearly unrelated are
+dropped. Only the ambiguous band between the two thresholds is sent to the
+LLM. Needs no network access and no extra dependencies.
+"""
+
+import logging
+import math
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from backend.env import env_float
+from backend.models import Skill
+from backend.services.ai.pipeline.models import SkillRelevanceResult
+from backend.services.ai.pipeline.skill_relevance_evaluator.vocabulary import TECH_VOCABULARY
+from backend.services.ai.taxonomy import get_skill_taxonomy
+from backend.services.ai.text import extract_words, normalize_text
+
+logger = logging.getLogger(__name__)
+
+NGRAM_SIZE = 3
+# Share of the score from name n-grams; the rest comes from context words.
+# Vocabulary contexts are short, so sibling technologies ("Rust" and "C++",
+# "React" and "Angular") share most of theirs; the name keeps them below
+# the accept threshold and leaves them to the LLM.
+NGRAM_WEIGHT = 0.4
+DEFAULT_ACCEPT = 0.38
+DEFAULT_REJECT = 0.05
+
+Vector = Dict[str, float]
+# (skill, result, error), as produced by the LLM evaluators
+EvaluationResult = Tuple[Skill, Optional[SkillRelevanceResult], Optional[Exception]]
+
+
+def _thresholds() -> Tuple[float, float]:
+    """(accept, reject) from AI_SKILL_SIMILARITY_ACCEPT / AI_SKILL_SIMILARITY_REJECT."""
+    return (
+        env_float("AI_SKILL_SIMILARITY_ACCEPT", DEFAULT_ACCEPT),
+        env_float("AI_SKILL_SIMILARITY_REJECT", DEFAULT_REJECT),
+    )
+
+
+def _vocabulary_key(term: str) -> str:
+    """The vocabulary entry for a term, looking aliases up under their canonical name."""
+    name = normalize_text(term)
+    if name in TECH_VOCABULARY:
+        return name
+    return get_skill_taxonomy().canonical(name) or name
+
+
+def _features(term: str) -> Tuple[Counter, Counter]:
+    """Character n-grams of the name, and its words plus vocabulary context words."""
+    name = normalize_text(term)
+    padded = f" {name} "
+    ngrams = Counter(padded[i:i + NGRAM_SIZE] for i in range(len(padded) - NGRAM_SIZE + 1))
+    words = Counter(extract_words(f"{name} {TECH_VOCABULARY.get(_vocabulary_key(name), '')}"))
+    return ngrams, words
+
+
+@lru_cache(maxsize=1)
+def _idf() -> Tuple[Dict[str, float], float]:
+    """Smoothed IDF over the bundled vocabulary, plus the weight of unseen features."""
+    df: Counter = Counter()
+    for term in TECH_VOCABULARY:
+        ngrams, words = _features(term)
+        df.update(set(ngrams))
+        df.update(set(words))
+    total = len(TECH_VOCABULARY)
+    idf = {feature: math.log((1 + total) / (1 + count)) + 1 for feature, count in df.items()}
+    return idf, math.log(1 + total) + 1
+
+
+def _weighted_block(counts: Counter, prefix: str, share: float) -> Vector:
+    """TF-IDF block normalized to length sqrt(share), so its cosine contributes ``share``."""
+    idf, unseen = _idf()
+    block = {feature: count * idf.get(feature, unseen) for feature, count in counts.items()}
+    norm = math.sqrt(sum(weight * weight for weight in block.values()))
+    if not norm:
+        return {}
+    scale = math.sqrt(share) / norm
+    return {prefix + feature: weight * scale for feature, weight in block.items()}
+
+
+def vectorize(term: str) -> Vector:
+    """TF-IDF vector of a skill or requirement name.
+
+    The dot product of two vectors is NGRAM_WEIGHT times the cosine of their
+    name n-grams plus the remaining weight times the cosine of their words.
+    """
+    ngrams, words = _features(term)
+    return {
+        **_weighted_block(ngrams, "n:", NGRAM_WEIGHT),
+        **_weighted_block(words, "w:", 1 - NGRAM_WEIGHT),
+    }
+
+
+def similarity_matrix(terms: List[str], requirements: List[str]) -> List[List[float]]:
+    """Cosine similarity of every term against every requirement.
+
+    Computed as one sparse product: requirement vectors are inverted into
+    per-feature postings, so each term only touches requirements it shares
+    a feature with.
+    """
+    postings: Dict[str, List[Tuple[int, float]]] = {}
+    for col, requirement in enumerate(requirements):
+        for feature, weight in vectorize(requirement).items():
+            postings.setdefault(feature, []).append((col, weight))
+
+    matrix = []
+    for term in terms:
+        row = [0.0] * len(requirements)
+        for feature, weight in vectorize(term).items():
+            for col, req_weight in postings.get(feature, ()):
+                row[col] += weight * req_weight
+        matrix.append(row)
+    return matrix
+
+
+def triage_by_similarity(
+    skills: List[Skill],
+    jd_requirements: List[str],
+    additional_context: Optional[str] = None,
+) -> Tuple[List[EvaluationResult], List[Skill]]:
+    """Decide clear-cut skills locally and return (results, skills still needing the LLM).
+
+    A skill scoring at least the accept threshold against some requirement is
+    relevant. A skill from the bundled vocabulary scoring below the reject
+    threshold against every requirement is not. Unknown skills are never
+    rejected. With a directive nothing is decided locally, since it may
+    change how the LLM weighs any skill.
+    """
+    accept, reject = _thresholds()
+    if not skills or not jd_requirements or additional_context:
+        return [], list(skills)
+
+    matrix = similarity_matrix([skill.name for skill in skills], jd_requirements)
+    decided: List[EvaluationResult] = []
+    ambiguous: List[Skill] = []
+    for skill, row in zip(skills, matrix):
+        best = max(range(len(row)), key=row.__getitem__)
+        score = row[best]
+        requirement = jd_requirements[best]
+        if score >= accept:
+            foundation = normalize_text(skill.name) in extract_words(
+                TECH_VOCABULARY.get(_vocabulary_key(requirement), "")
+            )
+            decided.append((skill, SkillRelevanceResult(
+                relevant=True,
+                relevance_type="foundation" if foundation else "alternative",
+                why=f"Similar to '{requirement}' (local similarity {score:.2f})",
+                match=requirement,
+            ), None))
+        elif score < reject and _vocabulary_key(skill.name) in TECH_VOCABULARY:
+            decided.append((skill, SkillRelevanceResult(
+                relevant=False,
+                relevance_type="related",
+                why=f"Unrelated to the requirements (local similarity {score:.2f})",
+                match="",
+            ), None))
+        else:
+            ambiguous.append(skill)
+
+    logger.info(
+        f"Local similarity decided {len(decided)} of {len(skills)} skill(s); "
+        f"{len(ambiguous)} left for the LLM"
+    )
+    return decided, ambiguous
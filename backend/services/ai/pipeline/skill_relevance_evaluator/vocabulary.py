@@ -0,0 +1,123 @@
+"""Bundled tech vocabulary for offline skill similarity.
+
+Each entry maps a lower-cased technology to a few context words: its
+category, language and ecosystem. Similar technologies share context words,
+so "Express" lands near "Node.js" even though the names share no characters.
+"""
+
+from typing import Dict
+
+TECH_VOCABULARY: Dict[str, str] = {
+    # Languages
+    "python": "language scripting data",
+    "java": "language jvm backend enterprise",
+    "kotlin": "language jvm android backend",
+    "scala": "language jvm functional data",
+    "javascript": "language web frontend node.js",
+    "typescript": "language javascript web frontend node.js",
+    "go": "language golang backend systems cloud",
+    "golang": "language go backend systems cloud",
+    "rust": "language systems performance",
+    "c": "language systems embedded",
+    "c++": "language systems performance embedded",
+    "c#": "language .net microsoft backend",
+    "ruby": "language rails web",
+    "php": "language laravel web",
+    "swift": "language ios apple mobile",
+    "objective-c": "language ios apple mobile",
+    "r": "language statistics data analysis",
+    "bash": "shell scripting linux automation",
+    "sql": "query language relational database",
+    # Backend frameworks
+    "django": "python web framework backend",
+    "flask": "python web framework backend",
+    "fastapi": "python web framework backend api",
+    "express": "node.js javascript web framework backend",
+    "nestjs": "node.js typescript web framework backend",
+    "node.js": "javascript runtime backend server",
+    "spring": "java web framework backend enterprise jvm",
+    "spring boot": "java spring web framework backend jvm",
+    "rails": "ruby web framework backend",
+    "laravel": "php web framework backend",
+    ".net": "c# microsoft framework backend",
+    "asp.net": "c# .net microsoft web framework backend",
+    # Frontend
+    "react": "javascript frontend ui framework web",
+    "next.js": "react javascript frontend web framework",
+    "angular": "typescript frontend ui framework web",
+    "vue": "javascript frontend ui framework web",
+    "svelte": "javascript frontend ui framework web",
+    "redux": "react javascript frontend state",
+    "html": "web frontend markup",
+    "css": "web frontend styling",
+    "tailwind": "css web frontend styling",
+    "react native": "react javascript mobile framework",
+    "flutter": "dart mobile ui framework",
+    # Databases
+    "postgresql": "relational database sql",
+    "postgres": "relational database sql postgresql",
+    "mysql": "relational database sql",
+    "mariadb": "relational database sql mysql",
+    "sqlite": "relational database sql embedded",
+    "oracle": "relational database sql enterprise",
+    "sql server": "relational database sql microsoft",
+    "mongodb": "nosql document database",
+    "dynamodb": "nosql key-value database aws",
+    "cassandra": "nosql wide-column database distributed",
+    "redis": "in-memory key-value cache database",
+    "memcached": "in-memory cache",
+    "elasticsearch": "search engine database",
+    "neo4j": "graph database",
+    # Cloud and infrastructure
+    "aws": "cloud provider amazon infrastructure",
+    "azure": "cloud provider microsoft infrastructure",
+    "gcp": "cloud provider google infrastructure",
+    "docker": "containers devops infrastructure",
+    "kubernetes": "container orchestration devops infrastructure cloud",
+    "k8s": "kubernetes container orchestration devops",
+    "helm": "kubernetes deployment devops",
+    "terraform": "infrastructure as code devops cloud",
+    "ansible": "configuration management automation devops",
+    "linux": "operating system infrastructure devops",
+    "nginx": "web server proxy infrastructure",
+    # CI/CD and tooling
+    "jenkins": "ci/cd automation devops",
+    "github actions": "ci/cd automation devops github",
+    "gitlab ci": "ci/cd automation devops gitlab",
+    "circleci": "ci/cd automation devops",
+    "git": "version control",
+    # Observability
+    "prometheus": "monitoring metrics observability",
+    "grafana": "monitoring dashboards observability",
+    "datadog": "monitoring observability",
+    # Messaging and data engineering
+    "kafka": "event streaming messaging data",
+    "rabbitmq": "message queue messaging",
+    "celery": "python task queue messaging",
+    "spark": "big data processing distributed",
+    "hadoop": "big data processing distributed",
+    "airflow": "data pipeline orchestration workflow",
+    "dbt": "data transformation sql analytics",
+    "snowflake": "data warehouse sql analytics cloud",
+    "bigquery": "data warehouse sql analytics google",
+    "databricks": "data platform spark analytics",
+    # Data science and ML
+    "pandas": "python data analysis",
+    "numpy": "python numerical computing",
+    "scikit-learn": "python machine learning",
+    "tensorflow": "machine learning deep learning",
+    "pytorch": "machine learning deep learning python",
+    "machine learning": "ml ai models data",
+    # APIs
+    "rest": "api web services http",
+    "graphql": "api query language web services",
+    "grpc": "api rpc services",
+    # Testing
+    "pytest": "python testing",
+    "jest": "javascript testing",
+    "selenium": "testing browser automation",
+    "cypress": "testing browser javascript",
+    # Process
+    "agile": "methodology scrum process",
+    "scrum": "methodology agile process",
+}
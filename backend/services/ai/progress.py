@@ -0,0 +1,74 @@
+"""Progress events emitted while a CV draft is generated.
+
+``generate_cv_draft`` reports intermediate results through an
+``on_event(name, data)`` callback so the streaming endpoint can forward them
+as they become available. Event payloads are plain JSON-serializable dicts.
+"""
+
+from typing import Any, Callable, Dict, Optional
+
+from backend.services.ai.pipeline.models import JDAnalysis, SelectionResult, SkillMapping
+
+ProgressCallback = Callable[[str, Dict[str, Any]], None]
+
+_ITEM_TYPES = {
+    "exp_desc": "experience_description",
+    "proj_desc": "project_description",
+    "highlight": "highlight",
+}
+
+
+def _index(value: str) -> Optional[int]:
+    return int(value) if value != "" else None
+
+
+def step_event(name: str, status: str) -> Dict[str, Any]:
+    return {"step": name, "status": status}
+
+
+def jd_analysis_event(jd_analysis: JDAnalysis) -> Dict[str, Any]:
+    return {
+        "required_skills": sorted(jd_analysis.required_skills),
+        "preferred_skills": sorted(jd_analysis.preferred_skills),
+        "responsibilities": list(jd_analysis.responsibilities),
+        "domain_keywords": sorted(jd_analysis.domain_keywords),
+        "seniority_signals": list(jd_analysis.seniority_signals),
+    }
+
+
+def skill_mapping_event(skill_mapping: SkillMapping) -> Dict[str, Any]:
+    return {
+        "matched_skills": [
+            {
+                "skill": match.profile_skill.name,
+                "requirement": match.jd_requirement,
+                "match_type": match.match_type,
+                "confidence": match.confidence,
+            }
+            for match in skill_mapping.matched_skills
+        ],
+        "coverage_gaps": list(skill_mapping.coverage_gaps),
+    }
+
+
+def selection_event(selection_result: SelectionResult) -> Dict[str, Any]:
+    return {
+        "experiences": [
+            {"index": idx, "title": exp.title, "company": exp.company}
+            for idx, exp in enumerate(selection_result.experiences)
+        ]
+    }
+
+
+def adapted_item_event(result: tuple) -> Dict[str, Any]:
+    """Convert a content adapter result tuple into an event payload."""
+    task_type, exp_idx, proj_idx, hl_idx, original, adapted, error = result
+    return {
+        "type": _ITEM_TYPES.get(task_type, task_type),
+        "experience_index": _index(exp_idx),
+        "project_index": _index(proj_idx),
+        "highlight_index": _index(hl_idx),
+        "text": adapted,
+        "changed": adapted != original,
+        "error": error,
+    }
@@ -1,11 +1,16 @@
 """Scoring utilities for matching profile items to a job description."""
 
+from collections import Counter
 from dataclasses import dataclass
-from typing import Iterable, List, Sequence, Set, Tuple
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Sequence, Set, Tuple, Union
 
 from backend.services.ai.target_spec import TargetSpec
 from backend.services.ai.text import contains_any, extract_words, word_set
 
+# Distinct items whose token features are kept; covers a few large profiles
+FEATURE_CACHE_SIZE = 8192
+
 
 @dataclass(frozen=True)
 class Score:
@@ -43,16 +48,64 @@ def _overlap_score(
     return min(1.0, (2.0 * required_hits + 1.0 * preferred_hits) / (2.0 * denom))
 
 
-def _responsibility_overlap(item_text: str, responsibilities: Sequence[str]) -> float:
-    if not responsibilities:
+@dataclass(frozen=True)
+class CompiledSpec:
+    """A TargetSpec with its responsibilities tokenized once, for scoring many items."""
+
+    required_keywords: FrozenSet[str]
+    preferred_keywords: FrozenSet[str]
+    responsibility_count: int
+    # word -> indices of the responsibilities that contain it
+    responsibility_postings: Dict[str, Tuple[int, ...]]
+
+
+def compile_spec(spec: Union[TargetSpec, CompiledSpec]) -> CompiledSpec:
+    """Tokenize a spec's responsibilities and index them by word."""
+    if isinstance(spec, CompiledSpec):
+        return spec
+    postings: Dict[str, List[int]] = {}
+    for idx, resp in enumerate(spec.responsibilities):
+        for word in set(extract_words(resp)):
+            postings.setdefault(word, []).append(idx)
+    return CompiledSpec(
+        required_keywords=frozenset(spec.required_keywords),
+        preferred_keywords=frozenset(spec.preferred_keywords),
+        responsibility_count=len(spec.responsibilities),
+        responsibility_postings={word: tuple(ids) for word, ids in postings.items()},
+    )
+
+
+@dataclass(frozen=True)
+class ItemFeatures:
+    """Token features of one profile item; they do not depend on the JD."""
+
+    words: FrozenSet[str]  # text and technologies
+    text_words: FrozenSet[str]
+    seniority: bool
+    quality_penalty: float
+
+
+@lru_cache(maxsize=FEATURE_CACHE_SIZE)
+def item_features(text_parts: Tuple[str, ...], technologies: Tuple[str, ...]) -> ItemFeatures:
+    """Tokenize an item once; repeated drafts from the same profile reuse the result."""
+    text = " ".join(text_parts)
+    return ItemFeatures(
+        words=frozenset(word_set([*text_parts, *technologies])),
+        text_words=frozenset(extract_words(text)),
+        seniority=contains_any(text, _SENIORITY_SIGNAL_WORDS),
+        quality_penalty=_quality_penalty(text_parts),
+    )
+
+
+def _responsibility_overlap(item_words: FrozenSet[str], spec: CompiledSpec) -> float:
+    """Share of responsibilities sharing at least two words with the item."""
+    if not spec.responsibility_count:
         return 0.0
-    item_words = set(extract_words(item_text))
-    matches = 0
-    for resp in responsibilities:
-        resp_words = set(extract_words(resp))
-        if resp_words and len(item_words.intersection(resp_words)) >= 2:
-            matches += 1
-    return min(1.0, matches / max(1, len(responsibilities)))
+    shared = Counter(
+        idx for word in item_words for idx in spec.responsibility_postings.get(word, ())
+    )
+    matches = sum(1 for count in shared.values() if count >= 2)
+    return min(1.0, matches / spec.responsibility_count)
 
 
 def _quality_penalty(text_parts: Iterable[str]) -> float:
@@ -74,22 +127,35 @@ def score_item(
     text_parts: List[str],
     technologies: Sequence[str],
     start_date: str,
-    spec: TargetSpec,
+    spec: Union[TargetSpec, CompiledSpec],
 ) -> Score:
-    item_words = word_set([*text_parts, *technologies])
+    """Score one item; compile the spec first when scoring many."""
+    features = item_features(tuple(text_parts), tuple(technologies))
+    return _score(features, start_date, compile_spec(spec))
+
+
+def score_items(
+    items: Sequence[Tuple[Sequence[str], Sequence[str], str]],
+    spec: Union[TargetSpec, CompiledSpec],
+) -> List[Score]:
+    """Score (text_parts, technologies, start_date) items against one compiled spec."""
+    compiled = compile_spec(spec)
+    return [
+        _score(item_features(tuple(text_parts), tuple(technologies)), start_date, compiled)
+        for text_parts, technologies, start_date in items
+    ]
+
+
+def _score(features: ItemFeatures, start_date: str, spec: CompiledSpec) -> Score:
     keyword_match = _overlap_score(
-        item_words, spec.required_keywords, spec.preferred_keywords
-    )
-    responsibility_match = _responsibility_overlap(
-        " ".join(text_parts), spec.responsibilities
-    )
-    seniority_match = (
-        1.0 if contains_any(" ".join(text_parts), _SENIORITY_SIGNAL_WORDS) else 0.0
+        features.words, spec.required_keywords, spec.preferred_keywords
     )
+    responsibility_match = _responsibility_overlap(features.text_words, spec)
+    seniority_match = 1.0 if features.seniority else 0.0
     recency = (
         1.0 if start_date >= "2022-01" else 0.85 if start_date >= "2019-01" else 0.7
     )
-    quality_penalty = _quality_penalty(text_parts)
+    quality_penalty = features.quality_penalty
 
     value = (
         0.45 * keyword_match
@@ -0,0 +1,140 @@
+"""Bundled skill taxonomy: aliases, ecosystems and foundations.
+
+The data ships as skill_taxonomy.json next to this module and is loaded once
+per process. It answers the questions the skill matchers used to leave to the
+LLM: "Postgres" is PostgreSQL, "Express" belongs to the Node.js ecosystem and
+Python is the foundation of Django.
+"""
+
+import json
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, Optional, Set, Tuple
+
+from backend.services.ai.text import normalize_text
+
+TAXONOMY_PATH = Path(__file__).with_name("skill_taxonomy.json")
+
+# Relations between a skill and a requirement, strongest first
+SYNONYM = "synonym"  # same technology, e.g. "Postgres" for "PostgreSQL"
+FOUNDATION = "foundation"  # the skill underlies the requirement, e.g. "Python" for "Django"
+ECOSYSTEM = "ecosystem"  # the skill builds on the requirement, e.g. "Express" for "Node.js"
+RELATIONS = (SYNONYM, FOUNDATION, ECOSYSTEM)
+
+_NONE: FrozenSet[str] = frozenset()
+
+
+class SkillTaxonomy:
+    """Alias, ecosystem and foundation lookups over the bundled taxonomy.
+
+    Every name is normalized and mapped to one interned canonical string.
+    Foundations are stored transitively: ecosystem hubs are foundations of
+    their members, so Express builds on Node.js and, through it, JavaScript.
+    """
+
+    def __init__(self, data: dict):
+        self.version = str(data["version"])
+        self._canonical: Dict[str, str] = {}
+        for name, aliases in data.get("aliases", {}).items():
+            canonical = self._register(name)
+            for alias in aliases:
+                self._add_alias(alias, canonical)
+
+        direct: Dict[str, Set[str]] = {}
+        for hub, members in data.get("ecosystems", {}).items():
+            hub = self._register(hub)
+            for member in members:
+                direct.setdefault(self._register(member), set()).add(hub)
+        for name, foundations in data.get("foundations", {}).items():
+            direct.setdefault(self._register(name), set()).update(self._register(f) for f in foundations)
+
+        self._foundations: Dict[str, FrozenSet[str]] = {
+            name: self._closure(name, direct) for name in direct
+        }
+
+    def _register(self, name: str) -> str:
+        key = normalize_text(name)
+        return self._canonical.setdefault(key, sys.intern(key))
+
+    def _add_alias(self, alias: str, canonical: str) -> None:
+        key = normalize_text(alias)
+        existing = self._canonical.setdefault(key, canonical)
+        if existing != canonical:
+            raise ValueError(f"Taxonomy alias '{alias}' maps to both '{existing}' and '{canonical}'")
+
+    @staticmethod
+    def _closure(name: str, direct: Dict[str, Set[str]]) -> FrozenSet[str]:
+        seen: Set[str] = set()
+        stack = list(direct.get(name, ()))
+        while stack:
+            current = stack.pop()
+            if current in seen or current == name:
+                continue
+            seen.add(current)
+            stack.extend(direct.get(current, ()))
+        return frozenset(seen) or _NONE
+
+    def __len__(self) -> int:
+        return len(self._canonical)
+
+    def __contains__(self, term: str) -> bool:
+        return normalize_text(term) in self._canonical
+
+    def canonical(self, term: str) -> Optional[str]:
+        """Canonical name of a known term ("Postgres" -> "postgresql"), else None."""
+        return self._canonical.get(normalize_text(term))
+
+    def canonicalize(self, term: str) -> str:
+        """Canonical name of a known term, or the term unchanged."""
+        return self._canonical.get(normalize_text(term), term)
+
+    def foundations(self, term: str) -> FrozenSet[str]:
+        """Everything the term builds on, directly or through its ecosystems."""
+        canonical = self.canonical(term)
+        return self._foundations.get(canonical, _NONE) if canonical else _NONE
+
+    def relation(self, skill: str, requirement: str) -> Optional[str]:
+        """How a profile skill relates to a JD requirement, or None if unrelated."""
+        skill_key = self.canonical(skill)
+        requirement_key = self.canonical(requirement)
+        if skill_key is None or requirement_key is None:
+            return None
+        if skill_key == requirement_key:
+            return SYNONYM
+        if skill_key in self._foundations.get(requirement_key, _NONE):
+            return FOUNDATION
+        if requirement_key in self._foundations.get(skill_key, _NONE):
+            return ECOSYSTEM
+        return None
+
+    def best_relation(self, skill: str, requirements: Iterable[str]) -> Optional[Tuple[str, str]]:
+        """The strongest (relation, requirement) for a skill; ties go to the earliest requirement."""
+        best: Optional[Tuple[str, str]] = None
+        for requirement in requirements:
+            relation = self.relation(skill, requirement)
+            if relation is None:
+                continue
+            if best is None or RELATIONS.index(relation) < RELATIONS.index(best[0]):
+                best = (relation, requirement)
+                if relation == SYNONYM:
+                    break
+        return best
+
+
+def load_skill_taxonomy(path: Path = TAXONOMY_PATH) -> SkillTaxonomy:
+    """Load a taxonomy file."""
+    with open(path, encoding="utf-8") as f:
+        return SkillTaxonomy(json.load(f))
+
+
+@lru_cache(maxsize=1)
+def get_skill_taxonomy() -> SkillTaxonomy:
+    """Get the bundled taxonomy, loading it on first use."""
+    return load_skill_taxonomy()
+
+
+def canonicalize_terms(terms: Iterable[str]) -> Set[str]:
+    """Map known terms to their canonical names, merging aliases of the same skill."""
+    taxonomy = get_skill_taxonomy()
+    return {taxonomy.canonicalize(term) for term in terms}
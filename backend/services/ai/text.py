@@ -1,7 +1,8 @@
 """Text helpers for AI heuristics."""
 
 import re
-from typing import Iterable, List, Set
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 
 _WORD_RE = re.compile(r"[a-zA-Z][a-zA-Z0-9.+#/-]*")
@@ -28,6 +29,32 @@ def contains_any(text: str, needles: Iterable[str]) -> bool:
     return any(needle in lowered for needle in needles)
 
 
+def trie_pattern(keys: Iterable[str]) -> str:
+    """Build a regex alternation shaped like a trie of ``keys``.
+
+    Each position is tried once per character instead of once per key.
+    Optional tails are greedy, so the longest key matching at a position wins
+    and shorter ones are tried only if what follows it fails to match.
+    """
+    trie: Dict[str, dict] = {}
+    for key in keys:
+        node = trie
+        for ch in key:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            return f"(?:{body})?"
+        return body
+
+    return build(trie)
+
+
 def split_compound(text: str) -> List[str]:
     """Split compound tech names like TailwindCSS → ['tailwind', 'css']."""
     # First split by camelCase/PascalCase
@@ -98,17 +125,17 @@ def _cores_match_as_prefix(core1: str, core2: str, min_length: int) -> bool:
     return len(shorter) >= min_length and longer.startswith(shorter) and suffix_len <= 2
 
 
-def _multiword_match(t1: str, t2: str, core1: str, core2: str, min_len: int) -> bool:
+def _term_words(term: str, core: str, min_len: int) -> Set[str]:
+    """Word cores of a normalized term, or its core when no word is long enough."""
+    return {_strip_tech_suffix(w) for w in term.split() if len(w) >= min_len} or {core}
+
+
+def _multiword_match(words1: Set[str], words2: Set[str], core1: str, core2: str, min_len: int) -> bool:
     """Check if multi-word terms match via word cores.
 
     Requires at least one non-generic word match to avoid false positives
     like "Technical Leadership" matching "Technical documentation".
     """
-    words1 = {_strip_tech_suffix(w) for w in t1.split() if len(w) >= min_len}
-    words2 = {_strip_tech_suffix(w) for w in t2.split() if len(w) >= min_len}
-    words1 = words1 or {core1}
-    words2 = words2 or {core2}
-
     # Find all matching words (non-generic only)
     non_generic_matches = []
     for w1 in words1:
@@ -136,22 +163,108 @@ def tech_terms_match(term1: str, term2: str, min_length: int = 3) -> bool:
         - "Vue" matches "VueJS"
         - "Java" does NOT match "JavaScript" (different technologies)
     """
-    t1 = normalize_text(term1)
-    t2 = normalize_text(term2)
+    return _parsed_terms_match(_TechTerm(term1, min_length), _TechTerm(term2, min_length), min_length)
+
 
-    if t1 == t2:
+class _TechTerm:
+    """A term normalized once for repeated matching."""
+
+    __slots__ = ("text", "core", "words")
+
+    def __init__(self, term: str, min_length: int):
+        self.text = normalize_text(term)
+        self.core = _strip_tech_suffix(self.text)
+        self.words = _term_words(self.text, self.core, min_length)
+
+
+def _parsed_terms_match(a: _TechTerm, b: _TechTerm, min_length: int) -> bool:
+    if a.text == b.text:
         return True
-    if len(t1) < 2 or len(t2) < 2:
+    if len(a.text) < 2 or len(b.text) < 2:
         return False
 
-    core1 = _strip_tech_suffix(t1)
-    core2 = _strip_tech_suffix(t2)
-
-    if core1 == core2 and len(core1) >= min_length:
+    if a.core == b.core and len(a.core) >= min_length:
         return True
-    if _cores_match_as_prefix(core1, core2, min_length):
+    if _cores_match_as_prefix(a.core, b.core, min_length):
         return True
-    if " " in t1 or " " in t2:
-        return _multiword_match(t1, t2, core1, core2, min_length)
+    if " " in a.text or " " in b.text:
+        return _multiword_match(a.words, b.words, a.core, b.core, min_length)
 
     return False
+
+
+class TechTermIndex:
+    """Answer ``tech_terms_match(query, term)`` against a whole list of terms at once.
+
+    Each term is normalized once and filed under its text, its core, its core
+    minus one or two trailing characters and its non-generic words. Any pair
+    that tech_terms_match accepts shares at least one of these keys, so a
+    query only verifies the terms found under its own keys.
+    """
+
+    def __init__(self, terms: Iterable[str], min_length: int = 3):
+        self.terms = list(terms)
+        self.min_length = min_length
+        self._parsed = [_TechTerm(term, min_length) for term in self.terms]
+        self._positions: Dict[Tuple[str, str], List[int]] = {}
+        for pos, term in enumerate(self._parsed):
+            for key in self._index_keys(term):
+                self._positions.setdefault(key, []).append(pos)
+
+    def _long_enough(self, value: str) -> bool:
+        return len(value) >= self.min_length
+
+    def _index_keys(self, term: _TechTerm) -> Set[Tuple[str, str]]:
+        keys = {("text", term.text)}
+        keys.update(("core", core) for core in (term.core,) if self._long_enough(core))
+        # A shorter query core may be this core minus a 1-2 character suffix
+        keys.update(("prefix", term.core[:-cut]) for cut in (1, 2) if self._long_enough(term.core[:-cut]))
+        keys.update(
+            ("word", word) for word in term.words
+            if self._long_enough(word) and word not in _GENERIC_TECH_WORDS
+        )
+        return keys
+
+    def _query_keys(self, term: _TechTerm) -> Set[Tuple[str, str]]:
+        keys = {("text", term.text)}
+        keys.update(
+            ("core", core) for core in (term.core, term.core[:-1], term.core[:-2]) if self._long_enough(core)
+        )
+        if self._long_enough(term.core):
+            keys.update({("prefix", term.core), ("word", term.core)})
+        for word in term.words:
+            if self._long_enough(word) and word not in _GENERIC_TECH_WORDS:
+                keys.update({("core", word), ("word", word)})
+        return keys
+
+    def _candidates(self, query: _TechTerm) -> List[int]:
+        positions: Set[int] = set()
+        for key in self._query_keys(query):
+            positions.update(self._positions.get(key, ()))
+        return sorted(positions)
+
+    def matches(self, term: str) -> List[int]:
+        """Positions of all indexed terms that match ``term``, in list order."""
+        query = _TechTerm(term, self.min_length)
+        return [
+            pos for pos in self._candidates(query)
+            if _parsed_terms_match(query, self._parsed[pos], self.min_length)
+        ]
+
+    def first_match(self, term: str) -> Optional[str]:
+        """The earliest indexed term that matches ``term``, or None."""
+        query = _TechTerm(term, self.min_length)
+        for pos in self._candidates(query):
+            if _parsed_terms_match(query, self._parsed[pos], self.min_length):
+                return self.terms[pos]
+        return None
+
+
+@lru_cache(maxsize=256)
+def _cached_index(terms: Tuple[str, ...], min_length: int) -> TechTermIndex:
+    return TechTermIndex(terms, min_length)
+
+
+def get_tech_term_index(terms: Iterable[str], min_length: int = 3) -> TechTermIndex:
+    """Get the index for a list of terms, reusing it while the list is unchanged."""
+    return _cached_index(tuple(terms), min_length)
@@ -17,6 +17,10 @@ from backend.database.supabase import cover_letter as supabase_cover_letter
 from backend.database.supabase import cv as supabase_cv
 from backend.database.supabase import cv_search as supabase_cv_search
 from backend.database.supabase import profile as supabase_profile
+from backend.database.supabase import profile_cache as supabase_profile_cache
+from backend.services.ai.pipeline.jd_analyzer import cache as jd_analysis_cache
+from backend.services.ai.llm_client.circuit_breaker import reset_circuit_breaker
+from backend.services.ai.llm_client.telemetry import reset_llm_telemetry
 
 
 def pytest_configure(config):
@@ -99,6 +103,7 @@ def mock_supabase_client(monkeypatch, request):
     monkeypatch.setattr(supabase_cover_letter, "get_admin_client", lambda: fake_client)
     monkeypatch.setattr(supabase_profile, "get_admin_client", lambda: fake_client)
     monkeypatch.setattr(supabase_cv_search, "get_admin_client", lambda: fake_client)
+    supabase_profile_cache.reset_profile_cache()
     return fake_client
 
 
@@ -108,6 +113,28 @@ def _apply_supabase_defaults(mock_supabase_client):
     yield
 
 
+@pytest.fixture(autouse=True)
+def _reset_circuit_breaker():
+    """Keep provider failures in one test from opening the circuit for the next."""
+    reset_circuit_breaker()
+    yield
+    reset_circuit_breaker()
+
+
+@pytest.fixture(autouse=True)
+def _reset_llm_telemetry():
+    """Start every test with empty LLM call metrics."""
+    reset_llm_telemetry()
+    yield
+
+
+@pytest.fixture(autouse=True)
+def _reset_jd_analysis_cache():
+    """Keep cached JD analyses from leaking between tests."""
+    jd_analysis_cache.reset_jd_analysis_cache()
+    yield
+
+
 @pytest_asyncio.fixture
 async def client():
     """FastAPI test client."""
@@ -214,3 +214,39 @@ class TestGenerateCvDraft:
                             found_context = True
                             break
                 assert found_context, "Additional context should appear in LLM prompts"
+
+    async def test_generate_cv_draft_regenerate_bypasses_response_cache(
+        self, client, sample_cv_data, mock_supabase_client
+    ):
+        """Test regenerate=true runs the pipeline with cache lookups disabled."""
+        from backend.services.ai.llm_client import response_cache
+
+        profile_data = {
+            "personal_info": sample_cv_data["personal_info"],
+            "experience": sample_cv_data["experience"],
+            "education": sample_cv_data["education"],
+            "skills": sample_cv_data["skills"],
+            "updated_at": "2024-01-01T00:00:00",
+        }
+        seen = []
+
+        async def fake_generate(profile, payload):
+            seen.append(response_cache._bypass.get())
+            raise ValueError("stop after recording")
+
+        with patch(
+            "backend.app_helpers.routes.ai.queries.get_profile",
+            return_value=profile_data,
+        ), patch(
+            "backend.app_helpers.routes.ai.generate_cv_draft", side_effect=fake_generate
+        ):
+            for regenerate in (False, True):
+                await client.post(
+                    "/api/ai/generate-cv",
+                    json={
+                        "job_description": "We require FastAPI and React. You will build web features.",
+                        "regenerate": regenerate,
+                    },
+                )
+
+        assert seen == [False, True]
@@ -0,0 +1,143 @@
+"""Tests for POST /api/ai/generate-cv/stream endpoint."""
+
+import asyncio
+import json
+
+import pytest
+from unittest.mock import patch
+
+from backend.app_helpers.routes.ai import _generate_cv_events
+from backend.models import ProfileData
+from backend.models_ai import AIGenerateCVRequest
+
+
+def _profile_data(sample_cv_data):
+    return {
+        "personal_info": sample_cv_data["personal_info"],
+        "experience": sample_cv_data["experience"],
+        "education": sample_cv_data["education"],
+        "skills": sample_cv_data["skills"],
+        "updated_at": "2024-01-01T00:00:00",
+    }
+
+
+def _parse_events(body):
+    """Split an SSE body into (event, data) pairs, skipping comments."""
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = [line for line in block.split("\n") if not line.startswith(":")]
+        if not lines:
+            continue
+        fields = dict(line.split(": ", 1) for line in lines)
+        events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+@pytest.mark.asyncio
+@pytest.mark.api
+class TestGenerateCvStream:
+    """Test POST /api/ai/generate-cv/stream endpoint."""
+
+    async def test_streams_progress_then_result(
+        self, client, sample_cv_data, mock_supabase_client
+    ):
+        """Test pipeline events arrive in order, followed by the full draft."""
+        with patch(
+            "backend.app_helpers.routes.ai.queries.get_profile",
+            return_value=_profile_data(sample_cv_data),
+        ):
+            response = await client.post(
+                "/api/ai/generate-cv/stream",
+                json={
+                    "job_description": "We require Python and React. You will build and improve web features.",
+                    "max_experiences": 2,
+                },
+            )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = _parse_events(response.text)
+        names = [name for name, _ in events]
+        assert names.index("jd_analysis") < names.index("skills") < names.index("selection")
+        assert names[-1] == "result"
+        assert ("step", {"step": "assembly", "status": "finished"}) in events
+        assert "python" in {s.lower() for s in events[names.index("jd_analysis")][1]["required_skills"]}
+        assert events[-1][1]["draft_cv"]["personal_info"]["name"] == "John Doe"
+
+    async def test_streams_error_event(
+        self, client, sample_cv_data, mock_supabase_client
+    ):
+        """Test a pipeline failure is reported as an error event."""
+
+        async def failing_draft(profile, payload, on_event=None):
+            on_event("step", {"step": "jd", "status": "started"})
+            raise ValueError("LLM is not configured")
+
+        with patch(
+            "backend.app_helpers.routes.ai.queries.get_profile",
+            return_value=_profile_data(sample_cv_data),
+        ), patch("backend.app_helpers.routes.ai.generate_cv_draft", side_effect=failing_draft):
+            response = await client.post(
+                "/api/ai/generate-cv/stream",
+                json={"job_description": "We require Python and React engineers.", "style": "llm_tailor"},
+            )
+
+        events = _parse_events(response.text)
+        assert events[0] == ("step", {"step": "jd", "status": "started"})
+        assert events[-1][0] == "error"
+        assert events[-1][1]["status_code"] == 400
+        assert "AI_ENABLED=true" in events[-1][1]["detail"]
+
+    async def test_profile_missing(self, client, mock_supabase_client):
+        """Test a missing profile fails before the stream starts."""
+        with patch(
+            "backend.app_helpers.routes.ai.queries.get_profile", return_value=None
+        ):
+            response = await client.post(
+                "/api/ai/generate-cv/stream",
+                json={"job_description": "We require FastAPI and React."},
+            )
+        assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+class TestGenerateCvEvents:
+    """Test the event generator directly."""
+
+    async def test_heartbeat_while_idle(self, sample_cv_data):
+        """Test keep-alive comments are sent while no step reports progress."""
+        release = asyncio.Event()
+
+        async def slow_draft(profile, payload, on_event=None):
+            await release.wait()
+            raise RuntimeError("stopped")
+
+        profile = ProfileData.model_validate(_profile_data(sample_cv_data))
+        payload = AIGenerateCVRequest(job_description="We require Python and React engineers.")
+        with patch("backend.app_helpers.routes.ai.generate_cv_draft", side_effect=slow_draft):
+            stream = _generate_cv_events(profile, payload, heartbeat_s=0.01)
+            assert await stream.__anext__() == ": keep-alive\n\n"
+            release.set()
+            chunks = [chunk async for chunk in stream]
+
+        assert chunks[-1].startswith("event: error\n")
+
+    async def test_closing_stream_cancels_pipeline(self, sample_cv_data):
+        """Test a disconnected client stops the running pipeline."""
+        cancelled = asyncio.Event()
+
+        async def slow_draft(profile, payload, on_event=None):
+            on_event("step", {"step": "jd", "status": "started"})
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        profile = ProfileData.model_validate(_profile_data(sample_cv_data))
+        payload = AIGenerateCVRequest(job_description="We require Python and React engineers.")
+        with patch("backend.app_helpers.routes.ai.generate_cv_draft", side_effect=slow_draft):
+            stream = _generate_cv_events(profile, payload)
+            assert (await stream.__anext__()).startswith("event: step\n")
+            await stream.aclose()
+            await asyncio.wait_for(cancelled.wait(), timeout=1)
@@ -0,0 +1,121 @@
+"""Tests for POST /api/ai/generate-cover-letter/stream endpoint."""
+
+import json
+
+import pytest
+from unittest.mock import Mock, patch
+
+from backend.services.ai.cover_letter_selection import SelectedContent
+
+REQUEST = {
+    "job_description": "We are looking for a Senior Developer with Python and React experience.",
+    "company_name": "Tech Corp",
+    "hiring_manager_name": "John Doe",
+}
+
+
+def _profile_data(sample_cv_data):
+    return {
+        "personal_info": sample_cv_data["personal_info"],
+        "experience": sample_cv_data["experience"],
+        "education": sample_cv_data["education"],
+        "skills": sample_cv_data["skills"],
+        "updated_at": "2024-01-01T00:00:00",
+    }
+
+
+def _parse_events(body):
+    """Split an SSE body into (event, data) pairs, skipping comments."""
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = [line for line in block.split("\n") if not line.startswith(":")]
+        if lines:
+            fields = dict(line.split(": ", 1) for line in lines)
+            events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+def _streaming_llm_client(*deltas):
+    async def stream_text(prompt, system_prompt=None):
+        for delta in deltas:
+            yield delta
+
+    mock_llm_client = Mock()
+    mock_llm_client.is_configured.return_value = True
+    mock_llm_client.stream_text = stream_text
+    return mock_llm_client
+
+
+@pytest.mark.asyncio
+@pytest.mark.api
+class TestGenerateCoverLetterStream:
+    """Test POST /api/ai/generate-cover-letter/stream endpoint."""
+
+    async def test_streams_tokens_then_result(
+        self, client, sample_cv_data, mock_supabase_client
+    ):
+        """Test body tokens arrive first and the formatted letter comes last."""
+        selected_content = SelectedContent(
+            experience_indices=[0],
+            skill_names=["Python"],
+            key_highlights=["Built REST APIs"],
+            relevance_reasoning="Test",
+        )
+        mock_llm_client = _streaming_llm_client("Dear John Doe,\n\n", "I am writing ", "to apply.")
+
+        with patch(
+            "backend.database.queries.get_profile",
+            return_value=_profile_data(sample_cv_data),
+        ), patch(
+            "backend.services.ai.cover_letter.generation.get_llm_client",
+            return_value=mock_llm_client,
+        ), patch(
+            "backend.services.ai.cover_letter.generation.select_relevant_content",
+            return_value=selected_content,
+        ):
+            response = await client.post("/api/ai/generate-cover-letter/stream", json=REQUEST)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = _parse_events(response.text)
+        assert [data["text"] for name, data in events if name == "token"] == [
+            "Dear John Doe,\n\n",
+            "I am writing ",
+            "to apply.",
+        ]
+        name, result = events[-1]
+        assert name == "result"
+        assert "I am writing to apply." in result["cover_letter_text"]
+        assert "Tech Corp" in result["cover_letter_html"]
+        assert result["highlights_used"] == ["Built REST APIs"]
+        assert result["selected_skills"] == ["Python"]
+
+    async def test_llm_not_configured_is_error_event(
+        self, client, sample_cv_data, mock_supabase_client
+    ):
+        """Test generation failures end the stream with an error event."""
+        mock_llm_client = Mock()
+        mock_llm_client.is_configured.return_value = False
+
+        with patch(
+            "backend.database.queries.get_profile",
+            return_value=_profile_data(sample_cv_data),
+        ), patch(
+            "backend.services.ai.cover_letter.generation.get_llm_client",
+            return_value=mock_llm_client,
+        ):
+            response = await client.post("/api/ai/generate-cover-letter/stream", json=REQUEST)
+
+        events = _parse_events(response.text)
+        assert len(events) == 1
+        name, error = events[0]
+        assert name == "error"
+        assert error["status_code"] == 400
+        assert "configure" in error["detail"].lower()
+
+    async def test_profile_missing(self, client, mock_supabase_client):
+        """Test a missing profile fails before the stream starts."""
+        with patch("backend.database.queries.get_profile", return_value=None):
+            response = await client.post("/api/ai/generate-cover-letter/stream", json=REQUEST)
+
+        assert response.status_code == 404
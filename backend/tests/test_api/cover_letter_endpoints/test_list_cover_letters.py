@@ -48,3 +48,20 @@ class TestListCoverLetters:
             assert response.status_code == 500
             data = response.json()
             assert "Failed to list cover letters" in data["detail"]
+
+    async def test_list_cover_letters_invalid_cursor(self, client, mock_supabase_client):
+        """Test list cover letters rejects malformed cursors."""
+        with patch("backend.app_helpers.routes.cover_letter.endpoints.queries.list_cover_letters") as mock_list:
+            mock_list.side_effect = ValueError("Invalid cursor")
+
+            response = await client.get("/api/cover-letters?cursor=bogus")
+            assert response.status_code == 400
+            assert response.json()["detail"] == "Invalid cursor"
+            assert mock_list.call_args.kwargs["cursor"] == "bogus"
+
+    async def test_list_cover_letters_rejects_unknown_count_mode(self, client, mock_supabase_client):
+        """Test cover letter listing validates the count option like the CV listing."""
+        with patch("backend.app_helpers.routes.cover_letter.endpoints.queries.list_cover_letters") as mock_list:
+            response = await client.get("/api/cover-letters?count=approximate")
+            assert response.status_code == 422
+            mock_list.assert_not_called()
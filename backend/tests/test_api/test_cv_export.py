@@ -0,0 +1,75 @@
+"""Tests for GET /api/cvs/export endpoint."""
+import json
+import pytest
+from unittest.mock import patch
+
+
+def _cv(idx, **extra):
+    return {
+        "cv_id": f"id{idx}",
+        "created_at": "2024-01-01T10:30:00Z",
+        "updated_at": "2024-01-02T08:00:00+00:00",
+        "person_name": f"Person {idx}",
+        "filename": "cv.docx" if idx % 2 else None,
+        **extra,
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.api
+class TestExportCVs:
+    """Test GET /api/cvs/export endpoint."""
+
+    async def test_export_csv_streams_all_rows(self, client, mock_supabase_client):
+        """Test CSV export is not truncated and formats dates."""
+        rows = (_cv(idx) for idx in range(1500))
+        with patch("backend.database.queries.iter_cvs", return_value=rows) as mock_iter:
+            response = await client.get("/api/cvs/export?search=Person")
+            assert response.status_code == 200
+            assert response.headers["content-type"].startswith("text/csv")
+            lines = response.text.strip().splitlines()
+            assert lines[0].startswith("CV ID,Person Name")
+            assert len(lines) == 1501
+            assert lines[1] == "id0,Person 0,,,2024-01-01 10:30:00,2024-01-02 08:00:00,No"
+            kwargs = mock_iter.call_args.kwargs
+            assert kwargs["search"] == "Person"
+            assert kwargs["user_id"] == "test-user"
+            assert kwargs["full"] is False
+
+    async def test_export_csv_empty(self, client, mock_supabase_client):
+        """Test CSV export with no CVs still returns the header."""
+        with patch("backend.database.queries.iter_cvs", return_value=iter([])):
+            response = await client.get("/api/cvs/export")
+            assert response.status_code == 200
+            assert response.text.strip().startswith("CV ID")
+            assert len(response.text.strip().splitlines()) == 1
+
+    async def test_export_ndjson_includes_full_payload(self, client, mock_supabase_client):
+        """Test NDJSON export emits one full CV per line."""
+        rows = iter([_cv(1, experience=[{"title": "Dev"}]), _cv(2, skills=[])])
+        with patch("backend.database.queries.iter_cvs", return_value=rows) as mock_iter:
+            response = await client.get("/api/cvs/export?format=ndjson")
+            assert response.status_code == 200
+            assert response.headers["content-type"].startswith("application/x-ndjson")
+            assert ".ndjson" in response.headers["content-disposition"]
+            records = [json.loads(line) for line in response.text.splitlines()]
+            assert [r["cv_id"] for r in records] == ["id1", "id2"]
+            assert records[0]["experience"] == [{"title": "Dev"}]
+            assert mock_iter.call_args.kwargs["full"] is True
+
+    async def test_export_rejects_unknown_format(self, client, mock_supabase_client):
+        """Test export validates the format option."""
+        response = await client.get("/api/cvs/export?format=xlsx")
+        assert response.status_code == 422
+
+    async def test_export_query_error(self, client, mock_supabase_client):
+        """Test export returns 500 when the first page cannot be fetched."""
+
+        def failing_rows():
+            raise RuntimeError("db down")
+            yield  # pragma: no cover
+
+        with patch("backend.database.queries.iter_cvs", return_value=failing_rows()):
+            response = await client.get("/api/cvs/export")
+            assert response.status_code == 500
+            assert response.json()["detail"] == "Failed to export CVs"
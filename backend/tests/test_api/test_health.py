@@ -3,6 +3,11 @@ from types import SimpleNamespace
 import pytest
 from unittest.mock import patch
 
+from backend.app import app
+from backend.app_helpers.auth import get_current_admin
+from backend.services.ai.llm_client import get_llm_telemetry
+from backend.services.ai.llm_client.telemetry import LLMCall
+
 
 class FakeAdminClient:
     """Minimal Supabase admin client stub."""
@@ -48,3 +53,19 @@ class TestHealthEndpoint:
             data = response.json()
             assert data["status"] == "unhealthy"
             assert data["database"] == "disconnected"
+
+    async def test_llm_metrics_reports_calls_by_step(self, client):
+        """Test the admin metrics endpoint returns call, governor and circuit stats."""
+        get_llm_telemetry().record(LLMCall("jd_analysis", "gpt-4o-mini", attempts=1, prompt_tokens=10))
+        app.dependency_overrides[get_current_admin] = lambda: SimpleNamespace(id="admin-1")
+        try:
+            response = await client.get("/api/admin/llm-metrics")
+        finally:
+            app.dependency_overrides.pop(get_current_admin, None)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["calls"]["steps"]["jd_analysis"]["prompt_tokens"] == 10
+        assert data["circuit"]["state"] == "closed"
+        assert {"in_flight", "queued"} <= set(data["governor"])
+        assert data["cache"] == {"enabled": False}
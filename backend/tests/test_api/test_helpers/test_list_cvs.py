@@ -63,3 +63,29 @@ class TestListCVs:
             data = response.json()
             assert data["cvs"][0]["target_company"] == "Google"
             assert data["cvs"][0]["target_role"] == "Senior Developer"
+
+    async def test_list_cvs_with_cursor(self, client, mock_supabase_client):
+        """Test CV listing forwards cursor and count options."""
+        list_data = {"cvs": [], "total": None, "next_cursor": None}
+        with patch("backend.database.queries.list_cvs", return_value=list_data) as mock_list:
+            response = await client.get("/api/cvs?cursor=abc&count=none")
+            assert response.status_code == 200
+            assert response.json()["total"] is None
+            kwargs = mock_list.call_args.kwargs
+            assert kwargs["cursor"] == "abc"
+            assert kwargs["count"] == "none"
+
+    async def test_list_cvs_invalid_cursor(self, client, mock_supabase_client):
+        """Test CV listing rejects malformed cursors."""
+        with patch(
+            "backend.database.queries.list_cvs",
+            side_effect=ValueError("Invalid cursor"),
+        ):
+            response = await client.get("/api/cvs?cursor=bogus")
+            assert response.status_code == 400
+            assert response.json()["detail"] == "Invalid cursor"
+
+    async def test_list_cvs_rejects_unknown_count_mode(self, client, mock_supabase_client):
+        """Test CV listing validates the count option."""
+        response = await client.get("/api/cvs?count=approximate")
+        assert response.status_code == 422
@@ -0,0 +1,21 @@
+"""Tests for the typed environment readers."""
+from backend.env import env_float, env_int
+
+
+def test_env_float_reads_value(monkeypatch):
+    monkeypatch.setenv("CV_TEST_FLOAT", "2.5")
+    assert env_float("CV_TEST_FLOAT", 1.0) == 2.5
+
+
+def test_env_float_falls_back_when_unset_or_malformed(monkeypatch):
+    monkeypatch.delenv("CV_TEST_FLOAT", raising=False)
+    assert env_float("CV_TEST_FLOAT", 1.5) == 1.5
+    monkeypatch.setenv("CV_TEST_FLOAT", "fast")
+    assert env_float("CV_TEST_FLOAT", 1.5) == 1.5
+
+
+def test_env_int_reads_value_and_falls_back(monkeypatch):
+    monkeypatch.setenv("CV_TEST_INT", "7")
+    assert env_int("CV_TEST_INT", 3) == 7
+    monkeypatch.setenv("CV_TEST_INT", "7.5")
+    assert env_int("CV_TEST_INT", 3) == 3
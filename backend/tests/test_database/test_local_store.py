@@ -0,0 +1,176 @@
+"""Tests for the local (SQLite and in-memory) storage backends."""
+import importlib
+
+import pytest
+
+from backend.database import local as local_storage
+from backend.database.local import MemoryStore, SQLiteStore, create_local_store
+from backend.database.local.store import LocalStore
+from backend.database.supabase.utils import reset_user_id_context, set_user_id_context
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        instance = MemoryStore()
+    else:
+        instance = SQLiteStore(str(tmp_path / "cv.sqlite3"))
+    token = set_user_id_context("user-a")
+    yield instance
+    reset_user_id_context(token)
+    instance.close()
+
+
+def _as_user(user_id, func, *args, **kwargs):
+    token = set_user_id_context(user_id)
+    try:
+        return func(*args, **kwargs)
+    finally:
+        reset_user_id_context(token)
+
+
+def _cv(name, email="person@example.com"):
+    return {
+        "personal_info": {"name": name, "email": email},
+        "experience": [{"title": "Engineer", "company": "Acme", "description": "Python APIs"}],
+        "education": [],
+        "skills": [{"name": "Python"}],
+        "theme": "modern",
+    }
+
+
+class TestLocalStoreCVs:
+    """Test CV queries against local stores."""
+
+    def test_create_and_get(self, store):
+        cv_id = store.create_cv(_cv("Jane"))
+        cv = store.get_cv_by_id(cv_id)
+        assert cv["cv_id"] == cv_id
+        assert cv["personal_info"]["name"] == "Jane"
+        assert cv["theme"] == "modern"
+        assert cv["layout"] == "classic-two-column"
+
+    def test_rows_are_scoped_per_user(self, store):
+        cv_id = store.create_cv(_cv("Jane"))
+        assert _as_user("user-b", store.get_cv_by_id, cv_id) is None
+        assert _as_user("user-b", store.list_cvs)["total"] == 0
+        assert _as_user("user-b", store.delete_cv, cv_id) is False
+        assert _as_user("user-b", store.update_cv, cv_id, _cv("Mallory")) is False
+        assert store.get_cv_by_id(cv_id)["personal_info"]["name"] == "Jane"
+
+    def test_update_filename_and_delete(self, store):
+        cv_id = store.create_cv(_cv("Jane"))
+        assert store.update_cv(cv_id, _cv("Janet")) is True
+        assert store.set_cv_filename(cv_id, "janet.docx") is True
+        cv = store.get_cv_by_filename("janet.docx")
+        assert cv["personal_info"]["name"] == "Janet"
+        assert store.delete_cv(cv_id) is True
+        assert store.get_cv_by_id(cv_id) is None
+
+    def test_list_search_and_cursor_pages(self, store):
+        for idx in range(5):
+            store.create_cv(_cv(f"Person {idx}"))
+        store.create_cv(_cv("Other", email="someone@corp.test"))
+        first = store.list_cvs(limit=2, search="person")
+        assert first["total"] == 5
+        assert len(first["cvs"]) == 2
+        second = store.list_cvs(limit=2, search="person", cursor=first["next_cursor"])
+        third = store.list_cvs(limit=2, search="person", cursor=second["next_cursor"])
+        names = [cv["person_name"] for page in (first, second, third) for cv in page["cvs"]]
+        assert sorted(names) == [f"Person {idx}" for idx in range(5)]
+        assert third["next_cursor"] is None
+        other = store.list_cvs(search="corp.test", count="none")
+        assert [cv["person_name"] for cv in other["cvs"]] == ["Other"]
+        assert other["total"] is None
+
+    def test_iter_and_search_cvs(self, store):
+        store.create_cv(_cv("Jane"))
+        store.create_cv(_cv("John"))
+        assert len(list(store.iter_cvs(full=True))) == 2
+        assert len(store.search_cvs(skills=["python"])) == 2
+        assert store.search_cvs(education_keywords=["mit"]) == []
+
+
+class TestLocalStoreProfiles:
+    """Test profile queries against local stores."""
+
+    def test_save_get_and_delete(self, store):
+        assert store.get_profile() is None
+        store.save_profile({"personal_info": {"name": "Jane"}})
+        store.save_profile({"personal_info": {"name": "Janet"}})
+        profile = store.get_profile()
+        assert profile["personal_info"]["name"] == "Janet"
+        assert store.list_profiles() == [
+            {"name": "Janet", "updated_at": profile["updated_at"]}
+        ]
+        assert store.get_profile_by_updated_at(profile["updated_at"]) == profile
+        assert _as_user("user-b", store.get_profile) is None
+        assert store.delete_profile() is True
+        assert store.get_profile() is None
+
+
+class TestLocalStoreCoverLetters:
+    """Test cover letter queries against local stores."""
+
+    def test_create_list_get_delete(self, store):
+        cover_letter_id = store.create_cover_letter(
+            cover_letter_id="6f1c1f0e-2b8a-4f7e-9f55-5a4b6f3d2c10",
+            created_at="2024-01-01T00:00:00+00:00",
+            job_description="Build Python services",
+            company_name="Acme",
+            hiring_manager_name=None,
+            company_address=None,
+            tone="professional",
+            cover_letter_html="<p>Hi</p>",
+            cover_letter_text="Hi",
+            highlights_used=["Python"],
+            selected_experiences=[],
+            selected_skills=["Python"],
+        )
+        listing = store.list_cover_letters(search="python")
+        assert listing["total"] == 1
+        assert listing["cover_letters"][0]["company_name"] == "Acme"
+        letter = store.get_cover_letter_by_id(cover_letter_id)
+        assert letter["highlights_used"] == ["Python"]
+        assert _as_user("user-b", store.get_cover_letter_by_id, cover_letter_id) is None
+        assert store.delete_cover_letter(cover_letter_id) is True
+        assert store.list_cover_letters()["total"] == 0
+
+
+def test_store_missing_primitives_cannot_be_created():
+    class PartialStore(LocalStore):
+        def _insert(self, table, row):
+            pass
+
+    with pytest.raises(TypeError, match="_select"):
+        PartialStore()
+
+
+class TestBackendSelection:
+    """Test STORAGE_BACKEND selects the queries implementation."""
+
+    def test_unknown_backend_raises(self, monkeypatch):
+        monkeypatch.setenv("STORAGE_BACKEND", "mongo")
+        with pytest.raises(RuntimeError, match="Unknown STORAGE_BACKEND"):
+            create_local_store()
+
+    def test_sqlite_path_from_env(self, monkeypatch, tmp_path):
+        path = tmp_path / "nested" / "cv.sqlite3"
+        monkeypatch.setenv("SQLITE_DATABASE_PATH", str(path))
+        instance = create_local_store("sqlite")
+        assert instance.ping() is True
+        assert path.exists()
+        instance.close()
+
+    def test_queries_bind_to_local_store(self, monkeypatch):
+        from backend.database import queries
+
+        monkeypatch.setenv("STORAGE_BACKEND", "memory")
+        monkeypatch.setattr(local_storage, "_store", None)
+        try:
+            importlib.reload(queries)
+            cv_id = _as_user("user-a", queries.create_cv, _cv("Jane"))
+            assert _as_user("user-a", queries.get_cv_by_id, cv_id)["cv_id"] == cv_id
+        finally:
+            monkeypatch.delenv("STORAGE_BACKEND")
+            importlib.reload(queries)
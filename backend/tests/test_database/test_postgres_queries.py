@@ -0,0 +1,166 @@
+"""Tests for the optional direct Postgres read path."""
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+from uuid import UUID
+
+import pytest
+
+from backend.database import postgres, queries
+from backend.database.postgres import pool as postgres_pool
+from backend.database.postgres import queries as postgres_queries
+from backend.database.supabase import profile_cache
+from backend.database.supabase.pagination import decode_cursor, encode_cursor
+from backend.database.supabase.utils import reset_user_id_context, set_user_id_context
+
+USER_ID = "11111111-1111-1111-1111-111111111111"
+CV_ID = "6f1c1f0e-2b8a-4f7e-9f55-5a4b6f3d2c10"
+
+
+class FakeConnection:
+    """asyncpg connection/pool stand-in that records queries."""
+
+    def __init__(self, rows=None, value=None):
+        self.rows = rows or []
+        self.value = value
+        self.calls = []
+
+    async def fetchrow(self, sql, *params):
+        self.calls.append((sql, params))
+        return self.rows[0] if self.rows else None
+
+    async def fetch(self, sql, *params):
+        self.calls.append((sql, params))
+        return self.rows
+
+    async def fetchval(self, sql, *params):
+        self.calls.append((sql, params))
+        return self.value
+
+    def acquire(self):
+        conn = self
+
+        class _Acquire:
+            async def __aenter__(self):
+                return conn
+
+            async def __aexit__(self, *_exc):
+                return False
+
+        return _Acquire()
+
+
+def _record(idx):
+    return {
+        "id": UUID(f"00000000-0000-0000-0000-{idx:012d}"),
+        "created_at": datetime(2024, 1, idx + 1, tzinfo=timezone.utc),
+        "updated_at": datetime(2024, 1, idx + 1, tzinfo=timezone.utc),
+        "filename": None,
+        "target_company": None,
+        "target_role": None,
+        "cv_data": {"personal_info": {"name": f"Person {idx}"}},
+    }
+
+
+@pytest.fixture
+def fake_pool(monkeypatch):
+    conn = FakeConnection()
+
+    async def get_pool():
+        return conn
+
+    monkeypatch.setattr(postgres_queries, "get_pool", get_pool)
+    profile_cache.reset_profile_cache()
+    token = set_user_id_context(USER_ID)
+    yield conn
+    reset_user_id_context(token)
+    profile_cache.reset_profile_cache()
+
+
+@pytest.mark.asyncio
+class TestPostgresQueries:
+    """Test SQL scoping and result shaping of the direct path."""
+
+    async def test_get_cv_by_id_is_user_scoped(self, fake_pool):
+        fake_pool.rows = [{**_record(0), "id": UUID(CV_ID), "theme": "modern", "layout": None}]
+        cv = await postgres_queries.get_cv_by_id(CV_ID)
+        sql, params = fake_pool.calls[0]
+        assert "user_id = $2::uuid" in sql
+        assert params == (UUID(CV_ID), USER_ID)
+        assert cv["cv_id"] == CV_ID
+        assert cv["created_at"] == "2024-01-01T00:00:00+00:00"
+        assert cv["theme"] == "modern"
+
+    async def test_get_cv_by_id_rejects_malformed_id(self, fake_pool):
+        assert await postgres_queries.get_cv_by_id("not-a-uuid") is None
+        assert fake_pool.calls == []
+
+    async def test_get_profile_uses_cache(self, fake_pool):
+        fake_pool.rows = [
+            {
+                "profile_data": {"personal_info": {"name": "Jane"}},
+                "updated_at": datetime(2024, 2, 1, tzinfo=timezone.utc),
+            }
+        ]
+        first = await postgres_queries.get_profile()
+        second = await postgres_queries.get_profile()
+        assert first == second
+        assert first["updated_at"] == "2024-02-01T00:00:00+00:00"
+        assert len(fake_pool.calls) == 1
+        assert fake_pool.calls[0][1] == (USER_ID,)
+
+    async def test_list_cvs_with_search_cursor_and_count(self, fake_pool):
+        fake_pool.rows = [_record(2), _record(1), _record(0)]
+        fake_pool.value = 7
+        cursor = encode_cursor({"created_at": "2024-01-05T00:00:00+00:00", "id": CV_ID})
+        result = await postgres_queries.list_cvs(limit=2, offset=40, search="jane", cursor=cursor)
+        page_sql, page_params = fake_pool.calls[0]
+        assert "user_id = $1::uuid" in page_sql
+        assert "ilike $2" in page_sql
+        assert "(created_at, id) < ($3, $4)" in page_sql
+        assert page_params[0] == USER_ID
+        assert page_params[1] == "%jane%"
+        assert page_params[-2:] == (3, 0)
+        count_sql, count_params = fake_pool.calls[1]
+        assert count_sql.startswith("select count(*)")
+        assert count_params == (USER_ID, "%jane%")
+        assert result["total"] == 7
+        assert [cv["person_name"] for cv in result["cvs"]] == ["Person 2", "Person 1"]
+        assert decode_cursor(result["next_cursor"])[1] == "00000000-0000-0000-0000-000000000001"
+
+    async def test_list_cvs_planned_count_uses_plan_estimate(self, fake_pool):
+        fake_pool.value = '[{"Plan": {"Plan Rows": 1200}}]'
+        result = await postgres_queries.list_cvs(count="planned")
+        assert fake_pool.calls[1][0].startswith("explain (format json)")
+        assert result["total"] == 1200
+
+    async def test_list_cvs_without_count(self, fake_pool):
+        result = await postgres_queries.list_cvs(count="none")
+        assert result == {"cvs": [], "total": None, "next_cursor": None}
+        assert len(fake_pool.calls) == 1
+
+
+@pytest.mark.asyncio
+class TestQueryDispatch:
+    """Test the async query entry points pick the right path."""
+
+    async def test_falls_back_to_postgrest_without_database_url(self, monkeypatch):
+        monkeypatch.delenv("DATABASE_URL", raising=False)
+        mock_get = MagicMock(return_value={"cv_id": CV_ID})
+        monkeypatch.setattr(queries, "get_cv_by_id", mock_get)
+        assert await queries.aget_cv_by_id(CV_ID) == {"cv_id": CV_ID}
+        mock_get.assert_called_once_with(CV_ID)
+
+    async def test_uses_postgres_when_enabled(self, monkeypatch):
+        async def fake_list_cvs(**kwargs):
+            return {"cvs": [], "total": 0, "next_cursor": None, "kwargs": kwargs}
+
+        monkeypatch.setattr(postgres, "is_enabled", lambda: True)
+        monkeypatch.setattr(postgres, "list_cvs", fake_list_cvs)
+        result = await queries.alist_cvs(limit=5, search="x")
+        assert result["kwargs"]["limit"] == 5
+        assert result["kwargs"]["search"] == "x"
+
+    async def test_missing_driver_disables_direct_path(self, monkeypatch):
+        monkeypatch.setenv("DATABASE_URL", "postgresql://localhost/cv")
+        monkeypatch.setattr(postgres_pool, "asyncpg", None)
+        assert postgres_pool.is_enabled() is False
@@ -0,0 +1,137 @@
+"""Tests for the per-user profile read-through cache."""
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from backend.database.supabase import profile as supabase_profile
+from backend.database.supabase import profile_cache
+from backend.database.supabase.utils import reset_user_id_context, set_user_id_context
+
+
+class CountingTable:
+    """Supabase table stub that counts executed queries."""
+
+    def __init__(self, store):
+        self._store = store
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self
+
+    def upsert(self, payload, **_kwargs):
+        self._store["pending"] = payload
+        return self
+
+    def execute(self):
+        self._store["executions"] += 1
+        pending = self._store.pop("pending", None)
+        if pending is not None:
+            self._store["row"]["profile_data"] = pending["profile_data"]
+            self._store["row"]["updated_at"] = "2024-02-01T00:00:00+00:00"
+        return SimpleNamespace(data=[self._store["row"]])
+
+
+@pytest.fixture
+def profile_store(monkeypatch):
+    store = {
+        "executions": 0,
+        "row": {
+            "profile_data": {"personal_info": {"name": "Jane"}},
+            "updated_at": "2024-01-01T00:00:00+00:00",
+        },
+    }
+    client = SimpleNamespace(table=lambda _: CountingTable(store))
+    monkeypatch.setattr(supabase_profile, "get_admin_client", lambda: client)
+    monkeypatch.delenv("PROFILE_CACHE_REDIS_URL", raising=False)
+    monkeypatch.delenv("PROFILE_CACHE_TTL_S", raising=False)
+    profile_cache.reset_profile_cache()
+    token = set_user_id_context("user-a")
+    yield store
+    reset_user_id_context(token)
+    profile_cache.reset_profile_cache()
+
+
+class TestProfileCache:
+    """Test profile reads are cached per user and invalidated on writes."""
+
+    def test_second_read_is_served_from_cache(self, profile_store):
+        first = supabase_profile.get_profile()
+        second = supabase_profile.get_profile()
+        assert first == second
+        assert first["updated_at"] == "2024-01-01T00:00:00+00:00"
+        assert profile_store["executions"] == 1
+
+    def test_cached_profile_is_a_copy(self, profile_store):
+        supabase_profile.get_profile()["personal_info"]["name"] = "Mutated"
+        assert supabase_profile.get_profile()["personal_info"]["name"] == "Jane"
+
+    def test_cache_is_per_user(self, profile_store):
+        supabase_profile.get_profile()
+        token = set_user_id_context("user-b")
+        try:
+            supabase_profile.get_profile()
+        finally:
+            reset_user_id_context(token)
+        assert profile_store["executions"] == 2
+
+    def test_save_invalidates(self, profile_store):
+        supabase_profile.get_profile()
+        supabase_profile.save_profile({"personal_info": {"name": "Janet"}})
+        profile = supabase_profile.get_profile()
+        assert profile["personal_info"]["name"] == "Janet"
+        assert profile["updated_at"] == "2024-02-01T00:00:00+00:00"
+
+    @pytest.mark.parametrize(
+        "delete",
+        [
+            lambda: supabase_profile.delete_profile(),
+            lambda: supabase_profile.delete_profile_by_updated_at("2024-01-01T00:00:00+00:00"),
+        ],
+    )
+    def test_delete_invalidates(self, profile_store, delete):
+        supabase_profile.get_profile()
+        delete()
+        executions = profile_store["executions"]
+        supabase_profile.get_profile()
+        assert profile_store["executions"] == executions + 1
+
+    def test_get_by_updated_at_uses_matching_entry(self, profile_store):
+        supabase_profile.get_profile()
+        profile = supabase_profile.get_profile_by_updated_at("2024-01-01T00:00:00+00:00")
+        assert profile["personal_info"]["name"] == "Jane"
+        assert profile_store["executions"] == 1
+        supabase_profile.get_profile_by_updated_at("2023-12-01T00:00:00+00:00")
+        assert profile_store["executions"] == 2
+
+    def test_zero_ttl_disables_cache(self, profile_store, monkeypatch):
+        monkeypatch.setenv("PROFILE_CACHE_TTL_S", "0")
+        profile_cache.reset_profile_cache()
+        supabase_profile.get_profile()
+        supabase_profile.get_profile()
+        assert profile_store["executions"] == 2
+
+
+class TestLocalProfileCache:
+    """Test the in-process cache backend."""
+
+    def test_stale_fill_after_invalidation_is_dropped(self):
+        cache = profile_cache.LocalProfileCache(ttl_s=60)
+        generation = cache.generation("user-a")
+        cache.invalidate("user-a")
+        cache.set("user-a", {"updated_at": "old"}, generation)
+        assert cache.get("user-a") is None
+
+    def test_entries_expire(self, monkeypatch):
+        cache = profile_cache.LocalProfileCache(ttl_s=10)
+        monkeypatch.setattr(profile_cache.time, "monotonic", lambda: 100.0)
+        cache.set("user-a", {"updated_at": "t"}, cache.generation("user-a"))
+        assert cache.get("user-a") == {"updated_at": "t"}
+        monkeypatch.setattr(profile_cache.time, "monotonic", lambda: 111.0)
+        assert cache.get("user-a") is None
+
+    def test_missing_redis_falls_back_to_local(self, monkeypatch):
+        monkeypatch.setenv("PROFILE_CACHE_REDIS_URL", "redis://localhost:6379/0")
+        monkeypatch.setitem(sys.modules, "redis", None)
+        profile_cache.reset_profile_cache()
+        assert isinstance(profile_cache.get_profile_cache(), profile_cache.LocalProfileCache)
+        profile_cache.reset_profile_cache()
@@ -0,0 +1,242 @@
+"""Tests for Supabase keyset pagination helpers and list queries."""
+from types import SimpleNamespace
+
+import pytest
+
+from backend.database.supabase import cover_letter as supabase_cover_letter
+from backend.database.supabase import cv as supabase_cv
+from backend.database.supabase.pagination import (
+    apply_page,
+    decode_cursor,
+    encode_cursor,
+    resolve_count_mode,
+    split_page,
+)
+
+ROW_ID = "6f1c1f0e-2b8a-4f7e-9f55-5a4b6f3d2c10"
+
+
+class RecordingTable:
+    """Supabase table stub that records the builder calls it receives."""
+
+    def __init__(self, data):
+        self._data = data
+        self.calls = []
+
+    def __getattr__(self, name):
+        def method(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+            return self
+
+        return method
+
+    def execute(self):
+        return SimpleNamespace(data=self._data, count=42)
+
+
+def _rows(count):
+    return [
+        {
+            "id": f"00000000-0000-0000-0000-{idx:012d}",
+            "created_at": f"2024-01-{idx + 1:02d}T00:00:00+00:00",
+            "updated_at": f"2024-01-{idx + 1:02d}T00:00:00+00:00",
+            "cv_data": {"personal_info": {"name": f"Person {idx}"}},
+        }
+        for idx in range(count)
+    ]
+
+
+class TestCursorEncoding:
+    """Test opaque cursor round-trips and validation."""
+
+    def test_round_trip(self):
+        cursor = encode_cursor({"created_at": "2024-03-15T10:00:00.123+00:00", "id": ROW_ID})
+        assert decode_cursor(cursor) == ("2024-03-15T10:00:00.123+00:00", ROW_ID)
+
+    def test_cursor_is_url_safe(self):
+        cursor = encode_cursor({"created_at": "2024-03-15T10:00:00+00:00", "id": ROW_ID})
+        assert "=" not in cursor
+        assert "+" not in cursor
+        assert "/" not in cursor
+
+    @pytest.mark.parametrize(
+        "cursor",
+        ["not-a-cursor", encode_cursor({"created_at": "yesterday", "id": ROW_ID}),
+         encode_cursor({"created_at": "2024-01-01T00:00:00", "id": "1),id.gt.(0"})],
+    )
+    def test_invalid_cursor_raises(self, cursor):
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            decode_cursor(cursor)
+
+
+class TestCountMode:
+    """Test count mode resolution."""
+
+    def test_none_disables_counting(self):
+        assert resolve_count_mode("none") is None
+        assert resolve_count_mode(None) is None
+
+    def test_known_modes_pass_through(self):
+        assert resolve_count_mode("estimated") == "estimated"
+
+    def test_unknown_mode_raises(self):
+        with pytest.raises(ValueError):
+            resolve_count_mode("approximate")
+
+
+class TestApplyPage:
+    """Test query shaping for offset and keyset pages."""
+
+    def test_offset_page_fetches_one_extra_row(self):
+        table = RecordingTable([])
+        apply_page(table, 10, offset=20)
+        assert ("range", (20, 30), {}) in table.calls
+        assert ("order", ("id",), {"desc": True}) in table.calls
+
+    def test_cursor_page_seeks_instead_of_offset(self):
+        table = RecordingTable([])
+        cursor = encode_cursor({"created_at": "2024-01-05T00:00:00+00:00", "id": ROW_ID})
+        apply_page(table, 10, offset=500, cursor=cursor)
+        names = [name for name, _, _ in table.calls]
+        assert "range" not in names
+        assert ("limit", (11,), {}) in table.calls
+        filter_args = next(args for name, args, _ in table.calls if name == "or_")
+        assert 'created_at.lt."2024-01-05T00:00:00+00:00"' in filter_args[0]
+        assert f"id.lt.{ROW_ID}" in filter_args[0]
+
+    def test_split_page_returns_cursor_only_when_more_rows(self):
+        rows = _rows(3)
+        page, next_cursor = split_page(rows, 2)
+        assert len(page) == 2
+        assert decode_cursor(next_cursor) == (rows[1]["created_at"], rows[1]["id"])
+        assert split_page(rows, 3) == (rows, None)
+
+
+class TestListQueries:
+    """Test list queries with cursor pagination and count options."""
+
+    def test_list_cvs_returns_next_cursor(self, monkeypatch):
+        table = RecordingTable(_rows(3))
+        monkeypatch.setattr(
+            supabase_cv, "get_admin_client", lambda: SimpleNamespace(table=lambda _: table)
+        )
+        result = supabase_cv.list_cvs(limit=2)
+        assert len(result["cvs"]) == 2
+        assert result["total"] == 42
+        assert result["next_cursor"] is not None
+        select_kwargs = next(kw for name, _, kw in table.calls if name == "select")
+        assert select_kwargs["count"] == "exact"
+
+    def test_list_cvs_without_count(self, monkeypatch):
+        table = RecordingTable(_rows(1))
+        monkeypatch.setattr(
+            supabase_cv, "get_admin_client", lambda: SimpleNamespace(table=lambda _: table)
+        )
+        result = supabase_cv.list_cvs(limit=2, count="none")
+        assert result["total"] is None
+        assert result["next_cursor"] is None
+        select_kwargs = next(kw for name, _, kw in table.calls if name == "select")
+        assert select_kwargs["count"] is None
+
+    def test_list_cover_letters_with_cursor(self, monkeypatch):
+        table = RecordingTable([])
+        monkeypatch.setattr(
+            supabase_cover_letter,
+            "get_admin_client",
+            lambda: SimpleNamespace(table=lambda _: table),
+        )
+        cursor = encode_cursor({"created_at": "2024-01-05T00:00:00+00:00", "id": ROW_ID})
+        result = supabase_cover_letter.list_cover_letters(
+            limit=5, cursor=cursor, count="estimated"
+        )
+        assert result == {"cover_letters": [], "total": 42, "next_cursor": None}
+        assert ("limit", (6,), {}) in table.calls
+
+
+class CountingTable(RecordingTable):
+    """Recording table whose count is the number of rows left after the filters."""
+
+    def __init__(self, data, total):
+        super().__init__(data)
+        self._total = total
+
+    def execute(self):
+        count_mode = next(kw["count"] for name, _, kw in self.calls if name == "select")
+        seeks = any(name == "limit" for name, _, _ in self.calls)
+        count = None if count_mode is None else (self._total - 3 if seeks else self._total)
+        return SimpleNamespace(data=self._data, count=count)
+
+
+class TestTotalUnderCursor:
+    """Test total counts the whole filter, not only the rows after the cursor."""
+
+    CURSOR = encode_cursor({"created_at": "2024-01-05T00:00:00+00:00", "id": ROW_ID})
+
+    def _tables(self, monkeypatch, module):
+        tables = []
+
+        def table(_name):
+            tables.append(CountingTable(_rows(1), total=10))
+            return tables[-1]
+
+        monkeypatch.setattr(module, "get_admin_client", lambda: SimpleNamespace(table=table))
+        return tables
+
+    def test_list_cvs_counts_without_cursor(self, monkeypatch):
+        tables = self._tables(monkeypatch, supabase_cv)
+        result = supabase_cv.list_cvs(limit=2, search="jane", cursor=self.CURSOR)
+        assert result["total"] == 10
+        page, counted = tables
+        assert next(kw for name, _, kw in page.calls if name == "select")["count"] is None
+        assert ("select", ("id",), {"count": "exact", "head": True}) in counted.calls
+        # Only the search filter applies to the count, not the cursor seek
+        assert [name for name, _, _ in counted.calls].count("or_") == 1
+        assert not any(name in ("limit", "range", "order") for name, _, _ in counted.calls)
+
+    def test_list_cover_letters_counts_without_cursor(self, monkeypatch):
+        tables = self._tables(monkeypatch, supabase_cover_letter)
+        result = supabase_cover_letter.list_cover_letters(limit=2, cursor=self.CURSOR)
+        assert result["total"] == 10
+        assert len(tables) == 2
+        assert not any(name == "or_" for name, _, _ in tables[1].calls)
+
+    def test_offset_page_counts_in_one_query(self, monkeypatch):
+        tables = self._tables(monkeypatch, supabase_cv)
+        assert supabase_cv.list_cvs(limit=2)["total"] == 10
+        assert len(tables) == 1
+
+
+class PagedTable(RecordingTable):
+    """Recording table that serves successive pages on each execute."""
+
+    def __init__(self, pages):
+        super().__init__([])
+        self._pages = list(pages)
+
+    def execute(self):
+        return SimpleNamespace(data=self._pages.pop(0), count=None)
+
+
+class TestIterCVs:
+    """Test iterating over every CV with keyset pagination."""
+
+    def test_iter_cvs_follows_cursors(self, monkeypatch):
+        rows = _rows(4)
+        table = PagedTable([rows[:3], rows[2:4]])
+        monkeypatch.setattr(
+            supabase_cv, "get_admin_client", lambda: SimpleNamespace(table=lambda _: table)
+        )
+        result = list(supabase_cv.iter_cvs(user_id="owner", page_size=2))
+        assert [cv["person_name"] for cv in result] == [f"Person {idx}" for idx in range(4)]
+        assert ("eq", ("user_id", "owner"), {}) in table.calls
+        assert [name for name, _, _ in table.calls].count("or_") == 1
+
+    def test_iter_cvs_full_payload(self, monkeypatch):
+        table = PagedTable([_rows(1)])
+        monkeypatch.setattr(
+            supabase_cv, "get_admin_client", lambda: SimpleNamespace(table=lambda _: table)
+        )
+        result = list(supabase_cv.iter_cvs(user_id="owner", full=True))
+        assert result[0]["personal_info"] == {"name": "Person 0"}
+        select_args = next(args for name, args, _ in table.calls if name == "select")
+        assert select_args == ("*",)
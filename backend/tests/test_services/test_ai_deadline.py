@@ -0,0 +1,236 @@
+"""Tests for the request time budget and heuristic degradation."""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from backend.models import ProfileData, Skill
+from backend.models_ai import AIGenerateCVRequest
+from backend.models_cover_letter import CoverLetterRequest
+from backend.services.ai.cover_letter.generation import SELECTION_DEGRADED, generate_cover_letter
+from backend.services.ai.cover_letter_selection import SelectedContent
+from backend.services.ai.deadline import (
+    BudgetExhausted,
+    Deadline,
+    current_deadline,
+    deadline_scope,
+    within_budget,
+)
+from backend.services.ai.draft import generate_cv_draft
+from backend.services.ai.pipeline.content_adapter.batch_adaptation import _adapt_text_batch
+from backend.services.ai.pipeline.content_adapter.task_collection import ADAPTATION_DEGRADED
+from backend.services.ai.pipeline.jd_analyzer import analyze_jd
+from backend.services.ai.pipeline.models import JDAnalysis
+from backend.services.ai.pipeline.skill_relevance_evaluator.batch_evaluation import (
+    SKILLS_DEGRADED,
+    _evaluate_skill_batch,
+)
+
+
+@pytest.fixture
+def no_min_step(monkeypatch):
+    """Let LLM calls start with any amount of time left."""
+    monkeypatch.setenv("AI_DEADLINE_MIN_STEP_S", "0")
+
+
+async def _slow(value, delay=1.0):
+    await asyncio.sleep(delay)
+    return value
+
+
+def _configured_client():
+    llm_client = Mock()
+    llm_client.is_configured.return_value = True
+    llm_client.model = "test-model"
+    return llm_client
+
+
+class TestDeadline:
+    """Test the budget primitives."""
+
+    @pytest.mark.asyncio
+    async def test_without_scope_calls_run_unbounded(self):
+        """Test within_budget is a plain await when no deadline is set."""
+        assert current_deadline() is None
+        assert await within_budget(_slow("done", 0.01), "unused") == "done"
+
+    @pytest.mark.asyncio
+    async def test_skips_call_when_too_little_time_left(self):
+        """Test a call is not started below the minimum step time."""
+        call = _slow("never")
+        with deadline_scope(budget_s=2.0) as deadline:
+            with pytest.raises(BudgetExhausted):
+                await within_budget(call, "Skipped step")
+        assert deadline.degradations == ["Skipped step"]
+        assert call.cr_frame is None  # closed, so no "never awaited" warning
+
+    @pytest.mark.asyncio
+    async def test_cuts_off_call_at_deadline(self, no_min_step):
+        """Test a running call is cancelled when the budget runs out."""
+        with deadline_scope(budget_s=1.05) as deadline:
+            for _ in range(2):
+                with pytest.raises(BudgetExhausted):
+                    await within_budget(_slow("late"), "Slow step")
+        assert deadline.degradations == ["Slow step"]
+
+    def test_scope_is_reused_and_can_be_disabled(self, monkeypatch):
+        """Test nested scopes share the outer budget and 0 turns it off."""
+        with deadline_scope(budget_s=30) as outer:
+            with deadline_scope(budget_s=5) as inner:
+                assert inner is outer
+        assert current_deadline() is None
+
+        monkeypatch.setenv("AI_DEADLINE_S", "0")
+        with deadline_scope() as deadline:
+            assert deadline is None
+
+    def test_remaining_uses_clock(self):
+        """Test remaining time and LLM time exclude the heuristic reserve."""
+        now = [100.0]
+        deadline = Deadline(10.0, clock=lambda: now[0])
+        now[0] = 104.0
+        assert deadline.remaining() == 6.0
+        assert deadline.llm_time_left() == 5.0
+        now[0] = 200.0
+        assert deadline.remaining() == 0.0
+
+
+class TestPipelineDegradation:
+    """Test each LLM step falls back to its heuristic path."""
+
+    @pytest.mark.asyncio
+    async def test_jd_analysis_falls_back_to_heuristics(self, no_min_step):
+        """Test a slow JD analysis is replaced by the heuristic one."""
+        with patch(
+            "backend.services.ai.pipeline.jd_analyzer.analysis.get_llm_client",
+            return_value=_configured_client(),
+        ), patch(
+            "backend.services.ai.pipeline.jd_analyzer.analysis._analyze_with_llm",
+            new=lambda *args: _slow(None),
+        ):
+            with deadline_scope(budget_s=1.05) as deadline:
+                result = await analyze_jd("We require Python and Kubernetes experience.")
+
+        assert "python" in {s.lower() for s in result.required_skills}
+        assert len(deadline.degradations) == 1
+
+    @pytest.mark.asyncio
+    async def test_skill_batch_uses_heuristic_check(self):
+        """Test an exhausted budget yields heuristic results, not errors."""
+        llm_client = Mock()
+        llm_client.generate_text = AsyncMock(return_value="[]")
+        skills = [Skill(name="Python"), Skill(name="Go")]
+
+        with deadline_scope(budget_s=0.5) as deadline:
+            results = await _evaluate_skill_batch(skills, ["Python"], llm_client)
+
+        llm_client.generate_text.assert_not_awaited()
+        assert [(skill.name, error) for skill, _, error in results] == [("Python", None), ("Go", None)]
+        assert results[0][1].relevant
+        assert deadline.degradations == [SKILLS_DEGRADED]
+
+    @pytest.mark.asyncio
+    async def test_adaptation_keeps_original_text(self):
+        """Test pending items keep their wording and are not retried one by one."""
+        tasks = [
+            ("exp_desc", "0", "", "", "Built backend services for internal teams."),
+            ("highlight", "0", "0", "0", "Built REST API using Python"),
+        ]
+        llm_client = Mock()
+        llm_client.generate_text = AsyncMock()
+        llm_client.rewrite_text = AsyncMock()
+
+        with deadline_scope(budget_s=0.5) as deadline:
+            results = await _adapt_text_batch(llm_client, tasks, "Python", "")
+
+        llm_client.generate_text.assert_not_awaited()
+        llm_client.rewrite_text.assert_not_awaited()
+        assert [(r[5], r[6]) for r in results] == [(t[4], None) for t in tasks]
+        assert deadline.degradations == [ADAPTATION_DEGRADED]
+
+    @pytest.mark.asyncio
+    async def test_cv_draft_reports_degradations(self, sample_cv_data):
+        """Test degradation notes end up in the draft warnings."""
+        profile = ProfileData.model_validate({
+            key: sample_cv_data[key] for key in ("personal_info", "experience", "education", "skills")
+        })
+
+        async def degraded_analyze_jd(job_description, additional_context=None):
+            current_deadline().degrade("Job description analyzed with heuristics")
+            return JDAnalysis(
+                required_skills={"python"},
+                preferred_skills=set(),
+                responsibilities=["build web features"],
+                domain_keywords=set(),
+                seniority_signals=[],
+            )
+
+        request = AIGenerateCVRequest(
+            job_description="We require Python and React. You will build and improve web features.",
+            max_experiences=2,
+        )
+        with patch("backend.services.ai.draft.analyze_jd", side_effect=degraded_analyze_jd):
+            response = await generate_cv_draft(profile, request)
+
+        assert "Job description analyzed with heuristics" in response.warnings
+        assert current_deadline() is None
+
+
+class TestCoverLetterDegradation:
+    """Test cover letter generation under the time budget."""
+
+    @pytest.mark.asyncio
+    async def test_selection_falls_back_to_heuristics(self, sample_cv_data):
+        """Test an exhausted selection step still produces a letter with a warning."""
+        profile = ProfileData.model_validate({
+            key: sample_cv_data[key] for key in ("personal_info", "experience", "education", "skills")
+        })
+        llm_client = _configured_client()
+        llm_client.generate_text = AsyncMock(return_value="Dear team,\n\nI build Python services.")
+
+        async def exhausted_selection(**kwargs):
+            current_deadline().degrade(SELECTION_DEGRADED)
+            raise BudgetExhausted("no time left")
+
+        request = CoverLetterRequest(
+            job_description="We are looking for a Senior Software Engineer with Python experience.",
+            company_name="Tech Corp",
+            tone="professional",
+        )
+        with patch(
+            "backend.services.ai.cover_letter.generation.get_llm_client", return_value=llm_client
+        ), patch(
+            "backend.services.ai.cover_letter.generation.select_relevant_content",
+            side_effect=exhausted_selection,
+        ):
+            response = await generate_cover_letter(profile, request)
+
+        assert response.warnings == [SELECTION_DEGRADED]
+        assert response.selected_experiences == [exp["title"] for exp in sample_cv_data["experience"][:3]]
+        assert "I build Python services." in response.cover_letter_text
+
+    @pytest.mark.asyncio
+    async def test_body_past_deadline_fails(self, no_min_step):
+        """Test the body has no fallback, so running out of time is an error."""
+        profile = ProfileData.model_validate({
+            "personal_info": {"name": "Jane Smith"},
+            "experience": [],
+            "education": [],
+            "skills": [],
+        })
+        llm_client = _configured_client()
+        llm_client.generate_text = Mock(side_effect=lambda *args, **kwargs: _slow("late"))
+        request = CoverLetterRequest(
+            job_description="We are looking for a Senior Software Engineer with Python experience.",
+            company_name="Tech Corp",
+            tone="professional",
+        )
+        with patch(
+            "backend.services.ai.cover_letter.generation.get_llm_client", return_value=llm_client
+        ), patch(
+            "backend.services.ai.cover_letter.generation.select_relevant_content",
+            new=lambda **kwargs: _slow(SelectedContent([], [], [], ""), 0),
+        ), patch.dict("os.environ", {"AI_DEADLINE_S": "1.05"}):
+            with pytest.raises(ValueError, match="time budget"):
+                await generate_cover_letter(profile, request)
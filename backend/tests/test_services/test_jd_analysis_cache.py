@@ -0,0 +1,178 @@
+"""Tests for the JD analysis cache."""
+
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from backend.services.ai.cover_letter_selection import _build_selection_prompt
+from backend.services.ai.llm_client import bypass_response_cache
+from backend.services.ai.pipeline.jd_analyzer import analyze_jd, get_cached_jd_analysis
+from backend.services.ai.pipeline.jd_analyzer.cache import (
+    LocalJDAnalysisCache,
+    RedisJDAnalysisCache,
+    deserialize_jd_analysis,
+    jd_cache_key,
+    serialize_jd_analysis,
+)
+from backend.services.ai.pipeline.models import JDAnalysis
+
+JD = "We need a Senior Python developer.\n\nMust know Django and PostgreSQL."
+LLM_RESPONSE = (
+    '{"required_skills": ["Python", "Django"], "preferred_skills": ["PostgreSQL"],'
+    ' "responsibilities": ["Build APIs"], "domain_keywords": ["fintech"],'
+    ' "seniority_signals": ["senior"]}'
+)
+
+
+def _analysis():
+    return JDAnalysis(
+        required_skills={"python", "django"},
+        preferred_skills={"postgresql"},
+        responsibilities=["Build APIs"],
+        domain_keywords={"fintech"},
+        seniority_signals=["senior"],
+    )
+
+
+def _llm_client():
+    client = Mock()
+    client.model = "gpt-4o-mini"
+    client.is_configured.return_value = True
+    client.generate_text = AsyncMock(return_value=LLM_RESPONSE)
+    return client
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def set(self, key, value, px=None):
+        self.store[key] = value
+
+    def scan_iter(self, pattern):
+        return [key for key in list(self.store) if key.startswith(pattern.rstrip("*"))]
+
+    def delete(self, key):
+        self.store.pop(key, None)
+
+
+class TestJDAnalysisCacheStorage:
+    """Test keys, serialization and backends."""
+
+    def test_key_ignores_whitespace_and_case(self):
+        """Test the key is stable across formatting differences only."""
+        key = jd_cache_key(JD, None, "m")
+        assert key == jd_cache_key("  we need a senior python DEVELOPER. must know django and postgresql. ", "", "m")
+        assert key != jd_cache_key(JD, "emphasize Python", "m")
+        assert key != jd_cache_key(JD, None, "other-model")
+
+    def test_serialization_round_trip(self):
+        """Test the compact form restores an equal analysis."""
+        encoded = serialize_jd_analysis(_analysis())
+        assert " " not in encoded.replace("Build APIs", "")
+        assert deserialize_jd_analysis(encoded) == _analysis()
+
+    def test_local_cache_evicts_least_recently_used(self):
+        """Test the in-process cache is bounded."""
+        cache = LocalJDAnalysisCache(max_entries=2)
+        cache.set("a", _analysis())
+        cache.set("b", _analysis())
+        assert cache.get("a") is not None
+        cache.set("c", _analysis())
+        assert cache.get("b") is None
+        assert cache.get("a") == _analysis()
+
+    def test_local_cache_expires_entries(self):
+        """Test entries past the TTL are dropped."""
+        cache = LocalJDAnalysisCache(ttl_s=10)
+        with patch("backend.services.ai.pipeline.jd_analyzer.cache.time.monotonic", return_value=0):
+            cache.set("a", _analysis())
+        with patch("backend.services.ai.pipeline.jd_analyzer.cache.time.monotonic", return_value=11):
+            assert cache.get("a") is None
+
+    def test_redis_cache_round_trip(self):
+        """Test the shared backend stores the serialized form."""
+        redis = FakeRedis()
+        cache = RedisJDAnalysisCache(redis)
+        cache.set("a", _analysis())
+        assert redis.store["cv-pro:jd:a"] == serialize_jd_analysis(_analysis())
+        assert cache.get("a") == _analysis()
+        cache.clear()
+        assert cache.get("a") is None
+
+
+class TestAnalyzeJDCaching:
+    """Test analyze_jd reuses cached analyses."""
+
+    @pytest.mark.asyncio
+    async def test_llm_analysis_is_reused(self):
+        """Test a second analysis of the same JD does not call the LLM."""
+        llm_client = _llm_client()
+        with patch(
+            "backend.services.ai.pipeline.jd_analyzer.analysis.get_llm_client",
+            return_value=llm_client,
+        ):
+            first = await analyze_jd(JD)
+            second = await analyze_jd("  " + JD.upper())
+            peeked = get_cached_jd_analysis(JD)
+
+        assert llm_client.generate_text.await_count == 1
+        assert first == second == peeked
+        assert first.required_skills == {"Python", "Django"}
+
+    @pytest.mark.asyncio
+    async def test_bypass_forces_fresh_analysis(self):
+        """Test regenerate requests skip the cached analysis."""
+        llm_client = _llm_client()
+        with patch(
+            "backend.services.ai.pipeline.jd_analyzer.analysis.get_llm_client",
+            return_value=llm_client,
+        ):
+            await analyze_jd(JD)
+            with bypass_response_cache():
+                await analyze_jd(JD)
+
+        assert llm_client.generate_text.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_heuristic_fallback_is_not_cached(self):
+        """Test a failed LLM analysis is not stored."""
+        llm_client = _llm_client()
+        llm_client.generate_text = AsyncMock(side_effect=RuntimeError("down"))
+        with patch(
+            "backend.services.ai.pipeline.jd_analyzer.analysis.get_llm_client",
+            return_value=llm_client,
+        ):
+            await analyze_jd(JD)
+            assert get_cached_jd_analysis(JD) is None
+
+    @pytest.mark.asyncio
+    async def test_cache_errors_do_not_break_analysis(self):
+        """Test an unavailable shared cache falls through to the LLM."""
+        broken = Mock()
+        broken.get.side_effect = ConnectionError("redis down")
+        broken.set.side_effect = ConnectionError("redis down")
+        llm_client = _llm_client()
+        with patch(
+            "backend.services.ai.pipeline.jd_analyzer.analysis.get_llm_client",
+            return_value=llm_client,
+        ), patch(
+            "backend.services.ai.pipeline.jd_analyzer.analysis.get_jd_analysis_cache",
+            return_value=broken,
+        ):
+            result = await analyze_jd(JD)
+
+        assert result.required_skills == {"Python", "Django"}
+
+
+class TestCoverLetterReuse:
+    """Test cover letter selection uses a cached analysis."""
+
+    def test_selection_prompt_includes_requirements(self):
+        """Test extracted requirements are added to the selection prompt."""
+        prompt = _build_selection_prompt("EXPERIENCES:", JD, _analysis())
+        assert "EXTRACTED REQUIREMENTS:" in prompt
+        assert "Required: django, python" in prompt
+        assert "EXTRACTED REQUIREMENTS" not in _build_selection_prompt("EXPERIENCES:", JD)
@@ -0,0 +1,245 @@
+"""Tests for the LLM circuit breaker and hedged requests."""
+
+import asyncio
+
+import httpx
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from backend.models import Skill
+from backend.services.ai.llm_client import CircuitBreaker, CircuitOpenError, LLMClient, get_circuit_breaker
+from backend.services.ai.llm_client import request_executor
+from backend.services.ai.llm_client.circuit_breaker import CLOSED, HALF_OPEN, OPEN
+from backend.services.ai.pipeline.content_adapter.batch_adaptation import _adapt_text_batch
+from backend.services.ai.pipeline.content_adapter.task_collection import _adapt_single_text_item
+from backend.services.ai.pipeline.skill_relevance_evaluator.batch_evaluation import _evaluate_skill_batch
+from backend.services.ai.pipeline.skill_relevance_evaluator.llm_evaluation import (
+    _evaluate_skill_with_error_handling,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _status_error(status_code):
+    request = httpx.Request("POST", "https://llm.test")
+    response = httpx.Response(status_code, request=request)
+    return httpx.HTTPStatusError("error", request=request, response=response)
+
+
+class TestCircuitBreaker:
+    """Test breaker state transitions."""
+
+    def test_opens_after_consecutive_failures(self):
+        """Test the circuit opens at the threshold and rejects requests."""
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout_s=10, clock=FakeClock())
+        for _ in range(2):
+            breaker.record_failure()
+        assert breaker.state == CLOSED
+        breaker.record_success()
+        for _ in range(3):
+            breaker.record_failure()
+        assert breaker.state == OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.check()
+        assert breaker.snapshot()["rejected"] == 1
+
+    def test_half_open_allows_single_probe(self):
+        """Test one probe is let through after the cool-down."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout_s=10, clock=clock)
+        breaker.record_failure()
+        clock.now = 10
+        assert breaker.state == HALF_OPEN
+        assert breaker.check() is True
+        assert breaker.allow() is False
+
+        breaker.record_success()
+        assert breaker.state == CLOSED
+        assert breaker.check() is False
+
+    def test_failed_probe_reopens(self):
+        """Test a failed probe starts a new cool-down."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=5, reset_timeout_s=10, clock=clock)
+        for _ in range(5):
+            breaker.record_failure()
+        clock.now = 10
+        breaker.check()
+        breaker.record_failure()
+        assert breaker.state == OPEN
+        clock.now = 15
+        assert breaker.allow() is False
+        assert breaker.snapshot()["times_opened"] == 2
+
+
+@pytest.mark.asyncio
+class TestRequestExecutorResilience:
+    """Test retries, the breaker and hedging in the request executor."""
+
+    async def test_outage_fails_fast_once_open(self, monkeypatch):
+        """Test calls stop hitting the provider after the circuit opens."""
+        monkeypatch.setenv("AI_CIRCUIT_FAILURE_THRESHOLD", "2")
+        execute = AsyncMock(side_effect=_status_error(503))
+        with patch.object(request_executor, "_execute_request", execute), patch.object(
+            request_executor.asyncio, "sleep", AsyncMock()
+        ):
+            with pytest.raises(CircuitOpenError):
+                await request_executor._make_request_with_retry(None, "url", {}, {})
+            with pytest.raises(CircuitOpenError):
+                await request_executor._make_request_with_retry(None, "url", {}, {})
+
+        assert execute.await_count == 2
+        assert get_circuit_breaker().state == OPEN
+
+    async def test_client_errors_do_not_open_circuit(self, monkeypatch):
+        """Test 4xx responses count as a healthy provider."""
+        monkeypatch.setenv("AI_CIRCUIT_FAILURE_THRESHOLD", "1")
+        execute = AsyncMock(side_effect=_status_error(400))
+        with patch.object(request_executor, "_execute_request", execute):
+            with pytest.raises(httpx.HTTPStatusError):
+                await request_executor._make_request_with_retry(None, "url", {}, {})
+        assert get_circuit_breaker().state == CLOSED
+
+    async def test_retry_sleeps_are_jittered(self):
+        """Test the executor sleeps for the jittered delay, not the fixed schedule."""
+        execute = AsyncMock(side_effect=[_status_error(503), "ok"])
+        sleep = AsyncMock()
+        with patch.object(request_executor, "_execute_request", execute), patch.object(
+            request_executor.asyncio, "sleep", sleep
+        ), patch("backend.services.ai.llm_client.retry_logic.random.random", return_value=0.0):
+            assert await request_executor._make_request_with_retry(None, "url", {}, {}) == "ok"
+        sleep.assert_awaited_once_with(0.5)
+
+    async def test_hedged_request_returns_faster_response(self):
+        """Test a slow first request is raced by a backup and the loser is cancelled."""
+        cancelled = []
+
+        async def execute(self, url, payload, headers):
+            call = execute.calls = getattr(execute, "calls", 0) + 1
+            try:
+                await asyncio.sleep(1 if call == 1 else 0.01)
+            except asyncio.CancelledError:
+                cancelled.append(call)
+                raise
+            return f"response {call}"
+
+        with patch.object(request_executor, "_execute_request", execute):
+            result = await request_executor._cached_request(None, "url", {}, {}, hedge_after_s=0.02)
+
+        assert result == "response 2"
+        assert cancelled == [1]
+
+    async def test_cancelled_caller_cancels_primary_request(self):
+        """Test cancelling before the hedge delay does not leave the first request running."""
+        cancelled = []
+
+        async def execute(self, url, payload, headers):
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+            return "late"
+
+        with patch.object(request_executor, "_execute_request", execute):
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(
+                    request_executor._cached_request(None, "url", {}, {}, hedge_after_s=0.5), timeout=0.02
+                )
+
+        assert cancelled == [True]
+
+    async def test_hedge_not_sent_for_fast_response(self):
+        """Test no backup request is sent when the first answers in time."""
+        execute = AsyncMock(return_value="fast")
+        with patch.object(request_executor, "_execute_request", execute):
+            assert await request_executor._cached_request(None, "url", {}, {}, hedge_after_s=1) == "fast"
+        assert execute.await_count == 1
+
+    async def test_generate_text_hedges_only_when_asked(self, monkeypatch):
+        """Test hedging is opt-in per call and configured by AI_HEDGE_AFTER_S."""
+        monkeypatch.setenv("AI_ENABLED", "true")
+        monkeypatch.setenv("AI_BASE_URL", "https://llm.test")
+        monkeypatch.setenv("AI_API_KEY", "key")
+        monkeypatch.setenv("AI_HEDGE_AFTER_S", "1.5")
+        client = LLMClient()
+        cached_request = AsyncMock(return_value="ok")
+        with patch("backend.services.ai.llm_client.client._cached_request", cached_request):
+            await client.generate_text("prompt")
+            await client.generate_text("prompt", hedge=True)
+
+        assert cached_request.await_args_list[0].kwargs["hedge_after_s"] == 0.0
+        assert cached_request.await_args_list[1].kwargs["hedge_after_s"] == 1.5
+
+    async def test_malformed_hedge_delay_disables_hedging(self, monkeypatch):
+        """Test a bad AI_HEDGE_AFTER_S falls back to no hedging instead of failing."""
+        monkeypatch.setenv("AI_HEDGE_AFTER_S", "soon")
+        assert LLMClient().hedge_after_s == 0.0
+
+
+@pytest.fixture
+def open_circuit_client(monkeypatch):
+    monkeypatch.setenv("AI_ENABLED", "true")
+    monkeypatch.setenv("AI_BASE_URL", "https://llm.test")
+    monkeypatch.setenv("AI_API_KEY", "key")
+    monkeypatch.setenv("AI_CIRCUIT_FAILURE_THRESHOLD", "1")
+    get_circuit_breaker().record_failure()
+    assert get_circuit_breaker().state == OPEN
+    execute = AsyncMock(return_value="[]")
+    with patch.object(request_executor, "_execute_request", execute):
+        yield LLMClient()
+    execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+class TestSkillEvaluationWhenOpen:
+    """Test skill evaluation falls back to heuristics while the circuit is open."""
+
+    async def test_batch_uses_heuristic_check(self, open_circuit_client):
+        """Test a batch is matched heuristically instead of failing every skill."""
+        skills = [Skill(name="Python"), Skill(name="Cobol")]
+        results = await _evaluate_skill_batch(skills, ["Python", "Django"], open_circuit_client)
+
+        assert [(skill.name, error) for skill, _, error in results] == [("Python", None), ("Cobol", None)]
+        assert results[0][1].relevant
+        assert not results[1][1].relevant
+
+    async def test_single_skill_uses_heuristic_check(self, open_circuit_client):
+        """Test the per-skill path falls back the same way."""
+        skill, result, error = await _evaluate_skill_with_error_handling(
+            Skill(name="Python"), ["Python"], open_circuit_client
+        )
+
+        assert error is None
+        assert result.relevant
+
+
+@pytest.mark.asyncio
+class TestAdaptationWhenOpen:
+    """Test content adaptation keeps the original wording while the circuit is open."""
+
+    TASKS = [
+        ("exp_desc", "0", "", "", "Built Python services"),
+        ("highlight", "0", "0", "0", "Cut API latency in half"),
+    ]
+
+    async def test_batch_keeps_original_text(self, open_circuit_client):
+        """Test a batch is not retried item by item and reports no errors."""
+        results = await _adapt_text_batch(open_circuit_client, self.TASKS, "Python", "")
+
+        assert [(result[5], result[6]) for result in results] == [
+            ("Built Python services", None),
+            ("Cut API latency in half", None),
+        ]
+
+    async def test_single_item_keeps_original_text(self, open_circuit_client):
+        """Test the per-item path falls back the same way."""
+        result = await _adapt_single_text_item(open_circuit_client, self.TASKS[0], "Python", "")
+
+        assert result[5:] == ("Built Python services", None)
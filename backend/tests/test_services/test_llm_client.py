@@ -269,6 +269,100 @@ class TestLLMClient:
                 await llm_client.generate_text("prompt")
 
 
+def _mock_http_client(content="Generated text from LLM"):
+    mock_client = AsyncMock()
+    mock_response_obj = AsyncMock()
+    mock_response_obj.json = lambda: {"choices": [{"message": {"content": content}}]}
+    mock_response_obj.raise_for_status = lambda: None
+    mock_client.post = AsyncMock(return_value=mock_response_obj)
+    mock_client.get = AsyncMock(return_value=mock_response_obj)
+    return mock_client
+
+
+class TestLLMClientConnectionPool:
+    """Test the shared pooled HTTP client."""
+
+    @pytest.mark.asyncio
+    async def test_http_client_is_reused_across_calls(self, llm_client):
+        """Test consecutive calls share one pooled AsyncClient."""
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client = _mock_http_client()
+            mock_client_class.return_value = mock_client
+
+            await llm_client.generate_text("one")
+            await llm_client.rewrite_text("two", "prompt")
+
+            mock_client_class.assert_called_once()
+            assert mock_client.post.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_pool_limits_from_environment(self, llm_client):
+        """Test pool limits and HTTP/2 are configurable."""
+        env = {
+            "AI_HTTP_MAX_CONNECTIONS": "7",
+            "AI_HTTP_MAX_KEEPALIVE": "3",
+            "AI_HTTP_KEEPALIVE_EXPIRY_S": "2.5",
+            "AI_HTTP2": "true",
+        }
+        with patch.dict("os.environ", env), patch("httpx.AsyncClient") as mock_client_class:
+            mock_client_class.return_value = _mock_http_client()
+
+            await llm_client.generate_text("prompt")
+
+            kwargs = mock_client_class.call_args.kwargs
+            assert kwargs["limits"].max_connections == 7
+            assert kwargs["limits"].max_keepalive_connections == 3
+            assert kwargs["limits"].keepalive_expiry == 2.5
+            assert kwargs["http2"] is True
+            assert kwargs["timeout"] == 30
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_pool(self, llm_client):
+        """Test aclose closes the pooled client and a new one is opened afterwards."""
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client = _mock_http_client()
+            mock_client_class.return_value = mock_client
+
+            await llm_client.generate_text("prompt")
+            await llm_client.aclose()
+            mock_client.aclose.assert_awaited_once()
+
+            await llm_client.generate_text("prompt")
+            assert mock_client_class.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_warm_up_opens_connection(self, llm_client):
+        """Test warm_up issues a lightweight request on the pooled client."""
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client = _mock_http_client()
+            mock_client_class.return_value = mock_client
+
+            assert await llm_client.warm_up() is True
+            assert mock_client.get.call_args[0][0] == "https://api.openai.com/v1/models"
+
+            await llm_client.generate_text("prompt")
+            mock_client_class.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_warm_up_failure_is_not_fatal(self, llm_client):
+        """Test warm_up swallows connection errors."""
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client = _mock_http_client()
+            mock_client.get = AsyncMock(side_effect=httpx.ConnectError("refused"))
+            mock_client_class.return_value = mock_client
+
+            assert await llm_client.warm_up() is False
+
+    @pytest.mark.asyncio
+    async def test_warm_up_skipped_when_not_configured(self):
+        """Test warm_up does nothing without LLM configuration."""
+        with patch.dict("os.environ", {"AI_ENABLED": "false"}):
+            client = LLMClient()
+            with patch("httpx.AsyncClient") as mock_client_class:
+                assert await client.warm_up() is False
+                mock_client_class.assert_not_called()
+
+
 class TestGetLLMClient:
     """Test get_llm_client singleton."""
 
@@ -0,0 +1,126 @@
+"""Tests for the LLM concurrency governor."""
+import asyncio
+import time
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
+import pytest
+
+from backend.services.ai.llm_client import governor as governor_module
+from backend.services.ai.llm_client.governor import LLMGovernor, get_llm_governor
+
+
+async def _run(governor, user_id, log, hold=0.01):
+    async with governor.slot(user_id):
+        log.append(user_id)
+        await asyncio.sleep(hold)
+
+
+@pytest.mark.asyncio
+class TestLLMGovernor:
+    """Test admission control, fairness and metrics."""
+
+    async def test_limits_in_flight_requests(self):
+        """Test no more than max_in_flight requests run at once."""
+        governor = LLMGovernor(max_in_flight=2)
+        running = 0
+        peak = 0
+
+        async def work():
+            nonlocal running, peak
+            async with governor.slot("user"):
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        await asyncio.gather(*(work() for _ in range(10)))
+        assert peak == 2
+        assert governor.snapshot()["in_flight"] == 0
+
+    async def test_round_robin_between_users(self):
+        """Test a user with many queued calls does not starve another user."""
+        governor = LLMGovernor(max_in_flight=1)
+        log = []
+        tasks = [asyncio.create_task(_run(governor, "heavy", log)) for _ in range(6)]
+        await asyncio.sleep(0)
+        tasks += [asyncio.create_task(_run(governor, "light", log)) for _ in range(2)]
+        await asyncio.gather(*tasks)
+        assert log[:5] == ["heavy", "heavy", "light", "heavy", "light"]
+
+    async def test_token_bucket_spaces_requests(self):
+        """Test the rate limit delays requests beyond the burst."""
+        governor = LLMGovernor(max_in_flight=10, rate_per_s=50, burst=1)
+        started = time.monotonic()
+        await asyncio.gather(*(_run(governor, "user", [], hold=0) for _ in range(4)))
+        assert time.monotonic() - started >= 0.05
+
+    async def test_backoff_pauses_admission(self):
+        """Test backoff holds new requests until the pause expires."""
+        governor = LLMGovernor(max_in_flight=4)
+        governor.backoff(0.05)
+        started = time.monotonic()
+        await _run(governor, "user", [], hold=0)
+        assert time.monotonic() - started >= 0.04
+
+    async def test_cancelled_waiter_is_discarded(self):
+        """Test cancelling a queued request frees its place without leaking slots."""
+        governor = LLMGovernor(max_in_flight=1)
+        holder = asyncio.create_task(_run(governor, "a", [], hold=0.02))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(_run(governor, "b", []))
+        await asyncio.sleep(0)
+        assert governor.snapshot()["queued"] == 1
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        await holder
+        snapshot = governor.snapshot()
+        assert snapshot["queued"] == 0
+        assert snapshot["in_flight"] == 0
+
+    async def test_snapshot_reports_queue_time(self):
+        """Test queue-time metrics are recorded for admitted requests."""
+        governor = LLMGovernor(max_in_flight=1)
+        await asyncio.gather(*(_run(governor, "user", [], hold=0.01) for _ in range(3)))
+        snapshot = governor.snapshot()
+        assert snapshot["granted"] == 3
+        assert snapshot["max_wait_ms"] >= 10
+        assert snapshot["avg_wait_ms"] > 0
+
+
+class TestGovernorConfiguration:
+    """Test governor configuration from the environment."""
+
+    def test_reads_environment(self, monkeypatch):
+        monkeypatch.setenv("AI_MAX_IN_FLIGHT", "4")
+        monkeypatch.setenv("AI_RATE_LIMIT_RPS", "2.5")
+        monkeypatch.setattr(governor_module, "_governor", None)
+        governor = get_llm_governor()
+        assert governor.max_in_flight == 4
+        assert governor.rate_per_s == 2.5
+        assert governor.burst == 2.5
+        monkeypatch.setattr(governor_module, "_governor", None)
+
+
+@pytest.mark.asyncio
+class TestRequestExecutorUsesGovernor:
+    """Test LLM requests go through the governor."""
+
+    async def test_rate_limited_response_pauses_governor(self, monkeypatch):
+        from backend.services.ai.llm_client import request_executor
+
+        governor = LLMGovernor(max_in_flight=2)
+        governor.backoff = Mock()
+        monkeypatch.setattr(request_executor, "get_llm_governor", lambda: governor)
+        response = httpx.Response(429, request=httpx.Request("POST", "https://llm.test"))
+        error = httpx.HTTPStatusError("rate limited", request=response.request, response=response)
+        execute = AsyncMock(side_effect=[error, "ok"])
+        with patch.object(request_executor, "_execute_request", execute), patch.object(
+            request_executor.asyncio, "sleep", AsyncMock()
+        ):
+            result = await request_executor._make_request_with_retry(None, "url", {}, {})
+        assert result == "ok"
+        governor.backoff.assert_called_once_with(1)
+        assert governor.snapshot()["granted"] == 2
+        assert governor.snapshot()["in_flight"] == 0
@@ -0,0 +1,159 @@
+"""Tests for the LLM response cache."""
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from backend.services.ai.llm_client import (
+    LLMClient,
+    LLMResponseCache,
+    bypass_response_cache,
+    get_response_cache,
+    reset_response_cache,
+)
+from backend.services.ai.llm_client.response_cache import cache_key
+
+
+def _payload(content="hello", temperature=0.7):
+    return {
+        "model": "gpt-4o-mini",
+        "temperature": temperature,
+        "max_completion_tokens": 2000,
+        "messages": [{"role": "user", "content": content}],
+    }
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestLLMResponseCache:
+    """Test cache storage, expiry and metrics."""
+
+    def test_key_depends_on_model_temperature_and_messages(self):
+        """Test only output-relevant fields change the key."""
+        base = _payload()
+        assert cache_key(base) == cache_key(dict(reversed(list(base.items()))))
+        assert cache_key(base) == cache_key({**base, "stream": False})
+        assert cache_key(base) != cache_key(_payload(temperature=0.2))
+        assert cache_key(base) != cache_key(_payload(content="other"))
+        assert cache_key(base) != cache_key({**base, "model": "gpt-4o"})
+
+    def test_get_set_and_hit_rate(self):
+        """Test stored responses are returned and counted."""
+        cache = LLMResponseCache()
+        assert cache.get(_payload()) is None
+        cache.set(_payload(), "cached answer")
+        assert cache.get(_payload()) == "cached answer"
+
+        stats = cache.snapshot()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+        assert stats["entries"] == 1
+
+    def test_entries_expire_after_ttl(self):
+        """Test entries older than the TTL are treated as misses and removed."""
+        clock = FakeClock()
+        cache = LLMResponseCache(ttl_s=60, clock=clock)
+        cache.set(_payload(), "answer")
+        clock.now += 61
+        assert cache.get(_payload()) is None
+        assert cache.snapshot()["entries"] == 0
+
+    def test_evicts_least_recently_used(self):
+        """Test the cache stays within max_entries, dropping the coldest entry."""
+        clock = FakeClock()
+        cache = LLMResponseCache(max_entries=2, clock=clock)
+        cache.set(_payload("a"), "A")
+        clock.now += 1
+        cache.set(_payload("b"), "B")
+        clock.now += 1
+        assert cache.get(_payload("a")) == "A"
+        clock.now += 1
+        cache.set(_payload("c"), "C")
+
+        assert cache.get(_payload("b")) is None
+        assert cache.get(_payload("a")) == "A"
+        assert cache.get(_payload("c")) == "C"
+        assert cache.snapshot()["evictions"] == 1
+
+    def test_bypass_skips_lookup(self):
+        """Test lookups inside bypass_response_cache miss without counting as misses."""
+        cache = LLMResponseCache()
+        cache.set(_payload(), "answer")
+        with bypass_response_cache():
+            assert cache.get(_payload()) is None
+        with bypass_response_cache(False):
+            assert cache.get(_payload()) == "answer"
+        assert cache.snapshot()["bypassed"] == 1
+
+    def test_persists_to_file(self, tmp_path):
+        """Test responses survive reopening the SQLite file."""
+        path = str(tmp_path / "llm_cache.sqlite3")
+        cache = LLMResponseCache(path)
+        cache.set(_payload(), "answer")
+        cache.close()
+        assert LLMResponseCache(path).get(_payload()) == "answer"
+
+
+class TestLLMClientResponseCache:
+    """Test the cache wired into LLMClient."""
+
+    @pytest.fixture
+    def cached_client(self):
+        env = {
+            "AI_ENABLED": "true",
+            "AI_BASE_URL": "https://api.openai.com/v1",
+            "AI_API_KEY": "test-key",
+            "AI_RESPONSE_CACHE": "true",
+            "AI_RESPONSE_CACHE_PATH": ":memory:",
+        }
+        with patch.dict("os.environ", env):
+            reset_response_cache()
+            yield LLMClient()
+            reset_response_cache()
+
+    @staticmethod
+    def _mock_http_client(content="Generated text"):
+        mock_client = AsyncMock()
+        mock_response_obj = AsyncMock()
+        mock_response_obj.json = lambda: {"choices": [{"message": {"content": content}}]}
+        mock_response_obj.raise_for_status = lambda: None
+        mock_client.post = AsyncMock(return_value=mock_response_obj)
+        return mock_client
+
+    @pytest.mark.asyncio
+    async def test_identical_requests_hit_cache(self, cached_client):
+        """Test a repeated prompt is answered without a second API call."""
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client = self._mock_http_client()
+            mock_client_class.return_value = mock_client
+
+            first = await cached_client.generate_text("same prompt")
+            second = await cached_client.generate_text("same prompt")
+            await cached_client.rewrite_text("text", "same prompt")
+
+        assert first == second == "Generated text"
+        assert mock_client.post.call_count == 2
+        assert get_response_cache().snapshot()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_bypass_refreshes_cached_response(self, cached_client):
+        """Test regenerate requests skip the cache and store the fresh answer."""
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client_class.return_value = self._mock_http_client("old")
+            await cached_client.generate_text("prompt")
+
+            await cached_client.aclose()
+            mock_client_class.return_value = self._mock_http_client("new")
+            with bypass_response_cache():
+                assert await cached_client.generate_text("prompt") == "new"
+            assert await cached_client.generate_text("prompt") == "new"
+
+    def test_disabled_by_default(self):
+        """Test the cache is opt-in."""
+        with patch.dict("os.environ", {"AI_RESPONSE_CACHE": "false"}):
+            assert get_response_cache() is None
@@ -1,13 +1,24 @@
 """Tests for LLM retry logic."""
 import httpx
-from unittest.mock import Mock
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import Mock, patch
 
 from backend.services.ai.llm_client.retry_logic import (
+    MAX_RETRY_AFTER_S,
+    _backoff_delay,
+    _retry_after_seconds,
     _should_retry_status_error,
     _should_retry_timeout,
 )
 
 
+def _status_error(status_code, headers=None):
+    request = httpx.Request("POST", "https://llm.test")
+    response = httpx.Response(status_code, headers=headers or {}, request=request)
+    return httpx.HTTPStatusError("error", request=request, response=response)
+
+
 class TestShouldRetryStatusError:
     """Test _should_retry_status_error function."""
 
@@ -117,3 +128,32 @@ class TestShouldRetryTimeout:
         should_retry, delay = _should_retry_timeout(error, attempt=2, max_retries=4, retry_delays=[1, 2, 4, 8])
         assert should_retry is True
         assert delay == 4
+
+
+class TestRetryAfter:
+    """Test Retry-After parsing and backoff delays."""
+
+    def test_reads_seconds_and_milliseconds(self):
+        """Test both header forms are understood and capped."""
+        assert _retry_after_seconds(httpx.Response(429, headers={"Retry-After": "7"})) == 7
+        assert _retry_after_seconds(httpx.Response(429, headers={"retry-after-ms": "1500"})) == 1.5
+        assert _retry_after_seconds(httpx.Response(429, headers={"Retry-After": "3600"})) == MAX_RETRY_AFTER_S
+        assert _retry_after_seconds(httpx.Response(429)) is None
+        assert _retry_after_seconds(httpx.Response(429, headers={"Retry-After": "soon"})) is None
+
+    def test_reads_http_date(self):
+        """Test the HTTP-date form is converted to a relative wait."""
+        when = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+        assert 25 <= _retry_after_seconds(httpx.Response(503, headers={"Retry-After": when})) <= 30
+
+    def test_backoff_prefers_retry_after(self):
+        """Test the provider's requested wait wins over the default schedule."""
+        with patch("backend.services.ai.llm_client.retry_logic.random.random", return_value=0.0):
+            assert _backoff_delay(_status_error(429, {"Retry-After": "5"}), 1) == 5
+
+    def test_backoff_is_jittered(self):
+        """Test default delays are spread over [delay/2, delay]."""
+        with patch("backend.services.ai.llm_client.retry_logic.random.random", return_value=0.0):
+            assert _backoff_delay(_status_error(503), 4) == 2
+        with patch("backend.services.ai.llm_client.retry_logic.random.random", return_value=1.0):
+            assert _backoff_delay(httpx.ReadTimeout("slow"), 4) == 4
@@ -0,0 +1,110 @@
+"""Tests for streaming chat completions."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from backend.services.ai.llm_client import LLMClient, reset_response_cache
+from backend.services.ai.llm_client.streaming import _chunk_delta, _parse_stream_chunk
+
+ENV = {
+    "AI_ENABLED": "true",
+    "AI_BASE_URL": "https://api.openai.com/v1",
+    "AI_API_KEY": "test-key",
+    "AI_MODEL": "gpt-4o-mini",
+}
+
+
+def _sse_body(*deltas):
+    chunks = [{"choices": [{"delta": {"role": "assistant"}}]}]
+    chunks += [{"choices": [{"delta": {"content": delta}}]} for delta in deltas]
+    lines = [f"data: {json.dumps(chunk)}" for chunk in chunks] + ["data: [DONE]"]
+    return ("\n\n".join(lines) + "\n\n").encode()
+
+
+def _client_with(handler):
+    """Create an LLMClient whose pooled HTTP client uses a mock transport."""
+    with patch.dict("os.environ", ENV):
+        client = LLMClient()
+    client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client._http_client_loop = asyncio.get_running_loop()
+    return client
+
+
+async def _collect(client, prompt="Write a letter"):
+    return [delta async for delta in client.stream_text(prompt)]
+
+
+class TestStreamText:
+    """Test LLMClient.stream_text."""
+
+    def test_parse_stream_chunk(self):
+        """Test content deltas are extracted and role-only chunks are empty."""
+        assert _chunk_delta(_parse_stream_chunk('{"choices": [{"delta": {"content": "Hi"}}]}')) == "Hi"
+        assert _chunk_delta(_parse_stream_chunk('{"choices": [{"delta": {"role": "assistant"}}]}')) == ""
+        assert _chunk_delta(_parse_stream_chunk('{"choices": []}')) == ""
+        with pytest.raises(ValueError, match="Invalid stream chunk"):
+            _parse_stream_chunk("not json")
+
+    @pytest.mark.asyncio
+    async def test_yields_deltas_in_order(self):
+        """Test tokens are forwarded as they arrive and the request asks for a stream."""
+        requests = []
+
+        def handler(request):
+            requests.append(json.loads(request.content))
+            return httpx.Response(200, content=_sse_body("Dear ", "Hiring ", "Manager"))
+
+        client = _client_with(handler)
+        assert await _collect(client) == ["Dear ", "Hiring ", "Manager"]
+        assert requests[0]["stream"] is True
+        assert requests[0]["messages"][1]["content"] == "Write a letter"
+
+    @pytest.mark.asyncio
+    async def test_retries_before_first_token(self):
+        """Test a 503 before any output is retried."""
+        responses = [httpx.Response(503, json={"error": "busy"}), httpx.Response(200, content=_sse_body("ok"))]
+        client = _client_with(lambda request: responses.pop(0))
+
+        with patch("backend.services.ai.llm_client.request_executor.asyncio.sleep", new=AsyncMock()):
+            assert await _collect(client) == ["ok"]
+
+    @pytest.mark.asyncio
+    async def test_client_errors_are_raised(self):
+        """Test a 401 is not retried."""
+        client = _client_with(lambda request: httpx.Response(401, json={"error": "bad key"}))
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await _collect(client)
+
+    @pytest.mark.asyncio
+    async def test_requires_configuration(self):
+        """Test streaming is refused without LLM configuration."""
+        with patch.dict("os.environ", {"AI_ENABLED": "false"}):
+            client = LLMClient()
+        with pytest.raises(ValueError, match="not configured"):
+            await _collect(client)
+
+    @pytest.mark.asyncio
+    async def test_shares_response_cache_with_generate_text(self):
+        """Test a streamed response is cached under the non-streaming key."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, content=_sse_body("Cached ", "letter"))
+
+        with patch.dict("os.environ", {"AI_RESPONSE_CACHE": "true", "AI_RESPONSE_CACHE_PATH": ":memory:"}):
+            reset_response_cache()
+            try:
+                client = _client_with(handler)
+                assert await _collect(client) == ["Cached ", "letter"]
+                assert await _collect(client) == ["Cached letter"]
+                assert await client.generate_text("Write a letter") == "Cached letter"
+            finally:
+                reset_response_cache()
+
+        assert len(calls) == 1
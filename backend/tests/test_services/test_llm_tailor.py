@@ -1,5 +1,7 @@
 """Tests for LLM-powered CV tailoring."""
 
+import asyncio
+
 import pytest
 from unittest.mock import patch, AsyncMock, Mock
 
@@ -291,3 +293,79 @@ class TestReorderSkillsForJD:
             # Should still work correctly
             assert len(result.experience) == 1
             assert mock_client.rewrite_text.called
+
+
+def _delayed_rewrites(log, failures=()):
+    """Rewrite by upper-casing after a delay that makes later items finish first."""
+    state = {"active": 0, "peak": 0}
+
+    async def rewrite(text, prompt):
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        log.append(text)
+        try:
+            await asyncio.sleep(0.05 / len(log))
+            if text in failures:
+                raise ValueError(f"failed: {text}")
+            return text.upper()
+        finally:
+            state["active"] -= 1
+
+    return rewrite, state
+
+
+@pytest.mark.asyncio
+class TestConcurrentTailoring:
+    """Test per-item tailoring runs concurrently."""
+
+    async def test_results_keep_document_order(self, sample_draft, sample_profile):
+        """Test items finishing out of order are rebuilt in their original slots."""
+        log = []
+        rewrite, state = _delayed_rewrites(log)
+        with patch("backend.services.ai.llm_tailor.tailoring.get_llm_client") as mock_get_client:
+            mock_client = Mock()
+            mock_client.is_configured.return_value = True
+            mock_client.rewrite_text = AsyncMock(side_effect=rewrite)
+            mock_get_client.return_value = mock_client
+
+            result = await llm_tailor_cv(sample_draft, "Python developer.", sample_profile, concurrency=5)
+
+        original = sample_draft.experience[0]
+        tailored = result.experience[0]
+        assert tailored.description == original.description.upper()
+        assert tailored.projects[0].description == original.projects[0].description.upper()
+        assert tailored.projects[0].highlights == [h.upper() for h in original.projects[0].highlights]
+        assert state["peak"] == 5
+
+    async def test_concurrency_is_bounded(self, sample_draft, sample_profile):
+        """Test no more than the configured number of items are in flight."""
+        rewrite, state = _delayed_rewrites([])
+        with patch("backend.services.ai.llm_tailor.tailoring.get_llm_client") as mock_get_client, patch.dict(
+            "os.environ", {"AI_TAILOR_CONCURRENCY": "2"}
+        ):
+            mock_client = Mock()
+            mock_client.is_configured.return_value = True
+            mock_client.rewrite_text = AsyncMock(side_effect=rewrite)
+            mock_get_client.return_value = mock_client
+
+            await llm_tailor_cv(sample_draft, "Python developer.", sample_profile)
+
+        assert state["peak"] == 2
+        assert mock_client.rewrite_text.await_count == 5
+
+    async def test_failure_cancels_remaining_items(self, sample_draft, sample_profile):
+        """Test a failing item raises its error and stops the items still in flight."""
+        highlights = sample_draft.experience[0].projects[0].highlights
+        log = []
+        rewrite, state = _delayed_rewrites(log, failures={highlights[2]})
+        with patch("backend.services.ai.llm_tailor.tailoring.get_llm_client") as mock_get_client:
+            mock_client = Mock()
+            mock_client.is_configured.return_value = True
+            mock_client.rewrite_text = AsyncMock(side_effect=rewrite)
+            mock_get_client.return_value = mock_client
+
+            with pytest.raises(ValueError, match=f"failed: {highlights[2]}"):
+                await llm_tailor_cv(sample_draft, "Python developer.", sample_profile, concurrency=5)
+
+        assert len(log) == 5
+        assert state["active"] == 0
@@ -0,0 +1,126 @@
+"""Tests for per-call LLM telemetry."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from backend.services.ai.llm_client import (
+    LLMClient,
+    collect_llm_calls,
+    get_llm_telemetry,
+    llm_step,
+    summarize_calls,
+)
+from backend.services.ai.llm_client.telemetry import LLMCall
+
+ENV = {
+    "AI_ENABLED": "true",
+    "AI_BASE_URL": "https://api.openai.com/v1",
+    "AI_API_KEY": "test-key",
+    "AI_MODEL": "gpt-4o-mini",
+}
+
+
+def _completion(text, prompt_tokens=120, completion_tokens=30):
+    return {
+        "choices": [{"message": {"content": text}}],
+        "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens},
+    }
+
+
+def _client_with(handler):
+    """Create an LLMClient whose pooled HTTP client uses a mock transport."""
+    with patch.dict("os.environ", ENV):
+        client = LLMClient()
+    client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client._http_client_loop = asyncio.get_running_loop()
+    return client
+
+
+class TestLLMTelemetry:
+    """Test calls are recorded with step, model, retries and tokens."""
+
+    @pytest.mark.asyncio
+    async def test_records_tokens_and_retries_by_step(self):
+        """Test a retried call counts once, with its retries and reported usage."""
+        responses = [
+            httpx.Response(503, json={"error": "busy"}),
+            httpx.Response(200, json=_completion("ok")),
+            httpx.Response(200, json=_completion("ok")),
+        ]
+        client = _client_with(lambda request: responses.pop(0))
+
+        with patch("backend.services.ai.llm_client.request_executor.asyncio.sleep", new=AsyncMock()):
+            with llm_step("jd_analysis"):
+                assert await client.generate_text("Analyze this JD") == "ok"
+            await client.generate_text("Untagged call")
+
+        snapshot = get_llm_telemetry().snapshot()
+        jd = snapshot["steps"]["jd_analysis"]
+        assert (jd["calls"], jd["retries"], jd["errors"]) == (1, 1, 0)
+        assert (jd["prompt_tokens"], jd["completion_tokens"]) == (120, 30)
+        assert snapshot["steps"]["other"]["calls"] == 1
+        assert snapshot["models"]["gpt-4o-mini"]["calls"] == 2
+        assert snapshot["total"]["prompt_tokens"] == 240
+
+    @pytest.mark.asyncio
+    async def test_records_errors(self):
+        """Test a failed call is counted as an error."""
+        client = _client_with(lambda request: httpx.Response(401, json={"error": "bad key"}))
+
+        with llm_step("skill_eval"), pytest.raises(httpx.HTTPStatusError):
+            await client.generate_text("Evaluate skills")
+
+        assert get_llm_telemetry().snapshot()["steps"]["skill_eval"]["errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_step_follows_spawned_tasks(self):
+        """Test calls made from tasks started inside the step keep its tag."""
+        client = _client_with(lambda request: httpx.Response(200, json=_completion("ok")))
+
+        with collect_llm_calls() as calls, llm_step("adaptation"):
+            await asyncio.gather(*(client.generate_text(f"Item {i}") for i in range(3)))
+
+        assert [call.step for call in calls] == ["adaptation"] * 3
+        assert get_llm_telemetry().snapshot()["steps"]["adaptation"]["calls"] == 3
+
+    @pytest.mark.asyncio
+    async def test_stream_usage_recorded(self):
+        """Test streamed calls ask for usage and record it from the final chunk."""
+        requests = []
+        chunks = [
+            {"choices": [{"delta": {"content": "Dear "}}]},
+            {"choices": [{"delta": {"content": "team"}}]},
+            {"choices": [], "usage": {"prompt_tokens": 50, "completion_tokens": 2}},
+        ]
+        body = "".join(f"data: {json.dumps(chunk)}\n\n" for chunk in chunks) + "data: [DONE]\n\n"
+
+        def handler(request):
+            requests.append(json.loads(request.content))
+            return httpx.Response(200, content=body.encode())
+
+        client = _client_with(handler)
+        with llm_step("cover_letter"):
+            assert [delta async for delta in client.stream_text("Write")] == ["Dear ", "team"]
+
+        assert requests[0]["stream_options"] == {"include_usage": True}
+        step = get_llm_telemetry().snapshot()["steps"]["cover_letter"]
+        assert (step["calls"], step["prompt_tokens"], step["completion_tokens"]) == (1, 50, 2)
+
+    def test_summary_includes_cost_when_priced(self, monkeypatch):
+        """Test the per-request summary groups by step and prices tokens."""
+        monkeypatch.setenv("AI_PRICE_INPUT_PER_1M", "1")
+        monkeypatch.setenv("AI_PRICE_OUTPUT_PER_1M", "4")
+        calls = [
+            LLMCall("jd_analysis", "m", attempts=2, prompt_tokens=1000, completion_tokens=500, latency_ms=900),
+            LLMCall("skill_eval", "m", attempts=1, prompt_tokens=2000, completion_tokens=0, latency_ms=400),
+        ]
+
+        summary = summarize_calls(calls)
+
+        assert summary.startswith("2 calls, 3000 prompt + 500 completion tokens, ~$0.0050")
+        assert "jd_analysis=1 calls/900ms max/1000+500 tokens/1 retries" in summary
+        assert summarize_calls([]) == "no LLM calls"
@@ -0,0 +1,94 @@
+"""Tests for the mock OpenAI-compatible server used by the AI pipeline benchmark."""
+
+import asyncio
+
+import httpx
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from backend.benchmarks.ai_pipeline import synthetic_job_description, synthetic_profile
+from backend.benchmarks.mock_llm import MockLLMConfig, create_mock_llm_app
+from backend.models_ai import AIGenerateCVRequest
+from backend.models_cover_letter import CoverLetterRequest
+from backend.services.ai.cover_letter import generate_cover_letter
+from backend.services.ai.draft import generate_cv_draft
+from backend.services.ai.llm_client import collect_llm_calls, get_llm_client, reset_llm_client
+
+ENV = {
+    "AI_ENABLED": "true",
+    "AI_BASE_URL": "http://mock-llm/v1",
+    "AI_API_KEY": "mock",
+    "AI_MODEL": "mock",
+    "AI_RESPONSE_CACHE": "false",
+    "JD_CACHE_TTL_S": "0",
+}
+
+
+@pytest.fixture
+def mock_llm(monkeypatch):
+    """Route the shared LLM client to an in-process mock server."""
+    for name, value in ENV.items():
+        monkeypatch.setenv(name, value)
+    reset_llm_client()
+
+    def serve(**config):
+        app = create_mock_llm_app(MockLLMConfig(latency_ms=0, **config))
+        client = get_llm_client()
+        client._http_client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app))
+        client._http_client_loop = asyncio.get_running_loop()
+        return app.state.stats
+
+    yield serve
+    reset_llm_client()
+
+
+class TestMockLLMServer:
+    """Test the pipeline runs end to end against the mock server."""
+
+    @pytest.mark.asyncio
+    async def test_cv_draft_pipeline(self, mock_llm):
+        """Test every step gets a well-formed answer, so the draft has no warnings."""
+        stats = mock_llm()
+        request = AIGenerateCVRequest(job_description=synthetic_job_description(), max_experiences=2)
+
+        with collect_llm_calls() as calls:
+            response = await generate_cv_draft(synthetic_profile("small"), request)
+
+        assert response.warnings == []
+        assert {"jd_analysis", "adaptation"} <= {call.step for call in calls}
+        assert all(call.error is None and call.prompt_tokens for call in calls)
+        assert {"jd_analysis", "adaptation_batch"} <= set(stats["requests"])
+
+    @pytest.mark.asyncio
+    async def test_cover_letter_streams_usage(self, mock_llm):
+        """Test the streamed letter body reports token usage."""
+        stats = mock_llm()
+        request = CoverLetterRequest(
+            job_description=synthetic_job_description(), company_name="Bench Corp", tone="professional"
+        )
+
+        with collect_llm_calls() as calls:
+            response = await generate_cover_letter(synthetic_profile("small"), request)
+
+        assert response.cover_letter_text
+        assert stats["requests"]["cover_letter"] == 1
+        letter = next(call for call in calls if call.step == "cover_letter")
+        assert letter.completion_tokens > 0
+
+    @pytest.mark.asyncio
+    async def test_injected_errors_are_retried(self, mock_llm):
+        """Test injected 503s reach the client's retry path."""
+        stats = mock_llm(error_rate=1.0)
+
+        with patch("backend.services.ai.llm_client.request_executor.asyncio.sleep", new=AsyncMock()):
+            with collect_llm_calls() as calls, pytest.raises(httpx.HTTPStatusError):
+                await get_llm_client().generate_text("Say hello")
+
+        assert calls[0].retries > 0
+        assert stats["errors"]["generic"] == calls[0].attempts
+
+    def test_synthetic_inputs_are_deterministic(self):
+        """Test the same size and seed give the same profile."""
+        assert synthetic_profile("medium", 3) == synthetic_profile("medium", 3)
+        assert len(synthetic_profile("large").experience) == 8
+        assert synthetic_job_description(1) == synthetic_job_description(1)
@@ -4,7 +4,12 @@ import pytest
 from unittest.mock import AsyncMock, Mock, patch
 from backend.models import Experience, Project
 from backend.services.ai.pipeline.models import JDAnalysis, SelectionResult
-from backend.services.ai.pipeline.content_adapter import adapt_content, _adapt_text
+from backend.services.ai.pipeline.content_adapter import (
+    adapt_content,
+    parse_batch_adaptation_response,
+    _adapt_text,
+    _adapt_text_batch,
+)
 
 
 class TestContentAdapter:
@@ -115,3 +120,167 @@ class TestContentAdapter:
 
         # Should return the adapted text (not fallback to original)
         assert result == valid_response
+
+
+class TestBatchedContentAdapter:
+    """Test batched adaptation (one LLM call per experience group)."""
+
+    @staticmethod
+    def _selection_result():
+        return SelectionResult(
+            experiences=[
+                Experience(
+                    title="Software Engineer",
+                    company="Test Corp",
+                    start_date="2023-01",
+                    description="Built backend services for internal teams.",
+                    projects=[
+                        Project(
+                            name="API Project",
+                            highlights=["Built REST API using Python", "Wrote integration tests"],
+                            technologies=["Python"],
+                        )
+                    ],
+                ),
+                Experience(
+                    title="Developer",
+                    company="Other Corp",
+                    start_date="2020-01",
+                    description="Maintained the billing system.",
+                ),
+            ],
+            selected_indices={},
+        )
+
+    @staticmethod
+    def _jd_analysis():
+        return JDAnalysis(
+            required_skills={"python", "api"},
+            preferred_skills=set(),
+            responsibilities=[],
+            domain_keywords=set(),
+            seniority_signals=[],
+        )
+
+    def test_parse_batch_adaptation_response(self):
+        """Test array and object-keyed responses are parsed by item id."""
+        parsed = parse_batch_adaptation_response(
+            'Result: [{"id": 0, "text": " First "}, {"id": "1", "text": "Second"}, {"id": 2}]'
+        )
+        assert parsed == {0: "First", 1: "Second"}
+        assert parse_batch_adaptation_response('{"0": "Only"}') == {0: "Only"}
+        assert parse_batch_adaptation_response("not json") == {}
+
+    @pytest.mark.asyncio
+    async def test_adapt_content_uses_one_call_per_experience(self):
+        """Test items are grouped per experience and rewritten in one call each."""
+        mock_llm_client = Mock()
+        mock_llm_client.is_configured.return_value = True
+        mock_llm_client.rewrite_text = AsyncMock()
+
+        async def generate(prompt, system_prompt=None):
+            if "billing" in prompt:
+                return '[{"id": 0, "text": "Maintained the billing platform."}]'
+            return (
+                '[{"id": 0, "text": "Built backend APIs for internal teams."},'
+                ' {"id": 1, "text": "Built REST API with Python"},'
+                ' {"id": 2, "text": "Wrote API integration tests"}]'
+            )
+
+        mock_llm_client.generate_text = AsyncMock(side_effect=generate)
+
+        with patch(
+            "backend.services.ai.pipeline.content_adapter.adaptation.get_llm_client",
+            return_value=mock_llm_client,
+        ):
+            result = await adapt_content(self._selection_result(), self._jd_analysis(), batch_size=10)
+
+        assert mock_llm_client.generate_text.await_count == 2
+        mock_llm_client.rewrite_text.assert_not_called()
+        first, second = result.experiences
+        assert first.description == "Built backend APIs for internal teams."
+        assert first.projects[0].highlights == ["Built REST API with Python", "Wrote API integration tests"]
+        assert second.description == "Maintained the billing platform."
+        assert result.warnings == []
+
+    @pytest.mark.asyncio
+    async def test_batch_validates_each_item(self):
+        """Test length validation rejects only the offending item."""
+        tasks = [
+            ("highlight", "0", "0", "0", "Built REST API using Python"),
+            ("highlight", "0", "0", "1", "Wrote integration tests for the payment service"),
+        ]
+        mock_llm_client = Mock()
+        mock_llm_client.generate_text = AsyncMock(
+            return_value='[{"id": 0, "text": "Built REST APIs in Python"}, {"id": 1, "text": "Tests"}]'
+        )
+
+        results = await _adapt_text_batch(mock_llm_client, tasks, "Python", "")
+
+        assert results[0][5] == "Built REST APIs in Python"
+        assert results[0][6] is None
+        assert results[1][5] == tasks[1][4]
+        assert "too short" in results[1][6]
+
+    @pytest.mark.asyncio
+    async def test_batch_missing_items_fall_back_to_single_calls(self):
+        """Test items missing from the response are adapted individually."""
+        tasks = [
+            ("exp_desc", "0", "", "", "Built backend services for internal teams."),
+            ("highlight", "0", "0", "0", "Built REST API using Python"),
+        ]
+        mock_llm_client = Mock()
+        mock_llm_client.generate_text = AsyncMock(
+            return_value='[{"id": 0, "text": "Built backend APIs for internal teams."}]'
+        )
+        mock_llm_client.rewrite_text = AsyncMock(return_value="Built REST APIs in Python")
+
+        results = await _adapt_text_batch(mock_llm_client, tasks, "Python", "")
+
+        mock_llm_client.rewrite_text.assert_awaited_once()
+        assert [r[5] for r in results] == [
+            "Built backend APIs for internal teams.",
+            "Built REST APIs in Python",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_batch_size_one_uses_per_item_calls(self):
+        """Test batching can be disabled."""
+        mock_llm_client = Mock()
+        mock_llm_client.is_configured.return_value = True
+        mock_llm_client.generate_text = AsyncMock()
+        mock_llm_client.rewrite_text = AsyncMock(side_effect=lambda text, prompt: text)
+
+        with patch(
+            "backend.services.ai.pipeline.content_adapter.adaptation.get_llm_client",
+            return_value=mock_llm_client,
+        ):
+            await adapt_content(self._selection_result(), self._jd_analysis(), batch_size=1)
+
+        assert mock_llm_client.rewrite_text.await_count == 4
+        mock_llm_client.generate_text.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("batch_size", [1, 10])
+    async def test_on_item_reports_every_adapted_item(self, batch_size):
+        """Test the progress callback sees each item as its group finishes."""
+        mock_llm_client = Mock()
+        mock_llm_client.is_configured.return_value = True
+        mock_llm_client.generate_text = AsyncMock(return_value="[]")
+        mock_llm_client.rewrite_text = AsyncMock(side_effect=lambda text, prompt: text)
+        items = []
+
+        with patch(
+            "backend.services.ai.pipeline.content_adapter.adaptation.get_llm_client",
+            return_value=mock_llm_client,
+        ):
+            await adapt_content(
+                self._selection_result(), self._jd_analysis(), batch_size=batch_size, on_item=items.append
+            )
+
+        assert sorted((item[0], item[1], item[3]) for item in items) == [
+            ("exp_desc", "0", ""),
+            ("exp_desc", "1", ""),
+            ("highlight", "0", "0"),
+            ("highlight", "0", "1"),
+        ]
@@ -0,0 +1,214 @@
+"""Tests for the pipeline dependency-graph executor and draft scheduling."""
+
+import asyncio
+
+import pytest
+from unittest.mock import patch
+
+from backend.models import ProfileData
+from backend.models_ai import AIGenerateCVRequest
+from backend.services.ai.draft import _build_pipeline, generate_cv_draft
+from backend.services.ai.pipeline.dag import PipelineStep, run_pipeline_graph
+from backend.services.ai.pipeline.models import ContextAnalysis, JDAnalysis
+
+
+def _step(name, value, depends_on=(), delay=0.0, log=None):
+    async def run(results):
+        if log is not None:
+            log.append(f"start:{name}")
+        await asyncio.sleep(delay)
+        if log is not None:
+            log.append(f"end:{name}")
+        return value(results) if callable(value) else value
+
+    return PipelineStep(name, run, depends_on)
+
+
+class TestRunPipelineGraph:
+    """Test the generic executor."""
+
+    @pytest.mark.asyncio
+    async def test_independent_steps_overlap(self):
+        """Test steps without dependencies start before either finishes."""
+        log = []
+        results, timings = await run_pipeline_graph([
+            _step("a", 1, delay=0.02, log=log),
+            _step("b", 2, delay=0.02, log=log),
+            _step("sum", lambda r: r["a"] + r["b"], ("a", "b"), log=log),
+        ])
+
+        assert results["sum"] == 3
+        assert log[:2] == ["start:a", "start:b"]
+        assert log[-2:] == ["start:sum", "end:sum"]
+        assert timings["sum"].started_ms >= max(timings["a"].finished_ms, timings["b"].finished_ms)
+        assert timings["a"].duration_ms >= 15
+
+    @pytest.mark.asyncio
+    async def test_events_reported(self):
+        """Test the callback sees every step start and finish."""
+        events = []
+        await run_pipeline_graph(
+            [_step("a", 1), _step("b", 2, ("a",))],
+            on_event=lambda name, status: events.append((name, status)),
+        )
+        assert events == [("a", "started"), ("a", "finished"), ("b", "started"), ("b", "finished")]
+
+    @pytest.mark.asyncio
+    async def test_failure_cancels_remaining_steps(self):
+        """Test the first failure propagates and unrelated steps are cancelled."""
+        log = []
+
+        async def fail(results):
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            await run_pipeline_graph([
+                PipelineStep("fail", fail),
+                _step("slow", 1, delay=1, log=log),
+                _step("after", 2, ("fail",), log=log),
+            ])
+        assert "end:slow" not in log
+        assert "start:after" not in log
+
+    @pytest.mark.asyncio
+    async def test_cancelling_the_run_cancels_steps(self):
+        """Test a cancelled caller leaves no step task running."""
+        log = []
+        run = asyncio.create_task(run_pipeline_graph([
+            _step("slow", 1, delay=1, log=log),
+            _step("after", 2, ("slow",), log=log),
+        ]))
+        await asyncio.sleep(0.01)
+        run.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await run
+        pending = [task for task in asyncio.all_tasks() if task.get_name().startswith("pipeline:")]
+        assert pending == []
+        assert log == ["start:slow"]
+
+    @pytest.mark.asyncio
+    async def test_rejects_cycles_and_unknown_dependencies(self):
+        """Test invalid graphs are rejected before anything runs."""
+        with pytest.raises(ValueError, match="cycle"):
+            await run_pipeline_graph([_step("a", 1, ("b",)), _step("b", 2, ("a",))])
+        with pytest.raises(ValueError, match="unknown step"):
+            await run_pipeline_graph([_step("a", 1, ("missing",))])
+
+
+def _profile(sample_cv_data):
+    return ProfileData.model_validate({
+        "personal_info": sample_cv_data["personal_info"],
+        "experience": sample_cv_data["experience"],
+        "education": sample_cv_data["education"],
+        "skills": sample_cv_data["skills"],
+    })
+
+
+def _jd(tag):
+    return JDAnalysis(
+        required_skills={"python"},
+        preferred_skills=set(),
+        responsibilities=[tag],
+        domain_keywords=set(),
+        seniority_signals=[],
+    )
+
+
+class TestDraftPipelineScheduling:
+    """Test step 0 and step 1 overlap without changing their inputs."""
+
+    @pytest.mark.asyncio
+    async def test_context_and_jd_analysis_overlap_for_llm_tailor(self, sample_cv_data):
+        """Test llm_tailor starts JD analysis with the directive alongside step 0."""
+        log = []
+
+        async def fake_context(additional_context, job_description):
+            log.append("start:context")
+            await asyncio.sleep(0.01)
+            log.append("end:context")
+            return ContextAnalysis("directive", "adaptation_guidance", additional_context, "test")
+
+        async def fake_analyze_jd(job_description, additional_context=None):
+            log.append(f"start:jd:{additional_context}")
+            await asyncio.sleep(0.01)
+            return _jd("tailored")
+
+        request = AIGenerateCVRequest(
+            job_description="We need Python engineers to build APIs.",
+            style="llm_tailor",
+            additional_context="emphasize Python",
+        )
+        with patch("backend.services.ai.draft.analyze_additional_context", side_effect=fake_context), patch(
+            "backend.services.ai.draft.analyze_jd", side_effect=fake_analyze_jd
+        ):
+            steps = {step.name: step for step in _build_pipeline(_profile(sample_cv_data), request)}
+            results, _ = await run_pipeline_graph([steps["context"], steps["jd"]])
+
+        assert log.index("start:jd:emphasize Python") < log.index("end:context")
+        assert results["jd"].responsibilities == ["tailored"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "context_type, expected_calls",
+        [("content_statement", [None]), ("directive", [None, "emphasize Python"])],
+    )
+    async def test_speculative_jd_analysis_respects_directive(
+        self, sample_cv_data, context_type, expected_calls
+    ):
+        """Test step 1 reuses the plain analysis unless step 0 finds a directive."""
+        calls = []
+
+        async def fake_context(additional_context, job_description):
+            return ContextAnalysis(context_type, "summary", additional_context, "test")
+
+        async def fake_analyze_jd(job_description, additional_context=None):
+            calls.append(additional_context)
+            return _jd(str(additional_context))
+
+        request = AIGenerateCVRequest(
+            job_description="We need Python engineers to build APIs.",
+            style="select_and_reorder",
+            additional_context="emphasize Python",
+        )
+        with patch("backend.services.ai.draft.analyze_additional_context", side_effect=fake_context), patch(
+            "backend.services.ai.draft.analyze_jd", side_effect=fake_analyze_jd
+        ):
+            steps = {step.name: step for step in _build_pipeline(_profile(sample_cv_data), request)}
+            results, _ = await run_pipeline_graph([steps["context"], steps["jd_plain"], steps["jd"]])
+
+        assert calls == expected_calls
+        assert results["jd"].responsibilities == [str(expected_calls[-1])]
+
+    @pytest.mark.asyncio
+    async def test_generate_cv_draft_without_llm(self, sample_cv_data):
+        """Test the full graph runs end to end on the heuristic path."""
+        request = AIGenerateCVRequest(
+            job_description="We require Python and React. You will build and improve web features.",
+            max_experiences=2,
+        )
+        with patch("backend.services.ai.draft.logger") as mock_logger:
+            response = await generate_cv_draft(_profile(sample_cv_data), request)
+
+        assert response.draft_cv.experience
+        timing_logs = [c[0][0] for c in mock_logger.info.call_args_list if "step timings" in c[0][0]]
+        assert len(timing_logs) == 1
+        for step in ("raw_jd_skills", "jd", "skills", "selection", "adaptation", "assembly"):
+            assert f"{step}=" in timing_logs[0]
+
+    @pytest.mark.asyncio
+    async def test_generate_cv_draft_reports_progress(self, sample_cv_data):
+        """Test intermediate results are emitted as each step finishes."""
+        events = []
+        request = AIGenerateCVRequest(
+            job_description="We require Python and React. You will build and improve web features.",
+            max_experiences=2,
+        )
+        await generate_cv_draft(_profile(sample_cv_data), request, on_event=lambda name, data: events.append((name, data)))
+
+        names = [name for name, _ in events]
+        assert names.index("jd_analysis") < names.index("skills") < names.index("selection")
+        assert names[0] == "step" and events[0][1]["status"] == "started"
+        assert ("step", {"step": "assembly", "status": "finished"}) == events[-1]
+        skills = events[names.index("skills")][1]
+        assert {"skill", "requirement", "match_type", "confidence"} <= set(skills["matched_skills"][0])
@@ -5,6 +5,8 @@ from backend.services.ai.pipeline.jd_analyzer import (
     analyze_jd,
     _analyze_with_heuristics,
     _extract_tech_terms,
+    scan_tech_terms,
+    TechHit,
 )
 
 
@@ -57,6 +59,42 @@ class TestExtractTechTerms:
         assert "building" not in terms
 
 
+class TestScanTechTerms:
+    """Tests for the single-pass tech term scan."""
+
+    def test_hits_record_line_and_offset(self):
+        """Test each hit points at its normalized line."""
+        scan = scan_tech_terms("Requirements:\n\n  Python and Google Cloud Platform\nNice to have: Go.")
+
+        assert scan.lines == ["requirements:", "python and google cloud platform", "nice to have: go."]
+        assert TechHit("python", 1, 0) in scan.hits
+        assert TechHit("google cloud platform", 1, 11) in scan.hits
+        assert TechHit("google cloud", 1, 11) in scan.hits
+        assert TechHit("go", 2, 14) in scan.hits
+
+    def test_matches_per_line_extraction(self):
+        """Test line terms and all terms equal separate extraction calls."""
+        jd = (
+            "Must have: Node.js, Kubernetes/Docker and 9python.\n"
+            "Tools (e.g., Terraform,\nAnsible) and GitHub Actions!\n"
+            "Bonus: c++ or C#..."
+        )
+        scan = scan_tech_terms(jd)
+
+        # The parenthesized list spans two lines, so only the full text keeps its case
+        assert scan.all_terms == {
+            "node.js", "python", "Terraform", "terraform", "Ansible", "ansible",
+            "github", "github actions", "c++", "c#",
+        }
+        assert scan.terms_by_line() == [_extract_tech_terms(line) for line in scan.lines]
+
+    def test_heuristic_analysis_merges_aliases(self):
+        """Test aliases of one skill become a single canonical requirement."""
+        result = _analyze_with_heuristics("Must have: K8s, Kubernetes and Postgres.\nNice to have: Golang")
+        assert result.required_skills == {"kubernetes", "postgresql"}
+        assert result.preferred_skills == {"go"}
+
+
 class TestJDAnalyzer:
     def test_heuristic_analysis_extracts_required_skills(self):
         jd = "We require Python and FastAPI. Must have PostgreSQL experience."
@@ -1,10 +1,11 @@
 """Tests for Skill Mapper (Step 2)."""
 
 import pytest
+from unittest.mock import AsyncMock, Mock, patch
 from backend.models import Skill
 from backend.services.ai.pipeline.models import JDAnalysis
 from backend.services.ai.pipeline.skill_mapper import map_skills, _map_with_heuristics
-from backend.services.ai.text import tech_terms_match
+from backend.services.ai.text import TechTermIndex, get_tech_term_index, tech_terms_match
 
 
 class TestTechTermsMatch:
@@ -40,6 +41,38 @@ class TestTechTermsMatch:
         assert tech_terms_match(term1, term2) == expected
 
 
+class TestTechTermIndex:
+    """Test indexed matching gives the same answers as pairwise tech_terms_match."""
+
+    TERMS = [
+        "TailwindCSS", "JavaScript", "Postgres", "NodeJS", "Technical documentation",
+        "Machine Learning Pipelines", "Cloud", "AWS", "Golang", "REST APIs", "ui",
+    ]
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "Tailwind CSS", "Tailwind", "Java", "PostgreSQL", "Node", "Technical Leadership",
+            "Machine Learning", "Cloud Security", "aws", "Go", "REST API", "UI", "Rust",
+        ],
+    )
+    def test_matches_equal_pairwise(self, query):
+        index = TechTermIndex(self.TERMS)
+        expected = [pos for pos, term in enumerate(self.TERMS) if tech_terms_match(query, term)]
+        assert index.matches(query) == expected
+        assert index.first_match(query) == (self.TERMS[expected[0]] if expected else None)
+
+    def test_first_match_follows_list_order(self):
+        """Test the earliest matching term wins, as in the pairwise loop."""
+        index = TechTermIndex(["React Native", "ReactJS", "React"])
+        assert index.first_match("React") == "React Native"
+        assert index.first_match("Angular") is None
+
+    def test_index_is_cached_per_term_list(self):
+        assert get_tech_term_index(["Python", "Go"]) is get_tech_term_index(["Python", "Go"])
+        assert get_tech_term_index(["Go", "Python"]) is not get_tech_term_index(["Python", "Go"])
+
+
 class TestSkillMapper:
     def test_heuristic_mapping_matches_compound_tech_names(self):
         """Test that 'Tailwind CSS' matches JD keyword 'TailwindCSS'."""
@@ -163,3 +196,63 @@ class TestSkillMapper:
         assert isinstance(result.matched_skills, list)
         assert isinstance(result.selected_skills, list)
         assert isinstance(result.coverage_gaps, list)
+
+
+class TestTaxonomyMapping:
+    """Test skill mapping resolves taxonomy relations without the LLM."""
+
+    JD = JDAnalysis(
+        required_skills={"postgresql", "node.js"},
+        preferred_skills={"kubernetes"},
+        responsibilities=[],
+        domain_keywords=set(),
+        seniority_signals=[],
+    )
+
+    def test_heuristic_mapping_uses_taxonomy(self):
+        """Test aliases and ecosystem members match when names differ."""
+        profile_skills = [Skill(name="Postgres"), Skill(name="Express"), Skill(name="K8s")]
+
+        result = _map_with_heuristics(profile_skills, self.JD)
+
+        matches = {m.profile_skill.name: (m.jd_requirement, m.match_type) for m in result.matched_skills}
+        assert matches == {
+            "Postgres": ("postgresql", "exact"),
+            "Express": ("node.js", "ecosystem"),
+            "K8s": ("kubernetes", "exact"),
+        }
+        assert result.coverage_gaps == []
+
+    @pytest.mark.asyncio
+    async def test_map_skills_sends_only_unresolved_skills_to_llm(self):
+        """Test the LLM only sees skills the taxonomy could not map."""
+        profile_skills = [Skill(name="Express"), Skill(name="Excel")]
+        mock_llm_client = Mock()
+        mock_llm_client.is_configured.return_value = True
+        mock_llm_client.generate_text = AsyncMock(return_value="[]")
+
+        with patch(
+            "backend.services.ai.pipeline.skill_mapper.mapping.get_llm_client",
+            return_value=mock_llm_client,
+        ):
+            result = await map_skills(profile_skills, self.JD)
+
+        prompt = mock_llm_client.generate_text.await_args[0][0]
+        assert "- Excel" in prompt and "- Express" not in prompt
+        assert [s.name for s in result.selected_skills] == ["Express"]
+        assert sorted(result.coverage_gaps) == ["kubernetes", "postgresql"]
+
+    @pytest.mark.asyncio
+    async def test_map_skills_skips_llm_when_taxonomy_maps_everything(self):
+        """Test no LLM client is needed when every skill is mapped locally."""
+        with patch("backend.services.ai.pipeline.skill_mapper.mapping.get_llm_client") as get_client:
+            result = await map_skills([Skill(name="Golang"), Skill(name="Postgres")], JDAnalysis(
+                required_skills={"go", "postgresql"},
+                preferred_skills=set(),
+                responsibilities=[],
+                domain_keywords=set(),
+                seniority_signals=[],
+            ))
+
+        get_client.assert_not_called()
+        assert [m.match_type for m in result.matched_skills] == ["exact", "exact"]
@@ -7,8 +7,18 @@ from backend.services.ai.pipeline.models import JDAnalysis
 from backend.services.ai.pipeline.skill_relevance_evaluator import (
     evaluate_all_skills,
     evaluate_skill_relevance,
+    parse_batch_relevance_response,
     parse_relevance_response,
+    _evaluate_skill_batch,
+    _heuristic_skill_check,
     _skill_in_raw_jd,
+    SkillMatcher,
+    get_skill_matcher,
+)
+from backend.services.ai.pipeline.skill_relevance_evaluator.similarity import (
+    DEFAULT_ACCEPT,
+    similarity_matrix,
+    triage_by_similarity,
 )
 
 
@@ -47,6 +57,42 @@ class TestSkillInRawJD:
         assert _skill_in_raw_jd("Kubernetes", jd) is True
 
 
+class TestSkillMatcher:
+    """Tests for the compiled single-scan skill matcher."""
+
+    def test_scan_returns_all_skills_with_positions(self):
+        """Test one scan reports every matching skill and where it occurs."""
+        matcher = SkillMatcher(["Python", "SQL", "Go"])
+        jd = "Python and SQL; more python later."
+
+        assert matcher.scan(jd) == {"python": [0, 21], "sql": [11]}
+
+    def test_overlapping_skills_all_match(self):
+        """Test skills that share text are matched independently."""
+        matcher = SkillMatcher(["Java", "Java EE", "Machine Learning", "Learning", "JavaScript"])
+        found = matcher.scan("Java EE services and machine learning, no JavaScript.")
+
+        assert found["java ee"] == [0]
+        assert found["java"] == [0]
+        assert found["machine learning"] == [21]
+        assert found["learning"] == [29]
+        assert found["javascript"] == [42]
+
+    def test_symbol_skills_keep_word_boundary_rules(self):
+        """Test C++ and .NET behave like the per-skill word-boundary search."""
+        matcher = SkillMatcher(["C", "C++", "Node.js"])
+        found = matcher.scan("Write C++ and Node.js code")
+
+        assert "c" in found and "node.js" in found
+        assert "c++" not in found  # no word boundary after "++", as before
+
+    def test_matcher_is_cached_per_skill_set(self):
+        """Test the same skills reuse the compiled matcher regardless of order or case."""
+        assert get_skill_matcher(["Python", "SQL"]) is get_skill_matcher(["sql", "PYTHON"])
+        assert get_skill_matcher(["Python"]) is not get_skill_matcher(["Python", "SQL"])
+        assert SkillMatcher([]).scan("Python") == {}
+
+
 class TestRawJDMatching:
     """Tests for raw JD matching in evaluate_all_skills."""
 
@@ -238,3 +284,222 @@ class TestSkillRelevanceEvaluator:
             assert "Python" in [s.name for s in result.selected_skills]
             # COBOL should not be in selected skills (no match to "python")
             assert "COBOL" not in [s.name for s in result.selected_skills]
+
+
+@pytest.fixture
+def llm_only(monkeypatch):
+    """Send every remaining skill to the LLM, skipping the taxonomy and local similarity stages."""
+    monkeypatch.setattr(
+        "backend.services.ai.pipeline.skill_relevance_evaluator.evaluation._match_skills_by_taxonomy",
+        lambda *args: [],
+    )
+    monkeypatch.setenv("AI_SKILL_SIMILARITY_ACCEPT", "2")
+    monkeypatch.setenv("AI_SKILL_SIMILARITY_REJECT", "0")
+
+
+class TestTaxonomyMatching:
+    """Test aliases, ecosystems and foundations are resolved before the LLM."""
+
+    @pytest.mark.asyncio
+    async def test_taxonomy_matches_skip_llm(self):
+        """Test skills the taxonomy relates to a requirement need no LLM call."""
+        profile_skills = [Skill(name="Postgres"), Skill(name="Express"), Skill(name="Python")]
+        jd_analysis = JDAnalysis(
+            required_skills={"PostgreSQL", "Node.js", "Django"},
+            preferred_skills=set(),
+            responsibilities=[],
+            domain_keywords=set(),
+            seniority_signals=[],
+        )
+
+        with patch(
+            "backend.services.ai.pipeline.skill_relevance_evaluator.evaluation.get_llm_client"
+        ) as get_client:
+            result = await evaluate_all_skills(profile_skills, jd_analysis)
+
+        get_client.assert_not_called()
+        matches = {m.profile_skill.name: (m.jd_requirement, m.match_type, m.confidence) for m in result.matched_skills}
+        assert matches == {
+            "Postgres": ("PostgreSQL", "exact", 0.9),
+            "Python": ("Django", "ecosystem", 0.85),
+            "Express": ("Node.js", "ecosystem", 0.75),
+        }
+        assert result.coverage_gaps == []
+
+    def test_heuristic_check_uses_taxonomy(self):
+        """Test the LLM fallback check knows foundations."""
+        result = _heuristic_skill_check(Skill(name="JavaScript"), ["Express"])
+        assert (result.relevant, result.relevance_type, result.match) == (True, "foundation", "Express")
+
+
+class TestLocalSimilarity:
+    """Test the offline similarity stage before LLM evaluation."""
+
+    def test_similarity_scores_related_technologies(self):
+        """Test alternatives score high and unrelated technologies score zero."""
+        matrix = similarity_matrix(["PostgreSQL", "Kubernetes"], ["MySQL", "React"])
+        assert matrix[0][0] >= DEFAULT_ACCEPT
+        assert matrix[0][1] == 0.0 and matrix[1][1] == 0.0
+
+    def test_triage_decides_clear_cases_only(self):
+        """Test clear matches and known unrelated skills skip the LLM."""
+        skills = [Skill(name="PostgreSQL"), Skill(name="Terraform"), Skill(name="Pascal")]
+
+        decided, ambiguous = triage_by_similarity(skills, ["MySQL", "React"])
+
+        results = {skill.name: result for skill, result, _error in decided}
+        assert results["PostgreSQL"].relevant and results["PostgreSQL"].match == "MySQL"
+        assert results["Terraform"].relevant is False
+        # Pascal is not in the vocabulary, so only the LLM may reject it
+        assert [s.name for s in ambiguous] == ["Pascal"]
+
+    def test_directive_prevents_local_rejection(self):
+        """Test a directive leaves rejections to the LLM."""
+        decided, ambiguous = triage_by_similarity([Skill(name="Terraform")], ["React"], "emphasize cloud")
+        assert decided == [] and [s.name for s in ambiguous] == ["Terraform"]
+
+    def test_directive_prevents_local_acceptance(self):
+        """Test a directive also leaves clear matches to the LLM."""
+        decided, ambiguous = triage_by_similarity([Skill(name="PostgreSQL")], ["MySQL"], "emphasize Rust")
+        assert decided == [] and [s.name for s in ambiguous] == ["PostgreSQL"]
+
+    @pytest.mark.parametrize("skill,requirement", [
+        ("Rust", "C++"),
+        ("C", "C++"),
+        ("React", "Angular"),
+        ("Express", "Node.js"),
+    ])
+    def test_sibling_technologies_are_left_to_the_llm(self, skill, requirement):
+        """Test technologies that merely share a context are not accepted locally."""
+        assert similarity_matrix([skill], [requirement])[0][0] < DEFAULT_ACCEPT
+        decided, ambiguous = triage_by_similarity([Skill(name=skill)], [requirement])
+        assert decided == [] and [s.name for s in ambiguous] == [skill]
+
+    @pytest.mark.asyncio
+    async def test_evaluate_all_skills_needs_no_llm_when_all_clear(self):
+        """Test skills decided locally need no LLM, even when none is configured."""
+        jd_analysis = JDAnalysis(
+            required_skills={"mysql"},
+            preferred_skills=set(),
+            responsibilities=[],
+            domain_keywords=set(),
+            seniority_signals=[],
+        )
+        mock_llm_client = Mock()
+        mock_llm_client.is_configured.return_value = False
+
+        with patch(
+            "backend.services.ai.pipeline.skill_relevance_evaluator.evaluation.get_llm_client",
+            return_value=mock_llm_client,
+        ):
+            result = await evaluate_all_skills([Skill(name="PostgreSQL"), Skill(name="React")], jd_analysis)
+
+        assert [s.name for s in result.selected_skills] == ["PostgreSQL"]
+        assert result.matched_skills[0].match_type == "ecosystem"
+
+
+@pytest.mark.usefixtures("llm_only")
+class TestBatchedSkillEvaluation:
+    """Test batched LLM evaluation."""
+
+    @staticmethod
+    def _jd_analysis():
+        return JDAnalysis(
+            required_skills={"django", "kubernetes"},
+            preferred_skills=set(),
+            responsibilities=[],
+            domain_keywords=set(),
+            seniority_signals=[],
+        )
+
+    def test_parse_batch_response_array_and_object(self):
+        """Test both array and object-keyed batch responses are parsed."""
+        array = parse_batch_relevance_response(
+            'Here: [{"skill": "Flask", "relevant": true, "type": "alternative", "why": "web", "match": "django"}, "junk"]'
+        )
+        assert array["flask"].relevant is True
+        assert array["flask"].relevance_type == "alternative"
+        keyed = parse_batch_relevance_response(
+            '{"Helm": {"relevant": true, "type": "related", "why": "k8s", "match": "kubernetes"}}'
+        )
+        assert keyed["helm"].match == "kubernetes"
+        assert parse_batch_relevance_response("no json here") == {}
+
+    @pytest.mark.asyncio
+    async def test_evaluate_all_skills_batches_llm_calls(self):
+        """Test remaining skills are evaluated with one call per batch."""
+        profile_skills = [
+            Skill(name=name) for name in ("Flask", "Helm", "COBOL", "Fortran", "Pascal")
+        ]
+        mock_llm_client = Mock()
+        mock_llm_client.is_configured.return_value = True
+        mock_llm_client.generate_text = AsyncMock(
+            side_effect=[
+                '[{"skill": "Flask", "relevant": true, "type": "alternative", "why": "web", "match": "django"},'
+                ' {"skill": "Helm", "relevant": true, "type": "related", "why": "k8s", "match": "kubernetes"},'
+                ' {"skill": "COBOL", "relevant": false, "type": "related", "why": "no", "match": ""}]',
+                '[{"skill": "Fortran", "relevant": false, "type": "related", "why": "no", "match": ""},'
+                ' {"skill": "Pascal", "relevant": false, "type": "related", "why": "no", "match": ""}]',
+            ]
+        )
+
+        with patch(
+            "backend.services.ai.pipeline.skill_relevance_evaluator.evaluation.get_llm_client",
+            return_value=mock_llm_client,
+        ):
+            result = await evaluate_all_skills(profile_skills, self._jd_analysis(), batch_size=3)
+
+        assert mock_llm_client.generate_text.await_count == 2
+        first_prompt = mock_llm_client.generate_text.await_args_list[0][0][0]
+        assert '"Flask"' in first_prompt and '"COBOL"' in first_prompt
+        assert '"Fortran"' not in first_prompt
+        assert [s.name for s in result.selected_skills] == ["Flask", "Helm"]
+        matches = {m.profile_skill.name: m for m in result.matched_skills}
+        assert matches["Flask"].match_type == "ecosystem"
+        assert matches["Helm"].jd_requirement == "kubernetes"
+
+    @pytest.mark.asyncio
+    async def test_partial_batch_response_falls_back_to_heuristics(self):
+        """Test skills missing from the batch response use the heuristic check."""
+        skills = [Skill(name="Flask"), Skill(name="Django REST")]
+        mock_llm_client = Mock()
+        mock_llm_client.generate_text = AsyncMock(
+            return_value='[{"skill": "Flask", "relevant": false, "type": "related", "why": "no", "match": ""}]'
+        )
+        with patch(
+            "backend.services.ai.pipeline.skill_relevance_evaluator.batch_evaluation._heuristic_skill_check",
+            wraps=_heuristic_skill_check,
+        ) as heuristic:
+            results = await _evaluate_skill_batch(skills, ["django"], mock_llm_client)
+
+        heuristic.assert_called_once_with(skills[1], ["django"])
+        assert [(skill.name, error) for skill, _result, error in results] == [
+            ("Flask", None),
+            ("Django REST", None),
+        ]
+        assert results[0][1].relevant is False
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_call_reports_errors(self):
+        """Test an LLM failure marks every skill in the batch as failed."""
+        skills = [Skill(name="Flask"), Skill(name="Helm")]
+        mock_llm_client = Mock()
+        mock_llm_client.generate_text = AsyncMock(side_effect=RuntimeError("down"))
+        results = await _evaluate_skill_batch(skills, ["django"], mock_llm_client)
+        assert all(result is None and isinstance(error, RuntimeError) for _s, result, error in results)
+
+    @pytest.mark.asyncio
+    async def test_batch_size_one_uses_per_skill_calls(self):
+        """Test batching can be disabled."""
+        profile_skills = [Skill(name="Flask"), Skill(name="Helm")]
+        mock_llm_client = Mock()
+        mock_llm_client.is_configured.return_value = True
+        mock_llm_client.generate_text = AsyncMock(
+            return_value='{"relevant": false, "type": "related", "why": "no", "match": ""}'
+        )
+        with patch(
+            "backend.services.ai.pipeline.skill_relevance_evaluator.evaluation.get_llm_client",
+            return_value=mock_llm_client,
+        ):
+            await evaluate_all_skills(profile_skills, self._jd_analysis(), batch_size=1)
+        assert mock_llm_client.generate_text.await_count == 2
@@ -0,0 +1,86 @@
+"""Tests for profile item scoring against a compiled target spec."""
+
+from unittest.mock import patch
+
+from backend.models import Experience, Project
+from backend.services.ai.pipeline.content_selector import _select_highlights, select_content
+from backend.services.ai.pipeline.models import JDAnalysis, SkillMapping
+from backend.services.ai.scoring import compile_spec, item_features, score_item, score_items
+from backend.services.ai.target_spec import TargetSpec
+
+SPEC = TargetSpec(
+    required_keywords={"python", "kubernetes"},
+    preferred_keywords={"terraform"},
+    responsibilities=["Design scalable APIs for customers", "Mentor engineers on the team", ""],
+)
+
+
+class TestScoring:
+    """Test compiled scoring."""
+
+    def test_compiled_spec_scores_like_raw_spec(self):
+        """Test scoring with a compiled spec gives the same scores."""
+        item = {
+            "text_parts": ["Led design of scalable APIs in Python", "Mentor to two engineers"],
+            "technologies": ["Kubernetes"],
+            "start_date": "2021-05",
+        }
+
+        raw = score_item(spec=SPEC, **item)
+        compiled = score_item(spec=compile_spec(SPEC), **item)
+
+        assert raw == compiled
+        assert raw.keyword_match == 2 / 3
+        assert raw.responsibility_match == 2 / 3  # the empty responsibility still counts
+        assert (raw.seniority_match, raw.recency) == (1.0, 0.85)
+
+    def test_score_items_matches_score_item(self):
+        """Test batch scoring returns one score per item, in order."""
+        items = [
+            (["Worked on various Terraform modules"], ["Terraform"], "2023-01"),
+            (["Designed APIs"], [], "2018-01"),
+        ]
+        expected = [
+            score_item(text_parts=parts, technologies=tech, start_date=start, spec=SPEC)
+            for parts, tech, start in items
+        ]
+        assert score_items(items, SPEC) == expected
+        assert expected[0].quality_penalty == 0.1
+
+    def test_item_features_are_cached(self):
+        """Test an item is tokenized once across scorings."""
+        item_features.cache_clear()
+        for _ in range(3):
+            score_item(text_parts=["Built Python services"], technologies=[], start_date="2023-01", spec=SPEC)
+        assert item_features.cache_info().hits == 2
+
+
+class TestSelectContentScoring:
+    """Test select_content scores each project's highlights once."""
+
+    def test_highlights_selected_once_per_project(self):
+        experience = Experience(
+            title="Engineer",
+            company="Acme",
+            start_date="2023-01",
+            projects=[
+                Project(name="API", highlights=["Built Python APIs", "Ran retros", "Tuned Kubernetes"], technologies=["Python"]),
+                Project(name="Infra", highlights=["Wrote Terraform"], technologies=["Terraform"]),
+            ],
+        )
+        jd_analysis = JDAnalysis(
+            required_skills={"python"},
+            preferred_skills=set(),
+            responsibilities=[],
+            domain_keywords=set(),
+            seniority_signals=[],
+        )
+
+        with patch(
+            "backend.services.ai.pipeline.content_selector._select_highlights", wraps=_select_highlights
+        ) as select_highlights:
+            result = select_content([experience], jd_analysis, SkillMapping([], [], []), max_experiences=1)
+
+        assert select_highlights.call_count == 2
+        assert result.experiences[0].projects[0].highlights[0] == "Built Python APIs"
+        assert result.selected_indices["Acme_Engineer"]["highlights"][0] == [0, 1, 2]
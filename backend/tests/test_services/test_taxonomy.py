@@ -0,0 +1,59 @@
+"""Tests for the bundled skill taxonomy."""
+
+import json
+
+import pytest
+
+from backend.services.ai.taxonomy import (
+    ECOSYSTEM,
+    FOUNDATION,
+    SYNONYM,
+    SkillTaxonomy,
+    canonicalize_terms,
+    get_skill_taxonomy,
+    load_skill_taxonomy,
+)
+
+
+class TestSkillTaxonomy:
+    """Test alias, ecosystem and foundation lookups."""
+
+    def test_bundled_taxonomy_is_versioned_and_loaded_once(self):
+        taxonomy = get_skill_taxonomy()
+        assert taxonomy is get_skill_taxonomy()
+        assert taxonomy.version == "1"
+        assert "K8s" in taxonomy
+
+    @pytest.mark.parametrize(
+        "skill,requirement,expected",
+        [
+            ("Postgres", "PostgreSQL", SYNONYM),
+            ("Golang", "Go", SYNONYM),
+            ("Python", "Django", FOUNDATION),
+            ("JavaScript", "Express", FOUNDATION),  # through Node.js
+            ("Express", "Node.js", ECOSYSTEM),
+            ("Django", "Flask", None),
+            ("COBOL", "Python", None),
+        ],
+    )
+    def test_relation(self, skill, requirement, expected):
+        assert get_skill_taxonomy().relation(skill, requirement) == expected
+
+    def test_best_relation_prefers_stronger_relations(self):
+        """Test a synonym beats an earlier ecosystem relation."""
+        taxonomy = get_skill_taxonomy()
+        assert taxonomy.best_relation("Node", ["JavaScript", "Express", "nodejs"]) == (SYNONYM, "nodejs")
+        assert taxonomy.best_relation("Node", ["JavaScript", "Express"]) == (FOUNDATION, "Express")
+        assert taxonomy.best_relation("Node", ["Excel"]) is None
+
+    def test_canonicalize_terms_merges_aliases(self):
+        assert canonicalize_terms({"k8s", "Kubernetes", "Excel", "golang"}) == {
+            "kubernetes", "Excel", "go",
+        }
+
+    def test_conflicting_alias_is_rejected(self, tmp_path):
+        path = tmp_path / "taxonomy.json"
+        path.write_text(json.dumps({"version": 2, "aliases": {"go": ["golang"], "golang-ci": ["golang"]}}))
+        with pytest.raises(ValueError, match="golang"):
+            load_skill_taxonomy(path)
+        assert SkillTaxonomy({"version": 2}).relation("go", "go") is None
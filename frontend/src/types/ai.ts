@@ -9,6 +9,7 @@ export interface AIGenerateCVRequest {
   style?: AIGenerateStyle
   max_experiences?: number
   additional_context?: string
+  regenerate?: boolean
 }
 
 export interface EvidenceItem {
@@ -13,6 +13,7 @@ export interface CoverLetterResponse {
   highlights_used: string[]
   selected_experiences: string[]
   selected_skills: string[]
+  warnings?: string[]
 }
 
 export interface CoverLetterPDFRequest {
@@ -47,6 +48,7 @@ export interface CoverLetterListItem {
 export interface CoverLetterListResponse {
   cover_letters: CoverLetterListItem[]
   total: number
+  next_cursor?: string | null
 }
 
 export interface CoverLetterSaveRequest {
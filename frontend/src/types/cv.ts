@@ -103,6 +103,7 @@ export interface CVListItem {
 export interface CVListResponse {
   cvs: CVListItem[]
   total: number
+  next_cursor?: string | null
 }
 
 export interface ProfileData {
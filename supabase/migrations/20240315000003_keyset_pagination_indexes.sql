@@ -0,0 +1,5 @@
+-- Composite indexes backing keyset pagination on (created_at, id) per user.
+create index if not exists idx_cvs_user_created_id
+  on cvs(user_id, created_at desc, id desc);
+create index if not exists idx_cover_letters_user_created_id
+  on cover_letters(user_id, created_at desc, id desc);